@@ -0,0 +1,549 @@
+# binlog_cdc.py
+import os
+import re
+import json
+import shutil
+import subprocess
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal, InvalidOperation
+from typing import Dict, List, Any, Optional, Iterator, Callable
+
+from migration_logic import Table, Column, InsertPlan, UpsertPlan
+
+try:
+    from pymysqlreplication import BinLogStreamReader
+    from pymysqlreplication.event import QueryEvent, XidEvent, RotateEvent
+    from pymysqlreplication.row_event import WriteRowsEvent, UpdateRowsEvent, DeleteRowsEvent
+    REPLICATION_AVAILABLE = True
+except ImportError:
+    REPLICATION_AVAILABLE = False
+    print("AVISO: mysql-replication não encontrado. Leitura do binlog direto do servidor indisponível.")
+    print("Instale com: pip install mysql-replication (arquivos de mysqlbinlog continuam suportados)")
+
+
+@dataclass(frozen=True, order=True)
+class BinlogPosition:
+    """Posição no binlog. Os arquivos têm sufixo numérico com zeros, então a ordem do nome vale."""
+    log_file: str
+    log_pos: int
+
+    def __str__(self) -> str:
+        return f"{self.log_file}:{self.log_pos}"
+
+
+@dataclass
+class RowChange:
+    """Uma linha alterada; as imagens são tuplas na ordem de table.columns, como no extrator."""
+    kind: str                        # 'insert', 'update' ou 'delete'
+    table_name: str
+    values: Optional[tuple] = None   # imagem nova (insert/update)
+    before: Optional[tuple] = None   # imagem anterior (update/delete)
+
+
+@dataclass
+class BinlogTransaction:
+    """Alterações de uma transação confirmada e a posição logo depois do seu COMMIT."""
+    end_position: BinlogPosition
+    changes: List[RowChange] = field(default_factory=list)
+
+
+class BinlogPositionStore:
+    """Última posição do binlog já convertida em script, por servidor/banco."""
+
+    DEFAULT_PATH = os.path.join('cache', 'binlog_position.json')
+
+    def __init__(self, schema_key: str, path: Optional[str] = None):
+        self.path = path or self.DEFAULT_PATH
+        self.schema_key = schema_key
+        self._schemas: Dict[str, dict] = {}
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._schemas = json.load(f)
+
+    def get(self) -> Optional[BinlogPosition]:
+        entry = self._schemas.get(self.schema_key)
+        if entry is None:
+            return None
+        return BinlogPosition(entry['log_file'], entry['log_pos'])
+
+    def set(self, position: BinlogPosition):
+        self._schemas[self.schema_key] = {
+            'log_file': position.log_file,
+            'log_pos': position.log_pos,
+            'updated': datetime.now().isoformat(timespec='seconds'),
+        }
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._schemas, f, ensure_ascii=False, indent=1)
+        os.replace(temp_path, self.path)
+
+
+class ChangePlan(UpsertPlan):
+    """Converte RowChange em DML Informix com os formatadores de InsertPlan.
+
+    Todos os comandos são idempotentes, para que reaplicar um trecho do binlog (CDC
+    iniciado antes do fim da carga, ou retomado de uma posição salva antes de uma
+    falha) não duplique dados: INSERT vira MERGE pela PK, UPDATE grava os valores
+    novos e DELETE remove pela chave. Tabelas com BYTE/TEXT não aceitam MERGE com
+    origem em SELECT; nelas o INSERT vira DELETE pela PK seguido do INSERT. Tabelas
+    sem PK localizam a linha por todas as colunas comparáveis (BYTE/TEXT não podem
+    aparecer em WHERE) e recebem o INSERT simples.
+    """
+
+    _cache: Dict[tuple, InsertPlan] = {}
+
+    def __init__(self, table: Table):
+        super().__init__(table)
+        self.match_positions = [
+            position for position, (column, target_type) in enumerate(zip(self.columns, self.target_types))
+            if (column.is_primary_key if self.key_names else target_type.split('(')[0] not in ('BYTE', 'TEXT'))
+        ]
+
+    def _where(self, row: tuple) -> str:
+        formatted = self.format_row(row)
+        conditions = []
+        for position in self.match_positions:
+            name = self.column_names[position]
+            if row[self.indexes[position]] is None:
+                conditions.append(f"{name} IS NULL")
+            else:
+                conditions.append(f"{name} = {formatted[position]}")
+        return " AND ".join(conditions)
+
+    def render_change(self, change: RowChange) -> List[str]:
+        if change.kind == 'insert':
+            if self.supports_merge:
+                return [self.render_merge([change.values])]
+            if self.key_names:
+                return [f"DELETE FROM {self.table.name} WHERE {self._where(change.values)};",
+                        self.render_insert(change.values)]
+            return [self.render_insert(change.values)]
+        if change.kind == 'delete':
+            return [f"DELETE FROM {self.table.name} WHERE {self._where(change.before)};"]
+
+        after = self.format_row(change.values)
+        assignments = [
+            f"{name} = {value}"
+            for index, name, value in zip(self.indexes, self.column_names, after)
+            if change.before[index] != change.values[index]
+        ]
+        if not assignments:
+            return [] # UPDATE que não mudou nenhum valor
+        return [f"UPDATE {self.table.name} SET {', '.join(assignments)} WHERE {self._where(change.before)};"]
+
+
+# --- Leitura da saída de `mysqlbinlog -v` ---
+
+_AT_RE = re.compile(r'^# at (\d+)\s*$')
+_HEADER_RE = re.compile(r'^#\d{6}\s+\d{1,2}:\d{2}:\d{2}\s.*?end_log_pos (\d+)')
+_ROTATE_RE = re.compile(r'Rotate to (\S+)\s+pos: (\d+)')
+_ROW_EVENT_RE = re.compile(r'^### (INSERT INTO|UPDATE|DELETE FROM) `([^`]*)`\.`([^`]*)`')
+_ROW_VALUE_RE = re.compile(r'^###\s+@(\d+)=(.*)$')
+_HEX_ESCAPE_RE = re.compile(rb'\\x([0-9a-fA-F]{2})')
+_DDL_PREFIXES = ('ALTER ', 'CREATE ', 'DROP ', 'RENAME ', 'TRUNCATE ')
+
+
+def _split_binlog_value(text: str, unsigned: bool = False):
+    """(texto, entre aspas?) de um valor `@N=...`, sem o comentário de tipo do -vv."""
+    text = text.strip()
+    if text.startswith("'"):
+        # mysqlbinlog escreve aspas e barras dentro de strings como \x27 e \x5c
+        return text[1:text.index("'", 1)], True
+    if text.startswith("b'"):
+        return text[:text.index("'", 2) + 1], False
+    text = text.split(' /*', 1)[0]
+    # Inteiro com o bit de sinal ligado vem como "-1 (4294967295)": o mysqlbinlog não sabe
+    # se a coluna é UNSIGNED e mostra as duas leituras
+    match = re.match(r'^(-?\d+) \((\d+)\)$', text)
+    if match:
+        return match.group(2 if unsigned else 1), False
+    return text, False
+
+
+def parse_binlog_value(text: str, column: Column) -> Any:
+    """Valor Python (como o conector MariaDB devolveria) a partir do texto de `mysqlbinlog -v`.
+
+    DATE sai como 'AAAA:MM:DD', TIMESTAMP como segundos desde a época (convertidos no fuso
+    local), BIT como b'0101'. ENUM/SET saem como índice/máscara numérica: o rótulo não
+    está no binlog e o número é mantido. Inteiros de colunas UNSIGNED (column.is_unsigned)
+    usam a leitura sem sinal.
+    """
+    raw, quoted = _split_binlog_value(text, column.is_unsigned)
+    if raw == 'NULL' and not quoted:
+        return None
+    if quoted:
+        data = _HEX_ESCAPE_RE.sub(lambda m: bytes([int(m.group(1), 16)]), raw.encode('utf-8', 'surrogateescape'))
+        kind = InsertPlan.value_kind(column)
+        if kind == 'bytes':
+            return data
+        raw = data.decode('utf-8', 'replace')
+        if kind == 'datetime':
+            return None if raw.startswith('0000-00-00') else datetime.fromisoformat(raw)
+        if kind == 'date':
+            return None if raw.startswith('0000') else datetime.strptime(raw.replace(':', '-'), '%Y-%m-%d').date()
+        if kind == 'time':
+            negative = raw.startswith('-')
+            hours, minutes, seconds = raw.lstrip('-').split(':')
+            value = timedelta(hours=int(hours), minutes=int(minutes), seconds=float(seconds))
+            return -value if negative else value
+        return raw
+
+    kind = InsertPlan.value_kind(column)
+    if raw.startswith("b'"):
+        return int(raw[2:-1] or '0', 2)
+    if kind == 'datetime': # TIMESTAMP
+        seconds = Decimal(raw)
+        return None if seconds == 0 else datetime.fromtimestamp(float(seconds))
+    if kind in ('int', 'boolean') or (kind == 'string' and re.fullmatch(r'-?\d+', raw)):
+        return int(raw)
+    try:
+        return Decimal(raw)
+    except InvalidOperation:
+        return raw
+
+
+class MysqlbinlogFileReader:
+    """Lê transações de um binlog local: a saída de `mysqlbinlog -v --base64-output=DECODE-ROWS`
+    ou o próprio arquivo binário (convertido chamando mariadb-binlog/mysqlbinlog).
+
+    Serve para reprocessar um binlog copiado do servidor e para testar o CDC sem
+    conexão. Só alterações de `database` em tabelas de `tables` são devolvidas;
+    eventos antes de `start` são pulados. A posição de cada transação é a do fim do
+    seu evento de COMMIT (Xid), pronta para ser gravada e retomada.
+    """
+
+    BINLOG_MAGIC = b'\xfebin'
+
+    def __init__(self, path: str, tables: Dict[str, Table], database: str,
+                 start: Optional[BinlogPosition] = None, log_file: Optional[str] = None,
+                 log: Optional[Callable[[str, str], None]] = None):
+        self.path = path
+        self.tables = tables
+        self.database = database
+        self.start = start
+        self.log_file = log_file or (start.log_file if start else os.path.basename(path))
+        self.log = log or (lambda message, level="INFO": None)
+        self.skipped_changes = 0
+        self._warned = set()
+
+    def _open_lines(self):
+        with open(self.path, 'rb') as f:
+            is_binary = f.read(4) == self.BINLOG_MAGIC
+        if not is_binary:
+            return open(self.path, 'rb'), None
+
+        tool = shutil.which('mariadb-binlog') or shutil.which('mysqlbinlog')
+        if tool is None:
+            raise RuntimeError(f"{self.path} é um binlog binário e mariadb-binlog/mysqlbinlog não está no PATH. "
+                               "Gere o texto com: mysqlbinlog -v --base64-output=DECODE-ROWS <arquivo>")
+        command = [tool, '-v', '--base64-output=DECODE-ROWS', self.path]
+        process = subprocess.Popen(command, stdout=subprocess.PIPE)
+        return process.stdout, process
+
+    def _warn_once(self, key, message: str):
+        if key not in self._warned:
+            self._warned.add(key)
+            self.log(message, "WARNING")
+
+    def _to_row(self, table: Table, image: Dict[int, str]) -> tuple:
+        row = []
+        for position, column in enumerate(table.columns, start=1):
+            if position not in image:
+                self._warn_once((table.name, 'image'), f"{table.name}: binlog sem imagem completa da linha "
+                                                       "(use binlog_row_image=FULL). Colunas ausentes ficam NULL.")
+                row.append(None)
+                continue
+            if column.data_type in ('ENUM', 'SET') and not image[position].lstrip().startswith("'"):
+                self._warn_once((table.name, column.name), f"{table.name}.{column.name}: {column.data_type} no "
+                                                           "binlog em texto vem como índice numérico, não como rótulo.")
+            row.append(parse_binlog_value(image[position], column))
+        return tuple(row)
+
+    def _build_change(self, kind: str, table: Table, images: List[Dict[int, str]]) -> RowChange:
+        if kind == 'INSERT INTO':
+            return RowChange('insert', table.name, values=self._to_row(table, images[0]))
+        if kind == 'DELETE FROM':
+            return RowChange('delete', table.name, before=self._to_row(table, images[0]))
+        return RowChange('update', table.name, values=self._to_row(table, images[1]),
+                         before=self._to_row(table, images[0]))
+
+    def transactions(self) -> Iterator[BinlogTransaction]:
+        stream, process = self._open_lines()
+        current_file = self.log_file
+        event_at = 0
+        end_pos = 0
+        transaction: Optional[BinlogTransaction] = None
+        row_event = None  # (tipo, tabela ou None, [imagens])
+
+        def finish_row_event():
+            nonlocal row_event
+            if row_event is not None:
+                kind, table, images = row_event
+                row_event = None
+                if table is None:
+                    return
+                if transaction is None:
+                    self.skipped_changes += 1 # Alteração sem o BEGIN (posição inicial no meio da transação)
+                    return
+                transaction.changes.append(self._build_change(kind, table, images))
+
+        try:
+            for raw_line in stream:
+                line = raw_line.decode('utf-8', 'surrogateescape').rstrip('\r\n')
+                at_match = _AT_RE.match(line)
+                if at_match:
+                    finish_row_event()
+                    event_at = int(at_match.group(1))
+                    continue
+                skipping = self.start is not None and current_file == self.start.log_file and event_at < self.start.log_pos
+                header_match = _HEADER_RE.match(line)
+                if header_match:
+                    end_pos = int(header_match.group(1))
+                    rotate_match = _ROTATE_RE.search(line)
+                    if rotate_match and rotate_match.group(1) != current_file:
+                        current_file = rotate_match.group(1)
+                        event_at = 0
+                    continue
+                if skipping or line.startswith('#Q>'):
+                    continue
+
+                if line.startswith('###'):
+                    event_match = _ROW_EVENT_RE.match(line)
+                    if event_match:
+                        finish_row_event()
+                        kind, database, table_name = event_match.groups()
+                        table = self.tables.get(table_name) if database == self.database else None
+                        if table is None and database == self.database:
+                            self._warn_once(table_name, f"Alterações em {table_name} ignoradas (tabela não selecionada).")
+                        row_event = (kind, table, [])
+                    elif line.strip() in ('### SET', '### WHERE') and row_event is not None:
+                        row_event[2].append({})
+                    else:
+                        value_match = _ROW_VALUE_RE.match(line)
+                        if value_match and row_event is not None and row_event[2]:
+                            row_event[2][-1][int(value_match.group(1))] = value_match.group(2)
+                    continue
+                if line.startswith('#'):
+                    continue
+
+                finish_row_event()
+                statement = line.replace('/*!*/;', '').strip().upper()
+                if statement in ('BEGIN', 'START TRANSACTION'):
+                    transaction = BinlogTransaction(BinlogPosition(current_file, end_pos))
+                elif statement == 'COMMIT' or statement.startswith('COMMIT '):
+                    if transaction is not None:
+                        transaction.end_position = BinlogPosition(current_file, end_pos)
+                        yield transaction
+                    transaction = None
+                elif statement == 'ROLLBACK':
+                    transaction = None
+                elif statement.startswith(_DDL_PREFIXES):
+                    self.log(f"DDL no binlog ({current_file}:{event_at}) não é traduzido: {line.strip()[:120]}", "WARNING")
+        finally:
+            stream.close()
+            if process is not None:
+                process.wait()
+
+
+class LiveBinlogReader:
+    """Lê transações direto do servidor como uma réplica (mysql-replication).
+
+    Requer binlog_format=ROW, binlog_row_image=FULL e um usuário com REPLICATION SLAVE
+    e REPLICATION CLIENT. Com `blocking=False` para no fim do binlog atual; com
+    `blocking=True` segue esperando novos eventos até `should_continue` devolver False.
+    """
+
+    def __init__(self, source_config: Dict[str, Any], tables: Dict[str, Table], start: BinlogPosition,
+                 server_id: int = 4379, blocking: bool = False,
+                 should_continue: Optional[Callable[[], bool]] = None,
+                 log: Optional[Callable[[str, str], None]] = None):
+        if not REPLICATION_AVAILABLE:
+            raise RuntimeError("mysql-replication não está instalado (pip install mysql-replication)")
+        self.source_config = source_config
+        self.tables = tables
+        self.start = start
+        self.server_id = server_id
+        self.blocking = blocking
+        self.should_continue = should_continue or (lambda: True)
+        self.log = log or (lambda message, level="INFO": None)
+
+    def _to_row(self, table: Table, values: Dict[str, Any]) -> tuple:
+        row = []
+        for column in table.columns:
+            value = values.get(column.name)
+            if isinstance(value, str) and InsertPlan.value_kind(column) == 'boolean':
+                value = int(value, 2) # BIT chega como string de bits
+            row.append(value)
+        return tuple(row)
+
+    def transactions(self) -> Iterator[BinlogTransaction]:
+        config = self.source_config
+        stream = BinLogStreamReader(
+            connection_settings={
+                'host': config.get('source_host'),
+                'port': int(config.get('source_port', 3306)),
+                'user': config.get('source_user'),
+                'passwd': config.get('source_password'),
+            },
+            server_id=self.server_id,
+            log_file=self.start.log_file,
+            log_pos=self.start.log_pos,
+            resume_stream=True,
+            blocking=self.blocking,
+            only_schemas=[config.get('source_database')],
+            only_tables=list(self.tables),
+            only_events=[QueryEvent, XidEvent, RotateEvent, WriteRowsEvent, UpdateRowsEvent, DeleteRowsEvent],
+        )
+        transaction: Optional[BinlogTransaction] = None
+        try:
+            for event in stream:
+                if not self.should_continue():
+                    break
+                if isinstance(event, QueryEvent):
+                    query = event.query.strip().upper()
+                    if query in ('BEGIN', 'START TRANSACTION'):
+                        transaction = BinlogTransaction(BinlogPosition(stream.log_file, stream.log_pos))
+                    elif query == 'COMMIT' and transaction is not None: # Tabelas não transacionais
+                        transaction.end_position = BinlogPosition(stream.log_file, stream.log_pos)
+                        yield transaction
+                        transaction = None
+                    elif query.startswith(_DDL_PREFIXES):
+                        self.log(f"DDL no binlog ({stream.log_file}:{stream.log_pos}) não é traduzido: {event.query[:120]}", "WARNING")
+                elif isinstance(event, XidEvent):
+                    if transaction is not None:
+                        transaction.end_position = BinlogPosition(stream.log_file, stream.log_pos)
+                        yield transaction
+                    transaction = None
+                elif isinstance(event, (WriteRowsEvent, UpdateRowsEvent, DeleteRowsEvent)) and transaction is not None:
+                    table = self.tables.get(event.table)
+                    if table is None:
+                        continue
+                    for row in event.rows:
+                        if isinstance(event, WriteRowsEvent):
+                            change = RowChange('insert', table.name, values=self._to_row(table, row['values']))
+                        elif isinstance(event, DeleteRowsEvent):
+                            change = RowChange('delete', table.name, before=self._to_row(table, row['values']))
+                        else:
+                            change = RowChange('update', table.name, values=self._to_row(table, row['after_values']),
+                                               before=self._to_row(table, row['before_values']))
+                        transaction.changes.append(change)
+        finally:
+            stream.close()
+
+
+@dataclass
+class CDCRunResult:
+    start_position: BinlogPosition
+    end_position: BinlogPosition
+    transactions: int = 0
+    inserts: int = 0
+    updates: int = 0
+    deletes: int = 0
+    files: List[str] = field(default_factory=list)
+
+    def describe(self) -> str:
+        return (f"{self.transactions} transação(ões) de {self.start_position} até {self.end_position}: "
+                f"{self.inserts} INSERT, {self.updates} UPDATE, {self.deletes} DELETE")
+
+
+class BinlogCDC:
+    """Converte transações do binlog em scripts DML Informix ordenados.
+
+    Cada transação de origem vira um bloco BEGIN WORK/COMMIT WORK, na ordem do binlog.
+    Os arquivos se chamam CDC_<arquivo binlog>_<posição inicial>.sql, então aplicá-los
+    em ordem alfabética respeita a ordem das alterações. Depois de fechar cada arquivo
+    a posição final é gravada no BinlogPositionStore; a próxima execução continua dali.
+    """
+
+    FILE_PREFIX = "CDC_"
+
+    def __init__(self, tables: List[Table], output_directory: str, position_store: BinlogPositionStore,
+                 transactions_per_file: int = 10000,
+                 log: Optional[Callable[[str, str], None]] = None,
+                 should_continue: Optional[Callable[[], bool]] = None):
+        self.tables = {table.name: table for table in tables}
+        self.output_directory = output_directory
+        self.position_store = position_store
+        self.transactions_per_file = transactions_per_file
+        self.log = log or (lambda message, level="INFO": None)
+        self.should_continue = should_continue or (lambda: True)
+
+    def start_position(self, explicit: Optional[BinlogPosition] = None) -> BinlogPosition:
+        position = explicit or self.position_store.get()
+        if position is None:
+            raise RuntimeError("Posição inicial do binlog não informada e nenhuma posição gravada. "
+                               "Use a posição registrada no resumo da carga (SHOW MASTER STATUS).")
+        return position
+
+    def _filename(self, position: BinlogPosition) -> str:
+        return f"{self.FILE_PREFIX}{position.log_file}_{position.log_pos:012d}.sql"
+
+    def render_transaction(self, transaction: BinlogTransaction, result: CDCRunResult) -> str:
+        statements = []
+        for change in transaction.changes:
+            statements.extend(ChangePlan.for_table(self.tables[change.table_name]).render_change(change))
+            if change.kind == 'insert':
+                result.inserts += 1
+            elif change.kind == 'update':
+                result.updates += 1
+            else:
+                result.deletes += 1
+        if not statements:
+            return ""
+        return (f"-- binlog {transaction.end_position}\n"
+                "BEGIN WORK;\n" + "\n".join(statements) + "\nCOMMIT WORK;\n\n")
+
+    def run(self, reader, start: BinlogPosition) -> CDCRunResult:
+        """Consome `reader.transactions()` (lido a partir de `start`) e grava os scripts."""
+        os.makedirs(self.output_directory, exist_ok=True)
+        result = CDCRunResult(start_position=start, end_position=start)
+        current_file = None
+        file_start = start
+        in_file = 0
+
+        def close_file():
+            nonlocal current_file
+            if current_file is None:
+                return
+            current_file.close()
+            current_file = None
+            self.position_store.set(result.end_position)
+            self.position_store.save()
+
+        try:
+            for transaction in reader.transactions():
+                if not self.should_continue():
+                    self.log("CDC cancelado; posição salva na última transação gravada.", "WARNING")
+                    break
+                text = self.render_transaction(transaction, result)
+                if text:
+                    if current_file is None:
+                        filename = self._filename(file_start)
+                        current_file = open(os.path.join(self.output_directory, filename), 'w', encoding='utf-8')
+                        current_file.write(f"-- Alterações do binlog a partir de {file_start}\n")
+                        current_file.write(f"-- Gerado em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+                        result.files.append(filename)
+                    current_file.write(text)
+                    in_file += 1
+                    result.transactions += 1
+                elif current_file is None:
+                    file_start = transaction.end_position
+                result.end_position = transaction.end_position
+                if self.transactions_per_file and in_file >= self.transactions_per_file:
+                    close_file()
+                    file_start = result.end_position
+                    in_file = 0
+        finally:
+            close_file()
+            if result.end_position != start:
+                self.position_store.set(result.end_position)
+                self.position_store.save()
+
+        self.log(f"CDC: {result.describe()}", "SUCCESS" if result.transactions else "INFO")
+        return result
@@ -0,0 +1,151 @@
+# conversion_cache.py
+import hashlib
+import os
+import sqlite3
+import time
+from typing import List, Optional, Tuple
+
+
+class SQLConversionCache:
+    """Cache em disco das conversões do SQLConverter, comando a comando.
+
+    A chave é o SHA-256 do texto do comando junto com a versão das regras do
+    conversor (SQLConverter.RULES_VERSION): mudar uma regra invalida tudo sem
+    precisar apagar o arquivo. Cada entrada guarda o texto convertido, os alertas
+    e a contagem de itens. Quando o total passa de `max_bytes`, as entradas usadas
+    há mais tempo (LRU, com resolução de TOUCH_INTERVAL_SECONDS) são removidas até
+    sobrar EVICT_TO_FRACTION do limite.
+
+    Usa SQLite (biblioteca padrão) em vez de JSON como o cache de metadados: um dump
+    tem centenas de milhares de comandos, e os processos da conversão em lote
+    (SQLBatchConverter) leem e gravam o mesmo arquivo ao mesmo tempo. Uma conexão
+    por thread/processo; gravações ficam num buffer até flush().
+    """
+
+    FORMAT_VERSION = 2
+    DEFAULT_PATH = os.path.join('cache', 'conversion_cache.sqlite3')
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+    EVICT_TO_FRACTION = 0.9
+    FLUSH_EVERY = 10000             # Entradas novas/acessadas acumuladas antes de gravar
+    TOUCH_INTERVAL_SECONDS = 3600   # Acerto só regrava last_used se o anterior for mais velho que isso
+
+    def __init__(self, rules_version: str, path: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path or self.DEFAULT_PATH
+        self.rules_version = str(rules_version)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._pending: List[tuple] = []     # Entradas novas ainda não gravadas
+        self._touched: List[tuple] = []     # (last_used, key) de acertos, para o LRU
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, timeout=30)
+        self._open()
+
+    def _open(self):
+        connection = self._connection
+        connection.execute("PRAGMA journal_mode=WAL") # Leitores não esperam o processo que está gravando
+        connection.execute("PRAGMA synchronous=NORMAL") # Perder as últimas gravações numa queda só custa reconverter
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != self.FORMAT_VERSION:
+            connection.execute("DROP TABLE IF EXISTS conversions")
+            connection.execute(f"PRAGMA user_version = {self.FORMAT_VERSION}")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS conversions ("
+            " key BLOB PRIMARY KEY, rules_version TEXT NOT NULL, converted TEXT NOT NULL,"
+            " warnings TEXT NOT NULL, items INTEGER NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+            " WITHOUT ROWID")
+        # Sem índice em last_used: só a remoção (rara) ordena por ele, e o índice encareceria cada gravação
+        # Entradas de outras versões das regras nunca mais seriam usadas
+        connection.execute("DELETE FROM conversions WHERE rules_version <> ?", (self.rules_version,))
+        connection.commit()
+        self._total_bytes = self._stored_bytes()
+
+    def _stored_bytes(self) -> int:
+        return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM conversions").fetchone()[0]
+
+    def key(self, text: str) -> bytes:
+        return hashlib.sha256(f"{self.rules_version}\0{text}".encode('utf-8', 'surrogatepass')).digest()
+
+    def get(self, text: str) -> Optional[Tuple[str, list, int]]:
+        """(texto convertido, alertas, itens) de uma conversão anterior do mesmo comando, ou None."""
+        key = self.key(text)
+        row = self._connection.execute(
+            "SELECT converted, warnings, items, last_used FROM conversions WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        now = time.time()
+        if now - row[3] > self.TOUCH_INTERVAL_SECONDS:
+            self._touched.append((now, key))
+            if len(self._touched) >= self.FLUSH_EVERY:
+                self.flush()
+        return row[0], row[1].split("\n") if row[1] else [], row[2]
+
+    def put(self, text: str, converted: str, warnings: list, items: int):
+        warnings_text = "\n".join(warnings) # Alertas são de uma linha só
+        size = len(text) + len(converted) + len(warnings_text)
+        if size > self.max_bytes:
+            return # Um comando maior que o cache inteiro só expulsaria todo o resto
+        self._pending.append((self.key(text), self.rules_version, converted, warnings_text, items, size, time.time()))
+        self._total_bytes += size
+        if len(self._pending) >= self.FLUSH_EVERY:
+            self.flush()
+
+    def flush(self):
+        """Grava as entradas novas e os acessos pendentes; aplica o limite de tamanho."""
+        if not self._pending and not self._touched:
+            return
+        with self._connection:
+            if self._pending:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO conversions (key, rules_version, converted, warnings, items, size, last_used)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)", self._pending)
+            if self._touched:
+                self._connection.executemany("UPDATE conversions SET last_used = ? WHERE key = ?", self._touched)
+        self._pending, self._touched = [], []
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> int:
+        """Remove as entradas menos usadas até o total ficar abaixo do limite; devolve quantas saíram."""
+        self._total_bytes = self._stored_bytes() # Outros processos também gravam no arquivo
+        excess = self._total_bytes - int(self.max_bytes * self.EVICT_TO_FRACTION)
+        if self._total_bytes <= self.max_bytes or excess <= 0:
+            return 0
+        victims, freed = [], 0
+        for key, size in self._connection.execute("SELECT key, size FROM conversions ORDER BY last_used"):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        with self._connection:
+            self._connection.executemany("DELETE FROM conversions WHERE key = ?", victims)
+        self._total_bytes -= freed
+        self.evictions += len(victims)
+        return len(victims)
+
+    def clear(self):
+        self._pending, self._touched = [], []
+        with self._connection:
+            self._connection.execute("DELETE FROM conversions")
+        self._total_bytes = 0
+
+    def close(self):
+        self.flush()
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def describe(self) -> str:
+        total = self.hits + self.misses
+        rate = f" ({100.0 * self.hits / total:.0f}% de acerto)" if total else ""
+        return (f"{self.hits} comando(s) do cache, {self.misses} convertido(s){rate}, "
+                f"{self.evictions} entrada(s) removida(s), {self._total_bytes / (1024 * 1024):.1f} MB em cache")
@@ -0,0 +1,169 @@
+# informix_loader.py
+import os
+import sqlite3
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Callable
+
+from migration_logic import Table, MariaDBExtractor, MariaDBConnectionPool, ParameterPlan
+
+try:
+    import IfxPyDbi  # Interface DB-API 2.0 do pacote IfxPy
+    INFORMIX_DBAPI_AVAILABLE = True
+except ImportError:
+    INFORMIX_DBAPI_AVAILABLE = False
+    print("AVISO: IfxPyDbi não encontrado. Carga direta no Informix indisponível (use os scripts gerados).")
+    print("Instale com: pip install IfxPy (requer o IBM Informix Client SDK)")
+
+
+def connect_dsn(dsn: str):
+    """Conexão DB-API a partir de uma DSN da linha de comando.
+
+    'sqlite:///caminho.db' abre um SQLite local (destino de teste); qualquer outra
+    string vai para o IfxPy como está (SERVER=...;DATABASE=...;HOST=...;SERVICE=...;UID=...).
+    Se a DSN não tiver PWD, a senha vem da variável de ambiente INFORMIX_PASSWORD.
+    """
+    if dsn.startswith('sqlite:///'):
+        # check_same_thread=False: a conexão é aberta pelo worker que a usa, mas fechada no finally dele
+        return sqlite3.connect(dsn[len('sqlite:///'):], check_same_thread=False, timeout=30)
+    if not INFORMIX_DBAPI_AVAILABLE:
+        raise RuntimeError("IfxPyDbi não está instalado (pip install IfxPy)")
+    if 'PWD=' not in dsn.upper() and os.environ.get('INFORMIX_PASSWORD'):
+        dsn = f"{dsn.rstrip(';')};PWD={os.environ['INFORMIX_PASSWORD']}"
+    try:
+        return IfxPyDbi.connect(dsn, "", "")
+    except Exception as e:
+        raise RuntimeError(f"Erro ao conectar ao Informix ({dsn.split(';')[0]}): {str(e)}")
+
+
+@dataclass
+class DirectLoadOptions:
+    batch_size: int = 1000              # Linhas buscadas na origem e enviadas por executemany
+    commit_every: int = 10000           # Linhas por transação no destino
+    workers: int = 4                    # Tabelas carregadas em paralelo (uma conexão de cada lado por worker)
+    extraction_mode: str = 'paged'      # 'paged' (keyset/offset) ou 'stream'
+
+
+@dataclass
+class TableLoadResult:
+    table_name: str
+    rows: int = 0                       # Linhas confirmadas (COMMIT) no destino
+    commits: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+class InformixDirectLoader:
+    """Carga direta MariaDB -> Informix, sem passar por arquivos de script.
+
+    Cada worker pega uma tabela, lê os lotes com uma conexão do MariaDBConnectionPool
+    e os grava no destino com um INSERT preparado e `executemany`, fazendo COMMIT a
+    cada `commit_every` linhas. Os valores vão como parâmetros tipados (ParameterPlan),
+    sem virar literais SQL; as colunas são as mesmas dos scripts (auto_increment fica
+    para o SERIAL). As tabelas já precisam existir no destino (00_CREATE_TABLES_ALL.sql).
+
+    `connect_target` devolve uma conexão DB-API nova com paramstyle 'qmark'
+    (connect_dsn com a DSN do --direct-load, ou sqlite3 em testes).
+    """
+
+    def __init__(self, source_config: Dict[str, Any], connect_target: Callable[[], Any],
+                 options: DirectLoadOptions,
+                 log: Optional[Callable[[str, str], None]] = None,
+                 should_continue: Optional[Callable[[], bool]] = None,
+                 on_table_done: Optional[Callable[[TableLoadResult], None]] = None):
+        self.source_config = source_config
+        self.connect_target = connect_target
+        self.options = options
+        self.log = log or (lambda message, level="INFO": None)
+        self.should_continue = should_continue or (lambda: True)
+        self.on_table_done = on_table_done or (lambda result: None)
+        self._records_lock = threading.Lock()
+        self.total_records = 0
+
+    def run(self, tables: List[Table]) -> List[TableLoadResult]:
+        """Carrega as tabelas e devolve os resultados na ordem de `tables`."""
+        workers = max(1, min(self.options.workers, len(tables) or 1))
+        pool = MariaDBConnectionPool(self.source_config, workers)
+        results: List[Optional[TableLoadResult]] = [None] * len(tables)
+        self.log(f"Carga direta de {len(tables)} tabela(s) com {workers} worker(s).", "INFO")
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="carga") as executor:
+                futures = {executor.submit(self._load_worker, table, pool): i for i, table in enumerate(tables)}
+                for future in as_completed(futures):
+                    result = future.result()
+                    results[futures[future]] = result
+                    self.on_table_done(result)
+        finally:
+            pool.close_all()
+            self.log("Conexões MariaDB fechadas.", "INFO")
+        return [result for result in results if result is not None]
+
+    def _load_worker(self, table: Table, pool: MariaDBConnectionPool) -> TableLoadResult:
+        if not self.should_continue():
+            return TableLoadResult(table.name, error="Cancelado antes de iniciar")
+        try:
+            extractor = pool.acquire()
+        except Exception as e_source:
+            return TableLoadResult(table.name, error=f"Conexão MariaDB: {e_source}")
+        target = None
+        try:
+            target = self.connect_target()
+            return self.load_table(table, extractor, target)
+        except Exception as e_target:
+            self.log(f"{table.name}: falha na conexão com o destino: {e_target}", "ERROR")
+            return TableLoadResult(table.name, error=str(e_target))
+        finally:
+            pool.release(extractor)
+            if target is not None:
+                target.close()
+
+    def load_table(self, table: Table, extractor: MariaDBExtractor, target) -> TableLoadResult:
+        options = self.options
+        plan = ParameterPlan.for_table(table)
+        result = TableLoadResult(table.name)
+        if not plan.column_names:
+            self.log(f"{table.name}: só colunas auto_increment; nada a carregar.", "WARNING")
+            return result
+
+        strategy = 'stream' if options.extraction_mode == 'stream' else None
+        started = time.perf_counter()
+        cursor = target.cursor()
+        pending = 0
+        try:
+            for batch in extractor.iter_table_batches(table, options.batch_size, strategy):
+                if not self.should_continue():
+                    result.error = "Cancelado pelo usuário"
+                    break
+                cursor.executemany(plan.sql, plan.batch_parameters(batch))
+                pending += len(batch)
+                if pending >= options.commit_every:
+                    target.commit()
+                    result.commits += 1
+                    result.rows += pending
+                    pending = 0
+            if result.error:
+                target.rollback()
+            else:
+                target.commit()
+                result.commits += 1
+                result.rows += pending
+        except Exception as e:
+            result.error = str(e)
+            try:
+                target.rollback()
+            except Exception:
+                pass
+        finally:
+            cursor.close()
+            result.seconds = time.perf_counter() - started
+
+        with self._records_lock:
+            self.total_records += result.rows
+        if result.error:
+            self.log(f"{table.name}: carga interrompida com {result.rows} linha(s) já confirmada(s): {result.error}", "ERROR")
+        else:
+            self.log(f"{table.name}: {result.rows} linha(s) carregada(s) em {result.seconds:.1f}s "
+                     f"({result.commits} COMMIT(s)).", "SUCCESS")
+        return result
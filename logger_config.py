@@ -1,6 +1,8 @@
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 def setup_logger():
     # Cria o diretório logs se não existir
@@ -47,3 +49,36 @@ def setup_logger():
     logger.info("="*50)
 
     return logger
+
+
+def setup_migration_logger(log_dir='logs', max_bytes=5 * 1024 * 1024, backup_count=5,
+                           console_stream=None, console_level=logging.DEBUG):
+    """Logger do Migrador com gravação em segundo plano.
+
+    O logger só enfileira os registros (QueueHandler); uma QueueListener grava no
+    console e num arquivo com rotação por tamanho, fora da thread que chamou o log.
+    As mensagens chegam já formatadas por MigrationApp.log_message (ou pela CLI).
+    O console usa stderr, a menos que `console_stream` seja informado.
+    Retorna (logger, listener); chame listener.stop() ao encerrar para esvaziar a fila.
+    """
+    if not os.path.exists(log_dir):
+        os.makedirs(log_dir)
+
+    log_file = os.path.join(log_dir, 'migrador.log')
+    file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+    console_handler = logging.StreamHandler(console_stream)
+    console_handler.setLevel(console_level)
+    message_only = logging.Formatter('%(message)s')
+    file_handler.setFormatter(message_only)
+    console_handler.setFormatter(message_only)
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+
+    logger = logging.getLogger('Migrador')
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.handlers = [QueueHandler(log_queue)]
+
+    listener.start()
+    return logger, listener
@@ -1,367 +1,61 @@
 import tkinter as tk
-import os
 import json
+import logging
+import queue
 import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
-
-# Database connectors
-try:
-    import mysql.connector
-    MYSQL_AVAILABLE = True
-except ImportError:
-    MYSQL_AVAILABLE = False
-    print("AVISO: mysql-connector-python não encontrado. Funcionalidades MariaDB serão limitadas.")
-    print("Instale com: pip install mysql-connector-python")
-
-try:
-    import ifxpy  # Para Informix
-    INFORMIX_AVAILABLE = True
-except ImportError:
-    INFORMIX_AVAILABLE = False
-    print("AVISO: ifxpy não encontrado. Funcionalidades Informix (conexão direta) serão limitadas.")
-    print("Instale com: pip install ifxpy")
-    print("Lembre-se que ifxpy requer o driver do Informix (IBM Informix Client SDK) instalado e configurado no sistema.")
-
-@dataclass
-class Column:
-    name: str
-    data_type: str
-    max_length: Optional[int] = None
-    is_nullable: bool = True
-    default_value: Optional[str] = None
-    is_primary_key: bool = False
-    is_auto_increment: bool = False
-
-@dataclass
-class Table:
-    name: str
-    columns: List[Column]
-    row_count: int = 0
-
-@dataclass
-class MigrationConfig:
-    source_host: str
-    source_port: int
-    source_database: str
-    source_user: str
-    source_password: str
-    target_host: str
-    target_port: int
-    target_database: str
-    target_user: str
-    target_password: str
-    selected_tables: List[str]
-    migrate_data: bool = True
-    batch_size: int = 1000
-
-class TypeMapper:
-    """Mapeia tipos MariaDB para Informix"""
-
-    MARIADB_TO_INFORMIX = {
-        'TINYINT': 'SMALLINT',
-        'SMALLINT': 'SMALLINT',
-        'MEDIUMINT': 'INTEGER',
-        'INT': 'INTEGER',
-        'INTEGER': 'INTEGER',
-        'BIGINT': 'BIGINT',
-        'DECIMAL': 'DECIMAL',
-        'NUMERIC': 'DECIMAL',
-        'FLOAT': 'REAL', # MariaDB FLOAT is single-precision
-        'DOUBLE': 'FLOAT', # MariaDB DOUBLE is double-precision, maps to Informix FLOAT
-        'REAL': 'FLOAT', # MariaDB REAL is an alias for DOUBLE
-        'BIT': 'BOOLEAN',
-        'BOOL': 'BOOLEAN',
-        'BOOLEAN': 'BOOLEAN',
-        'CHAR': 'CHAR',
-        'VARCHAR': 'VARCHAR',
-        'BINARY': 'BYTE',
-        'VARBINARY': 'BYTE',
-        'TINYBLOB': 'BYTE',
-        'BLOB': 'BYTE',
-        'MEDIUMBLOB': 'BYTE',
-        'LONGBLOB': 'BYTE',
-        'TINYTEXT': 'LVARCHAR',
-        'TEXT': 'TEXT',
-        'MEDIUMTEXT': 'TEXT',
-        'LONGTEXT': 'TEXT',
-        'ENUM': 'VARCHAR', # Needs careful handling of length
-        'SET': 'VARCHAR',  # Needs careful handling of length
-        'DATE': 'DATE',
-        'TIME': 'DATETIME HOUR TO SECOND',
-        'DATETIME': 'DATETIME YEAR TO SECOND',
-        'TIMESTAMP': 'DATETIME YEAR TO SECOND',
-        'YEAR': 'SMALLINT', # Informix doesn't have a YEAR type, SMALLINT is a common mapping
-        'JSON': 'LVARCHAR' # Or JSON/BSON type if Informix version supports it and driver handles it
-    }
-
-    @classmethod
-    def map_type(cls, mariadb_type: str, length: Optional[int] = None, precision: Optional[int] = None, scale: Optional[int] = None) -> str:
-        base_type = mariadb_type.upper().split('(')[0]  # Remove any size/precision from type name
-        informix_type = cls.MARIADB_TO_INFORMIX.get(base_type)
-        
-        if not informix_type:
-            return 'VARCHAR(255)'  # Default fallback type
-            
-        # Add length/precision/scale where appropriate
-        if base_type in ['CHAR', 'VARCHAR', 'BINARY', 'VARBINARY']:
-            length = length or 255  # Default length if none specified
-            return f"{informix_type}({length})"
-        elif base_type in ['DECIMAL', 'NUMERIC']:
-            p = precision or 10  # Default precision
-            s = scale or 0      # Default scale
-            return f"{informix_type}({p},{s})"
-        
-        return informix_type
-
-
-class MariaDBExtractor:
-    def __init__(self):
-        self.connection = None
-
-    def connect(self, config: Dict[str, Any]) -> bool:
-        if not MYSQL_AVAILABLE:
-            raise RuntimeError("MySQL connector não está disponível")
-        try:
-            self.connection = mysql.connector.connect(
-                host=config['source_host'],
-                port=config['source_port'],
-                database=config['source_database'],
-                user=config['source_user'],
-                password=config['source_password']
-            )
-            return True
-        except mysql.connector.Error as e:
-            raise RuntimeError(f"Erro ao conectar ao MariaDB: {str(e)}")
-        except Exception as e:
-            raise RuntimeError(f"Erro inesperado: {str(e)}")
-
-    def get_tables(self) -> List[str]:
-        if not self.connection:
-            raise RuntimeError("Não conectado ao banco de dados")
-        cursor = self.connection.cursor()
-        cursor.execute("SHOW FULL TABLES WHERE Table_Type = 'BASE TABLE'") # Ignora views
-        tables = [table[0] for table in cursor.fetchall()]
-        cursor.close()
-        return tables
-
-    def get_table_info(self, table_name: str) -> Table:
-        if not self.connection:
-            raise RuntimeError("Não conectado ao banco de dados")
-        cursor = self.connection.cursor()
-
-        # Obter estrutura da tabela
-        cursor.execute(f"DESCRIBE `{table_name}`")
-        columns_info_raw = cursor.fetchall()
-
-        # Obter informações mais detalhadas de INFORMATION_SCHEMA
-        cursor.execute("""
-            SELECT COLUMN_NAME, DATA_TYPE, CHARACTER_MAXIMUM_LENGTH,
-                   NUMERIC_PRECISION, NUMERIC_SCALE, IS_NULLABLE,
-                   COLUMN_DEFAULT, COLUMN_KEY, EXTRA
-            FROM INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
-            ORDER BY ORDINAL_POSITION
-        """, (table_name,))
-        schema_columns_info = {row[0]: row for row in cursor.fetchall()}
-
-        columns = []
-        for col_raw in columns_info_raw:
-            field_name = col_raw[0]
-            schema_info = schema_columns_info[field_name]
-            
-            column = Column(
-                name=field_name,
-                data_type=schema_info[1].upper(),
-                max_length=schema_info[2],
-                is_nullable=schema_info[5] == 'YES',
-                default_value=schema_info[6],
-                is_primary_key=col_raw[3] == 'PRI',
-                is_auto_increment='auto_increment' in col_raw[5].lower() if col_raw[5] else False
-            )
-            columns.append(column)
-
-        # Obter contagem de registros
-        cursor.execute(f"SELECT COUNT(*) FROM `{table_name}`")
-        row_count = cursor.fetchone()[0]
-
-        cursor.close()
-        return Table(name=table_name, columns=columns, row_count=row_count)
-
-    def get_table_data(self, table_name: str, batch_size: int, offset: int) -> List[Dict]:
-        if not self.connection:
-            raise RuntimeError("Não conectado ao banco de dados")
-        
-        cursor = self.connection.cursor(dictionary=True, buffered=True)
-        query = f"SELECT * FROM `{table_name}` LIMIT %s OFFSET %s"
-        
-        try:
-            cursor.execute(query, (batch_size, offset))
-            data = cursor.fetchall()
-            return data
-        except mysql.connector.Error as e:
-            raise RuntimeError(f"Erro ao obter dados da tabela {table_name}: {str(e)}")
-        finally:
-            cursor.close()
-
-    def close(self):
-        if self.connection and self.connection.is_connected():
-            self.connection.close()
-
-class InformixGenerator:
-    @staticmethod
-    def generate_create_table(table: Table) -> str:
-        sql_parts = [f"CREATE TABLE {table.name} ("]
-        column_definitions = []
-        for column in table.columns:
-            # Passar precisão e escala para o TypeMapper
-            informix_type = TypeMapper.map_type(
-                column.data_type,
-                column.max_length,
-                getattr(column, 'precision', None),
-                getattr(column, 'scale', None)
-            )
-            col_def = f"    {column.name} {informix_type}"
-
-            if column.is_auto_increment:
-                if informix_type == 'BIGINT':
-                    col_def += " BIGSERIAL"
-                else:
-                    col_def += " SERIAL"
-            
-            if not column.is_nullable:
-                col_def += " NOT NULL"
-
-            if not column.is_auto_increment and column.default_value is not None:
-                if column.data_type.upper() in ['VARCHAR', 'CHAR', 'TEXT', 'LVARCHAR', 'ENUM', 'SET', 'JSON', 'DATE', 'TIME', 'DATETIME', 'TIMESTAMP']:
-                    if str(column.default_value).upper() in ("CURRENT_TIMESTAMP", "NOW()"):
-                         col_def += " DEFAULT CURRENT YEAR TO SECOND"
-                    elif str(column.default_value).upper() == "NULL":
-                        pass
-                    else:
-                        default_val = str(column.default_value).replace("'", "''")
-                        col_def += f" DEFAULT '{default_val}'"
-                elif column.data_type.upper() in ['BIT', 'BOOL', 'BOOLEAN']:
-                    if str(column.default_value).lower() in ['1', 'true', 't']:
-                        col_def += " DEFAULT 't'"
-                    elif str(column.default_value).lower() in ['0', 'false', 'f']:
-                        col_def += " DEFAULT 'f'"
-                else:
-                    try:
-                        num_val = float(column.default_value)
-                        col_def += f" DEFAULT {num_val}"
-                    except (ValueError, TypeError):
-                         if str(column.default_value).upper() != "NULL":
-                            default_val = str(column.default_value).replace("'", "''")
-                            col_def += f" DEFAULT '{default_val}'"
-
-            column_definitions.append(col_def)
-
-        pk_columns = [col.name for col in table.columns if col.is_primary_key]
-        if pk_columns:
-            column_definitions.append(f"    PRIMARY KEY ({', '.join(pk_columns)})")
-
-        sql_parts.append(',\n'.join(column_definitions))
-        sql_parts.append(");")
-
-        return '\n'.join(sql_parts)
-
-
-    @staticmethod
-    def generate_insert_statements(table: Table, data: List[Dict]) -> List[str]:
-        if not data:
-            return []
-
-        statements = []
-        # Colunas para INSERT não devem incluir as auto_increment (SERIAL/BIGSERIAL)
-        columns_for_insert = [col.name for col in table.columns if not col.is_auto_increment]
-        
-        if not columns_for_insert: # Caso todas as colunas sejam auto_increment (raro, mas possível)
-            # Informix requer `INSERT INTO table VALUES (0)` or `DEFAULT` for single SERIAL column
-            # Se houver múltiplas colunas SERIAL, a sintaxe de INSERT pode ser mais complexa
-            # ou a tabela pode não ser populável diretamente desta forma.
-            # Para este caso simplificado, se não há colunas não-SERIAL, não geramos INSERTs.
-            # Ou, se for uma única coluna SERIAL, pode-se usar:
-            # if len(table.columns) == 1 and table.columns[0].is_auto_increment:
-            #     for _ in data: # data aqui seria apenas para contar quantos inserts
-            #         statements.append(f"INSERT INTO {table.name} ({table.columns[0].name}) VALUES (0);") # Ou DEFAULT
-            return []
-
-
-        for row in data:
-            values = []
-            for col_name in columns_for_insert:
-                value = row.get(col_name) # MariaDB connector com dictionary=True retorna dict
-                
-                # Encontrar o tipo da coluna MariaDB para formatação correta
-                source_column_type = ""
-                for col_obj in table.columns:
-                    if col_obj.name == col_name:
-                        source_column_type = col_obj.data_type.upper()
-                        break
+from typing import Dict, List, Optional
 
-                if value is None:
-                    values.append('NULL')
-                elif isinstance(value, datetime):
-                    # Handle all datetime types in one block
-                    if hasattr(value, 'hour') and hasattr(value, 'minute'):  # Has time component
-                        if hasattr(value, 'year'):  # Full datetime
-                            values.append(f"'{value.strftime('%Y-%m-%d %H:%M:%S')}'") # DATETIME YEAR TO SECOND
-                        else:  # Just time
-                            values.append(f"'{value.strftime('%H:%M:%S')}'") # DATETIME HOUR TO SECOND
-                    else:  # Just date
-                        values.append(f"'{value.strftime('%Y-%m-%d')}'") # DATE
-                elif isinstance(value, (bytes, bytearray)):
-                    # Para BYTE/VARBYTE no Informix, usaremos a função HEX() para scripts puros SQL.
-                    # Isso é uma abordagem simplificada que funciona para scripts SQL.
-                    hex_value = value.hex()
-                    # Para tamanhos grandes, dividimos em chunks para evitar problemas com linha muito longa
-                    max_chunk = 1000  # Tamanho máximo por linha de SQL
-                    if len(hex_value) > max_chunk:
-                        chunks = [hex_value[i:i+max_chunk] for i in range(0, len(hex_value), max_chunk)]
-                        concat = "DECODE(" + " || ".join(f"'{chunk}'" for chunk in chunks) + ", 'hex')"
-                        values.append(concat)
-                    else:
-                        values.append(f"DECODE('{hex_value}', 'hex')")
-                elif isinstance(value, str):
-                    escaped_value = value.replace("'", "''") # Escapar aspas simples
-                    values.append(f"'{escaped_value}'")
-                elif isinstance(value, (int, float)):
-                    values.append(str(value))
-                elif source_column_type == 'BIT' or source_column_type == 'BOOLEAN': # MariaDB BIT(1) ou BOOL
-                    values.append("'t'" if value else "'f'") # Informix BOOLEAN 't' ou 'f'
-                else:
-                    # Fallback para outros tipos, tentando converter para string e escapar
-                    escaped_value = str(value).replace("'", "''")
-                    values.append(f"'{escaped_value}'")
-
-            sql = f"INSERT INTO {table.name} ({', '.join(columns_for_insert)}) VALUES ({', '.join(values)});"
-            statements.append(sql)
-
-        return statements
+from migration_logic import (
+    MYSQL_AVAILABLE,
+    Table, TypeMapper, MariaDBExtractor, format_row_count,
+    ScriptGenerationOptions, ScriptGenerator,
+)
+from informix_loader import INFORMIX_DBAPI_AVAILABLE
+from metadata_cache import SchemaMetadataCache
+from logger_config import setup_migration_logger
 
 class MigrationApp:
+    UI_POLL_MS = 50             # Intervalo da fila de atualizações vindas das threads de fundo
+    TABLES_CHUNK_SIZE = 50      # Tabelas por bloco mostrado na Treeview durante o carregamento
+    LOG_FLUSH_MS = 200          # Intervalo em que as mensagens enfileiradas vão para o widget de log
+    LOG_MAX_LINES = 5000        # Linhas mantidas no widget; o log completo fica em logs/migrador.log
+    LOG_LEVELS = {"DEBUG": logging.DEBUG, "WARNING": logging.WARNING, "ERROR": logging.ERROR, "CRITICAL": logging.CRITICAL}
+
     def __init__(self, root):
         self.root = root
         self.root.title("Migrador MariaDB para Informix (Gerador de Scripts)")
         self.root.geometry("1000x700")
 
-        self.extractor = MariaDBExtractor()
         self.tables_info: Dict[str, Table] = {} # type hint
         self.migration_running = False
 
+        # Conexões e leitura de metadados rodam fora da thread do Tk; os resultados
+        # voltam pela ui_queue e são aplicados na thread principal por _process_ui_queue.
+        self.background = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gui-bg")
+        self.ui_queue: queue.Queue = queue.Queue()
+        self.load_cancel_event: Optional[threading.Event] = None
+
+        # log_message pode ser chamado de qualquer thread: só enfileira. O widget é
+        # atualizado em lote por _flush_log e o arquivo/console pela QueueListener.
+        self.logger, self.log_listener = setup_migration_logger()
+        self.log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._pending_progress: Optional[str] = None
+
         self.setup_ui()
+        self.root.after(self.UI_POLL_MS, self._process_ui_queue)
+        self.root.after(self.LOG_FLUSH_MS, self._flush_log)
         self.check_dependencies() # Chamada aqui para logar no terminal cedo
 
     def check_dependencies(self):
         python_missing = []
         if not MYSQL_AVAILABLE:
             python_missing.append("mysql-connector-python")
-        if not INFORMIX_AVAILABLE:
-            python_missing.append("pyodbc")
+        if not INFORMIX_DBAPI_AVAILABLE:
+            python_missing.append("IfxPy")
 
         print("\n--- Verificação de Dependências ---")
         if python_missing:
@@ -369,31 +63,30 @@ class MigrationApp:
             msg_gui = (
                 f"Bibliotecas Python não encontradas:\n{', '.join(python_missing)}\n\n"
                 f"Instale com: {install_command}\n\n"
-                "Adicionalmente, para conectar ao Informix via pyodbc (se a migração direta fosse implementada aqui), "
-                "o driver IBM Informix ODBC (parte do Client SDK/CSDK) deve estar instalado e configurado no sistema."
+                "A geração de scripts só precisa do mysql-connector-python. O IfxPy (IfxPyDbi) é usado pela "
+                "carga direta no Informix (migration_cli.py --direct-load) e requer o IBM Informix Client SDK "
+                "(CSDK) instalado e configurado no sistema."
             )
             msg_terminal = (
                 f"AVISO: Bibliotecas Python não encontradas: {', '.join(python_missing)}.\n"
                 f"Tente instalar com: {install_command}\n"
-                "Lembre-se: Para o pyodbc se conectar ao Informix, o driver IBM Informix ODBC "
-                "(parte do Client SDK/CSDK) precisa estar instalado e configurado no seu sistema operacional. "
-                "Esta aplicação não pode instalá-lo para você. A migração direta para Informix NÃO está implementada, apenas geração de scripts."
+                "Lembre-se: o IfxPy (IfxPyDbi), usado pela carga direta (migration_cli.py --direct-load), precisa do "
+                "IBM Informix Client SDK (CSDK) instalado e configurado no seu sistema operacional. "
+                "Esta aplicação não pode instalá-lo para você. Sem ele continua disponível a geração de scripts."
             )
             messagebox.showwarning("Dependências Ausentes", msg_gui)
             print(msg_terminal)
         else:
-            print("INFO: As bibliotecas Python mysql-connector-python e pyodbc foram encontradas.")
-            print("INFO: Esta aplicação foca na GERAÇÃO DE SCRIPTS SQL. A conexão direta com Informix (usando pyodbc)\n"
-                  "      para executar os scripts não está implementada aqui. Para isso, o IBM Informix Client SDK (ODBC driver)\n"
-                  "      deve estar instalado e configurado no sistema onde os scripts seriam executados (ex: com dbaccess ou uma ferramenta Python).")
+            print("INFO: As bibliotecas Python mysql-connector-python e IfxPy foram encontradas.")
+            print("INFO: A GUI gera scripts SQL; a carga direta no Informix (IfxPyDbi, sem arquivos intermediários)\n"
+                  "      é feita por linha de comando: python migration_cli.py config.json --direct-load \"SERVER=...;DATABASE=...\".")
 
         if not MYSQL_AVAILABLE:
             print("PROBLEMA POTENCIAL: Conexão com MariaDB e extração de dados falhará sem 'mysql-connector-python'.")
-        # Como o foco é geração de scripts, a ausência de pyodbc é menos crítica para a funcionalidade principal,
-        # mas ainda é bom avisar se o usuário espera conexão direta.
-        if not INFORMIX_AVAILABLE:
-            print("AVISO: A biblioteca 'pyodbc' não foi encontrada. Se uma funcionalidade de conexão direta com Informix fosse adicionada, ela não funcionaria.\n"
-                  "       Mesmo com 'pyodbc', a conexão falharia sem o driver ODBC do Informix instalado no sistema.")
+        # A geração de scripts não depende do IfxPy; só a carga direta pelo migration_cli.py
+        if not INFORMIX_DBAPI_AVAILABLE:
+            print("AVISO: A biblioteca 'IfxPy' (IfxPyDbi) não foi encontrada. A carga direta (migration_cli.py --direct-load) não funcionará;\n"
+                  "       mesmo com ela instalada, a conexão precisa do IBM Informix Client SDK no sistema.")
         print("-----------------------------------\n")
 
 
@@ -474,6 +167,25 @@ class MigrationApp:
         self.migrate_data_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(options_frame, text="Gerar scripts de DADOS (INSERTs)",
                        variable=self.migrate_data_var).pack(anchor=tk.W, padx=5, pady=2)
+        self.resume_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options_frame, text="Retomar geração anterior (checkpoint no diretório de saída)",
+                       variable=self.resume_var).pack(anchor=tk.W, padx=5, pady=2)
+
+        delta_frame = ttk.Frame(options_frame)
+        delta_frame.pack(fill=tk.X, padx=5, pady=2, anchor=tk.W)
+        self.delta_mode_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(delta_frame, text="Modo delta (só linhas novas/alteradas). Colunas de alteração:",
+                        variable=self.delta_mode_var).pack(side=tk.LEFT)
+        self.delta_columns_entry = ttk.Entry(delta_frame, width=25)
+        self.delta_columns_entry.insert(0, "updated_at, data_alteracao")
+        self.delta_columns_entry.pack(side=tk.LEFT, padx=5)
+        self.delta_output_var = tk.StringVar(value="auto")
+        ttk.Radiobutton(delta_frame, text="Automático (MERGE com coluna de data)", value="auto",
+                        variable=self.delta_output_var).pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(delta_frame, text="INSERT", value="insert",
+                        variable=self.delta_output_var).pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(delta_frame, text="MERGE (upsert pela PK)", value="upsert",
+                        variable=self.delta_output_var).pack(side=tk.LEFT, padx=5)
 
         batch_frame = ttk.Frame(options_frame)
         batch_frame.pack(fill=tk.X, padx=5, pady=2, anchor=tk.W)
@@ -482,12 +194,102 @@ class MigrationApp:
         self.batch_size_entry.insert(0, "1000")
         self.batch_size_entry.pack(side=tk.LEFT, padx=5)
 
+        mode_frame = ttk.Frame(options_frame)
+        mode_frame.pack(fill=tk.X, padx=5, pady=2, anchor=tk.W)
+        ttk.Label(mode_frame, text="Modo de extração:").pack(side=tk.LEFT)
+        self.extraction_mode_var = tk.StringVar(value="paged")
+        ttk.Radiobutton(mode_frame, text="Paginado (keyset / LIMIT-OFFSET)", value="paged",
+                        variable=self.extraction_mode_var).pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(mode_frame, text="Streaming (um SELECT, cursor não bufferizado)", value="stream",
+                        variable=self.extraction_mode_var).pack(side=tk.LEFT, padx=5)
+
+        count_frame = ttk.Frame(options_frame)
+        count_frame.pack(fill=tk.X, padx=5, pady=2, anchor=tk.W)
+        ttk.Label(count_frame, text="Contagem de registros ao carregar tabelas:").pack(side=tk.LEFT)
+        self.row_count_mode_var = tk.StringVar(value="approximate")
+        ttk.Radiobutton(count_frame, text="Exata (COUNT(*))", value="exact",
+                        variable=self.row_count_mode_var).pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(count_frame, text="Aproximada (estatísticas)", value="approximate",
+                        variable=self.row_count_mode_var).pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(count_frame, text="Sob demanda (não contar)", value="lazy",
+                        variable=self.row_count_mode_var).pack(side=tk.LEFT, padx=5)
+        self.use_metadata_cache_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(count_frame, text="Cache local de metadados",
+                        variable=self.use_metadata_cache_var).pack(side=tk.LEFT, padx=10)
+
+        insert_frame = ttk.Frame(options_frame)
+        insert_frame.pack(fill=tk.X, padx=5, pady=2, anchor=tk.W)
+        ttk.Label(insert_frame, text="Formato dos INSERTs:").pack(side=tk.LEFT)
+        self.insert_mode_var = tk.StringVar(value="single")
+        ttk.Radiobutton(insert_frame, text="Um INSERT por linha", value="single",
+                        variable=self.insert_mode_var).pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(insert_frame, text="Agrupado (INSERT ... SELECT ... UNION ALL)", value="union",
+                        variable=self.insert_mode_var).pack(side=tk.LEFT, padx=5)
+        ttk.Label(insert_frame, text="Linhas por INSERT:").pack(side=tk.LEFT, padx=(10, 0))
+        self.rows_per_insert_entry = ttk.Entry(insert_frame, width=6)
+        self.rows_per_insert_entry.insert(0, "100")
+        self.rows_per_insert_entry.pack(side=tk.LEFT, padx=5)
+
+        format_frame = ttk.Frame(options_frame)
+        format_frame.pack(fill=tk.X, padx=5, pady=2, anchor=tk.W)
+        ttk.Label(format_frame, text="Formato dos dados:").pack(side=tk.LEFT)
+        self.data_format_var = tk.StringVar(value="sql")
+        ttk.Radiobutton(format_frame, text="Scripts SQL (INSERT)", value="sql",
+                        variable=self.data_format_var).pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(format_frame, text="Arquivos UNLOAD (.unl) + LOAD", value="unload",
+                        variable=self.data_format_var).pack(side=tk.LEFT, padx=5)
+
+        output_frame = ttk.Frame(options_frame)
+        output_frame.pack(fill=tk.X, padx=5, pady=2, anchor=tk.W)
+        ttk.Label(output_frame, text="Compressão dos scripts DML:").pack(side=tk.LEFT)
+        self.compression_var = tk.StringVar(value="none")
+        ttk.Combobox(output_frame, textvariable=self.compression_var, values=("none", "gzip", "zstd", "lz4"),
+                     state="readonly", width=6).pack(side=tk.LEFT, padx=5)
+        ttk.Label(output_frame, text="Dividir arquivos de dados a cada (MB, 0 = não dividir):").pack(side=tk.LEFT, padx=(10, 0))
+        self.chunk_size_entry = ttk.Entry(output_frame, width=6)
+        self.chunk_size_entry.insert(0, "0")
+        self.chunk_size_entry.pack(side=tk.LEFT, padx=5)
+
+        workers_frame = ttk.Frame(options_frame)
+        workers_frame.pack(fill=tk.X, padx=5, pady=2, anchor=tk.W)
+        ttk.Label(workers_frame, text="Workers paralelos (uma conexão MariaDB por worker):").pack(side=tk.LEFT)
+        self.workers_entry = ttk.Entry(workers_frame, width=6)
+        self.workers_entry.insert(0, "4")
+        self.workers_entry.pack(side=tk.LEFT, padx=5)
+        ttk.Label(workers_frame, text="Processos de renderização SQL (0 = no próprio worker):").pack(side=tk.LEFT, padx=(10, 0))
+        self.render_processes_entry = ttk.Entry(workers_frame, width=4)
+        self.render_processes_entry.insert(0, "2")
+        self.render_processes_entry.pack(side=tk.LEFT, padx=5)
+
+        partition_frame = ttk.Frame(options_frame)
+        partition_frame.pack(fill=tk.X, padx=5, pady=2, anchor=tk.W)
+        ttk.Label(partition_frame, text="Dividir tabelas com mais de").pack(side=tk.LEFT)
+        self.partition_threshold_entry = ttk.Entry(partition_frame, width=10)
+        self.partition_threshold_entry.insert(0, "1000000")
+        self.partition_threshold_entry.pack(side=tk.LEFT, padx=5)
+        ttk.Label(partition_frame, text="registros em").pack(side=tk.LEFT)
+        self.partitions_per_table_entry = ttk.Entry(partition_frame, width=4)
+        self.partitions_per_table_entry.insert(0, "4")
+        self.partitions_per_table_entry.pack(side=tk.LEFT, padx=5)
+        ttk.Label(partition_frame, text="faixas da PK (0 = não dividir)").pack(side=tk.LEFT)
+
+        transaction_frame = ttk.Frame(options_frame)
+        transaction_frame.pack(fill=tk.X, padx=5, pady=2, anchor=tk.W)
+        ttk.Label(transaction_frame, text="Instruções por transação (BEGIN/COMMIT WORK, 0 = desativado):").pack(side=tk.LEFT)
+        self.statements_per_transaction_entry = ttk.Entry(transaction_frame, width=8)
+        self.statements_per_transaction_entry.insert(0, "0")
+        self.statements_per_transaction_entry.pack(side=tk.LEFT, padx=5)
+
         # Botões de ação
         action_frame = ttk.Frame(parent)
         action_frame.pack(fill=tk.X, padx=10, pady=10)
 
-        ttk.Button(action_frame, text="Carregar Tabelas de MariaDB",
-                  command=self.load_tables).pack(side=tk.LEFT, padx=5)
+        self.load_tables_button = ttk.Button(action_frame, text="Carregar Tabelas de MariaDB",
+                                             command=self.load_tables)
+        self.load_tables_button.pack(side=tk.LEFT, padx=5)
+        self.cancel_load_button = ttk.Button(action_frame, text="Cancelar Carregamento",
+                                             command=self.cancel_load_tables, state=tk.DISABLED)
+        self.cancel_load_button.pack(side=tk.LEFT, padx=5)
         ttk.Button(action_frame, text="Salvar Configuração",
                   command=self.save_config).pack(side=tk.LEFT, padx=5)
         ttk.Button(action_frame, text="Carregar Configuração",
@@ -595,18 +397,35 @@ class MigrationApp:
     def log_message(self, message: str, level: str = "INFO"):
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_entry = f"[{timestamp}] [{level}] {message}"
-        
-        # Log to GUI
-        self.log_text.configure(state='normal')
-        self.log_text.insert(tk.END, log_entry + "\n")
-        self.log_text.see(tk.END)
-        self.log_text.configure(state='disabled')
-        
-        # Log to terminal
-        print(log_entry)
-        
-        if self.root: # Garante que a raiz existe antes de atualizar
-            self.root.update_idletasks() # Para atualizar a GUI imediatamente
+        self.log_queue.put(log_entry) # Widget: _flush_log, na thread do Tk
+        self.logger.log(self.LOG_LEVELS.get(level, logging.INFO), log_entry) # Arquivo e terminal, em segundo plano
+
+    def set_progress_async(self, message: str):
+        """Atualiza o texto de progresso a partir de qualquer thread; só o último valor é exibido."""
+        self._pending_progress = message
+
+    def _flush_log(self):
+        entries = []
+        try:
+            while True:
+                entries.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if entries:
+            entries = entries[-self.LOG_MAX_LINES:]
+            self.log_text.configure(state='normal')
+            self.log_text.insert(tk.END, "\n".join(entries) + "\n")
+            line_count = int(self.log_text.index('end-1c').split('.')[0]) - 1
+            if line_count > self.LOG_MAX_LINES: # Descarta as linhas mais antigas
+                self.log_text.delete('1.0', f"{line_count - self.LOG_MAX_LINES + 1}.0")
+            self.log_text.see(tk.END)
+            self.log_text.configure(state='disabled')
+
+        progress, self._pending_progress = self._pending_progress, None
+        if progress is not None:
+            self.progress_var.set(progress)
+        self.root.after(self.LOG_FLUSH_MS, self._flush_log)
 
     def clear_log(self):
         self.log_text.configure(state='normal')
@@ -628,12 +447,24 @@ class MigrationApp:
                 messagebox.showerror("Erro", f"Erro ao salvar o log:\n{str(e)}")
                 self.log_message(f"Erro ao salvar log: {str(e)}", level="ERROR")
 
-    def test_mariadb_connection(self):
-        if not MYSQL_AVAILABLE:
-            msg = "mysql-connector-python não está instalado. Não é possível testar a conexão."
-            self.log_message(msg, level="ERROR")
-            messagebox.showerror("Dependência Ausente", msg)
-            return
+    def _call_in_ui(self, func, *args):
+        """Agenda func(*args) na thread do Tk (pode ser chamado de qualquer thread)."""
+        self.ui_queue.put((func, args))
+
+    def _process_ui_queue(self):
+        try:
+            while True:
+                func, args = self.ui_queue.get_nowait()
+                try:
+                    func(*args)
+                except Exception:
+                    traceback.print_exc()
+        except queue.Empty:
+            pass
+        self.root.after(self.UI_POLL_MS, self._process_ui_queue)
+
+    def _read_maria_config(self) -> Optional[Dict]:
+        """Configuração de conexão dos campos da tela; None (com aviso) se inválida."""
         try:
             config = {
                 'source_host': self.maria_host.get(),
@@ -642,27 +473,50 @@ class MigrationApp:
                 'source_user': self.maria_user.get(),
                 'source_password': self.maria_pass.get()
             }
-            if not all(config.values()):
-                messagebox.showerror("Erro de Entrada", "Todos os campos devem ser preenchidos.")
-                self.log_message("Tentativa de conexão com campos vazios.", level="WARNING")
-                return
-
-            self.log_message(f"Testando conexão com MariaDB: {config['source_user']}@{config['source_host']}:{config['source_port']}/{config['source_database']}", level="INFO")
-            if self.extractor.connect(config):
-                messagebox.showinfo("Sucesso", "Conexão estabelecida com sucesso.")
-                self.log_message("Conexão com MariaDB testada com sucesso.", level="SUCCESS")
-            else:
-                raise RuntimeError("Falha na conexão sem erro específico.")
-
         except ValueError:
             messagebox.showerror("Erro de Entrada", "Porta deve ser um número.")
             self.log_message("Erro de entrada: Porta deve ser um número.", level="ERROR")
+            return None
+        if not all(config.values()):
+            messagebox.showerror("Erro de Entrada", "Todos os campos devem ser preenchidos.")
+            self.log_message("Tentativa de conexão com campos vazios.", level="WARNING")
+            return None
+        return config
+
+    def test_mariadb_connection(self):
+        if not MYSQL_AVAILABLE:
+            msg = "mysql-connector-python não está instalado. Não é possível testar a conexão."
+            self.log_message(msg, level="ERROR")
+            messagebox.showerror("Dependência Ausente", msg)
+            return
+        config = self._read_maria_config()
+        if config is None:
+            return
+
+        self.log_message(f"Testando conexão com MariaDB: {config['source_user']}@{config['source_host']}:{config['source_port']}/{config['source_database']}", level="INFO")
+        self.progress_var.set("Testando conexão com MariaDB...")
+        self.background.submit(self._test_connection_worker, config)
+
+    def _test_connection_worker(self, config: Dict):
+        extractor = MariaDBExtractor()
+        try:
+            if not extractor.connect(config):
+                raise RuntimeError("Falha na conexão sem erro específico.")
+            self._call_in_ui(self._show_connection_result, None)
         except Exception as e:
-            messagebox.showerror("Erro na Conexão", f"Erro ao conectar ao MariaDB:\n{str(e)}")
-            self.log_message(f"Erro na conexão MariaDB: {str(e)}", level="ERROR")
+            self._call_in_ui(self._show_connection_result, str(e))
         finally:
-            if self.extractor.connection:
-                self.extractor.close()
+            if extractor.connection:
+                extractor.close()
+
+    def _show_connection_result(self, error: Optional[str]):
+        self.progress_var.set("Pronto")
+        if error is None:
+            messagebox.showinfo("Sucesso", "Conexão estabelecida com sucesso.")
+            self.log_message("Conexão com MariaDB testada com sucesso.", level="SUCCESS")
+        else:
+            messagebox.showerror("Erro na Conexão", f"Erro ao conectar ao MariaDB:\n{error}")
+            self.log_message(f"Erro na conexão MariaDB: {error}", level="ERROR")
 
     def load_tables(self):
         if not MYSQL_AVAILABLE:
@@ -670,78 +524,101 @@ class MigrationApp:
             self.log_message(msg, level="ERROR")
             messagebox.showerror("Dependência Ausente", msg)
             return
-        try:
-            config = {
-                'source_host': self.maria_host.get(),
-                'source_port': int(self.maria_port.get()),
-                'source_database': self.maria_db.get(),
-                'source_user': self.maria_user.get(),
-                'source_password': self.maria_pass.get()
-            }
-            if not all(config.values()):
-                messagebox.showerror("Erro de Entrada", "Todos os campos devem ser preenchidos.")
-                self.log_message("Tentativa de carregar tabelas com campos vazios.", level="WARNING")
-                return
+        if self.load_cancel_event is not None:
+            self.log_message("O carregamento de tabelas já está em andamento.", level="WARNING")
+            return
+        config = self._read_maria_config()
+        if config is None:
+            return
 
-            self.log_message("Conectando ao MariaDB para carregar tabelas...", level="INFO")
-            if not self.extractor.connect(config):
+        # Limpar tabelas anteriores
+        for item in self.tables_tree.get_children():
+            self.tables_tree.delete(item)
+        self.tables_info.clear()
+
+        self.load_cancel_event = threading.Event()
+        self.load_tables_button.config(state=tk.DISABLED)
+        self.cancel_load_button.config(state=tk.NORMAL)
+        self.progress_var.set("Lendo metadados das tabelas (INFORMATION_SCHEMA)...")
+        self.background.submit(self._load_tables_worker, config, self.row_count_mode_var.get(),
+                               self.use_metadata_cache_var.get(), self.load_cancel_event)
+
+    def cancel_load_tables(self):
+        if self.load_cancel_event is not None:
+            self.load_cancel_event.set()
+            self.progress_var.set("Cancelando carregamento de tabelas...")
+            self.log_message("Cancelamento do carregamento de tabelas solicitado.", level="WARNING")
+
+    def _load_tables_worker(self, config: Dict, row_count_mode: str, use_cache: bool, cancel_event: threading.Event):
+        """Roda no executor de fundo: lê os metadados em blocos e os envia para a Treeview."""
+        extractor = MariaDBExtractor()
+        metadata_cache = None
+        try:
+            self._call_in_ui(self.log_message, "Conectando ao MariaDB para carregar tabelas...", "INFO")
+            if not extractor.connect(config):
                 raise RuntimeError("Falha na conexão sem erro específico.")
+            self._call_in_ui(self.log_message, "Conectado. Carregando lista de tabelas...", "INFO")
 
-            self.log_message("Conectado. Carregando lista de tabelas...", level="INFO")
-
-            # Limpar tabelas anteriores
-            for item in self.tables_tree.get_children():
-                self.tables_tree.delete(item)
-            self.tables_info.clear()
-
-            tables_names = self.extractor.get_tables()
-            self.log_message(f"Encontradas {len(tables_names)} tabelas. Obtendo detalhes...", level="INFO")
-
-            if not tables_names:
-                messagebox.showwarning("Aviso", "Nenhuma tabela encontrada no banco de dados.")
-                self.log_message("Nenhuma tabela encontrada.", level="WARNING")
-                return
-
-            self.progress_bar['maximum'] = len(tables_names)
-            self.progress_bar['value'] = 0
-            
-            for i, table_name in enumerate(tables_names, 1):
-                try:
-                    table_info = self.extractor.get_table_info(table_name)
-                    self.tables_info[table_name] = table_info
-                    
-                    # Adicionar à Treeview
-                    self.tables_tree.insert('', 'end', values=(
-                        '',  # Checkbox column
-                        table_name,
-                        len(table_info.columns),
-                        f"{table_info.row_count:,}"  # Format with thousands separator
-                    ))
-                    
-                    self.progress_bar['value'] = i
-                    self.progress_var.set(f"Carregando tabela {i} de {len(tables_names)}: {table_name}")
-                    self.root.update_idletasks()
-                except Exception as e:
-                    self.log_message(f"Erro ao carregar detalhes da tabela {table_name}: {str(e)}", level="ERROR")
-            
-            self.progress_var.set(f"Carregadas {len(self.tables_info)} tabelas com sucesso.")
-            self.log_message(f"Carregadas informações de {len(self.tables_info)} tabelas.", level="SUCCESS")
-            if len(self.tables_info) != len(tables_names):
-                self.log_message(f"AVISO: {len(tables_names) - len(self.tables_info)} tabelas não puderam ser carregadas.", level="WARNING")
-
-        except ValueError:
-            messagebox.showerror("Erro de Entrada", "Porta deve ser um número.")
-            self.log_message("Erro de entrada ao carregar tabelas: Porta deve ser um número.", level="ERROR")
+            if use_cache:
+                metadata_cache = SchemaMetadataCache(config['source_host'], config['source_port'], config['source_database'])
+            chunks = extractor.iter_schema_tables(row_count_mode=row_count_mode, cache=metadata_cache,
+                                                  chunk_size=self.TABLES_CHUNK_SIZE)
+            try:
+                for tables in chunks:
+                    if cancel_event.is_set():
+                        break
+                    self._call_in_ui(self._add_loaded_tables, tables)
+            finally:
+                chunks.close() # Fecha o cursor e grava o cache se o carregamento foi cancelado
+            self._call_in_ui(self._finish_load_tables, cancel_event.is_set(), metadata_cache, None)
         except Exception as e:
-            messagebox.showerror("Erro", f"Erro ao carregar tabelas de MariaDB:\n{str(e)}")
-            self.log_message(f"Erro ao carregar tabelas: {str(e)}", level="ERROR")
+            self._call_in_ui(self._finish_load_tables, False, None, str(e))
         finally:
-            if self.extractor.connection:
-                self.extractor.close()
-            self.progress_bar['value'] = 0
-            if not self.tables_info:
-                self.progress_var.set("Não há tabelas carregadas.")
+            if extractor.connection:
+                extractor.close()
+
+    def _add_loaded_tables(self, tables: List[Table]):
+        for table_info in tables:
+            self.tables_info[table_info.name] = table_info
+            # Adicionar à Treeview
+            self.tables_tree.insert('', 'end', values=(
+                '',  # Checkbox column
+                table_info.name,
+                len(table_info.columns),
+                format_row_count(table_info)  # '~' para estimativa, '?' se não contada
+            ))
+        self.progress_var.set(f"Carregando tabelas... {len(self.tables_info)} até agora.")
+
+    def _finish_load_tables(self, cancelled: bool, metadata_cache: Optional[SchemaMetadataCache], error: Optional[str]):
+        self.load_cancel_event = None
+        self.load_tables_button.config(state=tk.NORMAL)
+        self.cancel_load_button.config(state=tk.DISABLED)
+
+        if error is not None:
+            messagebox.showerror("Erro", f"Erro ao carregar tabelas de MariaDB:\n{error}")
+            self.log_message(f"Erro ao carregar tabelas: {error}", level="ERROR")
+        elif cancelled:
+            self.log_message(f"Carregamento cancelado. {len(self.tables_info)} tabelas carregadas.", level="WARNING")
+        elif not self.tables_info:
+            messagebox.showwarning("Aviso", "Nenhuma tabela encontrada no banco de dados.")
+            self.log_message("Nenhuma tabela encontrada.", level="WARNING")
+        else:
+            self.log_message(f"Carregadas informações de {len(self.tables_info)} tabelas.", level="SUCCESS")
+        if metadata_cache is not None:
+            self.log_message(f"Cache de metadados ({metadata_cache.path}): {metadata_cache.describe()}.", level="INFO")
+
+        if self.tables_info:
+            self.progress_var.set(f"Carregadas {len(self.tables_info)} tabelas.")
+        else:
+            self.progress_var.set("Não há tabelas carregadas.")
+
 
+    def shutdown_background(self):
+        """Cancela o carregamento em andamento, libera o executor de fundo e esvazia a fila do log em arquivo."""
+        if self.load_cancel_event is not None:
+            self.load_cancel_event.set()
+        self.background.shutdown(wait=False, cancel_futures=True)
+        self.log_listener.stop() # Grava o que ainda estiver na fila do log em arquivo
 
     def view_table_structure(self):
         selection = self.tables_tree.selection()
@@ -834,9 +711,16 @@ class MigrationApp:
         try:
             int(self.maria_port.get())
             int(self.batch_size_entry.get())
+            int(self.rows_per_insert_entry.get())
+            int(self.statements_per_transaction_entry.get())
+            int(self.workers_entry.get())
+            int(self.render_processes_entry.get())
+            int(self.partition_threshold_entry.get())
+            int(self.partitions_per_table_entry.get())
+            int(self.chunk_size_entry.get())
         except ValueError:
-            messagebox.showerror("Erro de Configuração", "Porta do MariaDB e Tamanho do Lote devem ser números.")
-            self.log_message("Porta ou Tamanho do Lote não são numéricos.", level="ERROR")
+            messagebox.showerror("Erro de Configuração", "Porta do MariaDB e as opções numéricas de geração (lote, linhas por INSERT, transação, workers, processos, faixas, tamanho dos arquivos) devem ser números.")
+            self.log_message("Porta ou opções numéricas de geração não são numéricas.", level="ERROR")
             return
 
 
@@ -858,194 +742,111 @@ class MigrationApp:
         self.summary_text.configure(state='disabled')
 
 
-        thread = threading.Thread(target=self.perform_script_generation, args=(selected_tables_names,))
+        # Campos lidos aqui, na thread do Tk; a thread de geração não toca em widgets
+        maria_config = {
+            'source_host': self.maria_host.get(),
+            'source_port': int(self.maria_port.get()),
+            'source_database': self.maria_db.get(),
+            'source_user': self.maria_user.get(),
+            'source_password': self.maria_pass.get()
+        }
+        options = ScriptGenerationOptions(
+            output_directory=self.output_directory,
+            migrate_data=self.migrate_data_var.get(),
+            resume=self.resume_var.get(),
+            delta_mode=self.delta_mode_var.get(),
+            delta_columns=self.delta_columns_entry.get(),
+            delta_output=self.delta_output_var.get(),
+            batch_size=int(self.batch_size_entry.get()),
+            extraction_mode=self.extraction_mode_var.get(),
+            insert_mode=self.insert_mode_var.get(),
+            rows_per_insert=int(self.rows_per_insert_entry.get()),
+            statements_per_transaction=int(self.statements_per_transaction_entry.get()),
+            data_format=self.data_format_var.get(),
+            workers=int(self.workers_entry.get()),
+            render_processes=int(self.render_processes_entry.get()),
+            partition_threshold=int(self.partition_threshold_entry.get()),
+            partitions_per_table=int(self.partitions_per_table_entry.get()),
+            compression=self.compression_var.get(),
+            chunk_size_mb=int(self.chunk_size_entry.get()),
+            source_database=self.maria_db.get(),
+            informix_server_name=self.informix_server_name.get(),
+            informix_db_name=self.informix_db_name_script.get()
+        )
+        self.progress_bar['maximum'] = len(selected_tables_names)
+        self.progress_bar['value'] = 0
+
+        thread = threading.Thread(target=self.perform_script_generation,
+                                  args=(selected_tables_names, maria_config, options))
         thread.daemon = True # Permite que a aplicação feche mesmo se a thread estiver rodando
         thread.start()
 
     # Renomeado de perform_migration
-    def perform_script_generation(self, selected_tables_names: List[str]):
+    def perform_script_generation(self, selected_tables_names: List[str], maria_config: Dict,
+                                  options: ScriptGenerationOptions):
+        """Roda na thread de geração: widgets e messageboxes só via _call_in_ui."""
         try:
-            self.progress_var.set("Iniciando geração de scripts...")
-            self.progress_bar['maximum'] = len(selected_tables_names)
-            self.progress_bar['value'] = 0
-
-            # Conectar ao MariaDB para buscar dados se necessário
-            # A conexão só é feita se formos buscar dados
-            if self.migrate_data_var.get():
-                maria_config = {
-                    'host': self.maria_host.get(),
-                    'port': int(self.maria_port.get()),
-                    'database': self.maria_db.get(),
-                    'user': self.maria_user.get(),
-                    'password': self.maria_pass.get()
-                }
-                self.log_message("Conectando ao MariaDB para extrair dados...", level="INFO")
-                if not self.extractor.connect(maria_config): # connect pode levantar exceção
-                    self.log_message("Falha ao conectar ao MariaDB para extração de dados.", level="ERROR")
-                    # A exceção de connect() já deve ter sido logada.
-                    # Não precisamos fazer mais nada aqui, o finally cuidará do estado.
-                    return # Sai da função se a conexão falhar
-
-            ddl_scripts_content = []
-            ddl_scripts_content.append(f"-- Script de CRIAÇÃO DE ESTRUTURA (DDL) para Informix")
-            ddl_scripts_content.append(f"-- Gerado em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            ddl_scripts_content.append(f"-- Origem: MariaDB - {self.maria_db.get()}")
-            ddl_scripts_content.append(f"-- Destino: Informix - {self.informix_db_name_script.get()} (servidor: {self.informix_server_name.get()})\n")
-
-            total_records_processed = 0
-            generated_data_files = []
-
-            for i, table_name in enumerate(selected_tables_names):
-                if not self.migration_running:
-                    self.log_message("Geração de scripts interrompida pelo usuário.", level="WARNING")
-                    break
-                
-                self.progress_var.set(f"Gerando para tabela: {table_name} ({i+1}/{len(selected_tables_names)})")
-                self.log_message(f"Processando tabela: {table_name}", level="INFO")
+            self.set_progress_async("Iniciando geração de scripts...")
 
+            tables = []
+            for table_name in selected_tables_names:
                 if table_name not in self.tables_info:
                     self.log_message(f"Skipping {table_name}: Informações não encontradas (não foi carregada?).", level="WARNING")
-                    self.progress_bar['value'] = i + 1
+                    self._call_in_ui(self._advance_progress_bar)
                     continue
-                
-                table_info = self.tables_info[table_name]
-
-                # Gerar DDL (CREATE TABLE)
-                ddl = InformixGenerator.generate_create_table(table_info)
-                ddl_scripts_content.append(f"\n-- ESTRUTURA PARA A TABELA: {table_name}\n")
-                ddl_scripts_content.append(ddl)
-                ddl_scripts_content.append("\n")
-                self.log_message(f"DDL gerado para {table_name}.", level="DEBUG")
-
-                # Gerar DML (INSERTs) se solicitado
-                if self.migrate_data_var.get() and table_info.row_count > 0:
-                    self.log_message(f"Iniciando extração de dados para {table_name} ({table_info.row_count} registros).", level="INFO")
-                    
-                    # Garantir que estamos conectados (se ainda não estivermos)
-                    if not self.extractor.connection or not self.extractor.connection.is_connected():
-                         if not self.extractor.connect(maria_config): # type: ignore
-                            self.log_message(f"Falha ao reconectar ao MariaDB para {table_name}. Pulando dados.", level="ERROR")
-                            continue # Pula para a próxima tabela
-
-                    table_data_filename = os.path.join(self.output_directory, f"{table_name}_data.sql")
-                    generated_data_files.append(os.path.basename(table_data_filename))
-                    
-                    with open(table_data_filename, 'w', encoding='utf-8') as dml_file:
-                        dml_file.write(f"-- DADOS (DML) PARA A TABELA: {table_name}\n")
-                        dml_file.write(f"-- Total de Registros: {table_info.row_count}\n\n")
-
-                        batch_size = int(self.batch_size_entry.get())
-                        records_in_table_processed = 0
-                        for offset in range(0, table_info.row_count, batch_size):
-                            if not self.migration_running: break
-
-                            self.progress_var.set(f"{table_name}: Extraindo {offset+1}-{min(offset+batch_size, table_info.row_count)} de {table_info.row_count}")
-                            self.root.update_idletasks()
-
-                            try:
-                                data_batch = self.extractor.get_table_data(table_name, batch_size, offset)
-                            except Exception as e_fetch:
-                                self.log_message(f"Erro ao buscar dados para {table_name} (lote {offset // batch_size + 1}): {e_fetch}", "ERROR")
-                                break # Interrompe a busca de dados para esta tabela em caso de erro
-
-                            if not data_batch: # Pode acontecer se a contagem inicial estiver errada ou houver problema
-                                self.log_message(f"Nenhum dado retornado para {table_name} no lote {offset // batch_size + 1}. Finalizando dados para esta tabela.", "WARNING")
-                                break
-
-
-                            insert_statements = InformixGenerator.generate_insert_statements(table_info, data_batch)
-                            for stmt in insert_statements:
-                                dml_file.write(stmt + "\n")
-                            
-                            records_in_table_processed += len(data_batch)
-                            total_records_processed += len(data_batch)
-
-                        self.log_message(f"Script DML gerado para {table_name} com {records_in_table_processed} registros: {table_data_filename}", level="INFO")
-                
-                elif self.migrate_data_var.get() and table_info.row_count == 0:
-                    self.log_message(f"Tabela {table_name} não possui registros. Script de dados não será gerado.", level="INFO")
-
-                self.progress_bar['value'] = i + 1
-            # Fim do loop de tabelas
-
-            # Salvar o script DDL principal
-            ddl_main_filename = os.path.join(self.output_directory, "00_CREATE_TABLES_ALL.sql")
-            with open(ddl_main_filename, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(ddl_scripts_content))
-            self.log_message(f"Script DDL principal salvo: {ddl_main_filename}", level="SUCCESS")
-
-            # Gerar script de execução (exemplo para dbaccess)
-            exec_script_filename = os.path.join(self.output_directory, "RUN_ALL_SCRIPTS.sh")
-            with open(exec_script_filename, 'w', encoding='utf-8') as f:
-                f.write("#!/bin/bash\n")
-                f.write("# Script para executar os arquivos SQL gerados no Informix usando dbaccess.\n")
-                f.write("# Certifique-se de que as variáveis de ambiente do Informix (INFORMIXDIR, INFORMIXSERVER, etc.)\n")
-                f.write("# e o PATH estejam configurados corretamente.\n\n")
-                f.write(f"DB_NAME=\"{self.informix_db_name_script.get() or 'seu_banco_de_dados'}\"\n")
-                f.write(f"INFORMIXSERVER_TO_USE=\"{self.informix_server_name.get() or 'seu_servidor_informix'}\"\n\n")
-                f.write("echo \"Verifique e ajuste DB_NAME e INFORMIXSERVER_TO_USE neste script antes de executar.\"\n")
-                f.write("read -p \"Pressione Enter para continuar após verificar...\"\n\n")
-                f.write(f"echo \"Executando script de criação de tabelas: {os.path.basename(ddl_main_filename)}\"\n")
-                f.write(f"dbaccess \"$DB_NAME\"@{self.informix_server_name.get()} \"{os.path.basename(ddl_main_filename)}\" || exit 1\n\n")
-                if self.migrate_data_var.get() and generated_data_files:
-                    f.write("echo \"Executando scripts de inserção de dados...\"\n")
-                    for data_file in generated_data_files:
-                        f.write(f"echo \"  - {data_file}\"\n")
-                        f.write(f"  dbaccess \"$DB_NAME\"@{self.informix_server_name.get()} \"{data_file}\" || echo \"ERRO ao executar {data_file}. Continuando...\"\n")
-                f.write("\n_done\necho \"Execução dos scripts concluída.\"\n")
-            
-            # Tornar executável (Linux/macOS)
-            try:
-                os.chmod(exec_script_filename, 0o755) # rwxr-xr-x
-                self.log_message(f"Script de execução salvo e tornado executável: {exec_script_filename}", level="SUCCESS")
-            except OSError as e_chmod:
-                 self.log_message(f"Script de execução salvo: {exec_script_filename}. Falha ao tornar executável (chmod): {e_chmod}", level="WARNING")
-
-
-            # Atualizar resumo na GUI
-            summary_content = f"GERAÇÃO DE SCRIPTS CONCLUÍDA ({'COM' if self.migration_running else 'INTERROMPIDA'})\n"
-            summary_content += f"Data/Hora: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-            summary_content += f"Diretório de Saída: {self.output_directory}\n"
-            summary_content += f"Tabelas processadas: {self.progress_bar['value']} de {len(selected_tables_names)}\n"
-            if self.migrate_data_var.get():
-                summary_content += f"Total de registros processados para DML: {total_records_processed}\n"
-            summary_content += "\nArquivos Gerados:\n"
-            summary_content += f"  - {os.path.basename(ddl_main_filename)} (Estrutura DDL)\n"
-            if self.migrate_data_var.get():
-                for df in generated_data_files:
-                    summary_content += f"  - {df} (Dados DML)\n"
-            summary_content += f"  - {os.path.basename(exec_script_filename)} (Script de execução .sh)\n"
-            
-            self.summary_text.configure(state='normal')
-            self.summary_text.delete(1.0, tk.END)
-            self.summary_text.insert(1.0, summary_content)
-            self.summary_text.configure(state='disabled')
-
-            if self.migration_running: # Se não foi interrompido
-                self.progress_var.set("Geração de scripts concluída!")
+                tables.append(self.tables_info[table_name])
+
+            generator = ScriptGenerator(
+                maria_config, options,
+                log=self.log_message,
+                should_continue=lambda: self.migration_running,
+                on_progress=self.set_progress_async,
+                on_table_done=lambda result: self._call_in_ui(self._advance_progress_bar)
+            )
+            if options.migrate_data:
+                self.log_message("Conectando ao MariaDB para extrair dados...", level="INFO")
+            results = generator.run(tables)
+            completed = self.migration_running
+            if not completed:
+                self.log_message("Geração de scripts interrompida pelo usuário.", level="WARNING")
+
+            summary_content = generator.build_summary(results, len(selected_tables_names), completed)
+            if completed: # Se não foi interrompido
+                self.set_progress_async("Geração de scripts concluída!")
                 self.log_message("=== GERAÇÃO DE SCRIPTS CONCLUÍDA ===", level="SUCCESS")
-                messagebox.showinfo("Sucesso", f"Geração de scripts concluída!\nSalvos em: {self.output_directory}")
             else:
-                self.progress_var.set("Geração interrompida.")
+                self.set_progress_async("Geração interrompida.")
                 self.log_message("Geração de scripts interrompida.", level="WARNING")
-                messagebox.showwarning("Interrompido", "A geração de scripts foi interrompida.")
-
+            self._call_in_ui(self._finish_script_generation, summary_content, completed, None)
 
         except Exception as e_gen:
             self.log_message(f"ERRO CRÍTICO durante a geração de scripts: {str(e_gen)}", level="CRITICAL")
-            import traceback
             self.log_message(traceback.format_exc(), level="DEBUG") # Log stack trace
-            messagebox.showerror("Erro na Geração", f"Ocorreu um erro crítico:\n{str(e_gen)}")
-            self.progress_var.set("Erro na geração de scripts!")
+            self.set_progress_async("Erro na geração de scripts!")
+            self._call_in_ui(self._finish_script_generation, None, False, str(e_gen))
         finally:
-            if self.extractor.connection and self.extractor.connection.is_connected():
-                self.extractor.close()
-                self.log_message("Conexão MariaDB fechada.", level="INFO")
-            
             self.migration_running = False
-            self.generate_button.config(state=tk.NORMAL)
-            self.stop_button.config(state=tk.DISABLED)
-            self.progress_bar['value'] = 0 # Reset progress bar
+
+    def _advance_progress_bar(self):
+        self.progress_bar['value'] += 1
+
+    def _finish_script_generation(self, summary_content: Optional[str], completed: bool, error: Optional[str]):
+        """Fim da geração, na thread do Tk: resumo, mensagem final e botões."""
+        if summary_content is not None:
+            self.summary_text.configure(state='normal')
+            self.summary_text.delete(1.0, tk.END)
+            self.summary_text.insert(1.0, summary_content)
+            self.summary_text.configure(state='disabled')
+        self.generate_button.config(state=tk.NORMAL)
+        self.stop_button.config(state=tk.DISABLED)
+        self.progress_bar['value'] = 0 # Reset progress bar
+
+        if error is not None:
+            messagebox.showerror("Erro na Geração", f"Ocorreu um erro crítico:\n{error}")
+        elif completed:
+            messagebox.showinfo("Sucesso", f"Geração de scripts concluída!\nSalvos em: {self.output_directory}")
+        else:
+            messagebox.showwarning("Interrompido", "A geração de scripts foi interrompida.")
 
     # Renomeado de stop_migration
     def stop_script_generation(self):
@@ -1072,7 +873,24 @@ class MigrationApp:
             },
             'options': {
                 'generate_data_scripts': self.migrate_data_var.get(),
-                'batch_size': self.batch_size_entry.get()
+                'resume': self.resume_var.get(),
+                'delta_mode': self.delta_mode_var.get(),
+                'delta_columns': self.delta_columns_entry.get(),
+                'delta_output': self.delta_output_var.get(),
+                'batch_size': self.batch_size_entry.get(),
+                'extraction_mode': self.extraction_mode_var.get(),
+                'row_count_mode': self.row_count_mode_var.get(),
+                'use_metadata_cache': self.use_metadata_cache_var.get(),
+                'insert_mode': self.insert_mode_var.get(),
+                'rows_per_insert': self.rows_per_insert_entry.get(),
+                'statements_per_transaction': self.statements_per_transaction_entry.get(),
+                'data_format': self.data_format_var.get(),
+                'workers': self.workers_entry.get(),
+                'render_processes': self.render_processes_entry.get(),
+                'partition_threshold': self.partition_threshold_entry.get(),
+                'partitions_per_table': self.partitions_per_table_entry.get(),
+                'compression': self.compression_var.get(),
+                'chunk_size_mb': self.chunk_size_entry.get()
             }
         }
 
@@ -1119,7 +937,24 @@ class MigrationApp:
                 # Carregar opções
                 options = config.get('options', {})
                 self.migrate_data_var.set(options.get('generate_data_scripts', True))
+                self.resume_var.set(options.get('resume', False))
+                self.delta_mode_var.set(options.get('delta_mode', False))
+                self.delta_columns_entry.delete(0, tk.END); self.delta_columns_entry.insert(0, options.get('delta_columns', "updated_at, data_alteracao"))
+                self.delta_output_var.set(options.get('delta_output', 'auto'))
                 self.batch_size_entry.delete(0, tk.END); self.batch_size_entry.insert(0, str(options.get('batch_size', 1000)))
+                self.extraction_mode_var.set(options.get('extraction_mode', 'paged'))
+                self.row_count_mode_var.set(options.get('row_count_mode', 'approximate'))
+                self.use_metadata_cache_var.set(options.get('use_metadata_cache', True))
+                self.insert_mode_var.set(options.get('insert_mode', 'single'))
+                self.data_format_var.set(options.get('data_format', 'sql'))
+                self.workers_entry.delete(0, tk.END); self.workers_entry.insert(0, str(options.get('workers', 4)))
+                self.render_processes_entry.delete(0, tk.END); self.render_processes_entry.insert(0, str(options.get('render_processes', 2)))
+                self.partition_threshold_entry.delete(0, tk.END); self.partition_threshold_entry.insert(0, str(options.get('partition_threshold', 1000000)))
+                self.partitions_per_table_entry.delete(0, tk.END); self.partitions_per_table_entry.insert(0, str(options.get('partitions_per_table', 4)))
+                self.compression_var.set(options.get('compression', 'none'))
+                self.chunk_size_entry.delete(0, tk.END); self.chunk_size_entry.insert(0, str(options.get('chunk_size_mb', 0)))
+                self.rows_per_insert_entry.delete(0, tk.END); self.rows_per_insert_entry.insert(0, str(options.get('rows_per_insert', 100)))
+                self.statements_per_transaction_entry.delete(0, tk.END); self.statements_per_transaction_entry.insert(0, str(options.get('statements_per_transaction', 0)))
 
                 self.log_message(f"Configuração carregada de: {filename}", level="SUCCESS")
                 messagebox.showinfo("Sucesso", f"Configuração carregada de:\n{filename}")
@@ -1190,10 +1025,11 @@ def main():
             "- Mapeamento de tipos de dados de MariaDB para Informix.\n"
             "- Geração de scripts CREATE TABLE para Informix.\n"
             "- Geração de scripts INSERT para popular dados no Informix.\n"
-            "- Geração de um script shell (.sh) de exemplo para executar os SQLs via 'dbaccess'.\n\n"
-            "Dependências Python (para extração de MariaDB):\n"
+            "- Geração de um script shell (.sh) de exemplo para executar os SQLs via 'dbaccess'.\n"
+            "- Carga direta no Informix, sem scripts, pela linha de comando: migration_cli.py --direct-load.\n\n"
+            "Dependências Python:\n"
             f"- mysql-connector-python ({'Instalado' if MYSQL_AVAILABLE else 'NÃO INSTALADO - instale via pip'})\n"
-            f"- pyodbc ({'Instalado' if INFORMIX_AVAILABLE else 'NÃO INSTALADO - instale via pip, usado para referência de tipos, não para conexão direta aqui'})\n\n"
+            f"- IfxPy/IfxPyDbi ({'Instalado' if INFORMIX_DBAPI_AVAILABLE else 'NÃO INSTALADO - pip install IfxPy; só necessário para a carga direta'})\n\n"
             "Importante: A execução dos scripts no Informix é de responsabilidade do usuário e requer "
             "o IBM Informix Client SDK devidamente configurado."
         )
@@ -1206,9 +1042,11 @@ def main():
                 app.stop_script_generation() # Tenta parar a thread
                 # Pode ser necessário esperar um pouco para a thread finalizar se ela estiver em uma operação longa
                 # No entanto, como a thread é daemon, ela será terminada quando o processo principal sair.
+                app.shutdown_background()
                 root.destroy()
         else:
             if messagebox.askokcancel("Sair?", "Deseja fechar o aplicativo?"):
+                app.shutdown_background()
                 root.destroy()
 
     root.protocol("WM_DELETE_WINDOW", on_closing)
@@ -0,0 +1,97 @@
+# metadata_cache.py
+import json
+import os
+import threading
+from dataclasses import asdict
+from typing import Dict, List, Optional, Iterable
+
+from migration_logic import Column
+
+
+class SchemaMetadataCache:
+    """Cache em disco das colunas de cada tabela, por servidor/banco/tabela.
+
+    Cada entrada guarda a assinatura da tabela no momento da leitura (CREATE_TIME de
+    INFORMATION_SCHEMA.TABLES + checksum das definições de coluna, ver
+    MariaDBExtractor.get_table_signatures). Se a assinatura atual for diferente, a
+    entrada é descartada e a tabela é lida de novo do INFORMATION_SCHEMA.
+    """
+
+    FORMAT_VERSION = 2 # 2: Column.is_unsigned
+    DEFAULT_PATH = os.path.join('cache', 'metadata_cache.json')
+
+    def __init__(self, host: str, port: int, database: str, path: Optional[str] = None):
+        self.path = path or self.DEFAULT_PATH
+        self.schema_key = f"{host}:{port}/{database}"
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._schemas: Dict[str, Dict[str, dict]] = {}
+        self._dirty = False
+        self.load()
+
+    @property
+    def _tables(self) -> Dict[str, dict]:
+        return self._schemas.setdefault(self.schema_key, {})
+
+    def load(self):
+        """Lê o arquivo de cache; arquivo ausente, corrompido ou de outra versão é ignorado."""
+        self._schemas = {}
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"AVISO: cache de metadados ignorado ({self.path}): {e}")
+            return
+        if data.get('version') == self.FORMAT_VERSION:
+            self._schemas = data.get('schemas', {})
+
+    def get(self, table_name: str, signature: str) -> Optional[List[Column]]:
+        """Colunas em cache da tabela, se a assinatura ainda for a mesma."""
+        with self._lock:
+            entry = self._tables.get(table_name)
+            if entry is None or entry.get('signature') != signature:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return [Column(**column) for column in entry['columns']]
+
+    def put(self, table_name: str, signature: str, columns: List[Column]):
+        with self._lock:
+            self._tables[table_name] = {
+                'signature': signature,
+                'columns': [asdict(column) for column in columns],
+            }
+            self._dirty = True
+
+    def retain(self, table_names: Iterable[str]):
+        """Remove do cache as tabelas que não existem mais no banco."""
+        keep = set(table_names)
+        with self._lock:
+            for name in [name for name in self._tables if name not in keep]:
+                del self._tables[name]
+                self._dirty = True
+
+    def clear(self):
+        with self._lock:
+            self._schemas.pop(self.schema_key, None)
+            self._dirty = True
+
+    def save(self):
+        """Grava o cache (num arquivo temporário + os.replace, para não deixar JSON pela metade)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.FORMAT_VERSION, 'schemas': self._schemas}, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+            self._dirty = False
+
+    def describe(self) -> str:
+        return f"{self.hits} tabela(s) do cache, {self.misses} lida(s) do banco"
@@ -0,0 +1,412 @@
+# migration_cli.py
+"""Geração de scripts MariaDB -> Informix sem interface gráfica (cron, containers).
+
+Uso:
+    python migration_cli.py config.json --output scripts/ [--tables t1,t2] [--resume] [--verbose]
+    python migration_cli.py config.json --direct-load "SERVER=...;DATABASE=...;HOST=...;SERVICE=...;UID=..." [--tables t1,t2]
+    python migration_cli.py config.json --cdc-binlog mysql-bin.000042.txt --output cdc/ [--cdc-start mysql-bin.000042:4]
+    python migration_cli.py config.json --cdc-live [--cdc-follow] --output cdc/ [--cdc-start mysql-bin.000042:4]
+
+Lê o JSON gravado por "Salvar Configuração" na GUI (seções mariadb,
+informix_script_refs e options) e roda o mesmo ScriptGenerator. A senha do MariaDB
+pode vir da variável de ambiente MARIADB_PASSWORD em vez do arquivo. Não importa Tk.
+
+Com --direct-load, em vez de gerar scripts, carrega os dados direto no Informix
+(InformixDirectLoader) pela DSN informada; as tabelas já precisam existir no destino.
+A DSN 'sqlite:///arquivo.db' usa um SQLite local como destino, para testes.
+
+Com --cdc-binlog, converte um binlog copiado do servidor (binário ou a saída de
+`mysqlbinlog -v --base64-output=DECODE-ROWS`) em scripts CDC_*.sql no diretório de
+saída (BinlogCDC). A posição inicial vem de --cdc-start ou da última posição gravada
+em cache/binlog_position.json, e a posição final é gravada lá para a próxima execução.
+Com --cdc-live o binlog é lido direto do servidor como uma réplica (mysql-replication),
+a partir da posição registrada no início da carga; é o que permite a virada (cutover):
+carga completa, depois só as alterações. Sem --cdc-follow para no fim do binlog atual;
+com ele segue esperando novos eventos até Ctrl+C.
+
+Códigos de saída:
+    0   geração concluída sem erros
+    1   geração concluída, mas alguma tabela teve erro
+    2   configuração ou argumentos inválidos (tabela inexistente, opção não numérica...)
+    3   falha de conexão com o MariaDB (ou com o destino da carga direta) ou dependência ausente
+    4   erro inesperado (detalhes em logs/migrador.log)
+    130 interrompida (Ctrl+C / SIGTERM); com --resume a próxima execução continua dali
+"""
+import argparse
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+import traceback
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from migration_logic import MariaDBExtractor, ScriptGenerator, ScriptGenerationOptions, TableGenerationResult
+from metadata_cache import SchemaMetadataCache
+from informix_loader import InformixDirectLoader, DirectLoadOptions, TableLoadResult, connect_dsn
+from binlog_cdc import BinlogCDC, BinlogPosition, BinlogPositionStore, MysqlbinlogFileReader, LiveBinlogReader
+from logger_config import setup_migration_logger
+
+EXIT_OK = 0
+EXIT_TABLE_ERRORS = 1
+EXIT_CONFIG_ERROR = 2
+EXIT_CONNECTION_ERROR = 3
+EXIT_FAILURE = 4
+EXIT_INTERRUPTED = 130
+
+LOG_LEVELS = {"DEBUG": logging.DEBUG, "WARNING": logging.WARNING, "ERROR": logging.ERROR, "CRITICAL": logging.CRITICAL}
+
+# Opções numéricas do JSON: a GUI grava o texto dos campos, então podem vir como string
+INT_OPTIONS = ('batch_size', 'rows_per_insert', 'statements_per_transaction', 'workers', 'render_processes',
+               'partition_threshold', 'partitions_per_table', 'chunk_size_mb', 'commit_every',
+               'cdc_transactions_per_file', 'delta_overlap_seconds')
+
+
+class ConfigError(RuntimeError):
+    """Configuração ou argumentos inválidos (código de saída 2)."""
+
+
+def load_config(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ConfigError(f"Não foi possível ler a configuração {path}: {e}")
+    if not isinstance(config.get('mariadb'), dict):
+        raise ConfigError(f"{path} não tem a seção 'mariadb' (use um arquivo gerado por Salvar Configuração).")
+    return config
+
+
+def source_config_from(config: Dict[str, Any]) -> Dict[str, Any]:
+    maria = config['mariadb']
+    missing = [key for key in ('host', 'port', 'database', 'user') if not str(maria.get(key, '')).strip()]
+    if missing:
+        raise ConfigError(f"Configuração do MariaDB incompleta: {', '.join(missing)}")
+    try:
+        port = int(maria['port'])
+    except ValueError:
+        raise ConfigError(f"Porta do MariaDB não numérica: {maria['port']}")
+    return {
+        'source_host': maria['host'],
+        'source_port': port,
+        'source_database': maria['database'],
+        'source_user': maria['user'],
+        'source_password': os.environ.get('MARIADB_PASSWORD', maria.get('password', '')),
+    }
+
+
+def options_from_config(config: Dict[str, Any], output_directory: str, resume: bool = False) -> ScriptGenerationOptions:
+    """ScriptGenerationOptions a partir da seção options do JSON (mesmos padrões da GUI)."""
+    options = dict(config.get('options', {}))
+    for key in INT_OPTIONS:
+        if key in options:
+            try:
+                options[key] = int(options[key])
+            except (TypeError, ValueError):
+                raise ConfigError(f"Opção '{key}' deve ser um número: {options[key]!r}")
+    refs = config.get('informix_script_refs', {})
+    return ScriptGenerationOptions(
+        output_directory=output_directory,
+        migrate_data=options.get('generate_data_scripts', True),
+        resume=resume or options.get('resume', False),
+        delta_mode=options.get('delta_mode', False),
+        delta_columns=options.get('delta_columns', "updated_at, data_alteracao"),
+        delta_output=options.get('delta_output', 'auto'),
+        delta_overlap_seconds=options.get('delta_overlap_seconds', 60),
+        batch_size=options.get('batch_size', 1000),
+        extraction_mode=options.get('extraction_mode', 'paged'),
+        insert_mode=options.get('insert_mode', 'single'),
+        rows_per_insert=options.get('rows_per_insert', 100),
+        statements_per_transaction=options.get('statements_per_transaction', 0),
+        data_format=options.get('data_format', 'sql'),
+        workers=options.get('workers', 4),
+        render_processes=options.get('render_processes', 2),
+        partition_threshold=options.get('partition_threshold', 1000000),
+        partitions_per_table=options.get('partitions_per_table', 4),
+        compression=options.get('compression', 'none'),
+        chunk_size_mb=options.get('chunk_size_mb', 0),
+        source_database=config['mariadb'].get('database', ''),
+        informix_server_name=refs.get('server_name', ''),
+        informix_db_name=refs.get('db_name', ''),
+    )
+
+
+def direct_load_options_from_config(config: Dict[str, Any]) -> DirectLoadOptions:
+    """DirectLoadOptions a partir da seção options do JSON (lote, workers e modo de extração da geração)."""
+    options = dict(config.get('options', {}))
+    for key in ('batch_size', 'commit_every', 'workers'):
+        if key in options:
+            try:
+                options[key] = int(options[key])
+            except (TypeError, ValueError):
+                raise ConfigError(f"Opção '{key}' deve ser um número: {options[key]!r}")
+    return DirectLoadOptions(
+        batch_size=options.get('batch_size', 1000),
+        commit_every=options.get('commit_every', 10000),
+        workers=options.get('workers', 4),
+        extraction_mode=options.get('extraction_mode', 'paged'),
+    )
+
+
+def int_option(config: Dict[str, Any], key: str, default: int) -> int:
+    value = config.get('options', {}).get(key, default)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ConfigError(f"Opção '{key}' deve ser um número: {value!r}")
+
+
+def parse_binlog_position(text: str) -> BinlogPosition:
+    """'mysql-bin.000042:1234' -> BinlogPosition."""
+    log_file, _, log_pos = text.strip().rpartition(':')
+    try:
+        position = BinlogPosition(log_file, int(log_pos))
+    except ValueError:
+        position = None
+    if position is None or not log_file:
+        raise ConfigError(f"Posição do binlog inválida: {text!r} (use arquivo:posição, ex.: mysql-bin.000042:4)")
+    return position
+
+
+class CLIRunner:
+    """Carrega os metadados e roda o ScriptGenerator, com log no stdout e em logs/migrador.log."""
+
+    def __init__(self, verbose: bool = False):
+        self.logger, self.log_listener = setup_migration_logger(
+            console_stream=sys.stdout, console_level=logging.DEBUG if verbose else logging.INFO)
+        self.cancel_event = threading.Event()
+        self.tables_done = 0
+        self.tables_total = 0
+
+    def log(self, message: str, level: str = "INFO"):
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.logger.log(LOG_LEVELS.get(level, logging.INFO), f"[{timestamp}] [{level}] {message}")
+
+    def install_signal_handlers(self):
+        def request_stop(signum, frame):
+            self.log("Interrupção solicitada; terminando os lotes em andamento (repita para abortar).", "WARNING")
+            self.cancel_event.set()
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+        signal.signal(signal.SIGINT, request_stop)
+        if hasattr(signal, 'SIGTERM'):
+            signal.signal(signal.SIGTERM, request_stop)
+
+    def on_table_done(self, result: TableGenerationResult):
+        self.tables_done += 1
+        status = f"ERRO: {result.error}" if result.error else f"{result.records} registros"
+        self.log(f"[{self.tables_done}/{self.tables_total}] {result.table_name}: {status}",
+                 "ERROR" if result.error else "INFO")
+
+    def on_table_loaded(self, result: TableLoadResult):
+        self.tables_done += 1
+        status = f"ERRO: {result.error}" if result.error else f"{result.rows} linhas em {result.seconds:.1f}s"
+        self.log(f"[{self.tables_done}/{self.tables_total}] {result.table_name}: {status}",
+                 "ERROR" if result.error else "INFO")
+
+    def load_tables(self, source_config: Dict[str, Any], table_names: Optional[List[str]],
+                    row_count_mode: str, use_cache: bool):
+        extractor = MariaDBExtractor()
+        metadata_cache = None
+        try:
+            extractor.connect(source_config)
+            self.log(f"Conectado a {source_config['source_host']}:{source_config['source_port']}/{source_config['source_database']}.", "INFO")
+            if use_cache:
+                metadata_cache = SchemaMetadataCache(source_config['source_host'], source_config['source_port'],
+                                                     source_config['source_database'])
+            tables = extractor.get_schema_tables(table_names, row_count_mode, metadata_cache)
+        finally:
+            if extractor.connection:
+                extractor.close()
+        if metadata_cache is not None:
+            self.log(f"Metadados: {metadata_cache.describe()}.", "INFO")
+        if table_names:
+            found = {table.name for table in tables}
+            missing = [name for name in table_names if name not in found]
+            if missing:
+                raise ConfigError(f"Tabela(s) não encontrada(s) no MariaDB: {', '.join(missing)}")
+            by_name = {table.name: table for table in tables}
+            tables = [by_name[name] for name in table_names] # Na ordem pedida
+        return tables
+
+    def run(self, args: argparse.Namespace) -> int:
+        config = load_config(args.config)
+        source_config = source_config_from(config)
+        if args.direct_load and args.cdc_binlog:
+            raise ConfigError("Use --direct-load ou --cdc-binlog, não os dois.")
+        if args.cdc_live and (args.direct_load or args.cdc_binlog):
+            raise ConfigError("--cdc-live não combina com --direct-load nem com --cdc-binlog.")
+        if args.cdc_follow and not args.cdc_live:
+            raise ConfigError("--cdc-follow só vale junto com --cdc-live.")
+        if args.cdc_start and not (args.cdc_binlog or args.cdc_live):
+            raise ConfigError("--cdc-start só vale junto com --cdc-binlog ou --cdc-live.")
+        if args.direct_load:
+            direct_options = direct_load_options_from_config(config)
+        elif not args.output:
+            raise ConfigError("Informe o diretório de saída (--output) ou use --direct-load.")
+        elif args.cdc_binlog or args.cdc_live:
+            if args.cdc_binlog and not os.path.isfile(args.cdc_binlog):
+                raise ConfigError(f"Arquivo de binlog não encontrado: {args.cdc_binlog}")
+            cdc_start = parse_binlog_position(args.cdc_start) if args.cdc_start else None
+            cdc_transactions_per_file = int_option(config, 'cdc_transactions_per_file', 10000)
+        else:
+            options = options_from_config(config, os.path.abspath(args.output), args.resume)
+            os.makedirs(options.output_directory, exist_ok=True)
+        table_names = [name.strip() for name in args.tables.split(',') if name.strip()] if args.tables else None
+        config_options = config.get('options', {})
+
+        try:
+            tables = self.load_tables(source_config, table_names, config_options.get('row_count_mode', 'approximate'),
+                                      config_options.get('use_metadata_cache', True))
+        except ConfigError:
+            raise
+        except RuntimeError as e_connect:
+            self.log(f"Falha ao carregar as tabelas do MariaDB: {e_connect}", "CRITICAL")
+            return EXIT_CONNECTION_ERROR
+        if not tables:
+            self.log("Nenhuma tabela encontrada para gerar scripts.", "WARNING")
+            return EXIT_OK
+
+        self.tables_total = len(tables)
+        if args.direct_load:
+            return self.run_direct_load(args.direct_load, source_config, direct_options, tables)
+        if args.cdc_binlog or args.cdc_live:
+            return self.run_cdc(args.cdc_binlog, os.path.abspath(args.output), source_config, cdc_start, tables,
+                                cdc_transactions_per_file, follow=args.cdc_follow)
+        self.log(f"Gerando scripts de {len(tables)} tabela(s) em {options.output_directory}", "ACTION")
+        generator = ScriptGenerator(
+            source_config, options,
+            log=self.log,
+            should_continue=lambda: not self.cancel_event.is_set(),
+            on_progress=(lambda message: self.log(message, "DEBUG")) if args.verbose else None,
+            on_table_done=self.on_table_done,
+        )
+        results = generator.run(tables)
+        completed = not self.cancel_event.is_set()
+        print(generator.build_summary(results, len(tables), completed), flush=True)
+
+        if not completed:
+            self.log("Geração interrompida. Use --resume para continuar.", "WARNING")
+            return EXIT_INTERRUPTED
+        if any(result.error for result in results):
+            self.log("Geração concluída com erros em algumas tabelas.", "ERROR")
+            return EXIT_TABLE_ERRORS
+        self.log("=== GERAÇÃO DE SCRIPTS CONCLUÍDA ===", "SUCCESS")
+        return EXIT_OK
+
+    def run_direct_load(self, dsn: str, source_config: Dict[str, Any], options: DirectLoadOptions,
+                        tables: List) -> int:
+        try:
+            connect_dsn(dsn).close() # Falha de conexão com o destino antes de abrir os workers
+        except Exception as e_target:
+            self.log(f"Falha ao conectar ao destino: {e_target}", "CRITICAL")
+            return EXIT_CONNECTION_ERROR
+
+        self.log(f"Carga direta de {len(tables)} tabela(s) (lote {options.batch_size}, "
+                 f"COMMIT a cada {options.commit_every} linhas).", "ACTION")
+        loader = InformixDirectLoader(
+            source_config, lambda: connect_dsn(dsn), options,
+            log=self.log,
+            should_continue=lambda: not self.cancel_event.is_set(),
+            on_table_done=self.on_table_loaded,
+        )
+        results = loader.run(tables)
+        print(f"Carga direta: {loader.total_records} linha(s) em {len(results)} tabela(s).", flush=True)
+
+        if self.cancel_event.is_set():
+            self.log("Carga interrompida; as tabelas incompletas ficaram com as linhas já confirmadas.", "WARNING")
+            return EXIT_INTERRUPTED
+        if any(result.error for result in results):
+            self.log("Carga concluída com erros em algumas tabelas.", "ERROR")
+            return EXIT_TABLE_ERRORS
+        self.log("=== CARGA DIRETA CONCLUÍDA ===", "SUCCESS")
+        return EXIT_OK
+
+    def run_cdc(self, binlog_path: Optional[str], output_directory: str, source_config: Dict[str, Any],
+                start: Optional[BinlogPosition], tables: List, transactions_per_file: int = 10000,
+                follow: bool = False) -> int:
+        """Converte as alterações do binlog em scripts CDC_*.sql: de `binlog_path` (arquivo
+        copiado do servidor) ou, sem ele, direto do servidor (`follow` espera novos eventos)."""
+        schema_key = f"{source_config['source_host']}:{source_config['source_port']}/{source_config['source_database']}"
+        should_continue = lambda: not self.cancel_event.is_set()
+        cdc = BinlogCDC(tables, output_directory, BinlogPositionStore(schema_key), transactions_per_file,
+                        log=self.log, should_continue=should_continue)
+        try:
+            start = cdc.start_position(start)
+        except RuntimeError as e_position:
+            raise ConfigError(str(e_position))
+
+        if binlog_path:
+            self.log(f"Convertendo {binlog_path} a partir de {start} em {output_directory}", "ACTION")
+            reader = MysqlbinlogFileReader(binlog_path, cdc.tables, source_config['source_database'],
+                                           start=start, log=self.log)
+        else:
+            try:
+                reader = LiveBinlogReader(source_config, cdc.tables, start, blocking=follow,
+                                          should_continue=should_continue, log=self.log)
+            except RuntimeError as e_replication:
+                self.log(str(e_replication), "CRITICAL")
+                return EXIT_CONNECTION_ERROR
+            waiting = " (aguardando novos eventos; Ctrl+C para parar)" if follow else ""
+            self.log(f"Lendo o binlog de {schema_key} a partir de {start} em {output_directory}{waiting}", "ACTION")
+        result = cdc.run(reader, start)
+        print(f"CDC: {result.describe()}; {len(result.files)} arquivo(s).", flush=True)
+        if getattr(reader, 'skipped_changes', 0):
+            self.log(f"{reader.skipped_changes} alteração(ões) ignorada(s): a posição inicial cai no meio de "
+                     "uma transação.", "WARNING")
+
+        if self.cancel_event.is_set():
+            self.log(f"CDC interrompido; a próxima execução continua de {result.end_position}.", "WARNING")
+            return EXIT_INTERRUPTED
+        self.log("=== CDC CONCLUÍDO ===", "SUCCESS")
+        return EXIT_OK
+
+    def close(self):
+        self.log_listener.stop()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Gera scripts Informix (DDL, dados e RUN_ALL_SCRIPTS.sh) a partir de um MariaDB, sem interface gráfica.")
+    parser.add_argument('config', help="JSON salvo pela GUI (Salvar Configuração)")
+    parser.add_argument('-o', '--output', help="Diretório de saída dos scripts (obrigatório sem --direct-load)")
+    parser.add_argument('--direct-load', metavar='DSN',
+                        help="Carregar direto no Informix por esta DSN em vez de gerar scripts "
+                             "('sqlite:///arquivo.db' para um destino SQLite de teste)")
+    parser.add_argument('--cdc-binlog', metavar='ARQUIVO',
+                        help="Converter as alterações deste binlog em scripts CDC_*.sql no diretório de saída")
+    parser.add_argument('--cdc-live', action='store_true',
+                        help="Ler as alterações direto do binlog do servidor (mysql-replication) e gravar CDC_*.sql")
+    parser.add_argument('--cdc-follow', action='store_true',
+                        help="Com --cdc-live, continuar esperando novos eventos até Ctrl+C em vez de parar no fim do binlog")
+    parser.add_argument('--cdc-start', metavar='ARQUIVO:POSIÇÃO',
+                        help="Posição inicial do binlog (padrão: a última gravada em cache/binlog_position.json)")
+    parser.add_argument('-t', '--tables', help="Tabelas separadas por vírgula (padrão: todas)")
+    parser.add_argument('--resume', action='store_true', help="Retomar a partir do checkpoint do diretório de saída")
+    parser.add_argument('-v', '--verbose', action='store_true', help="Mostrar mensagens DEBUG e o progresso de cada lote")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    runner = CLIRunner(verbose=args.verbose)
+    runner.install_signal_handlers()
+    try:
+        return runner.run(args)
+    except ConfigError as e_config:
+        runner.log(str(e_config), "ERROR")
+        return EXIT_CONFIG_ERROR
+    except KeyboardInterrupt:
+        runner.log("Geração abortada.", "CRITICAL")
+        return EXIT_INTERRUPTED
+    except Exception as e:
+        runner.log(f"ERRO CRÍTICO durante a geração de scripts: {e}", "CRITICAL")
+        runner.log(traceback.format_exc(), "DEBUG")
+        return EXIT_FAILURE
+    finally:
+        runner.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
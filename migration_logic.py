@@ -0,0 +1,2405 @@
+# migration_logic.py
+import os
+import gzip
+import json
+import queue
+import threading
+import time
+import multiprocessing
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from datetime import datetime, date, timedelta
+from decimal import Decimal
+from typing import Dict, List, Any, Optional, Iterator, Callable
+from dataclasses import dataclass, field
+from functools import partial
+
+# Database connectors
+try:
+    import mysql.connector
+    MYSQL_AVAILABLE = True
+except ImportError:
+    MYSQL_AVAILABLE = False
+    print("AVISO: mysql-connector-python não encontrado. Funcionalidades MariaDB serão limitadas.")
+    print("Instale com: pip install mysql-connector-python")
+
+try:
+    import ifxpy  # Para Informix
+    INFORMIX_AVAILABLE = True
+except ImportError:
+    INFORMIX_AVAILABLE = False
+    print("AVISO: ifxpy não encontrado. Funcionalidades Informix (conexão direta) serão limitadas.")
+    print("Instale com: pip install ifxpy")
+    print("Lembre-se que ifxpy requer o driver do Informix (IBM Informix Client SDK) instalado e configurado no sistema.")
+
+# Compressão opcional dos arquivos de dados (gzip vem da biblioteca padrão)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    print("AVISO: zstandard não encontrado. Compressão zstd indisponível (pip install zstandard).")
+
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+    print("AVISO: lz4 não encontrado. Compressão lz4 indisponível (pip install lz4).")
+
+@dataclass
+class Column:
+    name: str
+    data_type: str
+    max_length: Optional[int] = None
+    is_nullable: bool = True
+    default_value: Optional[str] = None
+    is_primary_key: bool = False
+    is_auto_increment: bool = False
+    is_unsigned: bool = False           # COLUMN_TYPE com UNSIGNED (o DATA_TYPE não diz)
+
+@dataclass
+class Table:
+    name: str
+    columns: List[Column]
+    row_count: int = 0
+    row_count_source: str = 'exact'    # 'exact' (COUNT(*)), 'approximate' (TABLE_ROWS) ou 'unknown' (não contado)
+
+
+def format_row_count(table: Table) -> str:
+    """Contagem para exibição: '1,234', '~1,234' (estimativa) ou '?' (não contada)."""
+    if table.row_count_source == 'unknown':
+        return "?"
+    prefix = "~" if table.row_count_source == 'approximate' else ""
+    return f"{prefix}{table.row_count:,}"
+
+@dataclass
+class KeyRange:
+    """Faixa [lower, upper) de valores de uma coluna indexada; None deixa o lado em aberto.
+
+    As faixas de partição são fechadas à esquerda; a janela do modo delta é
+    (marca anterior, marca nova], com lower_inclusive=False e upper_inclusive=True.
+    """
+    column: str
+    lower: Any = None
+    upper: Any = None
+    lower_inclusive: bool = True
+    upper_inclusive: bool = False
+
+    def predicate(self):
+        conditions = []
+        params: List[Any] = []
+        if self.lower is not None:
+            conditions.append(f"`{self.column}` {'>=' if self.lower_inclusive else '>'} %s")
+            params.append(self.lower)
+        if self.upper is not None:
+            conditions.append(f"`{self.column}` {'<=' if self.upper_inclusive else '<'} %s")
+            params.append(self.upper)
+        return " AND ".join(conditions), params
+
+    def describe(self) -> str:
+        lower = "-∞" if self.lower is None else repr(self.lower)
+        upper = "+∞" if self.upper is None else repr(self.upper)
+        left = "[" if self.lower_inclusive else "("
+        right = "]" if self.upper_inclusive else ")"
+        return f"{self.column} em {left}{lower}, {upper}{right}"
+
+@dataclass
+class MigrationConfig:
+    source_host: str
+    source_port: int
+    source_database: str
+    source_user: str
+    source_password: str
+    target_host: str
+    target_port: int
+    target_database: str
+    target_user: str
+    target_password: str
+    selected_tables: List[str]
+    migrate_data: bool = True
+    batch_size: int = 1000
+
+class TypeMapper:
+    """Mapeia tipos MariaDB para Informix"""
+
+    MARIADB_TO_INFORMIX = {
+        'TINYINT': 'SMALLINT',
+        'SMALLINT': 'SMALLINT',
+        'MEDIUMINT': 'INTEGER',
+        'INT': 'INTEGER',
+        'INTEGER': 'INTEGER',
+        'BIGINT': 'BIGINT',
+        'DECIMAL': 'DECIMAL',
+        'NUMERIC': 'DECIMAL',
+        'FLOAT': 'REAL', # MariaDB FLOAT is single-precision
+        'DOUBLE': 'FLOAT', # MariaDB DOUBLE is double-precision, maps to Informix FLOAT
+        'REAL': 'FLOAT', # MariaDB REAL is an alias for DOUBLE
+        'BIT': 'BOOLEAN',
+        'BOOL': 'BOOLEAN',
+        'BOOLEAN': 'BOOLEAN',
+        'CHAR': 'CHAR',
+        'VARCHAR': 'VARCHAR',
+        'BINARY': 'BYTE',
+        'VARBINARY': 'BYTE',
+        'TINYBLOB': 'BYTE',
+        'BLOB': 'BYTE',
+        'MEDIUMBLOB': 'BYTE',
+        'LONGBLOB': 'BYTE',
+        'TINYTEXT': 'LVARCHAR',
+        'TEXT': 'TEXT',
+        'MEDIUMTEXT': 'TEXT',
+        'LONGTEXT': 'TEXT',
+        'ENUM': 'VARCHAR', # Needs careful handling of length
+        'SET': 'VARCHAR',  # Needs careful handling of length
+        'DATE': 'DATE',
+        'TIME': 'DATETIME HOUR TO SECOND',
+        'DATETIME': 'DATETIME YEAR TO SECOND',
+        'TIMESTAMP': 'DATETIME YEAR TO SECOND',
+        'YEAR': 'SMALLINT', # Informix doesn't have a YEAR type, SMALLINT is a common mapping
+        'JSON': 'LVARCHAR' # Or JSON/BSON type if Informix version supports it and driver handles it
+    }
+
+    @classmethod
+    def map_type(cls, mariadb_type: str, length: Optional[int] = None, precision: Optional[int] = None, scale: Optional[int] = None) -> str:
+        base_type = mariadb_type.upper().split('(')[0]  # Remove any size/precision from type name
+        informix_type = cls.MARIADB_TO_INFORMIX.get(base_type)
+        
+        if not informix_type:
+            return 'VARCHAR(255)'  # Default fallback type
+            
+        # Add length/precision/scale where appropriate
+        if base_type in ['CHAR', 'VARCHAR', 'BINARY', 'VARBINARY']:
+            length = length or 255  # Default length if none specified
+            return f"{informix_type}({length})"
+        elif base_type in ['DECIMAL', 'NUMERIC']:
+            p = precision or 10  # Default precision
+            s = scale or 0      # Default scale
+            return f"{informix_type}({p},{s})"
+        
+        return informix_type
+
+
+class MariaDBExtractor:
+    def __init__(self):
+        self.connection = None
+
+    def connect(self, config: Dict[str, Any]) -> bool:
+        if not MYSQL_AVAILABLE:
+            raise RuntimeError("MySQL connector não está disponível")
+        try:
+            self.connection = mysql.connector.connect(
+                host=config['source_host'],
+                port=config['source_port'],
+                database=config['source_database'],
+                user=config['source_user'],
+                password=config['source_password']
+            )
+            return True
+        except mysql.connector.Error as e:
+            raise RuntimeError(f"Erro ao conectar ao MariaDB: {str(e)}")
+        except Exception as e:
+            raise RuntimeError(f"Erro inesperado: {str(e)}")
+
+    def get_tables(self) -> List[str]:
+        if not self.connection:
+            raise RuntimeError("Não conectado ao banco de dados")
+        cursor = self.connection.cursor()
+        cursor.execute("SHOW FULL TABLES WHERE Table_Type = 'BASE TABLE'") # Ignora views
+        tables = [table[0] for table in cursor.fetchall()]
+        cursor.close()
+        return tables
+
+    # Tabelas por consulta UNION ALL de contagem em get_schema_tables
+    COUNT_TABLES_PER_QUERY = 200
+    # 'exact': COUNT(*) de cada tabela; 'approximate': TABLE_ROWS das estatísticas do
+    # InnoDB (sem varrer a tabela); 'lazy': não conta (count_rows quando for necessário)
+    ROW_COUNT_MODES = ('exact', 'approximate', 'lazy')
+
+    def get_table_info(self, table_name: str, row_count_mode: str = 'exact') -> Table:
+        tables = self.get_schema_tables([table_name], row_count_mode)
+        if not tables:
+            raise RuntimeError(f"Tabela {table_name} não encontrada no banco de dados")
+        return tables[0]
+
+    @staticmethod
+    def _column_from_schema(row: tuple) -> Column:
+        """Column a partir de uma linha de INFORMATION_SCHEMA.COLUMNS
+        (COLUMN_NAME, DATA_TYPE, CHARACTER_MAXIMUM_LENGTH, IS_NULLABLE, COLUMN_DEFAULT, COLUMN_KEY, EXTRA, COLUMN_TYPE)."""
+        name, data_type, max_length, is_nullable, default_value, column_key, extra, column_type = row
+        return Column(
+            name=name,
+            data_type=data_type.upper(),
+            max_length=max_length,
+            is_nullable=is_nullable == 'YES',
+            default_value=default_value,
+            is_primary_key=column_key == 'PRI',
+            is_auto_increment='auto_increment' in extra.lower() if extra else False,
+            is_unsigned='unsigned' in column_type.lower() if column_type else False
+        )
+
+    @staticmethod
+    def _table_signatures(cursor, create_times: Dict[str, Any]) -> Dict[str, str]:
+        """Assinatura por tabela: CREATE_TIME + quantidade e checksum das definições de coluna.
+
+        Uma única consulta agregada no INFORMATION_SCHEMA.COLUMNS; muda quando a tabela é
+        recriada ou quando qualquer coluna é adicionada, removida ou alterada.
+        """
+        cursor.execute("""
+            SELECT TABLE_NAME, COUNT(*),
+                   SUM(CRC32(CONCAT_WS('|', ORDINAL_POSITION, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE,
+                                       IFNULL(COLUMN_DEFAULT, '<NULL>'), COLUMN_KEY, EXTRA)))
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE()
+            GROUP BY TABLE_NAME
+        """)
+        return {
+            name: f"{create_times.get(name)}|{column_count}|{checksum}"
+            for name, column_count, checksum in cursor.fetchall()
+        }
+
+    def _load_columns(self, cursor, names: List[str], whole_schema: bool) -> Dict[str, List[Column]]:
+        """Colunas de `names`; com whole_schema lê o schema inteiro numa consulta, senão em blocos IN (...)."""
+        query = """
+            SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE, CHARACTER_MAXIMUM_LENGTH,
+                   IS_NULLABLE, COLUMN_DEFAULT, COLUMN_KEY, EXTRA, COLUMN_TYPE
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE(){}
+            ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """
+        if whole_schema:
+            chunks = [((), "")]
+        else:
+            chunks = []
+            for i in range(0, len(names), self.COUNT_TABLES_PER_QUERY):
+                chunk = tuple(names[i:i + self.COUNT_TABLES_PER_QUERY])
+                chunks.append((chunk, f" AND TABLE_NAME IN ({', '.join(['%s'] * len(chunk))})"))
+
+        columns_by_table: Dict[str, List[Column]] = {name: [] for name in names}
+        for params, condition in chunks:
+            cursor.execute(query.format(condition), params)
+            for row in cursor.fetchall():
+                table_columns = columns_by_table.get(row[0])
+                if table_columns is not None:
+                    table_columns.append(self._column_from_schema(row[1:]))
+        return columns_by_table
+
+    def get_schema_tables(self, table_names: Optional[List[str]] = None, row_count_mode: str = 'exact',
+                          cache=None) -> List[Table]:
+        """Metadados (colunas, chaves e contagem) de todas as tabelas do banco, ou de `table_names`."""
+        tables = []
+        for chunk in self.iter_schema_tables(table_names, row_count_mode, cache):
+            tables.extend(chunk)
+        return tables
+
+    def iter_schema_tables(self, table_names: Optional[List[str]] = None, row_count_mode: str = 'exact',
+                           cache=None, chunk_size: Optional[int] = None) -> Iterator[List[Table]]:
+        """Gera os metadados em blocos de `chunk_size` tabelas (padrão COUNT_TABLES_PER_QUERY).
+
+        Em vez de DESCRIBE + INFORMATION_SCHEMA.COLUMNS + COUNT(*) por tabela, faz uma
+        consulta em INFORMATION_SCHEMA.TABLES e, por bloco, uma em INFORMATION_SCHEMA.COLUMNS
+        e (no modo 'exact') uma contagem UNION ALL. Quem consome pode mostrar cada bloco
+        assim que chega e interromper a leitura fechando o gerador.
+
+        Com `cache` (metadata_cache.SchemaMetadataCache) as colunas só são lidas para as
+        tabelas cuja assinatura mudou desde a última leitura; o cache é gravado no final.
+        """
+        if row_count_mode not in self.ROW_COUNT_MODES:
+            raise ValueError(f"Modo de contagem inválido: {row_count_mode}")
+        if not self.connection:
+            raise RuntimeError("Não conectado ao banco de dados")
+        chunk_size = chunk_size or self.COUNT_TABLES_PER_QUERY
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("""
+                SELECT TABLE_NAME, TABLE_ROWS, CREATE_TIME
+                FROM INFORMATION_SCHEMA.TABLES
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_TYPE = 'BASE TABLE'
+                ORDER BY TABLE_NAME
+            """)
+            tables_rows = cursor.fetchall()
+            table_rows = {row[0]: row[1] for row in tables_rows}
+            names = list(table_rows)
+            if table_names is not None:
+                wanted = set(table_names)
+                names = [name for name in names if name in wanted]
+
+            signatures: Dict[str, str] = {}
+            if cache is not None and names:
+                signatures = self._table_signatures(cursor, {row[0]: row[2] for row in tables_rows})
+
+            for i in range(0, len(names), chunk_size):
+                chunk = names[i:i + chunk_size]
+                columns_by_table: Dict[str, List[Column]] = {}
+                if cache is not None:
+                    for name in chunk:
+                        cached_columns = cache.get(name, signatures.get(name))
+                        if cached_columns is not None:
+                            columns_by_table[name] = cached_columns
+                stale = [name for name in chunk if name not in columns_by_table]
+                if stale:
+                    columns_by_table.update(self._load_columns(cursor, stale, whole_schema=len(stale) == len(table_rows)))
+                    if cache is not None:
+                        for name in stale:
+                            cache.put(name, signatures.get(name), columns_by_table[name])
+
+                row_counts: Dict[str, int] = {}
+                if row_count_mode == 'exact':
+                    count_query = " UNION ALL ".join(f"SELECT %s, COUNT(*) FROM `{name}`" for name in chunk)
+                    cursor.execute(count_query, tuple(chunk))
+                    row_counts = {name: count for name, count in cursor.fetchall()}
+
+                tables = []
+                for name in chunk:
+                    table = Table(name=name, columns=columns_by_table[name])
+                    if row_count_mode == 'exact':
+                        table.row_count = row_counts.get(name, 0)
+                    elif row_count_mode == 'approximate':
+                        table.row_count = int(table_rows[name] or 0) # NULL para engines sem estatística
+                        table.row_count_source = 'approximate'
+                    else:
+                        table.row_count_source = 'unknown'
+                    tables.append(table)
+                yield tables
+
+            if cache is not None and table_names is None:
+                cache.retain(names)
+        except mysql.connector.Error as e:
+            raise RuntimeError(f"Erro ao ler metadados do MariaDB: {str(e)}")
+        finally:
+            cursor.close()
+            if cache is not None:
+                cache.save() # Também quando a leitura é interrompida: os blocos já lidos ficam no cache
+
+    def count_rows(self, table: Table) -> int:
+        """COUNT(*) exato da tabela; atualiza table.row_count."""
+        if not self.connection:
+            raise RuntimeError("Não conectado ao banco de dados")
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(f"SELECT COUNT(*) FROM `{table.name}`")
+            table.row_count = cursor.fetchone()[0]
+            table.row_count_source = 'exact'
+        except mysql.connector.Error as e:
+            raise RuntimeError(f"Erro ao contar registros de {table.name}: {str(e)}")
+        finally:
+            cursor.close()
+        return table.row_count
+
+    @staticmethod
+    def get_key_columns(table: Table) -> List[str]:
+        """Colunas da chave primária (na ordem da tabela) usadas na paginação por chave."""
+        return [col.name for col in table.columns if col.is_primary_key]
+
+    def choose_pagination_strategy(self, table: Table) -> str:
+        """'keyset' quando a tabela tem PK utilizável; 'offset' (LIMIT/OFFSET) caso contrário."""
+        return 'keyset' if self.get_key_columns(table) else 'offset'
+
+    @staticmethod
+    def get_partition_column(table: Table) -> Optional[Column]:
+        """Primeira coluna da PK: é a coluna líder do índice primário, então faixas nela viram range scans."""
+        for col in table.columns:
+            if col.is_primary_key:
+                return col
+        return None
+
+    @staticmethod
+    def get_delta_column(table: Table, preferred_names: List[str]) -> Optional[Column]:
+        """Coluna de marca d'água do modo delta: a primeira TIMESTAMP/DATETIME cujo nome está em
+        `preferred_names` ou, sem ela, a chave primária auto_increment de uma só coluna
+        (que só enxerga linhas novas, não alteradas)."""
+        temporal = {col.name.lower(): col for col in table.columns if col.data_type in ('TIMESTAMP', 'DATETIME')}
+        for name in preferred_names:
+            column = temporal.get(name.strip().lower())
+            if column is not None:
+                return column
+        key_columns = [col for col in table.columns if col.is_primary_key]
+        if len(key_columns) == 1 and key_columns[0].is_auto_increment:
+            return key_columns[0]
+        return None
+
+    def get_column_max(self, table: Table, column_name: str) -> Any:
+        if not self.connection:
+            raise RuntimeError("Não conectado ao banco de dados")
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(f"SELECT MAX(`{column_name}`) FROM `{table.name}`")
+            return cursor.fetchone()[0]
+        except mysql.connector.Error as e:
+            raise RuntimeError(f"Erro ao obter MAX({column_name}) de {table.name}: {str(e)}")
+        finally:
+            cursor.close()
+
+    def get_binlog_position(self) -> Optional[tuple]:
+        """(arquivo, posição) atuais do binlog do servidor (SHOW MASTER STATUS), ou None se o
+        binlog estiver desativado. É o ponto de partida do CDC (binlog_cdc) depois de uma carga."""
+        if not self.connection:
+            raise RuntimeError("Não conectado ao banco de dados")
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("SHOW MASTER STATUS")
+            row = cursor.fetchone()
+            return (row[0], int(row[1])) if row else None
+        except mysql.connector.Error as e:
+            raise RuntimeError(f"Erro ao ler a posição do binlog: {str(e)}")
+        finally:
+            cursor.close()
+
+    def get_key_ranges(self, table: Table, partitions: int) -> List[KeyRange]:
+        """Divide a tabela em até `partitions` faixas contíguas da coluna de partição.
+
+        Colunas inteiras são divididas em intervalos iguais entre MIN e MAX; as demais
+        usam limites amostrados por quantis da contagem de registros. A primeira e a
+        última faixa ficam abertas, cobrindo a tabela inteira.
+        """
+        if not self.connection:
+            raise RuntimeError("Não conectado ao banco de dados")
+
+        column = self.get_partition_column(table)
+        if column is None:
+            raise RuntimeError(f"Tabela {table.name} não possui chave primária para particionamento")
+        if partitions < 2:
+            return [KeyRange(column.name)]
+
+        cursor = self.connection.cursor(buffered=True)
+        try:
+            boundaries: List[Any] = []
+            if InsertPlan.value_kind(column) == 'int':
+                cursor.execute(f"SELECT MIN(`{column.name}`), MAX(`{column.name}`) FROM `{table.name}`")
+                low, high = cursor.fetchone()
+                if low is None or high is None:
+                    return [KeyRange(column.name)]
+                step = (high - low + 1) / partitions
+                boundaries = [low + int(step * k) for k in range(1, partitions)]
+            else:
+                row_count = table.row_count or 0
+                for k in range(1, partitions):
+                    cursor.execute(
+                        f"SELECT `{column.name}` FROM `{table.name}` ORDER BY `{column.name}` LIMIT 1 OFFSET %s",
+                        (row_count * k // partitions,)
+                    )
+                    row = cursor.fetchone()
+                    if row is not None:
+                        boundaries.append(row[0])
+        except mysql.connector.Error as e:
+            raise RuntimeError(f"Erro ao calcular faixas da tabela {table.name}: {str(e)}")
+        finally:
+            cursor.close()
+
+        unique_boundaries = []
+        for boundary in boundaries:
+            if not unique_boundaries or boundary > unique_boundaries[-1]:
+                unique_boundaries.append(boundary)
+
+        edges = [None] + unique_boundaries + [None]
+        return [KeyRange(column.name, edges[i], edges[i + 1]) for i in range(len(edges) - 1)]
+
+    @staticmethod
+    def _select_list(table: Table) -> str:
+        # Lista explícita na ordem de table.columns: a posição i da tupla retornada é table.columns[i]
+        return ", ".join(f"`{col.name}`" for col in table.columns)
+
+    @staticmethod
+    def _build_keyset_predicate(key_columns: List[str], last_key: tuple):
+        # (a, b) > (x, y) expandido para a > x OR (a = x AND b > y),
+        # forma que o otimizador do MariaDB resolve como range no índice da PK.
+        conditions = []
+        params: List[Any] = []
+        for i, key_col in enumerate(key_columns):
+            parts = [f"`{prev}` = %s" for prev in key_columns[:i]]
+            parts.append(f"`{key_col}` > %s")
+            conditions.append("(" + " AND ".join(parts) + ")")
+            params.extend(last_key[:i + 1])
+        return " OR ".join(conditions), params
+
+    @staticmethod
+    def _range_conditions(key_range: Optional[KeyRange]):
+        if key_range is None:
+            return [], []
+        predicate, params = key_range.predicate()
+        return ([predicate] if predicate else []), params
+
+    def get_table_data_keyset(self, table: Table, batch_size: int, last_key: Optional[tuple] = None,
+                              key_range: Optional[KeyRange] = None) -> List[tuple]:
+        """Lê o próximo lote a partir da última chave vista (WHERE pk > last_key ORDER BY pk LIMIT n)."""
+        if not self.connection:
+            raise RuntimeError("Não conectado ao banco de dados")
+
+        key_columns = self.get_key_columns(table)
+        if not key_columns:
+            raise RuntimeError(f"Tabela {table.name} não possui chave primária para paginação por chave")
+
+        query = f"SELECT {self._select_list(table)} FROM `{table.name}`"
+        conditions, params = self._range_conditions(key_range)
+        if last_key is not None:
+            predicate, keyset_params = self._build_keyset_predicate(key_columns, last_key)
+            conditions.append(f"({predicate})")
+            params.extend(keyset_params)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY " + ", ".join(f"`{c}`" for c in key_columns) + " LIMIT %s"
+        params.append(batch_size)
+
+        cursor = self.connection.cursor(buffered=True)
+        try:
+            cursor.execute(query, tuple(params))
+            return cursor.fetchall()
+        except mysql.connector.Error as e:
+            raise RuntimeError(f"Erro ao obter dados da tabela {table.name}: {str(e)}")
+        finally:
+            cursor.close()
+
+    def stream_table_data(self, table: Table, fetch_size: int, key_range: Optional[KeyRange] = None,
+                          after_key: Optional[tuple] = None, skip_rows: int = 0) -> Iterator[List[tuple]]:
+        """Executa um único SELECT em cursor não bufferizado e gera os registros em blocos de fetchmany.
+
+        Com chave primária o resultado vem ordenado por ela (no InnoDB é a ordem do
+        índice clusterizado, sem custo extra), o que permite retomar depois de `after_key`;
+        sem chave a ordem não é garantida entre execuções e `skip_rows` só vale dentro da
+        mesma consulta (o ScriptGenerator recomeça essas partes do zero). Enquanto o gerador não for
+        esgotado a conexão fica ocupada com o resultado pendente.
+        """
+        if not self.connection:
+            raise RuntimeError("Não conectado ao banco de dados")
+
+        key_columns = self.get_key_columns(table)
+        query = f"SELECT {self._select_list(table)} FROM `{table.name}`"
+        conditions, params = self._range_conditions(key_range)
+        if after_key is not None and key_columns:
+            predicate, keyset_params = self._build_keyset_predicate(key_columns, after_key)
+            conditions.append(f"({predicate})")
+            params.extend(keyset_params)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        if key_columns:
+            query += " ORDER BY " + ", ".join(f"`{c}`" for c in key_columns)
+        elif skip_rows:
+            query += " LIMIT 18446744073709551615 OFFSET %s" # Forma do MariaDB para OFFSET sem LIMIT
+            params.append(skip_rows)
+
+        cursor = self.connection.cursor(buffered=False)
+        exhausted = False
+        try:
+            try:
+                cursor.execute(query, tuple(params))
+            except mysql.connector.Error as e:
+                raise RuntimeError(f"Erro ao obter dados da tabela {table.name}: {str(e)}")
+            while True:
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    exhausted = True
+                    return
+                yield rows
+        finally:
+            if exhausted:
+                cursor.close()
+            else:
+                # Parada antecipada: descartar a conexão sai mais barato do que drenar
+                # o restante da tabela pelo cursor não bufferizado.
+                self.close()
+                self.connection = None
+
+    def iter_table_batches(self, table: Table, batch_size: int, strategy: Optional[str] = None,
+                           key_range: Optional[KeyRange] = None, resume_key: Optional[tuple] = None,
+                           resume_offset: int = 0) -> Iterator[List[tuple]]:
+        """Gera os lotes da tabela (ou só da faixa `key_range`) usando a estratégia indicada
+        ou a de paginação escolhida automaticamente.
+
+        Para retomar uma extração interrompida: `resume_key` é a chave primária da última
+        linha já gravada (keyset e streaming com PK); `resume_offset` é a quantidade de
+        linhas já gravadas (LIMIT/OFFSET e streaming sem PK).
+        """
+        strategy = strategy or self.choose_pagination_strategy(table)
+
+        if strategy == 'stream':
+            yield from self.stream_table_data(table, batch_size, key_range, resume_key, resume_offset)
+        elif strategy == 'keyset':
+            key_indexes = [i for i, col in enumerate(table.columns) if col.is_primary_key]
+            last_key = resume_key
+            while True:
+                batch = self.get_table_data_keyset(table, batch_size, last_key, key_range)
+                if not batch:
+                    return
+                yield batch
+                if len(batch) < batch_size:
+                    return
+                last_row = batch[-1]
+                last_key = tuple(last_row[i] for i in key_indexes)
+        else:
+            offset = resume_offset
+            while True:
+                batch = self.get_table_data(table, batch_size, offset, key_range)
+                if not batch:
+                    return
+                yield batch
+                if len(batch) < batch_size:
+                    return
+                offset += len(batch)
+
+    def get_table_data(self, table: Table, batch_size: int, offset: int, key_range: Optional[KeyRange] = None) -> List[tuple]:
+        if not self.connection:
+            raise RuntimeError("Não conectado ao banco de dados")
+        
+        cursor = self.connection.cursor(buffered=True)
+        query = f"SELECT {self._select_list(table)} FROM `{table.name}`"
+        conditions, params = self._range_conditions(key_range)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        # Sem ORDER BY as páginas podem repetir ou pular linhas, e a retomada pelo número de
+        # linhas já gravadas não cairia no mesmo ponto. Sem PK ordena por todas as colunas:
+        # linhas empatadas são idênticas e geram o mesmo INSERT, em qualquer ordem.
+        order_columns = self.get_key_columns(table) or [col.name for col in table.columns]
+        query += " ORDER BY " + ", ".join(f"`{c}`" for c in order_columns)
+        query += " LIMIT %s OFFSET %s"
+        
+        try:
+            cursor.execute(query, tuple(params) + (batch_size, offset))
+            data = cursor.fetchall()
+            return data
+        except mysql.connector.Error as e:
+            raise RuntimeError(f"Erro ao obter dados da tabela {table.name}: {str(e)}")
+        finally:
+            cursor.close()
+
+    def close(self):
+        if self.connection and self.connection.is_connected():
+            self.connection.close()
+
+class InsertPlan:
+    """Plano de formatação de valores compilado uma vez por Table.
+
+    Cada coluna inserida (as auto_increment ficam de fora) recebe um formatador
+    especializado pelo tipo MariaDB de origem. Valores de tipo inesperado caem no
+    formatador genérico InformixGenerator.format_value. As linhas são tuplas na
+    ordem de table.columns, como retornadas por MariaDBExtractor.
+    """
+
+    INTEGER_TYPES = {'TINYINT', 'SMALLINT', 'MEDIUMINT', 'INT', 'INTEGER', 'BIGINT', 'YEAR'}
+    NUMERIC_TYPES = {'DECIMAL', 'NUMERIC', 'FLOAT', 'DOUBLE', 'REAL'}
+    STRING_TYPES = {'CHAR', 'VARCHAR', 'TINYTEXT', 'TEXT', 'MEDIUMTEXT', 'LONGTEXT', 'ENUM', 'SET', 'JSON'}
+    DATETIME_TYPES = {'DATETIME', 'TIMESTAMP'}
+    BYTES_TYPES = {'BINARY', 'VARBINARY', 'TINYBLOB', 'BLOB', 'MEDIUMBLOB', 'LONGBLOB'}
+    BOOLEAN_TYPES = {'BIT', 'BOOL', 'BOOLEAN'}
+
+    # (nome da tabela, assinatura das colunas) -> plano. Cópias da mesma Table (recarga dos
+    # metadados, lotes enviados aos processos de renderização) reaproveitam o plano; uma
+    # tabela alterada tem outra assinatura. Cada subclasse tem o seu dicionário.
+    _cache: Dict[tuple, 'InsertPlan'] = {}
+    # INSERTs deixam as colunas auto_increment para o SERIAL do Informix gerar
+    INCLUDE_AUTO_INCREMENT = False
+
+    def __init__(self, table: Table):
+        self.table = table
+        self.indexes = [i for i, col in enumerate(table.columns)
+                        if self.INCLUDE_AUTO_INCREMENT or not col.is_auto_increment]
+        self.columns = [table.columns[i] for i in self.indexes]
+        self.column_names = [col.name for col in self.columns]
+        self.formatters = [self.formatter_for(col) for col in self.columns]
+        self._bound = list(zip(self.indexes, self.formatters))
+        self.insert_prefix = f"INSERT INTO {table.name} ({', '.join(self.column_names)}) VALUES ("
+
+        # Tipos Informix de destino: NULLs num bloco UNION ALL precisam de tipo explícito
+        self.target_types = [
+            TypeMapper.map_type(col.data_type, col.max_length,
+                                getattr(col, 'precision', None), getattr(col, 'scale', None))
+            for col in self.columns
+        ]
+        self._typed_nulls = [f"NULL::{target_type}" for target_type in self.target_types]
+        # Colunas BYTE/TEXT não podem aparecer em SELECT ... UNION (BINARY/VARBINARY viram BYTE(n))
+        self.supports_union_insert = bool(self.columns) and not any(
+            target_type.split('(')[0] in ('BYTE', 'TEXT') for target_type in self.target_types
+        )
+
+    @staticmethod
+    def cache_key(table: Table) -> tuple:
+        """Nome da tabela e tudo o que o plano lê de cada coluna."""
+        return (table.name, tuple(
+            (col.name, col.data_type, col.max_length, col.is_primary_key, col.is_auto_increment,
+             getattr(col, 'precision', None), getattr(col, 'scale', None))
+            for col in table.columns
+        ))
+
+    @classmethod
+    def for_table(cls, table: Table) -> 'InsertPlan':
+        key = cls.cache_key(table)
+        plan = cls._cache.get(key)
+        if plan is None:
+            plan = cls._cache[key] = cls(table)
+        return plan
+
+    @classmethod
+    def value_kind(cls, column: Column) -> str:
+        base_type = column.data_type.upper().split('(')[0]
+        if base_type in cls.INTEGER_TYPES:
+            return 'int'
+        if base_type in cls.NUMERIC_TYPES:
+            return 'numeric'
+        if base_type in cls.STRING_TYPES:
+            return 'string'
+        if base_type in cls.DATETIME_TYPES:
+            return 'datetime'
+        if base_type == 'DATE':
+            return 'date'
+        if base_type == 'TIME':
+            return 'time'
+        if base_type in cls.BYTES_TYPES:
+            return 'bytes'
+        if base_type in cls.BOOLEAN_TYPES:
+            return 'boolean'
+        return 'generic'
+
+    @classmethod
+    def formatter_for(cls, column: Column) -> Callable[[Any], str]:
+        kind = cls.value_kind(column)
+        if kind == 'generic':
+            return partial(InformixGenerator.format_value, source_column_type=column.data_type.upper())
+        return getattr(cls, f"_format_{kind}")
+
+    # --- Formatadores especializados (todos tratam None como NULL) ---
+
+    @staticmethod
+    def _format_int(value: Any) -> str:
+        if value is None:
+            return 'NULL'
+        if type(value) is int:
+            return str(value)
+        return InformixGenerator.format_value(value)
+
+    @staticmethod
+    def _format_numeric(value: Any) -> str:
+        if value is None:
+            return 'NULL'
+        if isinstance(value, (Decimal, float, int)) and not isinstance(value, bool):
+            return str(value)
+        return InformixGenerator.format_value(value)
+
+    @staticmethod
+    def _format_string(value: Any) -> str:
+        if value is None:
+            return 'NULL'
+        if type(value) is str:
+            return "'" + value.replace("'", "''") + "'"
+        return InformixGenerator.format_value(value)
+
+    @staticmethod
+    def _format_datetime(value: Any) -> str:
+        if value is None:
+            return 'NULL'
+        if isinstance(value, datetime):
+            return "'" + value.isoformat(sep=' ', timespec='seconds') + "'" # DATETIME YEAR TO SECOND
+        return InformixGenerator.format_value(value)
+
+    @staticmethod
+    def _format_date(value: Any) -> str:
+        if value is None:
+            return 'NULL'
+        if isinstance(value, date):
+            return "'" + value.strftime('%Y-%m-%d') + "'"
+        return InformixGenerator.format_value(value)
+
+    @staticmethod
+    def _time_of_day(value: Any) -> Optional[str]:
+        # O conector devolve TIME como timedelta; DATETIME HOUR TO SECOND só aceita 00:00:00-23:59:59
+        if isinstance(value, timedelta) and timedelta(0) <= value < timedelta(days=1):
+            seconds = int(value.total_seconds())
+            return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+        return None
+
+    @staticmethod
+    def _format_time(value: Any) -> str:
+        if value is None:
+            return 'NULL'
+        time_text = InsertPlan._time_of_day(value)
+        if time_text is not None:
+            return f"'{time_text}'"
+        return InformixGenerator.format_value(value)
+
+    @staticmethod
+    def _format_bytes(value: Any) -> str:
+        if value is None:
+            return 'NULL'
+        return InformixGenerator.format_value(value)
+
+    @staticmethod
+    def _format_boolean(value: Any) -> str:
+        # BIT(1) chega como int ou bytes (b'\x00'/b'\x01'); Informix BOOLEAN usa 't'/'f'
+        if value is None:
+            return 'NULL'
+        if isinstance(value, (bytes, bytearray)):
+            value = int.from_bytes(value, 'big')
+        return "'t'" if value else "'f'"
+
+    def format_row(self, row: tuple) -> List[str]:
+        return [formatter(row[index]) for index, formatter in self._bound]
+
+    def render_values(self, row: tuple) -> str:
+        return ', '.join([formatter(row[index]) for index, formatter in self._bound])
+
+    def render_insert(self, row: tuple) -> str:
+        return self.insert_prefix + self.render_values(row) + ");"
+
+    def render_union_insert(self, rows: List[tuple]) -> str:
+        """Um único INSERT ... SELECT ... FROM sysmaster:sysdual UNION ALL ... para várias linhas."""
+        selects = []
+        for row in rows:
+            values = []
+            for (index, formatter), typed_null in zip(self._bound, self._typed_nulls):
+                value = row[index]
+                values.append(typed_null if value is None else formatter(value))
+            selects.append("SELECT " + ', '.join(values) + " FROM sysmaster:sysdual")
+        return (f"INSERT INTO {self.table.name} ({', '.join(self.column_names)})\n"
+                + "\nUNION ALL ".join(selects) + ";")
+
+    def render_statements(self, rows: List[tuple], rows_per_statement: int = 1) -> List[str]:
+        """Comandos para as linhas; com rows_per_statement > 1 agrupa em blocos UNION ALL.
+
+        Tabelas com colunas BYTE/TEXT sempre recebem um INSERT por linha. Sem colunas a
+        inserir (todas auto_increment) não há comando: o SERIAL do Informix gera os valores.
+        """
+        if not self.columns:
+            return []
+        if rows_per_statement > 1 and self.supports_union_insert:
+            return [self.render_union_insert(rows[i:i + rows_per_statement])
+                    for i in range(0, len(rows), rows_per_statement)]
+        return [self.render_insert(row) for row in rows]
+
+class UpsertPlan(InsertPlan):
+    """Plano para MERGE (upsert) pela chave primária, usado no modo delta.
+
+    Inclui as colunas auto_increment: a linha alterada precisa manter a chave da origem.
+    Várias linhas vão numa única origem SELECT ... FROM sysmaster:sysdual UNION ALL ...
+    """
+
+    INCLUDE_AUTO_INCREMENT = True
+    _cache: Dict[tuple, InsertPlan] = {}
+
+    def __init__(self, table: Table):
+        super().__init__(table)
+        self.key_names = [col.name for col in self.columns if col.is_primary_key]
+        self.update_names = [col.name for col in self.columns if not col.is_primary_key]
+        self.supports_merge = self.supports_union_insert and bool(self.key_names)
+
+    def render_merge(self, rows: List[tuple]) -> str:
+        selects = []
+        for row_number, row in enumerate(rows):
+            values = []
+            for (index, formatter), typed_null in zip(self._bound, self._typed_nulls):
+                value = row[index]
+                values.append(typed_null if value is None else formatter(value))
+            if row_number == 0: # Os nomes das colunas da origem vêm do primeiro SELECT
+                values = [f"{value} AS {name}" for value, name in zip(values, self.column_names)]
+            selects.append("SELECT " + ', '.join(values) + " FROM sysmaster:sysdual")
+
+        on_clause = " AND ".join(f"tgt.{name} = src.{name}" for name in self.key_names)
+        statement = (f"MERGE INTO {self.table.name} AS tgt\n"
+                     f"USING ({' UNION ALL '.join(selects)}) AS src\n"
+                     f"ON ({on_clause})\n")
+        if self.update_names:
+            statement += "WHEN MATCHED THEN UPDATE SET " + ", ".join(f"{name} = src.{name}" for name in self.update_names) + "\n"
+        statement += (f"WHEN NOT MATCHED THEN INSERT ({', '.join(self.column_names)}) "
+                      f"VALUES ({', '.join(f'src.{name}' for name in self.column_names)});")
+        return statement
+
+    def render_statements(self, rows: List[tuple], rows_per_statement: int = 1) -> List[str]:
+        """Um MERGE para cada rows_per_statement linhas."""
+        step = max(1, rows_per_statement)
+        return [self.render_merge(rows[i:i + step]) for i in range(0, len(rows), step)]
+
+
+class UnloadPlan(InsertPlan):
+    """Plano de formatação para arquivos no formato UNLOAD/LOAD do Informix.
+
+    Reaproveita a classificação de tipos de InsertPlan, mas produz campos crus
+    separados por DELIMITER: NULL vira campo vazio, barra invertida, delimitador e
+    quebra de linha são escapados com '\\', BYTE vai em hexadecimal e BOOLEAN como t/f.
+    Datas saem como AAAA-MM-DD (carregar com DBDATE=Y4MD-).
+    """
+
+    DELIMITER = '|'
+    _ESCAPES = str.maketrans({'\\': '\\\\', DELIMITER: '\\' + DELIMITER, '\n': '\\\n'})
+    _cache: Dict[tuple, InsertPlan] = {}
+
+    @classmethod
+    def formatter_for(cls, column: Column) -> Callable[[Any], str]:
+        return getattr(cls, f"_format_{cls.value_kind(column)}")
+
+    @classmethod
+    def _escape(cls, text: str) -> str:
+        if not text:
+            return '\\ ' # String vazia (diferente de NULL) no formato UNLOAD
+        return text.translate(cls._ESCAPES)
+
+    @classmethod
+    def _format_generic(cls, value: Any) -> str:
+        if value is None:
+            return ''
+        if isinstance(value, (bytes, bytearray)):
+            return value.hex()
+        if isinstance(value, datetime):
+            return value.isoformat(sep=' ', timespec='seconds')
+        return cls._escape(str(value))
+
+    @classmethod
+    def _format_int(cls, value: Any) -> str:
+        if value is None:
+            return ''
+        if type(value) is int:
+            return str(value)
+        return cls._format_generic(value)
+
+    @classmethod
+    def _format_numeric(cls, value: Any) -> str:
+        if value is None:
+            return ''
+        if isinstance(value, (Decimal, float, int)) and not isinstance(value, bool):
+            return str(value)
+        return cls._format_generic(value)
+
+    @classmethod
+    def _format_string(cls, value: Any) -> str:
+        if value is None:
+            return ''
+        if type(value) is str:
+            return cls._escape(value)
+        return cls._format_generic(value)
+
+    @classmethod
+    def _format_datetime(cls, value: Any) -> str:
+        if value is None:
+            return ''
+        if isinstance(value, datetime):
+            return value.isoformat(sep=' ', timespec='seconds')
+        return cls._format_generic(value)
+
+    @classmethod
+    def _format_date(cls, value: Any) -> str:
+        if value is None:
+            return ''
+        if isinstance(value, date):
+            return value.strftime('%Y-%m-%d')
+        return cls._format_generic(value)
+
+    @classmethod
+    def _format_time(cls, value: Any) -> str:
+        if value is None:
+            return ''
+        time_text = cls._time_of_day(value)
+        if time_text is not None:
+            return time_text
+        return cls._format_generic(value)
+
+    @classmethod
+    def _format_bytes(cls, value: Any) -> str:
+        if value is None:
+            return ''
+        if isinstance(value, (bytes, bytearray)):
+            return value.hex() # LOAD lê colunas BYTE em hexadecimal
+        return cls._format_generic(value)
+
+    @classmethod
+    def _format_boolean(cls, value: Any) -> str:
+        if value is None:
+            return ''
+        return InsertPlan._format_boolean(value).strip("'")
+
+    def render_line(self, row: tuple) -> str:
+        delimiter = self.DELIMITER
+        return delimiter.join([formatter(row[index]) for index, formatter in self._bound]) + delimiter + "\n"
+
+
+class ParameterPlan(InsertPlan):
+    """INSERT preparado (`?` por coluna) e parâmetros tipados para a carga direta.
+
+    Os valores do conector são passados como estão, exceto onde o tipo Informix de
+    destino (TypeMapper) exige conversão: BOOLEAN recebe bool (BIT chega como bytes),
+    DATETIME HOUR TO SECOND recebe 'HH:MM:SS' (TIME chega como timedelta),
+    DATETIME YEAR TO SECOND perde as frações de segundo, colunas de texto recebem str
+    e BYTE recebe bytes.
+    """
+
+    _cache: Dict[tuple, InsertPlan] = {}
+
+    def __init__(self, table: Table):
+        super().__init__(table)
+        self.sql = (f"INSERT INTO {table.name} ({', '.join(self.column_names)}) "
+                    f"VALUES ({', '.join('?' for _ in self.column_names)})")
+        self.converters = [self.converter_for(target_type) for target_type in self.target_types]
+        self._converted = [(position, converter) for position, converter in enumerate(self.converters) if converter]
+
+    @classmethod
+    def converter_for(cls, target_type: str) -> Optional[Callable[[Any], Any]]:
+        base_type = target_type.split('(')[0]
+        if base_type == 'BOOLEAN':
+            return cls._to_boolean
+        if base_type == 'DATETIME HOUR TO SECOND':
+            return cls._to_time_of_day
+        if base_type == 'DATETIME YEAR TO SECOND':
+            return cls._to_datetime
+        if base_type in ('CHAR', 'VARCHAR', 'LVARCHAR', 'TEXT'):
+            return cls._to_text
+        if base_type == 'BYTE':
+            return cls._to_bytes
+        return None # Inteiros, DECIMAL, FLOAT e DATE: o driver associa o valor Python direto
+
+    @staticmethod
+    def _to_boolean(value: Any) -> Any:
+        if value is None:
+            return None
+        if isinstance(value, (bytes, bytearray)):
+            value = int.from_bytes(value, 'big')
+        return bool(value)
+
+    @staticmethod
+    def _to_time_of_day(value: Any) -> Any:
+        if value is None:
+            return None
+        time_text = InsertPlan._time_of_day(value)
+        if time_text is None:
+            raise RuntimeError(f"Valor TIME fora de 00:00:00-23:59:59 (DATETIME HOUR TO SECOND): {value}")
+        return time_text
+
+    @staticmethod
+    def _to_datetime(value: Any) -> Any:
+        if isinstance(value, datetime) and value.microsecond:
+            return value.replace(microsecond=0)
+        return value
+
+    @staticmethod
+    def _to_text(value: Any) -> Any:
+        if value is None or type(value) is str:
+            return value
+        if isinstance(value, (bytes, bytearray)): # Colunas com collation binária
+            return bytes(value).decode('utf-8', 'replace')
+        return str(value)
+
+    @staticmethod
+    def _to_bytes(value: Any) -> Any:
+        if isinstance(value, bytearray):
+            return bytes(value)
+        return value
+
+    def row_parameters(self, row: tuple) -> tuple:
+        values = [row[index] for index in self.indexes]
+        for position, converter in self._converted:
+            values[position] = converter(values[position])
+        return tuple(values)
+
+    def batch_parameters(self, rows: List[tuple]) -> List[tuple]:
+        if not self._converted:
+            indexes = self.indexes
+            return [tuple([row[index] for index in indexes]) for row in rows]
+        return [self.row_parameters(row) for row in rows]
+
+
+class InformixGenerator:
+    @staticmethod
+    def generate_create_table(table: Table) -> str:
+        sql_parts = [f"CREATE TABLE {table.name} ("]
+        column_definitions = []
+        for column in table.columns:
+            # Passar precisão e escala para o TypeMapper
+            informix_type = TypeMapper.map_type(
+                column.data_type,
+                column.max_length,
+                getattr(column, 'precision', None),
+                getattr(column, 'scale', None)
+            )
+            col_def = f"    {column.name} {informix_type}"
+
+            if column.is_auto_increment:
+                if informix_type == 'BIGINT':
+                    col_def += " BIGSERIAL"
+                else:
+                    col_def += " SERIAL"
+            
+            if not column.is_nullable:
+                col_def += " NOT NULL"
+
+            if not column.is_auto_increment and column.default_value is not None:
+                if column.data_type.upper() in ['VARCHAR', 'CHAR', 'TEXT', 'LVARCHAR', 'ENUM', 'SET', 'JSON', 'DATE', 'TIME', 'DATETIME', 'TIMESTAMP']:
+                    if str(column.default_value).upper() in ("CURRENT_TIMESTAMP", "NOW()"):
+                         col_def += " DEFAULT CURRENT YEAR TO SECOND"
+                    elif str(column.default_value).upper() == "NULL":
+                        pass
+                    else:
+                        default_val = str(column.default_value).replace("'", "''")
+                        col_def += f" DEFAULT '{default_val}'"
+                elif column.data_type.upper() in ['BIT', 'BOOL', 'BOOLEAN']:
+                    if str(column.default_value).lower() in ['1', 'true', 't']:
+                        col_def += " DEFAULT 't'"
+                    elif str(column.default_value).lower() in ['0', 'false', 'f']:
+                        col_def += " DEFAULT 'f'"
+                else:
+                    try:
+                        num_val = float(column.default_value)
+                        col_def += f" DEFAULT {num_val}"
+                    except (ValueError, TypeError):
+                         if str(column.default_value).upper() != "NULL":
+                            default_val = str(column.default_value).replace("'", "''")
+                            col_def += f" DEFAULT '{default_val}'"
+
+            column_definitions.append(col_def)
+
+        pk_columns = [col.name for col in table.columns if col.is_primary_key]
+        if pk_columns:
+            column_definitions.append(f"    PRIMARY KEY ({', '.join(pk_columns)})")
+
+        sql_parts.append(',\n'.join(column_definitions))
+        sql_parts.append(");")
+
+        return '\n'.join(sql_parts)
+
+
+    @staticmethod
+    def format_value(value: Any, source_column_type: str = "") -> str:
+        """Formata um valor Python como literal SQL Informix."""
+        if value is None:
+            return 'NULL'
+        elif isinstance(value, datetime):
+            # Handle all datetime types in one block
+            if hasattr(value, 'hour') and hasattr(value, 'minute'):  # Has time component
+                if hasattr(value, 'year'):  # Full datetime
+                    return f"'{value.strftime('%Y-%m-%d %H:%M:%S')}'" # DATETIME YEAR TO SECOND
+                else:  # Just time
+                    return f"'{value.strftime('%H:%M:%S')}'" # DATETIME HOUR TO SECOND
+            else:  # Just date
+                return f"'{value.strftime('%Y-%m-%d')}'" # DATE
+        elif isinstance(value, (bytes, bytearray)):
+            # Para BYTE/VARBYTE no Informix, usaremos a função HEX() para scripts puros SQL.
+            # Isso é uma abordagem simplificada que funciona para scripts SQL.
+            hex_value = value.hex()
+            # Para tamanhos grandes, dividimos em chunks para evitar problemas com linha muito longa
+            max_chunk = 1000  # Tamanho máximo por linha de SQL
+            if len(hex_value) > max_chunk:
+                chunks = [hex_value[i:i+max_chunk] for i in range(0, len(hex_value), max_chunk)]
+                return "DECODE(" + " || ".join(f"'{chunk}'" for chunk in chunks) + ", 'hex')"
+            return f"DECODE('{hex_value}', 'hex')"
+        elif isinstance(value, str):
+            escaped_value = value.replace("'", "''") # Escapar aspas simples
+            return f"'{escaped_value}'"
+        elif isinstance(value, (int, float)):
+            return str(value)
+        elif source_column_type == 'BIT' or source_column_type == 'BOOLEAN': # MariaDB BIT(1) ou BOOL
+            return "'t'" if value else "'f'" # Informix BOOLEAN 't' ou 'f'
+        else:
+            # Fallback para outros tipos, tentando converter para string e escapar
+            escaped_value = str(value).replace("'", "''")
+            return f"'{escaped_value}'"
+
+    @staticmethod
+    def generate_insert_statements(table: Table, data: List[tuple], rows_per_statement: int = 1) -> List[str]:
+        """INSERTs para as linhas; com rows_per_statement > 1 agrupa em blocos UNION ALL.
+
+        Tabelas com colunas BYTE/TEXT sempre recebem um INSERT por linha.
+        """
+        if not data:
+            return []
+        return InsertPlan.for_table(table).render_statements(data, rows_per_statement)
+
+    @staticmethod
+    def generate_load_statement(table: Table, unload_filename: str) -> str:
+        """LOAD do dbaccess que lê um arquivo gerado por UnloadWriter."""
+        plan = UnloadPlan.for_table(table)
+        return (f"LOAD FROM '{unload_filename}' DELIMITER '{UnloadPlan.DELIMITER}'\n"
+                f"INSERT INTO {table.name} ({', '.join(plan.column_names)});")
+
+
+class UnloadWriter:
+    """Escreve linhas no formato UNLOAD (arquivo .unl) usando UnloadPlan."""
+
+    def __init__(self, file, table: Table):
+        self.file = file
+        self.plan = UnloadPlan.for_table(table)
+        self.rows_written = 0
+
+    def write_rows(self, rows: List[tuple]):
+        render_line = self.plan.render_line
+        self.file.write(''.join([render_line(row) for row in rows]))
+        self.rows_written += len(rows)
+
+    def write_text(self, text: str):
+        """Grava linhas já renderizadas (render_batch)."""
+        self.file.write(text)
+
+    def close(self):
+        pass
+
+
+class DMLScriptWriter:
+    """Escreve instruções DML num arquivo, abrindo BEGIN WORK/COMMIT WORK a cada N instruções.
+
+    Com statements_per_transaction = 0 as instruções são escritas sem controle de transação
+    (modo de autocommit do dbaccess). BEGIN WORK exige banco Informix com log.
+    """
+
+    def __init__(self, file, statements_per_transaction: int = 0, in_transaction: int = 0):
+        self.file = file
+        self.statements_per_transaction = statements_per_transaction
+        self.statements_written = 0
+        self._in_transaction = in_transaction # > 0 ao retomar um arquivo parado no meio de uma transação
+
+    @property
+    def in_transaction(self) -> int:
+        """Instruções escritas desde o último BEGIN WORK ainda sem COMMIT WORK."""
+        return self._in_transaction
+
+    def write_statements(self, statements: List[str]):
+        if not self.statements_per_transaction:
+            for stmt in statements:
+                self.file.write(stmt + "\n")
+            self.statements_written += len(statements)
+            return
+
+        for stmt in statements:
+            if not self._in_transaction:
+                self.file.write("BEGIN WORK;\n")
+            self.file.write(stmt + "\n")
+            self._in_transaction += 1
+            self.statements_written += 1
+            if self._in_transaction >= self.statements_per_transaction:
+                self.file.write("COMMIT WORK;\n")
+                self._in_transaction = 0
+
+    def close(self):
+        """Fecha a transação pendente (não fecha o arquivo)."""
+        if self._in_transaction:
+            self.file.write("COMMIT WORK;\n")
+            self._in_transaction = 0
+
+
+class DataFileOutput:
+    """Arquivo de dados de uma parte: texto UTF-8, com compressão e divisão em pedaços opcionais.
+
+    Sem compressão nem divisão grava exatamente `filename`. Com `chunk_bytes` a saída vira
+    filename.001, .002, ... (antes da extensão); o pedaço só troca em next_chunk(), que o
+    gerador chama entre lotes para não cortar instruções. Com compressão (gzip, zstd ou
+    lz4) a extensão .gz/.zst/.lz4 é acrescentada e a compressão roda numa thread própria,
+    alimentada por uma fila limitada de blocos de BUFFER_BYTES.
+    """
+
+    EXTENSIONS = {'gzip': '.gz', 'zstd': '.zst', 'lz4': '.lz4'}
+    BUFFER_BYTES = 1 << 20
+    QUEUE_DEPTH = 8
+
+    def __init__(self, directory: str, filename: str, compression: str = 'none', chunk_bytes: int = 0,
+                 append: bool = False):
+        if compression != 'none' and compression not in self.EXTENSIONS:
+            raise RuntimeError(f"Compressão desconhecida: {compression}")
+        if compression == 'zstd' and not ZSTD_AVAILABLE:
+            raise RuntimeError("Compressão zstd requer o pacote zstandard (pip install zstandard)")
+        if compression == 'lz4' and not LZ4_AVAILABLE:
+            raise RuntimeError("Compressão lz4 requer o pacote lz4 (pip install lz4)")
+        self.directory = directory
+        self.filename = filename
+        self.compression = compression
+        self.chunk_bytes = chunk_bytes
+        self.chunk = 0
+        self.files = [self._chunk_name()]
+        self._written = 0 # Bytes (sem compressão) no pedaço atual
+        self._buffer: List[bytes] = []
+        self._buffered = 0
+        self._failure: Optional[Exception] = None
+        self._raw = None
+        self._stream = None
+        self._open_stream(self.files[0], append)
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        if compression != 'none':
+            self._queue = queue.Queue(maxsize=self.QUEUE_DEPTH)
+            self._thread = threading.Thread(target=self._compress_loop, name=f"compressao-{filename}", daemon=True)
+            self._thread.start()
+
+    @staticmethod
+    def output_name(filename: str, compression: str = 'none', chunk: Optional[int] = None) -> str:
+        if chunk is not None:
+            stem, extension = os.path.splitext(filename)
+            filename = f"{stem}.{chunk + 1:03d}{extension}"
+        return filename + DataFileOutput.EXTENSIONS.get(compression, '')
+
+    def _chunk_name(self) -> str:
+        return self.output_name(self.filename, self.compression, self.chunk if self.chunk_bytes else None)
+
+    def _open_stream(self, name: str, append: bool = False):
+        self._raw = open(os.path.join(self.directory, name), 'ab' if append else 'wb')
+        if self.compression == 'gzip':
+            self._stream = gzip.GzipFile(fileobj=self._raw, mode='wb', compresslevel=6)
+        elif self.compression == 'zstd':
+            self._stream = zstandard.ZstdCompressor(level=3).stream_writer(self._raw)
+        elif self.compression == 'lz4':
+            self._stream = lz4.frame.LZ4FrameFile(self._raw, mode='wb')
+        else:
+            self._stream = self._raw
+
+    def _close_stream(self):
+        if self._stream is not self._raw:
+            self._stream.close()
+        self._raw.close()
+
+    def _compress_loop(self):
+        # Dona dos streams enquanto há compressão: escreve os blocos e troca de pedaço na ordem da fila
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            if self._failure:
+                continue # Só esvazia a fila; o erro é repassado em write()/close()
+            try:
+                if isinstance(item, tuple):
+                    self._close_stream()
+                    self._open_stream(item[1])
+                else:
+                    self._stream.write(item)
+            except Exception as e_compress:
+                self._failure = e_compress
+        try:
+            self._close_stream()
+        except Exception as e_close:
+            self._failure = self._failure or e_close
+
+    def _push(self):
+        if self._failure:
+            raise self._failure
+        if self._buffer:
+            self._queue.put(b''.join(self._buffer))
+            self._buffer = []
+            self._buffered = 0
+
+    def write(self, text: str):
+        data = text.encode('utf-8')
+        self._written += len(data)
+        if self._queue is None:
+            self._stream.write(data)
+            return
+        self._buffer.append(data)
+        self._buffered += len(data)
+        if self._buffered >= self.BUFFER_BYTES:
+            self._push()
+
+    def flush(self):
+        if self._queue is None:
+            self._stream.flush()
+        else:
+            self._push()
+
+    def tell(self) -> int:
+        """Bytes gravados no pedaço atual (sem compressão, é a posição no arquivo)."""
+        return self._raw.tell() if self._queue is None else self._written
+
+    def chunk_full(self) -> bool:
+        return bool(self.chunk_bytes) and self._written >= self.chunk_bytes
+
+    def next_chunk(self):
+        self.chunk += 1
+        self._written = 0
+        name = self._chunk_name()
+        self.files.append(name)
+        if self._queue is None:
+            self._close_stream()
+            self._open_stream(name)
+        else:
+            self._push()
+            self._queue.put(('chunk', name))
+
+    def total_size(self) -> int:
+        return sum(os.path.getsize(os.path.join(self.directory, name)) for name in self.files)
+
+    def close(self):
+        if self._thread is None:
+            if not self._raw.closed:
+                self._close_stream()
+            return
+        try:
+            self._push()
+        finally:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        if self._failure:
+            raise self._failure
+
+    def __enter__(self) -> 'DataFileOutput':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def render_batch(table: Table, rows: List[tuple], data_format: str = 'sql', rows_per_statement: int = 1,
+                 upsert: bool = False):
+    """Renderiza um lote: (lista de INSERTs/MERGEs ou texto UNLOAD, segundos gastos).
+
+    Função de módulo para poder ser executada num ProcessPoolExecutor.
+    """
+    started = time.perf_counter()
+    if data_format == 'unload':
+        render_line = UnloadPlan.for_table(table).render_line
+        rendered = ''.join([render_line(row) for row in rows])
+    else:
+        plan = (UpsertPlan if upsert else InsertPlan).for_table(table)
+        rendered = plan.render_statements(rows, rows_per_statement)
+    return rendered, time.perf_counter() - started
+
+
+@dataclass
+class PipelineStats:
+    """Contadores das etapas busca -> renderização -> escrita.
+
+    Os tempos são somados entre as partes, então numa execução paralela representam
+    tempo gasto em cada etapa e não tempo de relógio.
+    """
+    fetch_rows: int = 0
+    fetch_seconds: float = 0.0
+    render_rows: int = 0
+    render_seconds: float = 0.0
+    write_bytes: int = 0
+    write_seconds: float = 0.0
+    queue_wait_seconds: float = 0.0     # Busca bloqueada com a fila de renderização cheia
+
+    def merge(self, other: 'PipelineStats'):
+        self.fetch_rows += other.fetch_rows
+        self.fetch_seconds += other.fetch_seconds
+        self.render_rows += other.render_rows
+        self.render_seconds += other.render_seconds
+        self.write_bytes += other.write_bytes
+        self.write_seconds += other.write_seconds
+        self.queue_wait_seconds += other.queue_wait_seconds
+
+    @staticmethod
+    def _rate(amount: float, seconds: float, digits: int = 0) -> str:
+        return f"{amount / seconds:,.{digits}f}" if seconds > 0 else "-"
+
+    def describe(self) -> str:
+        return (
+            f"busca {self.fetch_rows} linhas em {self.fetch_seconds:.2f}s ({self._rate(self.fetch_rows, self.fetch_seconds)} linhas/s); "
+            f"renderização {self.render_rows} linhas em {self.render_seconds:.2f}s ({self._rate(self.render_rows, self.render_seconds)} linhas/s); "
+            f"escrita {self.write_bytes / 1048576:.1f} MB em {self.write_seconds:.2f}s "
+            f"({self._rate(self.write_bytes / 1048576, self.write_seconds, 1)} MB/s); "
+            f"espera na fila {self.queue_wait_seconds:.2f}s"
+        )
+
+
+class MariaDBConnectionPool:
+    """Pool de MariaDBExtractor com uma conexão por worker, abertas sob demanda.
+
+    Um extrator devolvido sem conexão (ex.: streaming interrompido) é reconectado
+    no próximo acquire().
+    """
+
+    def __init__(self, config: Dict[str, Any], size: int):
+        self.config = config
+        self.size = max(1, size)
+        self._idle: "queue.LifoQueue[MariaDBExtractor]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self._extractors: List[MariaDBExtractor] = []
+
+    def acquire(self) -> MariaDBExtractor:
+        self._slots.acquire()
+        try:
+            try:
+                extractor = self._idle.get_nowait()
+            except queue.Empty:
+                extractor = MariaDBExtractor()
+                with self._lock:
+                    self._extractors.append(extractor)
+            if not extractor.connection or not extractor.connection.is_connected():
+                extractor.connect(self.config)
+            return extractor
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, extractor: MariaDBExtractor):
+        self._idle.put(extractor)
+        self._slots.release()
+
+    def close_all(self):
+        with self._lock:
+            for extractor in self._extractors:
+                if extractor.connection:
+                    extractor.close()
+            self._extractors.clear()
+
+
+@dataclass
+class ScriptGenerationOptions:
+    output_directory: str
+    migrate_data: bool = True
+    batch_size: int = 1000
+    extraction_mode: str = 'paged'      # 'paged' (keyset/offset) ou 'stream'
+    insert_mode: str = 'single'         # 'single' ou 'union'
+    rows_per_insert: int = 100
+    statements_per_transaction: int = 0
+    data_format: str = 'sql'            # 'sql' (INSERTs) ou 'unload' (.unl + LOAD)
+    workers: int = 1
+    partition_threshold: int = 0        # Registros a partir dos quais a tabela é dividida em faixas (0 = nunca)
+    partitions_per_table: int = 4
+    render_processes: int = 0           # Processos que renderizam o SQL (0 = na própria thread de busca)
+    pipeline_depth: int = 4             # Lotes aguardando renderização/escrita por parte
+    resume: bool = False                # Retomar a partir do checkpoint do diretório de saída
+    # Modo delta: só linhas novas/alteradas desde a marca d'água (MAX da coluna) da execução anterior.
+    # Com coluna de data a janela não é exata: linhas confirmadas depois da leitura do MAX com data
+    # anterior a ele, ou gravadas no mesmo segundo da marca, só são vistas relendo a partir de
+    # marca - delta_overlap_seconds, o que exige saída MERGE (com INSERT viram PK duplicada).
+    # Transações abertas por mais tempo que a sobreposição continuam podendo se perder.
+    delta_mode: bool = False
+    delta_columns: str = ''             # Nomes (separados por vírgula) de colunas TIMESTAMP/DATETIME de alteração
+    delta_output: str = 'auto'          # 'insert', 'upsert' (MERGE pela PK) ou 'auto' (MERGE com coluna de data)
+    delta_overlap_seconds: int = 60     # Releitura antes da marca de data (só com MERGE; 0 = janela exata)
+    delta_state_path: str = ''          # Arquivo das marcas d'água ('' = DeltaState.DEFAULT_PATH)
+    compression: str = 'none'           # 'none', 'gzip', 'zstd' ou 'lz4' (só scripts DML; .unl fica sem compressão)
+    chunk_size_mb: int = 0              # Divide cada arquivo de dados em pedaços de ~N MB (0 = não divide)
+    source_database: str = ''
+    informix_server_name: str = ''
+    informix_db_name: str = ''
+
+
+@dataclass
+class DataPartResult:
+    filename: str
+    key_range: Optional[KeyRange] = None
+    records: int = 0
+    strategy: Optional[str] = None
+    error: Optional[str] = None
+    completed: bool = False     # Extraída até o fim (não interrompida)
+    files: List[str] = field(default_factory=list)  # Arquivos gravados (pedaços/compressão); vazio = [filename]
+
+
+@dataclass
+class TableGenerationResult:
+    table_name: str
+    ddl: str = ''
+    data_files: List[str] = field(default_factory=list)   # Scripts executados pelo RUN_ALL_SCRIPTS.sh
+    unload_files: List[str] = field(default_factory=list)
+    strategy: Optional[str] = None
+    records: int = 0
+    parts: int = 0
+    error: Optional[str] = None
+
+
+def encode_checkpoint_value(value: Any) -> Any:
+    """Valor de chave (PK, limites de faixa) em forma serializável em JSON."""
+    if isinstance(value, datetime):
+        return {'datetime': value.isoformat()}
+    if isinstance(value, date):
+        return {'date': value.isoformat()}
+    if isinstance(value, timedelta):
+        return {'timedelta': value.total_seconds()}
+    if isinstance(value, Decimal):
+        return {'decimal': str(value)}
+    if isinstance(value, (bytes, bytearray)):
+        return {'bytes': bytes(value).hex()}
+    return value
+
+
+def decode_checkpoint_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        kind, raw = next(iter(value.items()))
+        if kind == 'datetime':
+            return datetime.fromisoformat(raw)
+        if kind == 'date':
+            return date.fromisoformat(raw)
+        if kind == 'timedelta':
+            return timedelta(seconds=raw)
+        if kind == 'decimal':
+            return Decimal(raw)
+        if kind == 'bytes':
+            return bytes.fromhex(raw)
+    return value
+
+
+class GenerationCheckpoint:
+    """Manifesto de checkpoint da geração de dados (CHECKPOINT_FILENAME no diretório de saída).
+
+    Guarda, por tabela, as faixas da PK usadas e, por arquivo de dados (parte), o estado
+    ('partial' ou 'done'), os registros gravados, o tamanho do arquivo em bytes até o
+    último lote completo, a chave primária da última linha gravada e quantas instruções
+    estavam abertas na transação corrente. Numa nova execução com retomada, as partes
+    concluídas são puladas e as parciais são truncadas nesse tamanho e continuam a partir
+    da chave (ou da quantidade de linhas, sem PK). O manifesto só vale para as mesmas
+    opções de formato: se elas mudarem a geração recomeça do zero.
+    """
+
+    CHECKPOINT_FILENAME = "00_CHECKPOINT.json"
+    FORMAT_VERSION = 1
+    SAVE_INTERVAL_SECONDS = 2.0     # Gravação periódica; partes concluídas e o fim da execução gravam na hora
+
+    def __init__(self, output_directory: str, fingerprint: Dict[str, Any]):
+        self.path = os.path.join(output_directory, self.CHECKPOINT_FILENAME)
+        self.fingerprint = fingerprint
+        self.tables: Dict[str, dict] = {}
+        self.parts: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._last_save = 0.0
+
+    @classmethod
+    def open(cls, output_directory: str, fingerprint: Dict[str, Any], resume: bool,
+             log: Callable[[str, str], None]) -> 'GenerationCheckpoint':
+        """Carrega o manifesto existente (com `resume`) ou começa um novo."""
+        checkpoint = cls(output_directory, fingerprint)
+        if not resume or not os.path.exists(checkpoint.path):
+            return checkpoint
+        try:
+            with open(checkpoint.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            log(f"Checkpoint ilegível ({checkpoint.path}): {e}. A geração começa do zero.", "WARNING")
+            return checkpoint
+        if data.get('version') != cls.FORMAT_VERSION or data.get('options') != fingerprint:
+            log("As opções de geração mudaram desde o checkpoint anterior. A geração começa do zero.", "WARNING")
+            return checkpoint
+        checkpoint.tables = data.get('tables', {})
+        checkpoint.parts = data.get('parts', {})
+        done = sum(1 for state in checkpoint.parts.values() if state.get('status') == 'done')
+        log(f"Retomando a partir do checkpoint: {done} de {len(checkpoint.parts)} arquivo(s) de dados concluídos.", "INFO")
+        return checkpoint
+
+    def get_key_ranges(self, table_name: str) -> Optional[List[Optional[KeyRange]]]:
+        """Faixas gravadas para a tabela (para retomar com as mesmas partes), ou None."""
+        with self._lock:
+            saved = self.tables.get(table_name, {}).get('key_ranges')
+        if saved is None:
+            return None
+        return [
+            None if item is None else KeyRange(item['column'], decode_checkpoint_value(item['lower']),
+                                               decode_checkpoint_value(item['upper']),
+                                               item.get('lower_inclusive', True), item.get('upper_inclusive', False))
+            for item in saved
+        ]
+
+    def set_key_ranges(self, table_name: str, key_ranges: List[Optional[KeyRange]]):
+        with self._lock:
+            self.tables.setdefault(table_name, {})['key_ranges'] = [
+                None if key_range is None else {
+                    'column': key_range.column,
+                    'lower': encode_checkpoint_value(key_range.lower),
+                    'upper': encode_checkpoint_value(key_range.upper),
+                    'lower_inclusive': key_range.lower_inclusive,
+                    'upper_inclusive': key_range.upper_inclusive,
+                }
+                for key_range in key_ranges
+            ]
+
+    def part_state(self, filename: str) -> Optional[dict]:
+        with self._lock:
+            state = self.parts.get(filename)
+            return dict(state) if state else None
+
+    def resume_key(self, state: dict) -> Optional[tuple]:
+        last_key = state.get('last_key')
+        return None if last_key is None else tuple(decode_checkpoint_value(value) for value in last_key)
+
+    def update_part(self, filename: str, status: str, records: int, offset: int, strategy: Optional[str],
+                    last_key: Optional[tuple] = None, in_transaction: int = 0, files: Optional[List[str]] = None):
+        with self._lock:
+            self.parts[filename] = {
+                'status': status,
+                'records': records,
+                'offset': offset,
+                'strategy': strategy,
+                'last_key': None if last_key is None else [encode_checkpoint_value(value) for value in last_key],
+                'in_transaction': in_transaction,
+                'files': list(files or [filename]),
+            }
+        self.save(force=status == 'done')
+
+    def discard_part(self, filename: str):
+        with self._lock:
+            self.parts.pop(filename, None)
+
+    def save(self, force: bool = True):
+        """Grava o manifesto (arquivo temporário + os.replace); sem `force`, no máximo a cada SAVE_INTERVAL_SECONDS."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_save < self.SAVE_INTERVAL_SECONDS:
+                return
+            self._last_save = now
+            data = {'version': self.FORMAT_VERSION, 'options': self.fingerprint,
+                    'tables': self.tables, 'parts': self.parts}
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=1)
+            os.replace(temp_path, self.path)
+
+
+class DeltaState:
+    """Marcas d'água do modo delta (coluna e último valor extraído) por servidor/banco/tabela."""
+
+    DEFAULT_PATH = os.path.join('cache', 'delta_state.json')
+
+    def __init__(self, schema_key: str, path: Optional[str] = None):
+        self.path = path or self.DEFAULT_PATH
+        self.schema_key = schema_key
+        self._schemas: Dict[str, Dict[str, dict]] = {}
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._schemas = json.load(f)
+
+    def get(self, table_name: str):
+        """(coluna, valor) gravados para a tabela, ou None se ainda não houve extração."""
+        entry = self._schemas.get(self.schema_key, {}).get(table_name)
+        if entry is None:
+            return None
+        return entry['column'], decode_checkpoint_value(entry['value'])
+
+    def set(self, table_name: str, column_name: str, value: Any):
+        self._schemas.setdefault(self.schema_key, {})[table_name] = {
+            'column': column_name,
+            'value': encode_checkpoint_value(value),
+            'updated': datetime.now().isoformat(timespec='seconds'),
+        }
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._schemas, f, ensure_ascii=False, indent=1)
+        os.replace(temp_path, self.path)
+
+
+class ScriptGenerator:
+    """Geração de scripts Informix (DDL, dados e RUN_ALL_SCRIPTS.sh) independente da GUI.
+
+    O trabalho de dados é dividido em partes: uma por tabela ou, para tabelas com
+    pelo menos `partition_threshold` registros, uma por faixa da chave primária.
+    As partes são distribuídas entre `options.workers` threads; cada worker usa sua
+    própria conexão do MariaDBConnectionPool e escreve seu próprio arquivo. Os
+    resultados são devolvidos (e os scripts consolidados) na ordem das tabelas e
+    das faixas, independentemente da ordem em que os workers terminam.
+
+    Cada parte é um pipeline: a thread do worker só busca lotes e os coloca numa
+    fila limitada (`pipeline_depth`); a formatação do SQL vai para um pool de
+    `render_processes` processos (fora do GIL) e uma thread escritora grava os
+    lotes no arquivo na ordem em que foram buscados.
+
+    O progresso de cada arquivo de dados é registrado num GenerationCheckpoint
+    depois de cada lote gravado; com `options.resume` uma nova execução pula as
+    partes concluídas e continua as parciais sem repetir linhas.
+
+    No modo delta cada tabela vira uma única parte filtrada pela janela
+    (marca d'água anterior, MAX(coluna) no início da execução]; a marca só avança
+    (DeltaState) quando a tabela é extraída até o fim sem erros. Com coluna de data
+    e saída MERGE a janela recua `delta_overlap_seconds` antes da marca.
+    """
+
+    DDL_FILENAME = "00_CREATE_TABLES_ALL.sql"
+    RUN_SCRIPT_FILENAME = "RUN_ALL_SCRIPTS.sh"
+    DECOMPRESS_COMMANDS = {'.gz': 'gzip -dc', '.zst': 'zstd -dc', '.lz4': 'lz4 -dc'}
+    STRATEGY_LABELS = {'keyset': "keyset (PK)", 'offset': "LIMIT/OFFSET", 'stream': "streaming"}
+
+    def __init__(self, source_config: Dict[str, Any], options: ScriptGenerationOptions,
+                 log: Optional[Callable[[str, str], None]] = None,
+                 should_continue: Optional[Callable[[], bool]] = None,
+                 on_progress: Optional[Callable[[str], None]] = None,
+                 on_table_done: Optional[Callable[[TableGenerationResult], None]] = None):
+        self.source_config = source_config
+        self.options = options
+        self.log = log or (lambda message, level="INFO": None)
+        self.should_continue = should_continue or (lambda: True)
+        self.on_progress = on_progress or (lambda message: None)
+        self.on_table_done = on_table_done or (lambda result: None)
+        self._records_lock = threading.Lock()
+        self.total_records = 0
+        self.stats = PipelineStats()
+        self._render_pool: Optional[ProcessPoolExecutor] = None
+        self.checkpoint: Optional[GenerationCheckpoint] = None
+        self.delta_state: Optional[DeltaState] = None
+        self.binlog_position: Optional[tuple] = None
+
+    def checkpoint_fingerprint(self) -> Dict[str, Any]:
+        """Opções que determinam o conteúdo dos arquivos; um checkpoint só é retomado se forem iguais."""
+        options = self.options
+        return {
+            'source_database': options.source_database,
+            'data_format': options.data_format,
+            'extraction_mode': options.extraction_mode,
+            'insert_mode': options.insert_mode,
+            'rows_per_insert': options.rows_per_insert,
+            'statements_per_transaction': options.statements_per_transaction,
+            'partition_threshold': options.partition_threshold,
+            'partitions_per_table': options.partitions_per_table,
+            'delta_mode': options.delta_mode,
+            'delta_columns': options.delta_columns,
+            'delta_output': options.delta_output,
+            'delta_overlap_seconds': options.delta_overlap_seconds,
+            'compression': options.compression,
+            'chunk_size_mb': options.chunk_size_mb,
+        }
+
+    def run(self, tables: List[Table]) -> List[TableGenerationResult]:
+        """Gera os scripts de todas as tabelas e devolve os resultados na ordem de `tables`."""
+        options = self.options
+        pool = MariaDBConnectionPool(self.source_config, max(1, options.workers)) if options.migrate_data else None
+        if options.migrate_data and options.render_processes > 0:
+            # 'spawn': a GUI tem threads ativas, e fork com threads em andamento não é seguro
+            self._render_pool = ProcessPoolExecutor(max_workers=options.render_processes,
+                                                    mp_context=multiprocessing.get_context('spawn'))
+            self.log(f"Renderização do SQL em {options.render_processes} processo(s).", "INFO")
+        if options.migrate_data and options.data_format == 'unload' and options.compression != 'none':
+            self.log("LOAD FROM do dbaccess lê arquivos comuns: os .unl são gravados sem compressão.", "WARNING")
+        if options.migrate_data:
+            self.checkpoint = GenerationCheckpoint.open(options.output_directory, self.checkpoint_fingerprint(),
+                                                        options.resume, self.log)
+        if options.migrate_data and options.delta_mode:
+            source = self.source_config
+            schema_key = f"{source.get('source_host')}:{source.get('source_port')}/{source.get('source_database')}"
+            self.delta_state = DeltaState(schema_key, options.delta_state_path or None)
+        results: List[Optional[TableGenerationResult]] = [None] * len(tables)
+        table_parts: List[List[Optional[DataPartResult]]] = [[] for _ in tables]
+
+        try:
+            if options.migrate_data:
+                self._record_binlog_position(pool)
+            jobs = []  # (índice da tabela, índice da parte, faixa)
+            for i, table in enumerate(tables):
+                if not self.should_continue():
+                    break
+                self.log(f"Processando tabela: {table.name}", "INFO")
+                results[i] = TableGenerationResult(
+                    table_name=table.name, ddl=InformixGenerator.generate_create_table(table)
+                )
+                self.log(f"DDL gerado para {table.name}.", "DEBUG")
+                if not options.migrate_data:
+                    continue
+                # Só uma contagem exata garante que a tabela está vazia; com estimativa ou sem
+                # contagem a extração segue até a origem não devolver mais lotes.
+                if table.row_count == 0 and table.row_count_source == 'exact':
+                    self.log(f"Tabela {table.name} não possui registros. Script de dados não será gerado.", "INFO")
+                    continue
+
+                try:
+                    key_ranges = self._plan_key_ranges(table, pool)
+                except Exception as e_plan: # Erro de uma tabela (MAX, faixas) não interrompe as demais
+                    results[i].error = f"Falha ao planejar a extração: {e_plan}"
+                    self.log(f"{table.name}: {results[i].error}", "ERROR")
+                    self.on_table_done(results[i])
+                    continue
+                if not key_ranges:
+                    continue # Modo delta sem linhas novas (ou tabela sem coluna de marca d'água)
+                table_parts[i] = [None] * len(key_ranges)
+                jobs.extend((i, part, key_range) for part, key_range in enumerate(key_ranges))
+
+            workers = max(1, min(options.workers, len(jobs) or 1))
+            if workers > 1:
+                self.log(f"Processando {len(jobs)} partes de dados com {workers} workers em paralelo.", "INFO")
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gerador") as executor:
+                futures = {
+                    executor.submit(self._process_part, tables[i], part, len(table_parts[i]), key_range, pool): (i, part)
+                    for i, part, key_range in jobs
+                }
+                pending = {i: len(parts) for i, parts in enumerate(table_parts) if parts}
+                for future in as_completed(futures):
+                    i, part = futures[future]
+                    table_parts[i][part] = future.result()
+                    pending[i] -= 1
+                    if pending[i] == 0:
+                        self._finish_table(tables[i], results[i], table_parts[i])
+                        self.on_table_done(results[i])
+        finally:
+            if self._render_pool:
+                self._render_pool.shutdown(cancel_futures=True)
+                self._render_pool = None
+            if self.checkpoint:
+                self.checkpoint.save()
+            if pool:
+                pool.close_all()
+                self.log("Conexões MariaDB fechadas.", "INFO")
+
+        if self.stats.fetch_rows:
+            self.log(f"Vazão do pipeline: {self.stats.describe()}", "INFO")
+
+        for i, parts in enumerate(table_parts):
+            if parts and all(part is None for part in parts):
+                results[i] = None # Todas as partes canceladas antes de começar
+        ordered = [result for result in results if result is not None]
+        self.write_ddl_script(ordered)
+        self.write_run_script(ordered)
+        return ordered
+
+    def _record_binlog_position(self, pool: MariaDBConnectionPool):
+        """Guarda a posição do binlog antes da extração: o CDC parte dela para aplicar o que
+        mudar durante e depois da carga."""
+        extractor = None
+        try:
+            extractor = pool.acquire()
+            self.binlog_position = extractor.get_binlog_position()
+        except Exception as e_binlog:
+            self.log(f"Posição do binlog não disponível ({e_binlog}). CDC precisará de uma posição informada.", "WARNING")
+            return
+        finally:
+            if extractor is not None:
+                pool.release(extractor)
+        if self.binlog_position:
+            self.log(f"Posição do binlog no início da extração: {self.binlog_position[0]}:{self.binlog_position[1]}", "INFO")
+
+    def _plan_key_ranges(self, table: Table, pool: MariaDBConnectionPool) -> List[Optional[KeyRange]]:
+        """Faixas da PK para tabelas grandes; [None] (tabela inteira num arquivo) para as demais."""
+        saved_ranges = self.checkpoint.get_key_ranges(table.name)
+        if saved_ranges is not None:
+            return saved_ranges # Retomada: as mesmas partes da execução anterior
+        if self.options.delta_mode:
+            key_ranges = self._plan_delta_window(table, pool)
+        else:
+            key_ranges = self._compute_key_ranges(table, pool)
+        self.checkpoint.set_key_ranges(table.name, key_ranges)
+        return key_ranges
+
+    def _plan_delta_window(self, table: Table, pool: MariaDBConnectionPool) -> List[Optional[KeyRange]]:
+        """[janela (marca anterior, MAX atual]] da tabela, ou [] quando não há o que extrair.
+
+        Com coluna de data e saída MERGE a janela começa em marca - delta_overlap_seconds
+        (inclusive) para pegar as linhas do mesmo segundo da marca e as confirmadas depois
+        da leitura do MAX anterior; relê-las só reaplica o MERGE."""
+        options = self.options
+        preferred = [name for name in options.delta_columns.split(',') if name.strip()]
+        column = MariaDBExtractor.get_delta_column(table, preferred)
+        if column is None:
+            self.log(f"{table.name}: sem coluna de data de alteração nem PK auto_increment. Modo delta não se aplica; dados não gerados.", "WARNING")
+            return []
+
+        temporal = column.data_type in ('TIMESTAMP', 'DATETIME')
+        merge = self._delta_uses_merge(column) and UpsertPlan.for_table(table).supports_merge
+        if temporal and not merge:
+            self.log(f"{table.name}: marca d'água por data ({column.name}) com saída INSERT: linhas alteradas "
+                     "viram INSERT com PK duplicada no destino e as do mesmo segundo da marca ou confirmadas "
+                     "depois da leitura do MAX se perdem. Use a saída MERGE (delta_output 'upsert' ou 'auto').", "WARNING")
+
+        mark = None
+        previous = self.delta_state.get(table.name)
+        if previous is not None:
+            if previous[0] == column.name:
+                mark = previous[1]
+            else:
+                self.log(f"{table.name}: marca d'água anterior era de {previous[0]}; extraindo tudo por {column.name}.", "WARNING")
+
+        extractor = pool.acquire()
+        try:
+            upper = extractor.get_column_max(table, column.name)
+        finally:
+            pool.release(extractor)
+
+        overlap = temporal and merge and options.delta_overlap_seconds > 0 and mark is not None
+        if upper is None or (mark is not None and (upper < mark if overlap else upper <= mark)):
+            self.log(f"{table.name}: nenhuma linha nova ou alterada desde a última execução.", "INFO")
+            return []
+
+        if overlap:
+            window = KeyRange(column.name, mark - timedelta(seconds=options.delta_overlap_seconds), upper,
+                              lower_inclusive=True, upper_inclusive=True)
+        else:
+            window = KeyRange(column.name, mark, upper, lower_inclusive=False, upper_inclusive=True)
+        self.log(f"{table.name}: delta {window.describe()}.", "INFO")
+        return [window]
+
+    def _delta_uses_merge(self, column: Column) -> bool:
+        """Se o delta pela coluna sai como MERGE (antes de checar se a tabela admite MERGE)."""
+        options = self.options
+        if options.data_format == 'unload':
+            return False
+        if options.delta_output == 'auto':
+            return column.data_type in ('TIMESTAMP', 'DATETIME')
+        return options.delta_output == 'upsert'
+
+    def _compute_key_ranges(self, table: Table, pool: MariaDBConnectionPool) -> List[Optional[KeyRange]]:
+        options = self.options
+        if (not options.partition_threshold or options.partitions_per_table < 2
+                or MariaDBExtractor.get_partition_column(table) is None):
+            return [None]
+
+        extractor = pool.acquire()
+        try:
+            if table.row_count_source == 'unknown':
+                extractor.count_rows(table) # Contagem sob demanda: só das tabelas que podem ser divididas
+            if table.row_count < options.partition_threshold:
+                return [None]
+            key_ranges = extractor.get_key_ranges(table, options.partitions_per_table)
+        except Exception as e_ranges:
+            self.log(f"{table.name}: não foi possível dividir em faixas ({e_ranges}). Extraindo num único arquivo.", "WARNING")
+            return [None]
+        finally:
+            pool.release(extractor)
+
+        if len(key_ranges) < 2:
+            return [None]
+        self.log(f"{table.name}: {format_row_count(table)} registros divididos em {len(key_ranges)} faixas de {key_ranges[0].column}.", "INFO")
+        return key_ranges
+
+    def _part_filename(self, table: Table, part: int, total_parts: int) -> str:
+        suffix = f".part{part + 1:03d}" if total_parts > 1 else ""
+        if self.options.data_format == 'unload':
+            return f"{table.name}{suffix}.unl"
+        return f"{table.name}_data{suffix}.sql"
+
+    def _process_part(self, table: Table, part: int, total_parts: int, key_range: Optional[KeyRange],
+                      pool: MariaDBConnectionPool) -> Optional[DataPartResult]:
+        if not self.should_continue():
+            return None # Cancelado antes de começar
+
+        part_result = DataPartResult(filename=self._part_filename(table, part, total_parts), key_range=key_range)
+        state = self.checkpoint.part_state(part_result.filename)
+        if (state and state['status'] == 'done'
+                and all(os.path.exists(os.path.join(self.options.output_directory, name))
+                        for name in state.get('files', [part_result.filename]))):
+            part_result.files = state.get('files', [part_result.filename])
+            part_result.records = state['records']
+            part_result.strategy = state['strategy']
+            part_result.completed = True
+            with self._records_lock:
+                self.total_records += part_result.records
+            self.log(f"{part_result.filename}: concluído numa execução anterior ({part_result.records} registros). Pulando.", "INFO")
+            return part_result
+
+        try:
+            extractor = pool.acquire()
+        except Exception as e_conn:
+            part_result.error = str(e_conn)
+            self.log(f"Falha ao conectar ao MariaDB para {table.name}. Pulando dados: {e_conn}", "ERROR")
+            return part_result
+        try:
+            self.generate_data_file(table, extractor, part_result, part, total_parts)
+        except Exception as e_table:
+            part_result.error = str(e_table)
+            self.log(f"Erro ao gerar dados para {part_result.filename}: {e_table}", "ERROR")
+        finally:
+            pool.release(extractor)
+        return part_result
+
+    def _finish_table(self, table: Table, result: TableGenerationResult, parts: List[Optional[DataPartResult]]):
+        """Consolida as partes (na ordem das faixas) no resultado da tabela."""
+        done_parts = [part for part in parts if part is not None]
+        if not done_parts:
+            return
+        result.parts = len(done_parts)
+        result.records = sum(part.records for part in done_parts)
+        result.strategy = done_parts[0].strategy
+        errors = [part.error for part in done_parts if part.error]
+        if errors:
+            result.error = "; ".join(errors)
+        elif self.delta_state is not None and len(done_parts) == len(parts) and all(part.completed for part in done_parts):
+            # A marca d'água só avança com a janela inteira gravada
+            window = done_parts[0].key_range
+            self.delta_state.set(table.name, window.column, window.upper)
+            self.delta_state.save()
+
+        if self.options.data_format == 'unload':
+            # Um único script LOAD por tabela, carregando as partes em ordem
+            load_script_filename = f"{table.name}_load.sql"
+            with open(os.path.join(self.options.output_directory, load_script_filename), 'w', encoding='utf-8') as load_file:
+                load_file.write(f"-- CARGA (LOAD) PARA A TABELA: {table.name}\n")
+                for part in done_parts:
+                    for unload_filename in part.files or [part.filename]:
+                        load_file.write(InformixGenerator.generate_load_statement(table, unload_filename) + "\n")
+            result.data_files.append(load_script_filename)
+            result.unload_files.extend(name for part in done_parts for name in part.files or [part.filename])
+        else:
+            result.data_files.extend(name for part in done_parts for name in part.files or [part.filename])
+
+        self.log(f"Dados gerados para {table.name}: {result.records} registros em {result.parts} arquivo(s).", "INFO")
+
+    def generate_data_file(self, table: Table, extractor: MariaDBExtractor, part_result: DataPartResult,
+                           part: int = 0, total_parts: int = 1):
+        """Extrai os dados da tabela (ou de uma faixa dela) e escreve o script de INSERTs ou o arquivo UNLOAD."""
+        options = self.options
+        table_name = table.name
+        key_range = part_result.key_range
+        use_unload_format = options.data_format == 'unload'
+        rows_per_statement = options.rows_per_insert if options.insert_mode == 'union' else 1
+        upsert = options.delta_mode and key_range is not None and any(
+            col.name == key_range.column and self._delta_uses_merge(col) for col in table.columns)
+        batch_size = options.batch_size
+        label = f"{table_name} (parte {part + 1}/{total_parts})" if total_parts > 1 else table_name
+
+        if key_range is not None:
+            self.log(f"Iniciando extração de dados para {label}: {key_range.describe()}.", "INFO")
+        else:
+            self.log(f"Iniciando extração de dados para {table_name} ({format_row_count(table)} registros).", "INFO")
+
+        table_data_filename = os.path.join(options.output_directory, part_result.filename)
+        compression = 'none' if use_unload_format else options.compression
+        chunk_bytes = max(0, options.chunk_size_mb) * 1024 * 1024
+        checkpoint = self.checkpoint
+        state = checkpoint.part_state(part_result.filename) if checkpoint else None
+        resume_key, resume_offset, in_transaction = None, 0, 0
+        restart_reason = None
+        if state and state['status'] == 'partial':
+            if compression != 'none' or chunk_bytes:
+                # Não dá para truncar um arquivo comprimido (nem saber em que pedaço parar)
+                restart_reason = "retomada no meio do arquivo não é possível com compressão/divisão"
+            elif state['strategy'] == 'stream' and not extractor.get_key_columns(table):
+                # O SELECT sem ORDER BY não devolve as linhas na mesma ordem em outra execução
+                restart_reason = "streaming sem chave primária não tem ordem garantida para retomar"
+        if restart_reason:
+            self.log(f"{label}: {restart_reason}; gerando a parte do zero.", "WARNING")
+            for name in state.get('files', []):
+                path = os.path.join(options.output_directory, name)
+                if os.path.exists(path):
+                    os.remove(path)
+            checkpoint.discard_part(part_result.filename)
+            state = None
+        if state and state['status'] == 'partial':
+            if os.path.exists(table_data_filename) and os.path.getsize(table_data_filename) >= state['offset']:
+                # Descarta o que foi escrito depois do último lote registrado no checkpoint
+                os.truncate(table_data_filename, state['offset'])
+                resume_key = checkpoint.resume_key(state)
+                resume_offset = state['records']
+                in_transaction = state['in_transaction']
+                part_result.records = resume_offset
+                with self._records_lock:
+                    self.total_records += resume_offset
+                self.log(f"{label}: retomando após {resume_offset} registros já gravados.", "INFO")
+            else:
+                self.log(f"{label}: arquivo não confere com o checkpoint, gerando a parte do zero.", "WARNING")
+                checkpoint.discard_part(part_result.filename)
+                state = None
+        resuming = state is not None and state['status'] == 'partial'
+
+        with DataFileOutput(options.output_directory, part_result.filename, compression, chunk_bytes, resuming) as dml_file:
+            if use_unload_format:
+                dml_writer = UnloadWriter(dml_file, table)
+            elif resuming:
+                dml_writer = DMLScriptWriter(dml_file, options.statements_per_transaction, in_transaction)
+            else:
+                dml_file.write(f"-- DADOS (DML) PARA A TABELA: {table_name}\n")
+                if key_range is not None and options.delta_mode:
+                    dml_file.write(f"-- Delta: {key_range.describe()}\n\n")
+                elif key_range is not None:
+                    dml_file.write(f"-- Parte {part + 1} de {total_parts}: {key_range.describe()}\n\n")
+                elif table.row_count_source == 'exact':
+                    dml_file.write(f"-- Total de Registros: {table.row_count}\n\n")
+                elif table.row_count_source == 'approximate':
+                    dml_file.write(f"-- Total de Registros (estimativa): {format_row_count(table)}\n\n")
+                else:
+                    dml_file.write("-- Total de Registros: não contado\n\n")
+                dml_writer = DMLScriptWriter(dml_file, options.statements_per_transaction)
+
+            if upsert and not UpsertPlan.for_table(table).supports_merge:
+                self.log(f"{table_name}: MERGE exige chave primária e não admite BYTE/TEXT; gerando INSERTs.", "WARNING")
+                upsert = False
+            if not upsert and not use_unload_format and rows_per_statement > 1 and part == 0 and not InsertPlan.for_table(table).supports_union_insert:
+                self.log(f"{table_name}: colunas BYTE/TEXT não admitem UNION ALL, usando um INSERT por linha.", "WARNING")
+
+            if options.extraction_mode == 'stream':
+                strategy = 'stream'
+            else:
+                strategy = extractor.choose_pagination_strategy(table)
+            part_result.strategy = strategy
+            if strategy == 'stream':
+                self.log(f"{label}: extração em streaming (lotes de {batch_size} via fetchmany).", "INFO")
+            elif strategy == 'keyset':
+                key_desc = ', '.join(extractor.get_key_columns(table))
+                self.log(f"{label}: paginação por chave (keyset) em ({key_desc}).", "INFO")
+            else:
+                self.log(f"{label}: sem chave primária utilizável, usando paginação LIMIT/OFFSET.", "WARNING")
+
+            def record_checkpoint(last_key: Optional[tuple]):
+                # Chamado pela thread escritora depois de cada lote gravado
+                if checkpoint:
+                    dml_file.flush()
+                    checkpoint.update_part(part_result.filename, 'partial', part_result.records, dml_file.tell(),
+                                           strategy, last_key, getattr(dml_writer, 'in_transaction', 0), dml_file.files)
+
+            def after_batch(last_key: Optional[tuple]):
+                if dml_file.chunk_full():
+                    # A transação aberta termina neste pedaço; cada pedaço é executado numa sessão dbaccess
+                    dml_writer.close()
+                    dml_file.next_chunk()
+                    if not use_unload_format:
+                        dml_file.write(f"-- DADOS (DML) PARA A TABELA: {table_name} (continuação, arquivo {dml_file.chunk + 1})\n\n")
+                record_checkpoint(last_key)
+
+            stats = PipelineStats()
+            write_rendered = dml_writer.write_text if use_unload_format else dml_writer.write_statements
+            render_queue: queue.Queue = queue.Queue(maxsize=max(1, options.pipeline_depth))
+            write_failures: List[Exception] = []
+            writer_thread = threading.Thread(
+                target=self._write_stage, name=f"escrita-{part_result.filename}",
+                args=(render_queue, write_rendered, part_result, stats, write_failures, after_batch), daemon=True,
+            )
+            writer_thread.start()
+
+            # Chave da última linha de cada lote: ponto de retomada para keyset e streaming com PK
+            key_indexes = [i for i, col in enumerate(table.columns) if col.is_primary_key]
+            batches = extractor.iter_table_batches(table, batch_size, strategy, key_range, resume_key, resume_offset)
+            batch_number = 0
+            completed = False
+            try:
+                while self.should_continue() and not write_failures:
+                    self.on_progress(f"{label}: Extraindo a partir do registro {resume_offset + stats.fetch_rows + 1}")
+
+                    started = time.perf_counter()
+                    try:
+                        data_batch = next(batches, None)
+                    except Exception as e_fetch:
+                        self.log(f"Erro ao buscar dados para {label} (lote {batch_number + 1}): {e_fetch}", "ERROR")
+                        part_result.error = str(e_fetch)
+                        break # Interrompe a busca de dados para esta parte em caso de erro
+                    stats.fetch_seconds += time.perf_counter() - started
+
+                    if data_batch is None:
+                        completed = True
+                        break
+                    batch_number += 1
+                    stats.fetch_rows += len(data_batch)
+                    last_row = data_batch[-1]
+                    last_key = tuple(last_row[i] for i in key_indexes) if key_indexes else None
+
+                    if self._render_pool is not None:
+                        rendered = self._render_pool.submit(render_batch, table, data_batch,
+                                                            options.data_format, rows_per_statement, upsert)
+                    else:
+                        rendered = render_batch(table, data_batch, options.data_format, rows_per_statement, upsert)
+                    started = time.perf_counter()
+                    render_queue.put((rendered, len(data_batch), last_key))
+                    stats.queue_wait_seconds += time.perf_counter() - started
+            finally:
+                batches.close() # Libera o cursor se a geração foi interrompida no meio da tabela
+                render_queue.put(None)
+                writer_thread.join()
+                dml_writer.close()
+                dml_file.close() # Tudo no disco (e a compressão concluída) antes de marcar a parte como concluída
+                part_result.files = list(dml_file.files)
+                if completed and not write_failures and not part_result.error:
+                    part_result.completed = True
+                    if checkpoint:
+                        checkpoint.update_part(part_result.filename, 'done', part_result.records, dml_file.total_size(),
+                                               strategy, files=dml_file.files)
+
+        if write_failures:
+            raise write_failures[0]
+        stats.write_bytes = dml_file.total_size()
+        with self._records_lock:
+            self.stats.merge(stats)
+        self.log(f"{label}: {stats.describe()}", "DEBUG")
+
+        self.log(f"Script DML gerado para {label} com {part_result.records} registros: {', '.join(part_result.files)}", "INFO")
+
+    def _write_stage(self, render_queue: queue.Queue, write_rendered: Callable[[Any], Any],
+                     part_result: DataPartResult, stats: PipelineStats, failures: List[Exception],
+                     on_written: Callable[[Optional[tuple]], None]):
+        """Thread escritora: grava os lotes renderizados na ordem da fila até receber None.
+
+        Depois de cada lote chama on_written(chave da última linha) para registrar o checkpoint.
+        """
+        while True:
+            item = render_queue.get()
+            if item is None:
+                return
+            if failures:
+                continue # Já falhou: só esvazia a fila para não travar a busca
+            rendered, row_count, last_key = item
+            try:
+                if isinstance(rendered, Future):
+                    rendered = rendered.result()
+                output, render_seconds = rendered
+                started = time.perf_counter()
+                write_rendered(output)
+                stats.write_seconds += time.perf_counter() - started
+            except Exception as e_write:
+                failures.append(e_write)
+                continue
+            stats.render_rows += row_count
+            stats.render_seconds += render_seconds
+            part_result.records += row_count
+            with self._records_lock:
+                self.total_records += row_count
+            try:
+                on_written(last_key)
+            except Exception as e_checkpoint:
+                failures.append(e_checkpoint)
+
+    def write_ddl_script(self, results: List[TableGenerationResult]) -> str:
+        ddl_scripts_content = []
+        ddl_scripts_content.append(f"-- Script de CRIAÇÃO DE ESTRUTURA (DDL) para Informix")
+        ddl_scripts_content.append(f"-- Gerado em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        ddl_scripts_content.append(f"-- Origem: MariaDB - {self.options.source_database}")
+        ddl_scripts_content.append(f"-- Destino: Informix - {self.options.informix_db_name} (servidor: {self.options.informix_server_name})\n")
+        for result in results:
+            ddl_scripts_content.append(f"\n-- ESTRUTURA PARA A TABELA: {result.table_name}\n")
+            ddl_scripts_content.append(result.ddl)
+            ddl_scripts_content.append("\n")
+
+        ddl_main_filename = os.path.join(self.options.output_directory, self.DDL_FILENAME)
+        with open(ddl_main_filename, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(ddl_scripts_content))
+        self.log(f"Script DDL principal salvo: {ddl_main_filename}", "SUCCESS")
+        return ddl_main_filename
+
+    def write_run_script(self, results: List[TableGenerationResult]) -> str:
+        """Gera o script de execução (exemplo para dbaccess)."""
+        server_name = self.options.informix_server_name
+        data_files = [data_file for result in results for data_file in result.data_files]
+
+        exec_script_filename = os.path.join(self.options.output_directory, self.RUN_SCRIPT_FILENAME)
+        with open(exec_script_filename, 'w', encoding='utf-8') as f:
+            f.write("#!/bin/bash\n")
+            f.write("# Script para executar os arquivos SQL gerados no Informix usando dbaccess.\n")
+            f.write("# Certifique-se de que as variáveis de ambiente do Informix (INFORMIXDIR, INFORMIXSERVER, etc.)\n")
+            f.write("# e o PATH estejam configurados corretamente.\n\n")
+            f.write("set -o pipefail # Falha do dbaccess num pipe de descompressão também conta como erro\n")
+            f.write("cd \"$(dirname \"$0\")\" || exit 1 # LOAD FROM usa caminhos relativos a este diretório\n")
+            f.write("export DBDATE=Y4MD- # Datas dos arquivos .unl estão no formato AAAA-MM-DD\n\n")
+            f.write(f"DB_NAME=\"{self.options.informix_db_name or 'seu_banco_de_dados'}\"\n")
+            f.write(f"INFORMIXSERVER_TO_USE=\"{server_name or 'seu_servidor_informix'}\"\n\n")
+            f.write("echo \"Verifique e ajuste DB_NAME e INFORMIXSERVER_TO_USE neste script antes de executar.\"\n")
+            f.write("read -p \"Pressione Enter para continuar após verificar...\"\n\n")
+            if self.options.delta_mode:
+                f.write(f"# Modo delta: as tabelas já existem no destino ({self.DDL_FILENAME} fica só como referência)\n\n")
+            else:
+                f.write(f"echo \"Executando script de criação de tabelas: {self.DDL_FILENAME}\"\n")
+                f.write(f"dbaccess \"$DB_NAME\"@\"$INFORMIXSERVER_TO_USE\" \"{self.DDL_FILENAME}\" || exit 1\n\n")
+            if self.options.migrate_data and data_files:
+                f.write("echo \"Executando scripts de inserção de dados...\"\n")
+                for data_file in data_files:
+                    f.write(f"echo \"  - {data_file}\"\n")
+                    decompress = self.DECOMPRESS_COMMANDS.get(os.path.splitext(data_file)[1])
+                    if decompress:
+                        # Descomprime direto para o dbaccess, sem gravar o .sql em disco
+                        command = f"{decompress} \"{data_file}\" | dbaccess \"$DB_NAME\"@\"$INFORMIXSERVER_TO_USE\" -"
+                    else:
+                        command = f"dbaccess \"$DB_NAME\"@\"$INFORMIXSERVER_TO_USE\" \"{data_file}\""
+                    f.write(f"  {command} || echo \"ERRO ao executar {data_file}. Continuando...\"\n")
+            f.write("\necho \"Execução dos scripts concluída.\"\n")
+
+        # Tornar executável (Linux/macOS)
+        try:
+            os.chmod(exec_script_filename, 0o755) # rwxr-xr-x
+            self.log(f"Script de execução salvo e tornado executável: {exec_script_filename}", "SUCCESS")
+        except OSError as e_chmod:
+            self.log(f"Script de execução salvo: {exec_script_filename}. Falha ao tornar executável (chmod): {e_chmod}", "WARNING")
+        return exec_script_filename
+
+    def build_summary(self, results: List[TableGenerationResult], total_tables: int, completed: bool) -> str:
+        options = self.options
+        summary_content = f"GERAÇÃO DE SCRIPTS CONCLUÍDA ({'COM' if completed else 'INTERROMPIDA'})\n"
+        summary_content += f"Data/Hora: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        summary_content += f"Diretório de Saída: {options.output_directory}\n"
+        summary_content += f"Tabelas processadas: {len(results)} de {total_tables}\n"
+        if options.migrate_data:
+            summary_content += f"Total de registros processados para DML: {self.total_records}\n"
+        if self.binlog_position:
+            summary_content += f"Posição do binlog no início (início do CDC): {self.binlog_position[0]}:{self.binlog_position[1]}\n"
+        summary_content += "\nArquivos Gerados:\n"
+        summary_content += f"  - {self.DDL_FILENAME} (Estrutura DDL)\n"
+        if options.migrate_data:
+            for result in results:
+                for df in result.data_files:
+                    summary_content += f"  - {df} ({'Carga LOAD' if options.data_format == 'unload' else 'Dados DML'})\n"
+                for uf in result.unload_files:
+                    summary_content += f"  - {uf} (Dados formato UNLOAD)\n"
+        summary_content += f"  - {self.RUN_SCRIPT_FILENAME} (Script de execução .sh)\n"
+
+        if any(result.strategy for result in results):
+            summary_content += "\nEstratégia de extração por tabela:\n"
+            for result in results:
+                if not result.strategy:
+                    continue
+                parts_desc = f", {result.parts} partes" if result.parts > 1 else ""
+                summary_content += f"  - {result.table_name}: {self.STRATEGY_LABELS[result.strategy]}{parts_desc}\n"
+
+        errors = [result for result in results if result.error]
+        if errors:
+            summary_content += "\nTabelas com erro:\n"
+            for result in errors:
+                summary_content += f"  - {result.table_name}: {result.error}\n"
+        return summary_content
@@ -3,7 +3,8 @@ import tkinter as tk
 from tkinter import scrolledtext, filedialog, messagebox, PanedWindow, Frame, Label, Button, Menu
 from tkinter import ttk
 import logging
-from sql_converter_logic import SQLConverter
+from sql_converter_logic import SQLConverter, SQLBatchConverter, open_conversion_cache
+from conversion_cache import SQLConversionCache
 from logger_config import setup_logger
 import webbrowser
 import json
@@ -20,6 +21,7 @@ class SQLConverterApp:
         master.geometry("1000x700")
         
         self.is_converting = False  # Flag para controlar estado de conversão
+        self.use_cache_var = tk.BooleanVar(value=True)  # Cache de conversão (arquivo grande / pasta)
         
         # Configurar atalhos de teclado
         self.setup_keyboard_shortcuts()
@@ -111,6 +113,12 @@ class SQLConverterApp:
                                    bg="lightblue")
         self.convert_button.pack(pady=5)
 
+        # Arquivos grandes (dumps) são convertidos direto de arquivo para arquivo, sem passar pelo editor
+        self.convert_file_button = Button(conversion_frame,
+                                        text="Converter Arquivo Grande...",
+                                        command=self.convert_large_file)
+        self.convert_file_button.pack(pady=(0, 5))
+
         # --- Área de Status/Mensagens ---
         self.status_label = Label(master, text="Pronto.", bd=1, relief=tk.SUNKEN, anchor=tk.W, justify=tk.LEFT)
         self.status_label.pack(fill=tk.X, padx=10, pady=5)
@@ -140,6 +148,9 @@ class SQLConverterApp:
         file_menu.add_separator()
         file_menu.add_command(label="Salvar Como... (Ctrl+S)", command=self.save_file)
         file_menu.add_separator()
+        file_menu.add_command(label="Converter Arquivo Grande...", command=self.convert_large_file)
+        file_menu.add_command(label="Converter Pasta...", command=self.convert_directory)
+        file_menu.add_separator()
         file_menu.add_command(label="Sair", command=self.master.quit)
         
         # Menu Editar
@@ -147,6 +158,8 @@ class SQLConverterApp:
         menubar.add_cascade(label="Editar", menu=edit_menu)
         edit_menu.add_command(label="Limpar Tudo (Ctrl+L)", command=self.clear_all)
         edit_menu.add_command(label="Buscar (Ctrl+F)", command=lambda: self.search_entry.focus())
+        edit_menu.add_separator()
+        edit_menu.add_checkbutton(label="Usar Cache de Conversão", variable=self.use_cache_var)
         
         # Menu Ajuda
         help_menu = Menu(menubar, tearoff=0)
@@ -363,6 +376,166 @@ Desenvolvido por JP Code.
             self.progress_var.set(0)
             self.master.update_idletasks()
 
+    def convert_large_file(self):
+        if self.is_converting:
+            messagebox.showwarning("Conversão em Andamento", "Uma conversão já está em andamento.")
+            return
+        input_path = filedialog.askopenfilename(
+            title="Script MariaDB a converter",
+            filetypes=[("SQL Files", "*.sql"), ("All Files", "*.*")]
+        )
+        if not input_path:
+            return
+        base, ext = os.path.splitext(input_path)
+        output_path = filedialog.asksaveasfilename(
+            defaultextension=".sql",
+            initialfile=os.path.basename(f"{base}_informix{ext or '.sql'}"),
+            initialdir=os.path.dirname(input_path),
+            filetypes=[("SQL Files", "*.sql"), ("All Files", "*.*")],
+            title="Salvar Script Informix Como..."
+        )
+        if not output_path:
+            return
+
+        self.is_converting = True
+        self.convert_button.config(state=tk.DISABLED, bg="gray")
+        self.convert_file_button.config(state=tk.DISABLED)
+        self.conversion_status.config(text=f"Convertendo {os.path.basename(input_path)}...", fg="blue")
+        self.progress_var.set(0)
+        logger.info(f"Iniciando conversão de arquivo: {input_path} -> {output_path}")
+
+        # A conversão roda numa thread; a interface só lê o progresso (Tk não é thread-safe)
+        progress = {'read': 0, 'total': 1, 'result': None, 'error': None}
+        use_cache = self.use_cache_var.get()
+
+        def on_progress(bytes_read, total_bytes):
+            progress['read'], progress['total'] = bytes_read, total_bytes or 1
+
+        def worker():
+            try:
+                if not use_cache:
+                    progress['result'] = SQLConverter().convert_file(input_path, output_path, on_progress=on_progress)
+                    return
+                # A conexão SQLite do cache precisa ser aberta na thread que a usa
+                with open_conversion_cache() as cache:
+                    progress['result'] = SQLConverter(cache).convert_file(input_path, output_path, on_progress=on_progress)
+                    logger.info(f"Cache de conversão: {cache.describe()}")
+            except Exception as e:
+                progress['error'] = e
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+
+        def poll():
+            self.progress_var.set(100.0 * progress['read'] / progress['total'])
+            if thread.is_alive():
+                self.master.after(200, poll)
+                return
+            self.is_converting = False
+            self.convert_button.config(state=tk.NORMAL, bg="lightblue")
+            self.convert_file_button.config(state=tk.NORMAL)
+            self.conversion_status.config(text="Pronto para converter", fg="black")
+            self.progress_var.set(0)
+            self._show_file_conversion_result(progress['result'], progress['error'])
+
+        self.master.after(200, poll)
+
+    def _show_file_conversion_result(self, result, error):
+        if error is not None:
+            messagebox.showerror("Erro de Conversão", f"Ocorreu um erro durante a conversão: {error}")
+            self.status_label.config(text=f"Erro na conversão: {error}")
+            logger.error(f"Erro durante a conversão de arquivo: {error}")
+            return
+
+        status_message = (f"Arquivo convertido: '{result.output_path}'. {result.statements} comandos, "
+                          f"{result.converted_items_count} itens/padrões processados.")
+        if result.cache_hits or result.cache_misses:
+            status_message += f" Cache: {result.cache_hits} reaproveitado(s), {result.cache_misses} convertido(s)."
+        warning_lines = result.format_warnings()
+        for line in warning_lines:
+            logger.warning(f"Alerta de conversão: {line}")
+        if warning_lines:
+            status_message += f"\n{sum(result.warning_counts.values())} ALERTA(S) GERADO(S) (requer revisão manual):\n"
+            status_message += "\n".join(f"  {line}" for line in warning_lines[:10])
+            if len(warning_lines) > 10:
+                status_message += "\n  ... lista completa no log"
+            messagebox.showwarning("Atenção Pós-Conversão",
+                                 "Conversão realizada com alertas.\nVerifique a barra de status e o log para detalhes.")
+        else:
+            messagebox.showinfo("Sucesso", "Conversão concluída sem alertas específicos. Revise o script gerado.")
+        self.status_label.config(text=status_message.strip())
+        logger.info(f"Conversão de arquivo finalizada: {result.statements} comandos, {result.converted_items_count} itens processados")
+
+    def convert_directory(self):
+        if self.is_converting:
+            messagebox.showwarning("Conversão em Andamento", "Uma conversão já está em andamento.")
+            return
+        directory = filedialog.askdirectory(title="Pasta com scripts MariaDB (.sql)")
+        if not directory:
+            return
+
+        self.is_converting = True
+        self.convert_button.config(state=tk.DISABLED, bg="gray")
+        self.convert_file_button.config(state=tk.DISABLED)
+        self.conversion_status.config(text=f"Convertendo a pasta {os.path.basename(directory)}...", fg="blue")
+        self.progress_var.set(0)
+        logger.info(f"Iniciando conversão em lote: {directory}")
+
+        progress = {'done': 0, 'total': 1, 'result': None, 'error': None}
+        cache_path = SQLConversionCache.DEFAULT_PATH if self.use_cache_var.get() else None
+
+        def on_file_done(result, done, total):
+            progress['done'], progress['total'] = done, total or 1
+
+        def log(message, level="INFO"):
+            logger.log(logging.ERROR if level == "ERROR" else logging.INFO, message)
+
+        def worker():
+            try:
+                progress['result'] = SQLBatchConverter(cache_path=cache_path, log=log,
+                                                       on_file_done=on_file_done).run([directory])
+            except Exception as e:
+                progress['error'] = e
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+
+        def poll():
+            self.progress_var.set(100.0 * progress['done'] / progress['total'])
+            if thread.is_alive():
+                self.master.after(200, poll)
+                return
+            self.is_converting = False
+            self.convert_button.config(state=tk.NORMAL, bg="lightblue")
+            self.convert_file_button.config(state=tk.NORMAL)
+            self.conversion_status.config(text="Pronto para converter", fg="black")
+            self.progress_var.set(0)
+            self._show_batch_conversion_result(progress['result'], progress['error'])
+
+        self.master.after(200, poll)
+
+    def _show_batch_conversion_result(self, batch, error):
+        if error is not None:
+            messagebox.showerror("Erro de Conversão", f"Ocorreu um erro durante a conversão em lote: {error}")
+            self.status_label.config(text=f"Erro na conversão: {error}")
+            logger.error(f"Erro durante a conversão em lote: {error}")
+            return
+        if not batch.files and not batch.errors:
+            messagebox.showinfo("Conversão em Lote", "Nenhum arquivo .sql encontrado na pasta.")
+            return
+        status_message = (f"{len(batch.files)} arquivo(s) convertido(s) ({batch.statements} comandos) em {batch.seconds:.1f}s; "
+                          f"saídas *_informix.sql ao lado dos originais.\n"
+                          f"{batch.warning_count} alerta(s), {len(batch.errors)} erro(s). Relatório: {batch.report_path}")
+        if batch.cache_hits or batch.cache_misses:
+            status_message += f"\nCache: {batch.cache_hits} comando(s) reaproveitado(s), {batch.cache_misses} convertido(s)."
+        self.status_label.config(text=status_message)
+        if batch.errors or batch.warning_count:
+            messagebox.showwarning("Atenção Pós-Conversão",
+                                 f"Conversão em lote realizada com {batch.warning_count} alerta(s) e {len(batch.errors)} erro(s).\n"
+                                 f"Detalhes em {batch.report_path}")
+        else:
+            messagebox.showinfo("Sucesso", "Conversão em lote concluída sem alertas específicos. Revise os scripts gerados.")
+
 def main():
     root = tk.Tk()
     app = SQLConverterApp(root)
@@ -1,14 +1,272 @@
 # sql_converter_logic.py
+import multiprocessing
+import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from conversion_cache import SQLConversionCache
+
+
+@dataclass
+class SQLStatement:
+    text: str           # Comando com o terminador normalizado para ';' (DELIMITER customizado removido)
+    line: int           # Linha (1-based) do primeiro caractere do comando no arquivo de entrada
+    leading: str = ""   # Espaços e quebras de linha antes do comando, repetidos na saída
+
+
+class SQLStatementReader:
+    """Divide um script em comandos, linha a linha, sem carregar o arquivo inteiro.
+
+    Respeita strings ('...', "..."), identificadores `...`, comentários (--, #, /* */)
+    e instruções DELIMITER do cliente mysql: o terminador só conta fora deles. As instruções
+    DELIMITER não são repassadas (o Informix não as usa) e suas linhas ficam em
+    `delimiter_lines`; o que vier depois do delimitador na mesma linha segue como comando.
+    A memória usada é a do maior comando, não a do arquivo.
+    """
+
+    DELIMITER_DIRECTIVE = re.compile(r"\s*DELIMITER\s+(\S+)", re.IGNORECASE)
+    QUOTE_END = {
+        "'": re.compile(r"\\.|'", re.DOTALL),
+        '"': re.compile(r'\\.|"', re.DOTALL),
+        '`': re.compile(r"`"),
+    }
+
+    def __init__(self, delimiter: str = ";"):
+        self.delimiter_lines: List[int] = []
+        self._set_delimiter(delimiter)
+
+    def _set_delimiter(self, delimiter: str):
+        self.delimiter = delimiter
+        # O delimitador vem primeiro na alternância: '//' não pode virar início de '/*'
+        self._token_pattern = re.compile(re.escape(delimiter) + r"|['\"`#]|--(?=\s|$)|/\*")
+
+    def statements(self, lines: Iterable[str]) -> Iterator[SQLStatement]:
+        parts: List[str] = []
+        first_line: Optional[int] = None
+        state = None  # None, "'", '"', '`' ou '/*'
+
+        for line_no, line in enumerate(lines, 1):
+            if state is None:
+                directive = self.DELIMITER_DIRECTIVE.match(line)
+                if directive:
+                    self._set_delimiter(directive.group(1))
+                    self.delimiter_lines.append(line_no)
+                    line = line[directive.end():].lstrip(" \t") # "DELIMITER $$ CREATE PROCEDURE ..." numa linha só
+                    if not line.strip():
+                        continue
+
+            pos = seg_start = 0
+            while pos < len(line):
+                if state is None:
+                    match = self._token_pattern.search(line, pos)
+                    if not match:
+                        break
+                    token = match.group(0)
+                    if token == self.delimiter:
+                        fragment = line[seg_start:match.start()]
+                        if first_line is None and fragment.strip():
+                            first_line = line_no
+                        parts.append(fragment)
+                        statement = self._build(parts, first_line, terminated=True)
+                        if statement:
+                            yield statement
+                        parts, first_line = [], None
+                        pos = seg_start = match.end()
+                    elif token in ("--", "#"):
+                        break  # O resto da linha é comentário
+                    else:
+                        state = token
+                        pos = match.end()
+                elif state == "/*":
+                    end = line.find("*/", pos)
+                    if end < 0:
+                        break
+                    state = None
+                    pos = end + 2
+                else:
+                    match = self.QUOTE_END[state].search(line, pos)
+                    if not match:
+                        break
+                    pos = match.end()
+                    if match.group(0)[0] == "\\":
+                        continue  # Caractere escapado
+                    if line.startswith(state, pos):
+                        pos += 1  # Aspas duplicadas ('') dentro da string
+                        continue
+                    state = None
+
+            fragment = line[seg_start:]
+            if first_line is None and fragment.strip():
+                first_line = line_no
+            parts.append(fragment)
+
+        statement = self._build(parts, first_line, terminated=False)
+        if statement:
+            yield statement
+
+    @staticmethod
+    def _build(parts: List[str], first_line: Optional[int], terminated: bool) -> Optional[SQLStatement]:
+        raw = "".join(parts)
+        body = raw.lstrip()
+        if not body.strip():
+            return None  # Terminador solto (';;') ou só espaços no fim do arquivo
+        return SQLStatement(body + ";" if terminated else body.rstrip(), first_line, raw[:len(raw) - len(body)])
+
+
+@dataclass
+class FileConversionResult:
+    input_path: str
+    output_path: str
+    statements: int = 0
+    converted_items_count: int = 0
+    bytes_read: int = 0
+    cancelled: bool = False
+    warnings: List[Tuple[int, str]] = field(default_factory=list)   # (linha, mensagem)
+    warning_counts: Dict[str, int] = field(default_factory=dict)   # Total de ocorrências por mensagem
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    def format_warnings(self) -> List[str]:
+        """Alertas com número de linha; mensagens repetidas mostram só as primeiras linhas."""
+        lines = [f"Linha {line}: {message}" for line, message in self.warnings]
+        for message, count in self.warning_counts.items():
+            listed = sum(1 for _, listed_message in self.warnings if listed_message == message)
+            if count > listed:
+                lines.append(f"(+{count - listed} ocorrência(s)) {message}")
+        return lines
+
+
+class SQLToken:
+    __slots__ = ('kind', 'text', 'upper')
+
+    def __init__(self, kind: str, text: str):
+        self.kind = kind
+        self.text = text
+        self.upper = text.upper() if kind == 'word' else text  # Palavras comparadas sem caixa
+
+
+class SQLLexer:
+    """Quebra um script MariaDB em tokens numa única passada.
+
+    Strings, identificadores entre crases e comentários viram um token só, então as
+    regras de reescrita nunca enxergam o que está dentro deles. DELIMITER no início da
+    linha vira um token 'directive' e troca o terminador reconhecido dali em diante (token
+    'delimiter'), inclusive no resto da mesma linha.
+    Nenhum padrão retrocede além do token atual: o tempo é linear no tamanho do texto.
+    """
+
+    DELIMITER_DIRECTIVE = re.compile(r"[^\S\n]*DELIMITER[^\S\n]+(\S+)[^\S\n]*", re.IGNORECASE)
+    TOKEN_PATTERNS = (
+        ('space', r"[^\S\n]*\n|[^\S\n]+"),                 # Quebra depois de cada '\n' (DELIMITER só vale no início da linha)
+        ('comment', r"--(?=\s|\Z)[^\n]*|/\*(?:.*?\*/|.*)"),  # Inclui /*! ... */ do mysqldump; sem '*/' vai até o fim
+        ('hash_comment', r"#[^\n]*"),
+        ('string', r"'(?:[^'\\]+|\\(?:.|\Z)|'')*(?:'|\Z)|\"(?:[^\"\\]+|\\(?:.|\Z)|\"\")*(?:\"|\Z)"),
+        ('ident', r"`(?:[^`]+|``)*(?:`|\Z)"),
+        ('number', r"\d+(?:\.\d*)?(?:[eE][+-]?\d+)?|\.\d+"),
+        ('word', r"[^\W\d]\w*"),                         # Sem '$': 'END$$' precisa separar o delimitador
+        ('variable', r"@@?[\w$.]*"),
+        ('open', r"\("),
+        ('close', r"\)"),
+        ('semicolon', r";"),                               # ';' dentro de um bloco DELIMITER customizado
+        ('punct', r"."),
+    )
+
+    _patterns: Dict[str, 're.Pattern'] = {}  # Padrão compilado por delimitador, compartilhado entre instâncias
+
+    def __init__(self, delimiter: str = ";"):
+        self.delimiter = delimiter
+
+    def _pattern(self, delimiter: str):
+        pattern = self._patterns.get(delimiter)
+        if pattern is None:
+            # O delimitador vem primeiro: '$$' ou '//' não podem ser lidos como outra coisa
+            alternatives = [f"(?P<delimiter>{re.escape(delimiter)})"]
+            alternatives += [f"(?P<{kind}>{regex})" for kind, regex in self.TOKEN_PATTERNS]
+            pattern = self._patterns[delimiter] = re.compile("|".join(alternatives), re.DOTALL)
+        return pattern
+
+    def tokenize(self, text: str) -> List[SQLToken]:
+        tokens = []
+        pattern = self._pattern(self.delimiter)
+        pos, length = 0, len(text)
+        while pos < length:
+            if pos == 0 or text[pos - 1] == "\n":
+                directive = self.DELIMITER_DIRECTIVE.match(text, pos)
+                if directive:
+                    tokens.append(SQLToken('directive', directive.group(0)))
+                    self.delimiter = directive.group(1)
+                    pattern = self._pattern(self.delimiter)
+                    pos = directive.end()
+                    continue
+            match = pattern.match(text, pos)
+            tokens.append(SQLToken(match.lastgroup, match.group()))
+            pos = match.end()
+        return tokens
+
 
 class SQLConverter:
-    def __init__(self):
+    # Versão das regras de reescrita, parte da chave do SQLConversionCache.
+    # Aumente ao mudar qualquer regra ou alerta, senão o cache devolve conversões antigas.
+    RULES_VERSION = "1"
+
+    # Ocorrências do mesmo alerta guardadas com número de linha em convert_file;
+    # as demais só são contadas (um dump de milhões de comandos não pode encher a memória)
+    MAX_WARNING_LINES_PER_MESSAGE = 20
+
+    # Tabela de regras: palavra-chave (maiúscula) ou tipo de token -> método que o reescreve.
+    # Cada regra recebe o índice do token, grava a saída em self._out e devolve o índice
+    # do próximo token a processar. Tokens sem regra são copiados como estão.
+    REWRITE_RULES = {
+        'INT': '_rule_integer_type', 'INTEGER': '_rule_integer_type', 'BIGINT': '_rule_integer_type',
+        'AUTO_INCREMENT': '_rule_auto_increment',
+        'SERIAL': '_rule_serial', 'SERIAL8': '_rule_serial',
+        'DATETIME': '_rule_datetime',
+        'TEXT': '_rule_text_type', 'TINYTEXT': '_rule_text_type',
+        'MEDIUMTEXT': '_rule_text_type', 'LONGTEXT': '_rule_text_type',
+        'NOW': '_rule_now',
+        'SELECT': '_rule_select',
+        'LIMIT': '_rule_limit',
+        'CREATE': '_rule_create',
+        'ALTER': '_rule_alter',
+        'PRIMARY': '_rule_primary_key',
+        'PROCEDURE': '_rule_routine_word', 'FUNCTION': '_rule_routine_word',
+        'BEGIN': '_rule_begin',
+        'CASE': '_rule_case',
+        'END': '_rule_end',
+        'WITH': '_rule_check_option',
+        'ident': '_rule_quoted_identifier',
+        'hash_comment': '_rule_hash_comment',
+        'directive': '_rule_delimiter_directive',
+        'delimiter': '_rule_terminator',
+        'semicolon': '_rule_terminator',
+        'open': '_rule_open_paren',
+        'close': '_rule_close_paren',
+    }
+    SKIPPED_KINDS = ('space', 'comment', 'hash_comment')
+    TERMINATOR_KINDS = ('delimiter', 'semicolon')
+    # END seguido destas palavras fecha um comando composto que não abre bloco na pilha
+    COMPOUND_ENDS = ('IF', 'LOOP', 'WHILE', 'REPEAT', 'FOR')
+
+    def __init__(self, cache: Optional[SQLConversionCache] = None):
         self.warnings = []
         self.converted_items_count = 0
+        self.cache = cache  # Usado por convert_statement/convert_file, não por convert()
+        self._rules = {key: getattr(self, name) for key, name in self.REWRITE_RULES.items()}
+        self._reset_state()
 
     def _reset_state(self):
         self.warnings = []
         self.converted_items_count = 0
+        self._tokens: List[SQLToken] = []
+        self._out: List[str] = []
+        self._depth = 0                       # Profundidade de parênteses
+        self._select_at: Dict[int, int] = {}  # Profundidade -> posição em _out do primeiro SELECT do comando
+        self._routine = None                  # 'PROCEDURE'/'FUNCTION' enquanto dentro de um CREATE de rotina
+        self._blocks: List[str] = []          # Pilha BEGIN/CASE do corpo da rotina
+        self._seen = set()                    # Construções vistas, para os alertas finais
 
     def _add_warning(self, message):
         if message not in self.warnings: # Evitar duplicados
@@ -19,189 +277,563 @@ class SQLConverter:
 
     def convert(self, mariadb_sql: str) -> tuple[str, list, int]:
         self._reset_state()
-        informix_sql = mariadb_sql
-
-        # --- Pré-processamento e Detecção de Blocos ---
-        # Lidar com DELIMITER para stored procedures/functions
-        # Esta é uma abordagem simplificada. Scripts complexos com DELIMITER podem precisar de mais.
-        delimiter_pattern = re.compile(r"DELIMITER\s+(.+)", re.IGNORECASE)
-        custom_delimiter = None
-        delimiters_found = list(delimiter_pattern.finditer(informix_sql))
-
-        if delimiters_found:
-            self._add_warning("Instruções 'DELIMITER' detectadas. Tentando processar blocos de Stored Procedure/Function.")
-            # Remove as declarações DELIMITER em si
-            informix_sql = delimiter_pattern.sub("", informix_sql)
-            
-            # Supõe que o último delimitador definido é o que finaliza os blocos
-            # e que o delimitador padrão é ';' antes do primeiro DELIMITER
-            # Isso é uma simplificação!
-            
-            # Regex para CREATE PROCEDURE/FUNCTION ... END delimiter
-            # Captura (CREATE [OR REPLACE] PROCEDURE/FUNCTION ...)(corpo)(END)(delimitador customizado)
-            proc_func_pattern_custom_delim = re.compile(
-                r"(CREATE\s+(?:OR\s+REPLACE\s+)?(?:PROCEDURE|FUNCTION)\s+[\w`]+\s*\(.*?\)\s*(?:RETURNS\s+\w+\s*)?.*?)(END)\s*(\S{2,})", 
-                re.IGNORECASE | re.DOTALL
-            )
-            
-            def replace_proc_func_end_custom(match):
-                self._increment_conversion_count()
-                # O delimitador customizado é o match.group(3)
-                # Se o delimitador customizado for por exemplo "$$", e a linha é "END$$"
-                # queremos substituir por "END PROCEDURE;" ou "END FUNCTION;"
-                proc_type = "PROCEDURE" if "PROCEDURE" in match.group(1).upper() else "FUNCTION"
-                return f"{match.group(1)}END {proc_type};"
+        tokens = self._tokens = SQLLexer().tokenize(mariadb_sql)
+        out = self._out
+        rules = self._rules
+        i, total = 0, len(tokens)
+        while i < total:
+            token = tokens[i]
+            rule = rules.get(token.upper if token.kind == 'word' else token.kind)
+            if rule is None:
+                out.append(token.text)
+                i += 1
+            else:
+                i = rule(i)
 
-            informix_sql = proc_func_pattern_custom_delim.sub(replace_proc_func_end_custom, informix_sql)
+        self._add_final_warnings()
+        informix_sql = "".join(out)
+        self._tokens, self._out = [], []
+        return informix_sql.strip(), self.warnings, self.converted_items_count
 
+    def _add_final_warnings(self):
+        seen = self._seen
+        if 'LIMIT' in seen: # LIMIT que sobrou (subquery, UNION...): não há como mover para FIRST com segurança
+            self._add_warning("Cláusulas 'LIMIT' complexas ou em subqueries podem precisar de revisão manual.")
+        if 'CREATE TABLE' in seen:
+            if 'SERIAL' in seen and 'PRIMARY KEY' in seen:
+                self._add_warning("Verifique definições de PRIMARY KEY em tabelas com colunas SERIAL. SERIAL já pode atuar como PK.")
+            self._add_warning("Revise a sintaxe de PRIMARY KEY e FOREIGN KEY para conformidade com Informix (nomes de constraint, etc.).")
+        if 'ALTER TABLE' in seen:
+            self._add_warning("Comandos ALTER TABLE podem ter sintaxe variada. Revise-os cuidadosamente.")
+        if 'CREATE VIEW' in seen:
+            self._add_warning("CREATE VIEW detectado. A query SELECT interna foi processada pelas regras gerais (ex: LIMIT). Revise a view completa.")
+        if '#' in seen:
+            self._add_warning("Comentários '#' foram convertidos para '--'.")
+        if 'PROCEDURE' in seen:
+            self._add_warning("Stored Procedures/Functions convertidas de forma básica. Lógica interna (loops, variáveis, SQL procedural) EXIGE revisão manual detalhada devido a grandes diferenças entre MariaDB SPL e Informix SPL.")
 
-        # --- Conversões Gerais (aplicadas em todo o script) ---
+    # --- Navegação nos tokens ---
 
-        # 1. `AUTO_INCREMENT` → `SERIAL`
-        #    Também cobre `BIGINT AUTO_INCREMENT` -> `SERIAL8`
-        #    e remove `DEFAULT NULL` ou `NOT NULL` se estiver com AUTO_INCREMENT
-        def replace_auto_increment(match):
-            self._increment_conversion_count()
-            type_before = match.group(1).upper() if match.group(1) else "INT"
-            if "BIGINT" in type_before:
-                return "SERIAL8"
-            return "SERIAL"
-        
-        informix_sql = re.sub(
-            r"\b(BIGINT|INT(?:EGER)?)\b\s+(NOT\s+NULL\s+|NULL\s+|DEFAULT\s+NULL\s+)?AUTO_INCREMENT",
-            replace_auto_increment, informix_sql, flags=re.IGNORECASE
-        )
-        informix_sql = re.sub(
-            r"\bAUTO_INCREMENT\b", "SERIAL", informix_sql, flags=re.IGNORECASE
-        ) # Pega AUTO_INCREMENT sozinho
-
-        # 2. `DATETIME` → `DATETIME YEAR TO SECOND`
-        #    Evitar `DATETIME YEAR TO ...` já existente
-        datetime_pattern = re.compile(r"\bDATETIME\b(?!\s+YEAR\b)", re.IGNORECASE)
-        if datetime_pattern.search(informix_sql):
-            self._increment_conversion_count(len(datetime_pattern.findall(informix_sql)))
-            informix_sql = datetime_pattern.sub("DATETIME YEAR TO SECOND", informix_sql)
-
-        # 3. `TEXT` → `CLOB` (e variantes como LONGTEXT, MEDIUMTEXT, TINYTEXT)
-        text_types_pattern = re.compile(r"\b(LONGTEXT|MEDIUMTEXT|TINYTEXT|TEXT)\b", re.IGNORECASE)
-        if text_types_pattern.search(informix_sql):
-            self._increment_conversion_count(len(text_types_pattern.findall(informix_sql)))
-            informix_sql = text_types_pattern.sub("CLOB", informix_sql)
-
-        # 4. `NOW()` → `CURRENT YEAR TO SECOND`
-        now_pattern = re.compile(r"\bNOW\(\s*\)", re.IGNORECASE)
-        if now_pattern.search(informix_sql):
-            self._increment_conversion_count(len(now_pattern.findall(informix_sql)))
-            informix_sql = now_pattern.sub("CURRENT YEAR TO SECOND", informix_sql)
-
-        # 5. Remover aspas invertidas (`)
-        backtick_pattern = re.compile(r"`([^`]+)`")
-        if backtick_pattern.search(informix_sql):
-            # Não necessariamente conta como "conversão" principal, mas é uma mudança.
-            # self._increment_conversion_count(len(backtick_pattern.findall(informix_sql)))
-            informix_sql = backtick_pattern.sub(r"\1", informix_sql)
-
-
-        # 6. `LIMIT` → `FIRST` / `SKIP FIRST`
-        #    Processa SELECTs que podem ou não terminar com ';'
-        #    `SELECT ... LIMIT count` -> `SELECT FIRST count ...`
-        #    `SELECT ... LIMIT offset, count` -> `SELECT SKIP offset FIRST count ...`
-        
-        # LIMIT offset, count
-        limit_offset_count_pattern = re.compile(
-            r"\b(SELECT)\b((?:\s*(?:ALL|DISTINCT))?\s*(?:.*?))"  # SELECT e o corpo (não guloso até LIMIT)
-            r"\bLIMIT\s+(\d+)\s*,\s*(\d+)\s*([;\n]|$)",
-            re.IGNORECASE | re.DOTALL # DOTALL para `.*?` cruzar linhas
-        )
-        def replace_limit_offset_count(match):
-            self._increment_conversion_count()
-            select_keyword = match.group(1) # "SELECT" ou "select"
-            select_body = match.group(2).strip() # Corpo da query
-            offset = match.group(3)
-            count = match.group(4)
-            terminator = match.group(5) # ';' ou fim de linha
-            # Informix: SELECT SKIP offset FIRST count col1, col2 ...
-            return f"{select_keyword} SKIP {offset} FIRST {count} {select_body}{terminator}"
-        
-        informix_sql, num_subs = limit_offset_count_pattern.subn(replace_limit_offset_count, informix_sql)
-        if num_subs == 0: # Só tenta o próximo se o anterior não casou
-            # LIMIT count
-            limit_count_pattern = re.compile(
-                r"\b(SELECT)\b((?:\s*(?:ALL|DISTINCT))?\s*(?:.*?))" # SELECT e o corpo
-                r"\bLIMIT\s+(\d+)\s*([;\n]|$)",
-                re.IGNORECASE | re.DOTALL
-            )
-            def replace_limit_count(match):
+    def _next_significant(self, i: int) -> int:
+        """Índice do próximo token que não é espaço nem comentário (len(tokens) no fim)."""
+        tokens = self._tokens
+        i += 1
+        while i < len(tokens) and tokens[i].kind in self.SKIPPED_KINDS:
+            i += 1
+        return i
+
+    def _upper_at(self, i: int) -> str:
+        return self._tokens[i].upper if i < len(self._tokens) else ""
+
+    def _kind_at(self, i: int) -> str:
+        return self._tokens[i].kind if i < len(self._tokens) else ""
+
+    def _ends_statement(self, i: int) -> bool:
+        return i >= len(self._tokens) or self._tokens[i].kind in self.TERMINATOR_KINDS
+
+    def _copy(self, i: int) -> int:
+        self._out.append(self._tokens[i].text)
+        return i + 1
+
+    def _copy_through(self, i: int, j: int) -> int:
+        """Copia os tokens de i até j (inclusive) sem passar pelas regras."""
+        self._out.extend(token.text for token in self._tokens[i:j + 1])
+        return j + 1
+
+    def _trim_output(self):
+        """Remove os espaços no fim da saída antes de um terminador que vem logo em seguida."""
+        while self._out and self._out[-1].isspace():
+            self._out.pop()
+        if self._out and self._out[-1].startswith("--"):
+            self._out.append("\n") # Comentário de linha: o ';' não pode cair dentro dele
+
+    # --- Regras ---
+
+    def _rule_integer_type(self, i: int) -> int:
+        # INT/BIGINT [(n)] [UNSIGNED] [NOT NULL | NULL | DEFAULT NULL] AUTO_INCREMENT -> SERIAL/SERIAL8
+        j = self._next_significant(i)
+        if self._upper_at(j) == "(":
+            k = self._next_significant(j)
+            if self._kind_at(k) == 'number' and self._upper_at(self._next_significant(k)) == ")":
+                j = self._next_significant(self._next_significant(k))
+        if self._upper_at(j) == "UNSIGNED":
+            j = self._next_significant(j)
+        if self._upper_at(j) == "NULL":
+            j = self._next_significant(j)
+        elif self._upper_at(j) in ("NOT", "DEFAULT") and self._upper_at(self._next_significant(j)) == "NULL":
+            j = self._next_significant(self._next_significant(j))
+        if self._upper_at(j) != "AUTO_INCREMENT":
+            return self._copy(i)
+        self._increment_conversion_count()
+        self._seen.add('SERIAL')
+        self._out.append("SERIAL8" if self._tokens[i].upper == "BIGINT" else "SERIAL")
+        return j + 1
+
+    def _rule_auto_increment(self, i: int) -> int:
+        if self._upper_at(self._next_significant(i)) == "=":
+            return self._copy(i) # Opção de tabela (AUTO_INCREMENT=5), não de coluna
+        self._increment_conversion_count()
+        self._seen.add('SERIAL')
+        self._out.append("SERIAL")
+        return i + 1
+
+    def _rule_serial(self, i: int) -> int:
+        self._seen.add('SERIAL')
+        return self._copy(i)
+
+    def _rule_datetime(self, i: int) -> int:
+        # DATETIME -> DATETIME YEAR TO SECOND; DATETIME(n) -> DATETIME YEAR TO FRACTION(n) (Informix vai até 5)
+        j = self._next_significant(i)
+        if self._upper_at(j) == "YEAR":
+            return self._copy(i) # Já está na sintaxe Informix
+        qualifier, end = "SECOND", i + 1
+        if self._upper_at(j) == "(":
+            k = self._next_significant(j)
+            close = self._next_significant(k)
+            if self._kind_at(k) == 'number' and self._upper_at(close) == ")":
+                precision = min(int(float(self._tokens[k].text)), 5)
+                qualifier = f"FRACTION({precision})" if precision > 0 else "SECOND"
+                end = close + 1
+        self._increment_conversion_count()
+        self._out.append(f"DATETIME YEAR TO {qualifier}")
+        return end
+
+    def _rule_text_type(self, i: int) -> int:
+        self._increment_conversion_count()
+        self._out.append("CLOB")
+        return i + 1
+
+    def _rule_now(self, i: int) -> int:
+        j = self._next_significant(i)
+        if j != i + 1 or self._upper_at(j) != "(" or self._upper_at(self._next_significant(j)) != ")":
+            return self._copy(i)
+        self._increment_conversion_count()
+        self._out.append("CURRENT YEAR TO SECOND")
+        return self._next_significant(j) + 1
+
+    def _rule_select(self, i: int) -> int:
+        self._select_at.setdefault(self._depth, len(self._out))
+        return self._copy(i)
+
+    def _rule_limit(self, i: int) -> int:
+        # SELECT ... LIMIT n | LIMIT o, n | LIMIT n OFFSET o no fim do comando -> SELECT [SKIP o] FIRST n ...
+        select_position = self._select_at.get(self._depth)
+        j = self._next_significant(i)
+        if select_position is None or self._kind_at(j) != 'number':
+            self._seen.add('LIMIT')
+            return self._copy(i)
+        count, offset = self._tokens[j].text, None
+        end = self._next_significant(j)
+        if self._upper_at(end) in (",", "OFFSET"):
+            k = self._next_significant(end)
+            if self._kind_at(k) != 'number':
+                self._seen.add('LIMIT')
+                return self._copy(i)
+            if self._upper_at(end) == ",":
+                offset, count = count, self._tokens[k].text
+            else:
+                offset = self._tokens[k].text
+            end = self._next_significant(k)
+        if not self._ends_statement(end):
+            self._seen.add('LIMIT') # LIMIT seguido de mais texto (subquery, UNION): fica para revisão
+            return self._copy(i)
+        self._increment_conversion_count()
+        skip = f" SKIP {offset}" if offset is not None else ""
+        self._out[select_position] += f"{skip} FIRST {count}"
+        self._trim_output()
+        return end
+
+    def _rule_create(self, i: int) -> int:
+        # Olha alguns tokens adiante para saber o que está sendo criado (OR REPLACE, TEMP, DEFINER=... no meio)
+        j = i
+        for _ in range(8):
+            j = self._next_significant(j)
+            word = self._upper_at(j)
+            if word == "TABLE":
+                self._seen.add('CREATE TABLE')
+                break
+            if word == "VIEW":
                 self._increment_conversion_count()
-                select_keyword = match.group(1)
-                select_body = match.group(2).strip()
-                count = match.group(3)
-                terminator = match.group(4)
-                return f"{select_keyword} FIRST {count} {select_body}{terminator}"
-            informix_sql = limit_count_pattern.sub(replace_limit_count, informix_sql)
-        
-        if "LIMIT" in informix_sql.upper(): # Se ainda houver LIMIT, pode ser complexo
-            self._add_warning("Cláusulas 'LIMIT' complexas ou em subqueries podem precisar de revisão manual.")
+                self._seen.add('CREATE VIEW')
+                break
+            if word in ("PROCEDURE", "FUNCTION"):
+                self._routine, self._blocks = word, []
+                break
+            if self._ends_statement(j):
+                break
+        return self._copy(i)
+
+    def _rule_alter(self, i: int) -> int:
+        if self._upper_at(self._next_significant(i)) == "TABLE":
+            self._seen.add('ALTER TABLE')
+        return self._copy(i)
+
+    def _rule_primary_key(self, i: int) -> int:
+        if self._upper_at(self._next_significant(i)) == "KEY":
+            self._seen.add('PRIMARY KEY')
+        return self._copy(i)
+
+    def _rule_routine_word(self, i: int) -> int:
+        self._seen.add('PROCEDURE')
+        return self._copy(i)
 
-        # 7. Stored Procedures/Functions: `END` -> `END PROCEDURE;` ou `END FUNCTION;`
-        #    Isto é para casos onde não havia DELIMITER e o final é `END;`
-        #    Procura por CREATE PROCEDURE/FUNCTION ... END;
-        proc_func_pattern_semicolon_end = re.compile(
-            r"(CREATE\s+(?:OR\s+REPLACE\s+)?(PROCEDURE|FUNCTION)\s+[\w`]+\s*\(.*?\)\s*(?:RETURNS\s+\w+\s*)?.*?)(END\s*;)",
-            re.IGNORECASE | re.DOTALL
-        )
-        def replace_proc_func_end_semicolon(match):
+    def _rule_begin(self, i: int) -> int:
+        following = self._next_significant(i)
+        if self._routine and self._upper_at(following) not in ("WORK", "TRANSACTION") and not self._ends_statement(following):
+            self._blocks.append("BEGIN")
+        return self._copy(i)
+
+    def _rule_case(self, i: int) -> int:
+        if self._routine:
+            self._blocks.append("CASE")
+        return self._copy(i)
+
+    def _rule_end(self, i: int) -> int:
+        # Só o END que fecha o BEGIN externo da rotina vira END PROCEDURE/END FUNCTION
+        if not self._routine or not self._blocks:
+            return self._copy(i)
+        j = self._next_significant(i)
+        following = self._upper_at(j) if self._kind_at(j) == 'word' else ""
+        if following in self.COMPOUND_ENDS:
+            return self._copy_through(i, j) # O IF/FOR de "END IF" não abre comando nem bloco
+        if following in ("PROCEDURE", "FUNCTION"):
+            self._blocks = [] # Já está na sintaxe Informix
+            return self._copy(i)
+        closed = self._blocks.pop()
+        if following == "CASE":
+            return self._copy_through(i, j) # O CASE de "END CASE" não abre outro bloco
+        if self._blocks or closed != "BEGIN":
+            return self._copy(i)
+        label_end = j if following else i
+        end = self._next_significant(label_end)
+        if self._ends_statement(end):
+            end = label_end + 1 # "END rotulo;" do bloco externo: o rótulo não existe no Informix
+        else:
+            end = self._undeclared_delimiter_end(end)
+            if end is None:
+                return self._copy(i)
+            self._out.append(f"END {self._routine};")
+            self._routine, self._blocks = None, []
             self._increment_conversion_count()
-            proc_type = match.group(2).upper() # PROCEDURE ou FUNCTION
-            return f"{match.group(1)}END {proc_type};"
-        
-        informix_sql = proc_func_pattern_semicolon_end.sub(replace_proc_func_end_semicolon, informix_sql)
-
-        # --- Ajustes Finais e Avisos ---
-        # CREATE TABLE:
-        #   - Chaves Primárias e Estrangeiras: A sintaxe básica é similar.
-        #     MariaDB: PRIMARY KEY (col), FOREIGN KEY (col) REFERENCES tbl(col)
-        #     Informix: PRIMARY KEY (col), FOREIGN KEY (col) REFERENCES tbl(col) [CONSTRAINT name]
-        #     Não requer grandes mudanças na sintaxe básica, mas nomes de constraints podem ser adicionados no Informix.
-        #     Se `SERIAL` for usado, ele geralmente implica PK e NOT NULL.
-        #     O usuário deve revisar se `SERIAL` sozinho é suficiente ou se `PRIMARY KEY` explícito é necessário.
-        if "CREATE TABLE" in informix_sql.upper():
-            if "SERIAL" in informix_sql.upper() and "PRIMARY KEY" in informix_sql.upper():
-                 self._add_warning("Verifique definições de PRIMARY KEY em tabelas com colunas SERIAL. SERIAL já pode atuar como PK.")
-            self._add_warning("Revise a sintaxe de PRIMARY KEY e FOREIGN KEY para conformidade com Informix (nomes de constraint, etc.).")
+            return end
+        self._increment_conversion_count()
+        self._out.append(f"END {self._routine}")
+        return end
 
-        if "ALTER TABLE" in informix_sql.upper():
-            self._add_warning("Comandos ALTER TABLE podem ter sintaxe variada. Revise-os cuidadosamente.")
-            # Exemplo: MariaDB `ALTER TABLE t MODIFY col VARCHAR(255);`
-            # Informix: `ALTER TABLE t MODIFY col VARCHAR(255);` (similar para simples)
-            #           `ALTER TABLE t ADD CONSTRAINT ...` (similar)
-            # A lógica de conversão de tipos de dados já deve ter ajudado aqui.
-
-        # CREATE VIEW
-        view_pattern = re.compile(r"CREATE\s+(?:OR\s+REPLACE\s+)?VIEW\s+\S+\s+AS\s+(SELECT.*?)(?:\s*WITH\s+CASCADED\s+CHECK\s+OPTION)?\s*;", re.IGNORECASE | re.DOTALL)
-        if view_pattern.search(informix_sql):
-            self._increment_conversion_count(len(view_pattern.findall(informix_sql)))
-            self._add_warning("CREATE VIEW detectado. A query SELECT interna foi processada pelas regras gerais (ex: LIMIT). Revise a view completa.")
-            # A estrutura `CREATE VIEW name AS SELECT ...` é a mesma.
-            # A remoção de `WITH CASCADED CHECK OPTION` se presente (não comum no Informix).
-            informix_sql = re.sub(r"\s*WITH\s+CASCADED\s+CHECK\s+OPTION", "", informix_sql, flags=re.IGNORECASE)
-            
-        # Comentários
-        # MariaDB: -- comment, # comment, /* comment */
-        # Informix: -- comment, { comment } /* comment */
-        # Substituir # por --
-        hash_comment_pattern = re.compile(r"^\s*#.*$", re.MULTILINE)
-        if hash_comment_pattern.search(informix_sql):
-            self._increment_conversion_count(len(hash_comment_pattern.findall(informix_sql)))
-            informix_sql = hash_comment_pattern.sub(lambda m: "--" + m.group(0).lstrip("# "), informix_sql)
-            self._add_warning("Comentários '#' foram convertidos para '--'. Revise se algum '#' era usado dentro de strings.")
-
-        # Alerta geral para Stored Procedures/Functions
-        if "PROCEDURE" in informix_sql.upper() or "FUNCTION" in informix_sql.upper():
-            self._add_warning("Stored Procedures/Functions convertidas de forma básica. Lógica interna (loops, variáveis, SQL procedural) EXIGE revisão manual detalhada devido a grandes diferenças entre MariaDB SPL e Informix SPL.")
+    def _undeclared_delimiter_end(self, i: int) -> Optional[int]:
+        # "END $$" sem o DELIMITER $$ antes: 2+ símbolos colados até o fim da linha fazem papel de terminador
+        tokens, j = self._tokens, i
+        while j < len(tokens) and tokens[j].kind == 'punct':
+            j += 1
+        if j - i < 2 or (j < len(tokens) and "\n" not in tokens[j].text):
+            return None
+        return j
+
+    def _rule_check_option(self, i: int) -> int:
+        # WITH CASCADED CHECK OPTION (views) não existe no Informix
+        j = self._next_significant(i)
+        k = self._next_significant(j)
+        end = self._next_significant(k)
+        if (self._upper_at(j), self._upper_at(k), self._upper_at(end)) != ("CASCADED", "CHECK", "OPTION"):
+            return self._copy(i)
+        self._trim_output()
+        return end + 1
+
+    def _rule_quoted_identifier(self, i: int) -> int:
+        text = self._tokens[i].text
+        if len(text) > 1 and text.endswith("`"):
+            text = text[1:-1].replace("``", "`")
+        self._out.append(text)
+        return i + 1
+
+    def _rule_hash_comment(self, i: int) -> int:
+        self._increment_conversion_count()
+        self._seen.add('#')
+        self._out.append("--" + self._tokens[i].text.lstrip("# "))
+        return i + 1
+
+    def _rule_delimiter_directive(self, i: int) -> int:
+        self._add_warning("Instruções 'DELIMITER' detectadas. Tentando processar blocos de Stored Procedure/Function.")
+        return i + 1 # A linha DELIMITER some; o terminador customizado vira ';' em _rule_terminator
+
+    def _rule_terminator(self, i: int) -> int:
+        self._out.append(";") # Delimitador customizado ($$, //) vira ';'
+        self._select_at.clear()
+        self._depth = 0
+        if self._routine and not self._blocks:
+            self._routine = None # Fim da rotina (ou rotina sem BEGIN ... END)
+        return i + 1
+
+    def _rule_open_paren(self, i: int) -> int:
+        self._depth += 1
+        return self._copy(i)
+
+    def _rule_close_paren(self, i: int) -> int:
+        self._select_at.pop(self._depth, None)
+        self._depth = max(self._depth - 1, 0)
+        return self._copy(i)
+
+    def convert_statement(self, statement: SQLStatement) -> Tuple[str, list, int]:
+        """Converte um único comando com as mesmas regras de convert(), consultando o cache."""
+        if self.cache is None:
+            return self.convert(statement.text)
+        cached = self.cache.get(statement.text)
+        if cached is not None:
+            return cached
+        converted, warnings, count = self.convert(statement.text)
+        self.cache.put(statement.text, converted, warnings, count)
+        return converted, warnings, count
+
+    def convert_file(self, input_path: str, output_path: str, encoding: str = 'utf-8',
+                     on_progress: Optional[Callable[[int, int], None]] = None,
+                     should_continue: Optional[Callable[[], bool]] = None) -> FileConversionResult:
+        """Converte um arquivo comando a comando, gravando a saída conforme avança.
+
+        A memória fica limitada ao maior comando do arquivo. A saída é gravada em
+        `output_path`.tmp e renomeada no fim (pode ser o próprio arquivo de entrada);
+        se `should_continue` devolver False, o temporário é removido e o resultado
+        volta com cancelled=True. `on_progress(bytes_lidos, bytes_totais)` é chamado
+        a cada comando. Com `cache`, comandos já convertidos antes saem do cache.
+        """
+        result = FileConversionResult(input_path, output_path)
+        hits_before = self.cache.hits if self.cache else 0
+        misses_before = self.cache.misses if self.cache else 0
+        total_bytes = os.path.getsize(input_path)
+        reader = SQLStatementReader()
+        temp_path = f"{output_path}.tmp"
+
+        def read_lines(source):
+            # Leitura binária para saber quantos bytes já foram consumidos (tell() não funciona
+            # ao iterar arquivo texto); uma quebra de linha nunca cai no meio de um caractere UTF-8
+            for raw_line in source:
+                result.bytes_read += len(raw_line)
+                yield raw_line.decode(encoding)
+
+        try:
+            with open(input_path, 'rb') as source, open(temp_path, 'w', encoding=encoding, newline='') as target:
+                for statement in reader.statements(read_lines(source)):
+                    if should_continue is not None and not should_continue():
+                        result.cancelled = True
+                        break
+                    converted, warnings, count = self.convert_statement(statement)
+                    target.write(statement.leading)
+                    target.write(converted)
+                    result.statements += 1
+                    result.converted_items_count += count
+                    for message in warnings:
+                        self._record_file_warning(result, statement.line, message)
+                    if on_progress is not None:
+                        on_progress(result.bytes_read, total_bytes)
+                else:
+                    target.write("\n")
+            if result.cancelled:
+                os.remove(temp_path)
+                return result
+            os.replace(temp_path, output_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        finally:
+            if self.cache is not None:
+                self.cache.flush()
+                result.cache_hits = self.cache.hits - hits_before
+                result.cache_misses = self.cache.misses - misses_before
+
+        if reader.delimiter_lines:
+            self._record_file_warning(
+                result, reader.delimiter_lines[0],
+                "Instruções 'DELIMITER' detectadas e removidas; os blocos entre elas foram convertidos como um comando cada.")
+        return result
+
+    def _record_file_warning(self, result: FileConversionResult, line: int, message: str):
+        count = result.warning_counts.get(message, 0)
+        if count < self.MAX_WARNING_LINES_PER_MESSAGE:
+            result.warnings.append((line, message))
+        result.warning_counts[message] = count + 1
+
+
+# --- Conversão em lote (pastas inteiras) ---
+
+CONVERTED_SUFFIX = "_informix"     # abd_2025.sql -> abd_2025_informix.sql, na mesma pasta
+BATCH_REPORT_NAME = "CONVERSAO_ALERTAS.txt"
+
+
+def converted_path(input_path: str) -> str:
+    base, ext = os.path.splitext(input_path)
+    return f"{base}{CONVERTED_SUFFIX}{ext or '.sql'}"
+
+
+def find_sql_files(paths: Iterable[str], recursive: bool = True) -> List[str]:
+    """Arquivos .sql das pastas/arquivos informados, sem as saídas de conversões anteriores."""
+    found = []
+    for path in paths:
+        if os.path.isfile(path):
+            found.append(path)
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if not d.startswith(('.', '__'))) if recursive else []
+            found.extend(os.path.join(root, name) for name in sorted(files)
+                         if name.lower().endswith('.sql')
+                         and not os.path.splitext(name)[0].endswith(CONVERTED_SUFFIX))
+    unique = []
+    for path in found:
+        if path not in unique:
+            unique.append(path)
+    return unique
+
+
+def open_conversion_cache(path: Optional[str] = None,
+                          max_bytes: int = SQLConversionCache.DEFAULT_MAX_BYTES) -> SQLConversionCache:
+    """Cache de conversão com a versão atual das regras (padrão: cache/conversion_cache.sqlite3)."""
+    return SQLConversionCache(SQLConverter.RULES_VERSION, path, max_bytes)
+
+
+def convert_file_job(input_path: str, output_path: str, encoding: str = 'utf-8',
+                     cache_path: Optional[str] = None) -> FileConversionResult:
+    """Converte um arquivo. Função de módulo para poder ser executada num ProcessPoolExecutor.
+
+    Com `cache_path`, abre a própria conexão com o cache (conexões SQLite não passam entre processos).
+    """
+    if cache_path is None:
+        return SQLConverter().convert_file(input_path, output_path, encoding)
+    with open_conversion_cache(cache_path) as cache:
+        return SQLConverter(cache).convert_file(input_path, output_path, encoding)
+
+
+@dataclass
+class BatchConversionResult:
+    files: List[FileConversionResult] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)   # Arquivo de entrada -> erro
+    seconds: float = 0.0
+    cancelled: bool = False
+    report_path: Optional[str] = None
+
+    @property
+    def statements(self) -> int:
+        return sum(result.statements for result in self.files)
+
+    @property
+    def warning_count(self) -> int:
+        return sum(sum(result.warning_counts.values()) for result in self.files)
+
+    @property
+    def cache_hits(self) -> int:
+        return sum(result.cache_hits for result in self.files)
+
+    @property
+    def cache_misses(self) -> int:
+        return sum(result.cache_misses for result in self.files)
+
+    def format_report(self) -> str:
+        lines = [f"Conversão MariaDB -> Informix: {len(self.files)} arquivo(s), {self.statements} comando(s), "
+                 f"{self.warning_count} alerta(s), {len(self.errors)} erro(s) em {self.seconds:.1f}s"]
+        if self.cache_hits or self.cache_misses:
+            lines.append(f"Cache: {self.cache_hits} comando(s) reaproveitado(s), {self.cache_misses} convertido(s)")
+        if self.cancelled:
+            lines.append("CONVERSÃO CANCELADA: arquivos não listados não foram convertidos.")
+        for input_path, error in self.errors.items():
+            lines += ["", f"== {input_path}", f"ERRO: {error}"]
+        for result in self.files:
+            warnings = result.format_warnings()
+            if warnings:
+                lines += ["", f"== {result.input_path} -> {os.path.basename(result.output_path)}"]
+                lines += [f"  {warning}" for warning in warnings]
+        return "\n".join(lines) + "\n"
+
+
+class SQLBatchConverter:
+    """Converte vários scripts em paralelo, um arquivo por processo do pool.
+
+    Cada saída fica ao lado da entrada (converted_path) e os alertas de todos os
+    arquivos vão para um relatório único (BATCH_REPORT_NAME) na pasta comum às
+    entradas. O regex/tokenizador roda em Python puro, então só processos (e não
+    threads) usam mais de um núcleo; arquivos maiores são enviados primeiro para
+    equilibrar a carga. Com `processes` <= 1 ou um arquivo só, converte no próprio processo.
+    Com `cache_path`, todos os processos compartilham o mesmo SQLConversionCache.
+    """
+
+    def __init__(self, processes: int = 0, encoding: str = 'utf-8', cache_path: Optional[str] = None,
+                 log: Optional[Callable[[str, str], None]] = None,
+                 should_continue: Optional[Callable[[], bool]] = None,
+                 on_file_done: Optional[Callable[[FileConversionResult, int, int], None]] = None):
+        self.processes = processes or os.cpu_count() or 1
+        self.encoding = encoding
+        self.cache_path = cache_path
+        self.log = log or (lambda message, level="INFO": None)
+        self.should_continue = should_continue or (lambda: True)
+        self.on_file_done = on_file_done or (lambda result, done, total: None)
+
+    def run(self, paths: Iterable[str], report_directory: Optional[str] = None) -> BatchConversionResult:
+        paths = list(paths)
+        inputs = find_sql_files(paths)
+        batch = BatchConversionResult()
+        started = time.perf_counter()
+        by_input: Dict[str, FileConversionResult] = {}
+        processes = max(1, min(self.processes, len(inputs)))
+        self.log(f"Convertendo {len(inputs)} arquivo(s) com {processes} processo(s).", "INFO")
+
+        if processes == 1:
+            for input_path in inputs:
+                if not self.should_continue():
+                    batch.cancelled = True
+                    break
+                try:
+                    by_input[input_path] = convert_file_job(input_path, converted_path(input_path), self.encoding,
+                                                           self.cache_path)
+                except Exception as e:
+                    batch.errors[input_path] = str(e)
+                self._file_done(batch, by_input.get(input_path), input_path, len(by_input) + len(batch.errors), len(inputs))
+        else:
+            ordered = sorted(inputs, key=lambda path: os.path.getsize(path), reverse=True)
+            with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('spawn')) as pool:
+                futures = {pool.submit(convert_file_job, path, converted_path(path), self.encoding, self.cache_path): path for path in ordered}
+                for future in as_completed(futures):
+                    input_path = futures[future]
+                    if future.cancelled():
+                        continue
+                    try:
+                        by_input[input_path] = future.result()
+                    except Exception as e:
+                        batch.errors[input_path] = str(e)
+                    self._file_done(batch, by_input.get(input_path), input_path,
+                                    len(by_input) + len(batch.errors), len(inputs))
+                    if not batch.cancelled and not self.should_continue():
+                        batch.cancelled = True
+                        for pending in futures:
+                            pending.cancel() # Os que já estão rodando terminam; os demais nem começam
+
+        batch.files = [by_input[path] for path in inputs if path in by_input] # Na ordem de entrada
+        batch.seconds = time.perf_counter() - started
+        if inputs:
+            batch.report_path = self.write_report(batch, report_directory or self._common_directory(paths))
+        level = "ERROR" if batch.errors else ("WARNING" if batch.cancelled else "SUCCESS")
+        self.log(f"Conversão em lote: {len(batch.files)} arquivo(s), {batch.statements} comando(s), "
+                 f"{batch.warning_count} alerta(s), {len(batch.errors)} erro(s) em {batch.seconds:.1f}s.", level)
+        if self.cache_path:
+            self.log(f"Cache de conversão: {batch.cache_hits} comando(s) reaproveitado(s), "
+                     f"{batch.cache_misses} convertido(s).", "INFO")
+        return batch
+
+    def _file_done(self, batch: BatchConversionResult, result: Optional[FileConversionResult],
+                   input_path: str, done: int, total: int):
+        if result is None:
+            self.log(f"{input_path}: ERRO: {batch.errors[input_path]}", "ERROR")
+            return
+        self.log(f"{input_path} -> {os.path.basename(result.output_path)}: {result.statements} comando(s), "
+                 f"{sum(result.warning_counts.values())} alerta(s).", "INFO")
+        self.on_file_done(result, done, total)
+
+    @staticmethod
+    def _common_directory(paths: List[str]) -> str:
+        directories = [os.path.abspath(path if os.path.isdir(path) else os.path.dirname(path) or '.') for path in paths]
+        try:
+            return os.path.commonpath(directories)
+        except ValueError: # Drives diferentes no Windows
+            return directories[0]
 
-        # INSERT, UPDATE, DELETE: A sintaxe básica é muito similar.
-        # As conversões de NOW() e tipos de dados já ajudam.
-        # Nenhuma conversão específica para a estrutura do comando em si, a menos que LIMIT fosse usado (raro).
-        
-        return informix_sql.strip(), self.warnings, self.converted_items_count
\ No newline at end of file
+    def write_report(self, batch: BatchConversionResult, directory: str) -> str:
+        path = os.path.join(directory, BATCH_REPORT_NAME)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(batch.format_report())
+        return path
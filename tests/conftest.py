@@ -0,0 +1,6 @@
+# tests/conftest.py
+import os
+import sys
+
+# Os módulos do projeto ficam na raiz do repositório (sem pacote)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
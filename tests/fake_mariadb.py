@@ -0,0 +1,81 @@
+# tests/fake_mariadb.py
+"""MariaDB de mentira sobre SQLite em memória, para testar o caminho de extração sem servidor.
+
+Troca MariaDBExtractor.connect por uma conexão que traduz os placeholders %s para ?;
+as consultas de paginação do extrator (LIMIT/OFFSET, keyset, streaming) rodam no SQLite.
+"""
+import itertools
+import re
+import sqlite3
+
+import migration_logic
+
+_names = itertools.count()
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self._cursor = connection.cursor()
+
+    def execute(self, query, params=()):
+        query = re.sub(r"DATABASE\(\)", "'main'", query.replace('%s', '?'))
+        self._cursor.execute(query, tuple(params))
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def fetchmany(self, size):
+        return self._cursor.fetchmany(size)
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def close(self):
+        self._cursor.close()
+
+
+class FakeConnection:
+    def __init__(self, uri):
+        self._connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        self._open = True
+
+    def cursor(self, **kwargs):
+        return FakeCursor(self._connection)
+
+    def is_connected(self):
+        return self._open
+
+    def close(self):
+        self._open = False
+        self._connection.close()
+
+
+class FakeMariaDB:
+    """Banco compartilhado em memória; `install(monkeypatch)` faz os extratores usarem ele."""
+
+    def __init__(self):
+        self.uri = f"file:fake_mariadb_{next(_names)}?mode=memory&cache=shared"
+        self.keeper = sqlite3.connect(self.uri, uri=True, check_same_thread=False) # Mantém o banco vivo
+
+    def install(self, monkeypatch):
+        uri = self.uri
+
+        def connect(extractor, config):
+            extractor.connection = FakeConnection(uri)
+            return True
+
+        monkeypatch.setattr(migration_logic.MariaDBExtractor, 'connect', connect)
+
+    def execute(self, sql, rows=None):
+        if rows is None:
+            self.keeper.execute(sql)
+        else:
+            self.keeper.executemany(sql, rows)
+        self.keeper.commit()
+
+    def close(self):
+        self.keeper.close()
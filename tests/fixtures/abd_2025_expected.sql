@@ -0,0 +1,522 @@
+CREATE DATABASE  IF NOT EXISTS bd2025 /*!40100 DEFAULT CHARACTER SET latin1 */ /*!80016 DEFAULT ENCRYPTION='N' */;
+USE bd2025;
+-- MySQL dump 10.13  Distrib 8.0.32, for Win64 (x86_64)
+--
+-- Host: localhost    Database: bd2020
+-- ------------------------------------------------------
+-- Server version	8.0.32
+
+/*!40101 SET @OLD_CHARACTER_SET_CLIENT=@@CHARACTER_SET_CLIENT */;
+/*!40101 SET @OLD_CHARACTER_SET_RESULTS=@@CHARACTER_SET_RESULTS */;
+/*!40101 SET @OLD_COLLATION_CONNECTION=@@COLLATION_CONNECTION */;
+/*!50503 SET NAMES utf8 */;
+/*!40103 SET @OLD_TIME_ZONE=@@TIME_ZONE */;
+/*!40103 SET TIME_ZONE='+00:00' */;
+/*!40014 SET @OLD_UNIQUE_CHECKS=@@UNIQUE_CHECKS, UNIQUE_CHECKS=0 */;
+/*!40014 SET @OLD_FOREIGN_KEY_CHECKS=@@FOREIGN_KEY_CHECKS, FOREIGN_KEY_CHECKS=0 */;
+/*!40101 SET @OLD_SQL_MODE=@@SQL_MODE, SQL_MODE='NO_AUTO_VALUE_ON_ZERO' */;
+/*!40111 SET @OLD_SQL_NOTES=@@SQL_NOTES, SQL_NOTES=0 */;
+
+--
+-- Table structure for table `atualizacao`
+--
+
+DROP TABLE IF EXISTS atualizacao;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE atualizacao (
+  atid SERIAL,
+  attabela varchar(255) DEFAULT NULL,
+  atcoluna varchar(255) DEFAULT NULL,
+  atvalor varchar(255) DEFAULT NULL,
+  atcondicao varchar(255) DEFAULT NULL,
+  PRIMARY KEY (atid)
+) ENGINE=InnoDB AUTO_INCREMENT=5 DEFAULT CHARSET=latin1;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `atualizacao`
+--
+
+LOCK TABLES atualizacao WRITE;
+/*!40000 ALTER TABLE `atualizacao` DISABLE KEYS */;
+INSERT INTO atualizacao VALUES (1,'usuario_perfil','upstatus','Habilitado','upid <= 3'),(2,'usuario_perfil','upstatus','Desabilitado','upid > 3'),(3,'usuario_perfil','upstatus','Habilitado','upid <= 3'),(4,'usuario_perfil','upstatus','Desabilitado','upid > 3');
+/*!40000 ALTER TABLE `atualizacao` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `bairro`
+--
+
+DROP TABLE IF EXISTS bairro;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE bairro (
+  baicodigo int NOT NULL DEFAULT '0',
+  bainome varchar(30) NOT NULL,
+  baizoncodigo int NOT NULL,
+  baiqtdepessoas int unsigned NOT NULL DEFAULT '0',
+  PRIMARY KEY (baicodigo),
+  KEY baizoncodigo (baizoncodigo),
+  CONSTRAINT bairro_ibfk_1 FOREIGN KEY (baizoncodigo) REFERENCES zona (zoncodigo)
+) ENGINE=InnoDB DEFAULT CHARSET=latin1;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `bairro`
+--
+
+LOCK TABLES bairro WRITE;
+/*!40000 ALTER TABLE `bairro` DISABLE KEYS */;
+INSERT INTO bairro VALUES (1,'ADRIANÓPOLIS',1,10549),(2,'CENTRO',2,39228),(3,'CACHOEIRINHA',2,20035),(4,'ALEIXO',6,24417),(5,'PLANALTO',5,19249),(6,'PARQUE 10',6,48771),(7,'COROADO',3,60709),(8,'JAPIIM',2,63092),(9,'EDUCANDOS',2,18745),(10,'PONTA NEGRA',4,5919),(11,'SAO JOSE',3,78222),(12,'ALVORADA',2,76392),(13,'FLORES',6,56859),(14,'DISTRITO INDUSTRIAL',3,3201),(15,'COMPENSA',4,89645),(16,'PETRÓPOLIS',2,48717);
+/*!40000 ALTER TABLE `bairro` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `cidade`
+--
+
+DROP TABLE IF EXISTS cidade;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE cidade (
+  cidcodigo int NOT NULL DEFAULT '0',
+  cidnome varchar(80) NOT NULL,
+  PRIMARY KEY (cidcodigo)
+) ENGINE=InnoDB DEFAULT CHARSET=latin1;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `cidade`
+--
+
+LOCK TABLES cidade WRITE;
+/*!40000 ALTER TABLE `cidade` DISABLE KEYS */;
+INSERT INTO cidade VALUES (1,'Manaus'),(2,'Belém'),(3,'Porto Velho'),(4,'Rio Branco'),(5,'Belo Horizonte'),(6,'Rio de Janeiro'),(7,'São Paulo'),(8,'Fortaleza'),(9,'Itacoatiara'),(10,'Parintins'),(11,'Coari'),(12,'Rio Preto da Eva');
+/*!40000 ALTER TABLE `cidade` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `cliente`
+--
+
+DROP TABLE IF EXISTS cliente;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE cliente (
+  clicodigo SERIAL,
+  clisexo char(1) NOT NULL,
+  clirendamensal double(6,2) NOT NULL,
+  clinome varchar(60) NOT NULL,
+  clibaicodigo int NOT NULL,
+  clifone varchar(10) NOT NULL DEFAULT '',
+  cliestcodigo int NOT NULL,
+  clidtcadastro date DEFAULT NULL,
+  clidtdesativacao date DEFAULT NULL,
+  PRIMARY KEY (clicodigo),
+  KEY clibaicodigo (clibaicodigo),
+  KEY cliestcodigo (cliestcodigo),
+  CONSTRAINT cliente_ibfk_1 FOREIGN KEY (clibaicodigo) REFERENCES bairro (baicodigo),
+  CONSTRAINT cliente_ibfk_2 FOREIGN KEY (cliestcodigo) REFERENCES estadocivil (estcodigo)
+) ENGINE=InnoDB AUTO_INCREMENT=605 DEFAULT CHARSET=latin1;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `cliente`
+--
+
+LOCK TABLES cliente WRITE;
+/*!40000 ALTER TABLE `cliente` DISABLE KEYS */;
+INSERT INTO cliente VALUES (1,'M',2550.00,'GANDERSON DOS SANTOS',1,'',1,NULL,NULL),(2,'M',3910.00,'FRANCISCO DOS SANTOS OLIVEIRA',8,'',1,NULL,NULL),(4,'M',1615.00,'CARLOS SOUZA MAGALHAES',1,'',1,NULL,NULL),(5,'F',2465.00,'CLEUMA O DIAS',5,'',2,NULL,NULL),(6,'F',3230.00,'MARIA R MARTINS',8,'',1,NULL,NULL),(7,'M',7140.00,'FRANCISCO M MONTEIRO',11,'',1,NULL,NULL),(8,'M',2329.00,'ALIRIO LIMA DA COSTA',9,'',3,NULL,NULL),(9,'F',3400.00,'FRANCISCA S CASTRO',5,'',1,NULL,NULL),(10,'M',2431.00,'EDMAR F DA SILVA',7,'',1,NULL,NULL),(11,'M',1394.00,'ERIVELTON O DA CUNHA',3,'',2,NULL,NULL),(12,'F',1870.00,'RAFAELA C DOS SANTOS',4,'',1,NULL,NULL),(13,'M',2601.00,'MAURICIO M DOS REIS',2,'',2,NULL,NULL),(14,'F',6460.00,'MARIA DA GLORIA MESQUITA ',4,'',1,NULL,NULL),(15,'M',4760.00,'ROBERTO DA SILVA PIMENTEL',3,'',3,NULL,NULL),(16,'F',1292.00,'KATRINA S ALBUQUERQUE',2,'',1,NULL,NULL),(17,'M',1647.30,'ANDERSON DE ARAUJO',9,'',1,NULL,NULL),(18,'F',2244.00,'EDIANE SOUZA MACIEL',11,'',2,NULL,NULL),(19,'F',6426.00,'RAIMUNDA R PINHEIRO',6,'',1,NULL,NULL),(20,'F',2125.00,'ALESSANDRINA P RAMALHO',6,'',4,NULL,NULL),(21,'M',1360.00,'GANDERSON HENRIQUE DOS SANTOS',1,'',1,NULL,NULL),(22,'M',1207.00,'FRANCISCO JOSE DOS SANTOS OLIVEIRA',2,'',1,NULL,NULL),(23,'M',1275.00,'RAIMUNDO MAGALHAES DE OLIVEIRA',3,'',3,NULL,NULL),(24,'M',1666.00,'CARLOS DE SOUZA MAGALHAES',6,'',1,NULL,NULL),(25,'F',1929.50,'CLEUMA OLIVEIRA DIAS',5,'',2,NULL,NULL),(26,'F',1666.00,'ANDREIA DE OLIVEIRA',6,'',1,NULL,NULL),(27,'F',2329.00,'ANDREZA OLIVEIRA',7,'',1,NULL,NULL),(28,'M',2040.00,'MARCOS PAULO OLIVEIRA FERNANDES',8,'',1,NULL,NULL),(29,'M',1368.50,'CLEUTO OLIVEIRA DIAS',9,'',1,NULL,NULL),(30,'F',1785.00,'MARIA ROMELIA MARTINS',2,'',1,NULL,NULL),(31,'M',1365.10,'FRANCISCO TEL MARQUES MONTEIRO',11,'',1,NULL,NULL),(32,'F',1343.00,'LEILA NUNES DOS SANTOS',1,'',1,NULL,NULL),(33,'F',2040.00,'RUBIA NUNES MONTEIRO',2,'',1,NULL,NULL),(34,'M',1511.30,'FERNANDO RICARDO DE CARVALHO',3,'',1,NULL,NULL),(35,'M',1965.20,'LINDOMAR KAZUO SHIGA',4,'',1,NULL,NULL),(36,'F',2286.50,'JESSICA GRANA NUNES',3,'',1,NULL,NULL),(37,'M',1700.00,'LUIZ AUGUSTO SANTOS OLIVEIRA',6,'',1,NULL,NULL),(38,'M',1700.00,'LUIZ FRANCKI JUNIOR',7,'',1,NULL,NULL),(39,'F',1360.00,'GIOVANA CARVALHO DOS SANTOS',8,'',2,NULL,NULL),(40,'F',1962.31,'MAYARA SILVA DE AMORIM',9,'',1,NULL,NULL),(41,'M',1560.60,'ROSENILDO VERAS DE MOURA JUNIOR',10,'',1,NULL,NULL),(42,'M',1360.00,'WILLIAM AGUIAR CUSTODIO',2,'',1,NULL,NULL),(43,'F',1207.00,'FRANCISCA SENA DE CASTRO',1,'',2,NULL,NULL),(44,'F',1560.60,'RAFAELA CUNHA DOS SANTOS',2,'',1,NULL,NULL),(45,'M',1962.31,'MAURICIO MARCOS MONTENEGRO DOS REIS',3,'',1,NULL,NULL),(46,'F',1962.31,'MARIA DA GLORIA MESQUITA DO NASCIME',4,'',2,NULL,NULL),(47,'F',1428.00,'KATRINA DA SILVA ALBUQUERQUE',5,'',1,NULL,NULL),(48,'F',1962.31,'MARIA DO LIVRAMENTO ALBUQUERQUE PIM',6,'',1,NULL,NULL),(49,'M',2337.50,'ALIRIO LIMA DA COSTA',7,'',1,NULL,NULL),(50,'F',1560.60,'RAIANE PAULA DA SILVA',2,'',2,NULL,NULL),(51,'M',2286.50,'JOSE MAIA',9,'',1,NULL,NULL),(52,'F',1929.50,'CASILDA PANDURA RAMOS',10,'',1,NULL,NULL),(53,'M',1560.60,'ROSIMAR GAIO MEIRELES DA COSTA',11,'',1,NULL,NULL),(54,'F',1360.00,'NEIVA MEIRELES DA COSTA',1,'',2,NULL,NULL),(55,'F',1360.00,'NATALIA CRISTINA DE SOUZA LIMA',2,'',2,NULL,NULL),(56,'F',1320.90,'DAILA CAMILLE REIS BLANCO',2,'',1,NULL,NULL),(57,'M',2337.50,'ADAUTO ALVES DE MOURA NETO',4,'',1,NULL,NULL),(58,'F',2286.50,'JEMIMA MESQUITA DE LIMA',5,'',1,NULL,NULL),(59,'F',1360.00,'NAILETE MEIRELES DA COSTA',6,'',2,NULL,NULL),(60,'M',1962.31,'MARLON MEIRELES DA COSTA',7,'',2,NULL,NULL),(61,'F',1962.31,'MARIA IOLEIDE DE OLIVEIRA IRMARE DA',8,'',1,NULL,NULL),(62,'F',1962.31,'MAYARA IRMERE DA COSTA',9,'',1,NULL,NULL),(63,'M',1560.60,'ROGERIO SOUZA DOS SANTOS',10,'',1,NULL,NULL),(64,'F',1572.50,'EDIANE SOUZA MACIEL',2,'',1,NULL,NULL),(65,'F',1572.50,'ERIKA MACIEL GRANGEIRO',1,'',2,NULL,NULL),(66,'M',1560.60,'REINALDO DOS SANTOS',2,'',1,NULL,NULL),(67,'M',1320.90,'DANIEL DE LIMA FIGUEIROA',3,'',1,NULL,NULL),(68,'M',1962.31,'MATHEUS ISRAEL DA SILVA',4,'',2,NULL,NULL),(69,'F',1560.60,'RAIMUNDA VALMIRA RODRIGUES PINHEIRO',5,'',1,NULL,NULL),(70,'M',2337.50,'ANDERSON RODRIGUES DOS SANTOS',2,'',2,NULL,NULL),(71,'F',2337.50,'ANDRESSA RODRIGUES DOS SANTOS',7,'',1,NULL,NULL),(72,'F',1275.00,'STEFANY RODRIGUES DOS SANTOS',8,'',1,NULL,NULL),(73,'F',1572.50,'ERIKA RODRIGUES DOS SANTOS',9,'',2,NULL,NULL),(74,'M',1360.00,'WENDEL RODRIGUES DOS SANTOS',10,'',1,NULL,NULL),(75,'M',1572.50,'EDISVAL FERREIRA NASCIMENTO',11,'',3,NULL,NULL),(76,'M',1360.00,'INES MARIA FERREIRA GUIMARAES',1,'',1,NULL,NULL),(77,'M',2278.00,'VICTOR GOMES DE CASTRO',2,'',3,NULL,NULL),(78,'M',1572.50,'ERIVELTON OLIVEIRA DA CUNHA',1,'',1,NULL,NULL),(79,'M',1572.50,'ERCIDES PALHETA DA SILVA',4,'',1,NULL,NULL),(80,'F',1929.50,'CRISTIANE DE SOUZA SILVA',5,'',3,NULL,NULL),(81,'M',2286.50,'JOAO AUGUSTO SOUZA',6,'',1,NULL,NULL),(82,'M',2286.50,'JULIO AID DUARTE',7,'',1,NULL,NULL),(83,'F',2278.00,'VANIA SOUZA',8,'',3,NULL,NULL),(84,'M',2337.50,'ABRAO PAZ DOS SANTOS',1,'',1,NULL,NULL),(85,'F',1560.60,'ROBENITA DOS SANTOS PAZ',10,'',2,NULL,NULL),(86,'F',1962.31,'MARIA MADALENA SANTOS DE JESUS',11,'',1,NULL,NULL),(87,'M',1560.60,'RAIMUNDO EVANGELISTA GARCIA',1,'',1,NULL,NULL),(88,'M',1572.50,'ELIVANDO MENDES DE MORAES',2,'',2,NULL,NULL),(89,'F',1428.00,'KEROLLAINE MENDONCA MAIA',1,'',1,NULL,NULL),(90,'F',1560.60,'RAQUEL SANTOS GARCIA',4,'',3,NULL,NULL),(91,'M',1360.00,'IZABEL CRISTINA SANTOS DE JESUS',5,'',1,NULL,NULL),(92,'M',1360.00,'OTAVIO SANTOS DE JESUS',6,'',2,NULL,NULL),(93,'F',1962.31,'MARIA JOSE SANTOS DE JESUS',7,'',1,NULL,NULL),(94,'M',2286.50,'JESUINO PAIXAO DOS SANTOS',8,'',1,NULL,NULL),(95,'M',1360.00,'TAMAR MARVAO DE SOUZA',9,'',1,NULL,NULL),(96,'M',1700.00,'LUCIVALDO DOS SANTOS SIQUEIRA',10,'',2,NULL,NULL),(97,'F',2337.50,'ANA ROSA FERRAZ',11,'',1,NULL,NULL),(98,'M',1428.00,'KLINGER BARBOZA',1,'',3,NULL,NULL),(99,'M',1360.00,'GERALDO SIQUEIRA DE SOUZA',2,'',1,NULL,NULL),(100,'M',2337.50,'ARNALDO SIQUEIRA DE SOUZA',3,'',1,NULL,NULL),(101,'F',1700.00,'LAUDENICE SIQUEIRA DE SOUZA',4,'',2,NULL,NULL),(102,'F',2337.50,'ADENILZA DOS SANTOS GOMES',5,'',1,NULL,NULL),(103,'M',1700.00,'LUAN GOMES SIQUEIRA',6,'',3,NULL,NULL),(104,'M',1572.50,'ELI REGINA FERREIRA DA SILVA',7,'',1,NULL,NULL),(105,'M',1394.00,'BRUNO ALMEIDA DA SILVA',8,'',1,NULL,NULL),(106,'M',2286.50,'JAIR FELIPE DA SILVA',9,'',1,NULL,NULL),(107,'M',2286.50,'JOAO VIEIRA DE CARVALHO',10,'',2,NULL,NULL),(108,'F',2337.50,'AUREA PINTO DO ROSARIO',11,'',3,NULL,NULL),(109,'F',1360.00,'IRNA ROSARIO DE CARVALHO',1,'',1,NULL,NULL),(110,'F',2337.50,'ANA DEISE ROSARIO DE CARVALHO',2,'',1,NULL,NULL),(111,'M',2286.50,'JAIR PINTO PEREIRA',3,'',2,NULL,NULL),(112,'M',1929.50,'CAIO AUZIER MOREIRA',4,'',1,NULL,NULL),(113,'M',1700.00,'LUCINEI MACIEL VIANA',5,'',1,NULL,NULL),(114,'F',2337.50,'AGNA SANTANA DA COSTA',6,'',1,NULL,NULL),(115,'M',1360.00,'HUYNGLE ROSARIO DE CARVALHO',7,'',2,NULL,NULL),(116,'M',1700.00,'LUZENILDES OLIVEIRA DOS SANTOS',8,'',1,NULL,NULL),(117,'M',2286.50,'JESSE FERNANDO PINHO RAMOS',9,'',1,NULL,NULL),(118,'M',1360.00,'WIDSON SANTOS DA SILVA',10,'',2,NULL,NULL),(119,'M',1572.50,'ELIAS SIMAO DA COSTA',1,'',1,NULL,NULL),(120,'F',2337.50,'ANA JESSICA SANTOS RAMOS',1,'',3,NULL,NULL),(121,'M',1360.00,'GERLY PINTO TAVARES',2,'',2,NULL,NULL),(122,'M',1320.90,'DARLEY BRUNALDO COSTA DE LIMA',3,'',1,NULL,NULL),(123,'F',1572.50,'ERIKA MALAFAIA MARINHO',4,'',1,NULL,NULL),(124,'F',1700.00,'LUZIA DA SILVA TORRES',5,'',2,NULL,NULL),(125,'M',2337.50,'ALEXANDRE TORRES DE OLIVEIRA',6,'',1,NULL,NULL),(126,'M',2337.50,'ALEXANDRE SANTOS DE OLIVEIRA',7,'',1,NULL,NULL),(127,'M',1360.00,'THIAGO TORRES DE OLIVEIRA',8,'',1,NULL,NULL),(128,'M',1929.50,'CARLOS LOPES TORRES',9,'',1,NULL,NULL),(129,'M',2337.50,'ALEXANDRE MOTA DA SILVA',10,'',2,NULL,NULL),(130,'F',2337.50,'ALINE FARIAS',2,'',1,NULL,NULL),(131,'M',1320.90,'DAVID JOSE LIMA DA SILVA',1,'',1,NULL,NULL),(132,'F',2337.50,'ADRIANA CAVALCANTE DA COSTA',2,'',1,NULL,NULL),(133,'M',1700.00,'LUCIANO LIMA DA CRUZ',3,'',1,NULL,NULL),(134,'M',1962.31,'MAURO JORGE SILVA DE LIMA',4,'',2,NULL,NULL),(135,'M',2286.50,'JEFFERSON MARCELO FERREIRA GUIMARAE',5,'',1,NULL,NULL),(136,'M',2286.50,'JONATAS DAVI GUIMARAES NASCIMENTO',6,'',1,NULL,NULL),(137,'M',1572.50,'EDISVAL FERREIRA NASCIMENTO JUNIOR',7,'',1,NULL,NULL),(138,'M',1962.31,'MATHEUS MIRANDA',8,'',1,NULL,NULL),(139,'M',1560.60,'RICARDO BRAGA ALVES',9,'',2,NULL,NULL),(140,'M',1929.50,'CRISTIANO DE SOUZA LYRA',10,'',1,NULL,NULL),(141,'F',2337.50,'ANA ROSA DE SOUZA MAIA',11,'',1,NULL,NULL),(142,'F',2337.50,'ALESSANDRA VILASA DA SILVA',1,'',2,NULL,NULL),(143,'M',2286.50,'JOUBERT ISAI PINEDO FERREIRA',2,'',1,NULL,NULL),(144,'M',2286.50,'JUCLESON GUIMARAES DOS SANTOS',3,'',1,NULL,NULL),(145,'F',2337.50,'ALANA VIEIRA DE SOUZA',4,'',2,NULL,NULL),(146,'F',1560.60,'ROSA FRAJADO',5,'',3,NULL,NULL),(147,'M',2286.50,'JOSE EDIMAR PENHA DIAS',6,'',1,NULL,NULL),(148,'F',1700.00,'LILIAN MARIA GUIMARAES DOS SANTOS',7,'',2,NULL,NULL),(149,'M',1962.31,'MATHEUS DOS SANTOS DIAS',8,'',1,NULL,NULL),(150,'M',2286.50,'JOAO EUDES JOAQUIM DE MELO',9,'',2,NULL,NULL),(151,'F',1560.60,'RAIMUNDA ALVES DA SILVA',10,'',1,NULL,NULL),(152,'F',1560.60,'RAYANE SILVA DE MELO',2,'',3,NULL,NULL),(153,'F',1320.90,'DAYANE SILVA DE MELO',1,'',1,NULL,NULL),(154,'F',1360.00,'TATIANE SILVA DE MELO',2,'',2,NULL,NULL),(155,'M',2337.50,'ANDERSON DE OLIVEIRA ARAUJO',3,'',2,NULL,NULL),(156,'M',1700.00,'LOURIVAL PEREIRA DE CASTRO',4,'',1,NULL,NULL),(157,'M',1929.50,'CARLOS RIBEIRO',5,'',1,NULL,NULL),(158,'F',1700.00,'LEONICE CHOTTI',6,'',1,NULL,NULL),(159,'M',1360.00,'ISMAEL BRAGA DA SILVA',7,'',3,NULL,NULL),(160,'M',1320.90,'DOMINGOS DE LIMA',8,'',1,NULL,NULL),(161,'F',1560.60,'ROSEANE FREITAS DA SILVA',9,'',1,NULL,NULL),(162,'F',1700.00,'LEOMARA PASTANA DE OLIVEIRA',10,'',1,NULL,NULL),(163,'M',1320.90,'DIEGO SILVA DE MELO',11,'',1,NULL,NULL),(164,'M',1320.90,'DAISE DIANE GOMES FEITOZA',1,'',1,NULL,NULL),(165,'F',2286.50,'JORDANA COLARES BATISTA',2,'',1,NULL,NULL),(166,'M',1962.31,'MERCEDES DA SILVA E SILVA',3,'',2,NULL,NULL),(167,'M',1275.00,'SAMUEL SILVA DE SOUZA',4,'',1,NULL,NULL),(168,'M',2286.50,'JUAN DA SILVA SOUZA',5,'',1,NULL,NULL),(169,'M',1275.00,'SAVIO DA SILVA SOUZA',6,'',3,NULL,NULL),(170,'M',1962.31,'MAELI RODRIGUES SANTANA',7,'',1,NULL,NULL),(171,'M',1929.50,'CARLOS ANDRE CALDEIRA DE SOUZA',8,'',1,NULL,NULL),(172,'F',1962.31,'MARIA DAS GRACAS CALDEIRA DE SOUZA',9,'',1,NULL,NULL),(173,'F',2286.50,'JANGLEIDE CALDEIRA DE SOUZA',10,'',1,NULL,NULL),(174,'F',1929.50,'CLAUDEJANE CALDEIRA DE SOUZA',11,'',1,NULL,NULL),(175,'F',1428.00,'KELLY JACKLISTA MATOS RIBEIRO',1,'',1,NULL,NULL),(176,'M',1320.90,'DEYSE LEAL LEITE',2,'',1,NULL,NULL),(177,'M',1360.00,'GABINO NUNES',3,'',4,NULL,NULL),(178,'F',1962.31,'MARIA DE FATIMA FERREIRA MATOS',4,'',1,NULL,NULL),(179,'F',1320.90,'DEYSIANE PEREIRA GONDIN',5,'',1,NULL,NULL),(180,'F',1428.00,'KAROLINE PEREIRA GONDIM',6,'',1,NULL,NULL),(181,'M',1320.90,'DOMINGAS DOS SANTOS PEREIRA',7,'',1,NULL,NULL),(182,'F',2286.50,'JOMARA NASCIMENTO AMARAL',8,'',2,NULL,NULL),(183,'F',2286.50,'JONAIRA NASCIMENTO AMARAL',9,'',1,NULL,NULL),(184,'F',1962.31,'MARIA DE NAZARE DA SILVA NASCIMENTO',10,'',1,NULL,NULL),(185,'F',1560.60,'RAQUEL PEREIRA AMARAL',11,'',1,NULL,NULL),(186,'M',2286.50,'JOAO GOMES AMARAL',1,'',1,NULL,NULL),(187,'M',2337.50,'ANTONIO MARCELO DE LIMA',2,'',1,NULL,NULL),(188,'M',2286.50,'JOSIEL GOMES DE LIMA',3,'',3,NULL,NULL),(189,'M',1572.50,'ESTEVAO PICANCO',4,'',2,NULL,NULL),(190,'F',1700.00,'LAUDELINA DE SOUZA',5,'',1,NULL,NULL),(191,'F',1360.00,'IRENE GOMES FERREIRA',6,'',1,NULL,NULL),(192,'M',1572.50,'EVERALDO DA SILVA LIMA',7,'',1,NULL,NULL),(193,'F',1360.00,'ZIZA GUEDES GONCALVES',8,'',1,NULL,NULL),(194,'F',1207.00,'FRANCIANE GUEDES GONCALVES',9,'',3,NULL,NULL),(195,'M',1428.00,'KAIQUE HENRIQUE SOARES LIBORIO',10,'',1,NULL,NULL),(196,'F',2337.50,'ADRIANA DE SOUZA RODRIGUES',11,'',1,NULL,NULL),(197,'F',1428.00,'KARINA NASCIMENTO COSTA',1,'',2,NULL,NULL),(198,'F',1572.50,'ERICA COSTA VIEIRA',2,'',1,NULL,NULL),(199,'F',1962.31,'MARIA COSTA DA SILVA',3,'',1,NULL,NULL),(200,'F',1428.00,'KATRINA NASCIMENTO SILVA',4,'',2,NULL,NULL),(201,'M',2286.50,'JOAO DOMINGOS DA SILVA',5,'',1,NULL,NULL),(202,'F',1320.90,'DERLANE TEIXEIRA LARANJEIRA',6,'',1,NULL,NULL),(203,'M',1360.00,'THIAGO LARANJEIRA PINTO',7,'',1,NULL,NULL),(204,'M',1962.31,'MANOEL PINHEIRO DE LIMA',8,'',3,NULL,NULL),(205,'F',1360.00,'PASCOALINA BARBOSA DE ANDRADE',9,'',1,NULL,NULL),(206,'F',1360.00,'TEREZA BARBOSA FELIX',10,'',1,NULL,NULL),(207,'M',2286.50,'JOAO FELIX DE SOUZA',11,'',1,NULL,NULL),(208,'M',2286.50,'JUCIMAR BARBOSA FELIX',1,'',2,NULL,NULL),(209,'M',1962.31,'MARIVANIO BARBOSA FELIX',2,'',1,NULL,NULL),(210,'F',2286.50,'JACILENE LEAL DE CASTRO',3,'',2,NULL,NULL),(211,'M',2286.50,'JONATHAN LEAL DA SILVA',4,'',1,NULL,NULL),(212,'F',2286.50,'JESSICA COSTA LEAL',5,'',1,NULL,NULL),(213,'M',1560.60,'RAIMUNDO ANTONIO DA SILVA NETO',6,'',1,NULL,NULL),(214,'M',2337.50,'ALEX OLIVEIRA DE SOUZA',7,'',3,NULL,NULL),(215,'F',2337.50,'ANA CRISTINA OLIVEIRA DE SOUZA',8,'',1,NULL,NULL),(216,'M',2278.00,'VICTOR VIEIRA BATISTA',9,'',1,NULL,NULL),(217,'M',1207.00,'FABIO JUNIOR COSTA PENA',10,'',1,NULL,NULL),(218,'F',2286.50,'JULLY OLIVEIRA REIS',11,'',1,NULL,NULL),(219,'M',1360.00,'THIAGO MACEDO DE SOUSA',1,'',2,NULL,NULL),(220,'F',2337.50,'APARECIDA OLIVEIRA DE SOUZA',2,'',1,NULL,NULL),(221,'M',1560.60,'RAY VIEIRA DA FONSECA',3,'',1,NULL,NULL),(222,'M',1572.50,'EDMILSON DA SILVA FONSECA',4,'',3,NULL,NULL),(223,'F',1560.60,'RILDA VIEIRA DA SILVA',5,'',1,NULL,NULL),(224,'M',1320.90,'DANIEL VIEIRA DA FONSECA',6,'',1,NULL,NULL),(225,'F',1320.90,'DANIELE VIEIRA DA FONSECA',7,'',1,NULL,NULL),(226,'M',2278.00,'VANDERLANDE SILVA DE SOUSA',8,'',2,NULL,NULL),(227,'F',1560.60,'ROSA MARIA SOUSA DE ALMEIDA',9,'',1,NULL,NULL),(228,'F',1360.00,'GELIANE DOS SANTOS LOPES',10,'',1,NULL,NULL),(229,'F',1360.00,'GELIVANE DOS SANTOS LOPES',11,'',1,NULL,NULL),(230,'M',2278.00,'VALDEMIR CARVALHO LOPES',1,'',3,NULL,NULL),(231,'F',2337.50,'ANTONIA CLAUDIA DOS SANTOS LOPES',2,'',1,NULL,NULL),(232,'M',2286.50,'JOCENLLDO DOS SANTOS LEITE',3,'',1,NULL,NULL),(233,'F',1275.00,'SUZANA RIBEIRO LOPES',4,'',1,NULL,NULL),(234,'M',1360.00,'NATANAEL LOPES LEITE',5,'',2,NULL,NULL),(235,'F',2286.50,'JOSIANE LOPES LEITE',6,'',1,NULL,NULL),(236,'F',2278.00,'VITORIA LOPES LEITE',7,'',1,NULL,NULL),(237,'F',1560.60,'RAQUEL LOPES LEITE',8,'',1,NULL,NULL),(238,'F',2337.50,'AIDA ROBERTO SARMENTO',9,'',1,NULL,NULL),(239,'M',1275.00,'SEBASTIAO LUIZ GOMES DA SILVA',10,'',2,NULL,NULL),(240,'M',1360.00,'PERGENTINO NORONHA FILHO',11,'',1,NULL,NULL),(241,'F',1700.00,'LEDA NORONHA DA SILVA',1,'',1,NULL,NULL),(242,'M',1207.00,'FERNANDO SOUZA SANTOS',2,'',1,NULL,NULL),(243,'F',1207.00,'FRANSOEILA RICARDO SOUZA',3,'',1,NULL,NULL),(244,'M',1962.31,'MICHAL BATISTA DE LIMA SANTOS',4,'',4,NULL,NULL),(245,'M',2337.50,'ACACIO CONCEICAO CARDOSO',5,'',1,NULL,NULL),(246,'F',1700.00,'LUANA MACHADO CARDOSO',6,'',1,NULL,NULL),(247,'M',2286.50,'JOAO PESSOA CONCEICAO CARDOSO',7,'',1,NULL,NULL),(248,'F',2337.50,'ANDREA NUNES DOS SANTOS',8,'',1,NULL,NULL),(249,'M',1962.31,'MARCOS VINICIUS DOS SANTOS CARDOSO',9,'',1,NULL,NULL),(250,'M',1700.00,'LUIZ SOUZA DE ALMEIDA FILHO',10,'',2,NULL,NULL),(251,'M',1360.00,'ODEMES DAS CHAGAS JACAUNA',11,'',1,NULL,NULL),(252,'F',1360.00,'GLAUCIMERE TAVARES ALVES',1,'',1,NULL,NULL),(253,'M',1360.00,'PAULO HENRIQUE FERREIRA',2,'',1,NULL,NULL),(254,'M',1360.00,'GLAUCIELES TAVARES ALVES',3,'',1,NULL,NULL),(255,'F',1360.00,'NADIELE TAVARES ALVES',4,'',4,NULL,NULL),(256,'M',1207.00,'FELIPE ALVES MAQUINE',5,'',1,NULL,NULL),(257,'M',1572.50,'ERASMO GOMES DA SILVA JUNIOR',6,'',3,NULL,NULL),(258,'M',2278.00,'VICTOR BELIZARIO GEISSLER',7,'',1,NULL,NULL),(259,'M',2278.00,'VILSON OLIVEIRA GEISSLER',8,'',1,NULL,NULL),(260,'M',1560.60,'RODRIGO BELIZARIO GEISSLER',9,'',1,NULL,NULL),(261,'M',1360.00,'GILSON PEREIRA DE JESUS',10,'',1,NULL,NULL),(262,'M',1360.00,'GILSON FIGUEIREDO DE JESUS',11,'',2,NULL,NULL),(263,'M',1700.00,'LEANDRO FIGUEIREDO DE JESUS',1,'',1,NULL,NULL),(264,'F',1700.00,'LUIZA HELENA DE FIGUEIREDO',2,'',1,NULL,NULL),(265,'M',1360.00,'WARLENSON HOROIAQUE BELEM',3,'',1,NULL,NULL),(266,'M',1275.00,'SUELEN HOROIAQUE BELEM',4,'',1,NULL,NULL),(267,'F',1560.60,'ROSA MARIA HOROHIAQUE',5,'',2,NULL,NULL),(268,'F',1962.31,'MARIA DE NAZARE OLIVEIRA DOS SANTOS',6,'',1,NULL,NULL),(269,'M',1360.00,'WILSON SOUZA DO NASCIMENTO',7,'',1,NULL,NULL),(270,'F',1962.31,'MARIA FRANCISCA SOARES DA GAMA',8,'',1,NULL,NULL),(271,'M',2278.00,'VICTOR DOS SANTOS BALIEIRO',9,'',1,NULL,NULL),(272,'F',1962.31,'MARIA AUXILIADORA LOPES DOS SANTOS',10,'',2,NULL,NULL),(273,'M',1320.90,'DANIEL DOS SANTOS BALIEIRO',11,'',2,NULL,NULL),(274,'F',1360.00,'IZAURA CASTRO DE SOUZA',1,'',1,NULL,NULL),(275,'F',1360.00,'OZILDA RODRIGUES DE SOUZA',2,'',1,NULL,NULL),(276,'M',1360.00,'PEDRO REIS FERREIRA',3,'',1,NULL,NULL),(277,'F',1572.50,'ELVIRA MARIA PINTO CAETANO',4,'',2,NULL,NULL),(278,'M',1360.00,'IGOR PINTO CAETANO',5,'',1,NULL,NULL),(279,'F',1360.00,'IANCA MARIA PINTO CAETANO',6,'',2,NULL,NULL),(280,'M',2337.50,'ALDENIR DE CARVALHO CAETANO',7,'',1,NULL,NULL),(281,'F',1929.50,'CELIA REGINA COELHO POND',8,'',1,NULL,NULL),(282,'M',2286.50,'JOSE FRANK DOS SANTOS CATAO',9,'',2,NULL,NULL),(283,'M',1207.00,'FRANK WILLIS POND CATAO',10,'',1,NULL,NULL),(284,'M',1700.00,'LEONARDO PASTANA DE OLIVEIRA',11,'',1,NULL,NULL),(285,'F',1360.00,'TEREZINHA DE JESUS DA SILVA',1,'',1,NULL,NULL),(286,'F',2278.00,'VANUZA DA SILVA MORREIRA',2,'',2,NULL,NULL),(287,'M',1560.60,'RAIMUNDO ANTONIO DA SILVA',3,'',2,NULL,NULL),(288,'F',1962.31,'MARIA LUCIA DE CASTRO',4,'',2,NULL,NULL),(289,'M',1207.00,'FRANCOAR DE CASTRO',5,'',1,NULL,NULL),(290,'M',1929.50,'CLEUDO DA SILVA MARIANO',6,'',1,NULL,NULL),(291,'M',1360.00,'THAIS DE CASTRO BARROS',7,'',2,NULL,NULL),(292,'F',2337.50,'ANA LUCIA DE CASTRO BARROS',8,'',1,NULL,NULL),(293,'M',2337.50,'ALIUSON DE CASTRO',9,'',1,NULL,NULL),(294,'M',1929.50,'CLECIO RIBEIRO',10,'',1,NULL,NULL),(295,'M',2278.00,'VALMI RODRIGUES LIRA',11,'',2,NULL,NULL),(296,'F',1572.50,'EDNA MARIANO DE CASTRO',1,'',1,NULL,NULL),(297,'M',2286.50,'JANDERSON DE CASTRO RIBEIRO',2,'',3,NULL,NULL),(298,'F',1962.31,'MACIANA DE CASTRO RIBEIRO',3,'',1,NULL,NULL),(299,'F',1320.90,'DIENE MARIANO DE CASTRO',4,'',2,NULL,NULL),(300,'M',1700.00,'LUCIMAR COSTA DE SOUZA',5,'',1,NULL,NULL),(301,'M',1962.31,'MARIANO FREIRE DE SOUZA',6,'',1,NULL,NULL),(302,'F',1700.00,'LUCIMARA MARIA SOUZA DA SILVA',7,'',1,NULL,NULL),(303,'F',1572.50,'ELISANGELA COSTA DE SOUZA',8,'',2,NULL,NULL),(304,'M',1962.31,'MARIANO FREIRE DE SOUZA FILHO',9,'',1,NULL,NULL),(305,'M',1962.31,'MARIVANO COSTA DE SOUZA',10,'',3,NULL,NULL),(306,'M',1700.00,'LUCIVAN COSTA DE SOUZA',11,'',1,NULL,NULL),(307,'F',1572.50,'ELIZANE COSTA DE SOUZA',1,'',1,NULL,NULL),(308,'M',2337.50,'AUGUSTO BATISTA LIRA',2,'',1,NULL,NULL),(309,'F',1700.00,'LIA LIMA GOMES',3,'',1,NULL,NULL),(310,'M',1360.00,'PAULO GUSTAVO LIMA GOMES',4,'',4,NULL,NULL),(311,'F',1962.31,'MARIA DE LOURDES FERNANDES DOS',5,'',1,NULL,NULL),(312,'M',1560.60,'RODRIGO DOS SANTOS REIS',6,'',1,NULL,NULL),(313,'M',1560.60,'ROGERIO DOS SANTOS DAMASCENO',7,'',1,NULL,NULL),(314,'M',1207.00,'FRANCELINO DOS SANTOS REIS',8,'',2,NULL,NULL),(315,'F',1572.50,'EDITE ALVES DE OLIVEIRA',9,'',1,NULL,NULL),(316,'F',1360.00,'URSULA OLIVEIRA DE FREITAS',10,'',1,NULL,NULL),(317,'M',1360.00,'ORLANDO BARROS MONTEIRO',11,'',1,NULL,NULL),(318,'F',1360.00,'NADIA BARROS MONTEIRO',1,'',2,NULL,NULL),(319,'F',1360.00,'OSVALDINA PINHEIRO BARROS',2,'',1,NULL,NULL),(320,'M',1929.50,'CARLOS DE JESUS BARROSO DOS SANTOS',3,'',1,NULL,NULL),(321,'M',1207.00,'FRANCISCO SALES DE OLIVEIRA SOARES',4,'',3,NULL,NULL),(322,'F',2278.00,'VALERIA MESQUITA DA SILVA',5,'',1,NULL,NULL),(323,'F',1560.60,'RAIMUNDA MESQUITA DA SILVA',6,'',2,NULL,NULL),(324,'F',1962.31,'MARIA DE NAZARE NEVES DA SILVA',7,'',1,NULL,NULL),(325,'M',1572.50,'ELENIMAR PINHEIRO MARTINS',8,'',1,NULL,NULL),(326,'M',1560.60,'RAFAEL PINHEIRO MARTINS DA CONCEICA',9,'',2,NULL,NULL),(327,'F',1560.60,'RAFAELA PINHEIRO MARTINS DA CONCEIC',10,'',1,NULL,NULL),(328,'F',2337.50,'ANGELA DE JESUS FEITOSA',11,'',1,NULL,NULL),(329,'M',1700.00,'LINDEMBERG COSTA DE SOUZA',1,'',3,NULL,NULL),(330,'M',1700.00,'LINDEMBERG FEITOSA DE SOUZA',2,'',1,NULL,NULL),(331,'F',1275.00,'STHEFANY FEITOSA DE SOUZA',3,'',1,NULL,NULL),(332,'M',1360.00,'PAULO JOSE AGUIAR DOS ANJOS',4,'',1,NULL,NULL),(333,'M',2337.50,'ALEXSANDRO CARVALHO DA COSTA',5,'',2,NULL,NULL),(334,'M',1360.00,'WARLISSON JOSE FERREIRA SANTOS',6,'',1,NULL,NULL),(335,'F',1962.31,'MARIA IRES CARVALHO DA COSTA',7,'',1,NULL,NULL),(336,'M',2278.00,'VALDOMIRO DE SOUZA AZEVEDO',8,'',1,NULL,NULL),(337,'M',1962.31,'MICHEL PLATINNIR DE MATOS AZEVEDO',9,'',3,NULL,NULL),(338,'F',1962.31,'MARIA LUCIA DE MATOS AZEVEDO',10,'',1,NULL,NULL),(339,'F',1962.31,'MILLENNA PALLMMER DE MATOS AZEVEDO',11,'',1,NULL,NULL),(340,'F',1962.31,'MISSENNA PANNIELLOW DE MATOS AZEVED',1,'',2,NULL,NULL),(341,'F',1962.31,'MELLISSA PANNIELLI DE MATOS AZEVEDO',2,'',1,NULL,NULL),(342,'F',2337.50,'ANA PINTO MARINHO',3,'',3,NULL,NULL),(343,'F',1572.50,'EDIMEIA DA SILVA PICANCO',4,'',1,NULL,NULL),(344,'F',1962.31,'MARIA DE NAZARE GOMES',5,'',1,NULL,NULL),(345,'M',1700.00,'LUIZ GUILHERME GOMES BARBOSA',6,'',2,NULL,NULL),(346,'M',1572.50,'ELLEN GOMES DE LIMA',7,'',1,NULL,NULL),(347,'F',1320.90,'DELIELZA BARROS ALVES',8,'',1,NULL,NULL),(348,'F',1700.00,'LAZARA MARIA GOMES DE OLIVEIRA',9,'',2,NULL,NULL),(349,'M',2286.50,'JANIO AUGUSTO LEAL BARBOSA',10,'',1,NULL,NULL),(350,'M',2337.50,'ARAO SPINDOLA DA COSTA',11,'',1,NULL,NULL),(351,'F',1360.00,'OLGA MOREIRA COSTA',1,'',2,NULL,NULL),(352,'F',1275.00,'SONIA CRISTINA MOREIRA DA COSTA',2,'',1,NULL,NULL),(353,'F',2278.00,'VERA LUCIA COSTA DA SILVA',3,'',1,NULL,NULL),(354,'M',1360.00,'PEDRO CARLOS COSTA DA SILVA',4,'',1,NULL,NULL),(355,'M',2337.50,'ARAO SPINDOLA DA COSTA FILHO',5,'',1,NULL,NULL),(356,'F',1320.90,'DEBORA MOREIRA DA COSTA',6,'',2,NULL,NULL),(357,'F',1962.31,'MARILENE DA SILVA ASSIS',7,'',1,NULL,NULL),(358,'M',1360.00,'WENDER COSTA E COSTA',8,'',1,NULL,NULL),(359,'M',1560.60,'RENATO MOREIRA DA COSTA',9,'',1,NULL,NULL),(360,'F',1275.00,'SUELY BARBOSA DA SILVA',10,'',1,NULL,NULL),(361,'M',2278.00,'VITOR AZEVEDO DE SOUZA',11,'',3,NULL,NULL),(362,'M',1207.00,'FRANCISCO ELIAS DE SOUZA',1,'',1,NULL,NULL),(363,'F',1700.00,'LANGENILDA MENDONCA BONFIM',2,'',2,NULL,NULL),(364,'M',1360.00,'PATRICK MENDONCA BONFIM',3,'',1,NULL,NULL),(365,'M',1360.00,'YUKI MENDONCA NOZAWA',4,'',1,NULL,NULL),(366,'M',1700.00,'LUIS FRANCA DE AZEVEDO',5,'',1,NULL,NULL),(367,'M',2286.50,'JONATHAS SENA AZEVEDO',6,'',3,NULL,NULL),(368,'M',1320.90,'DAITHY MENDONCA NOZAWA',7,'',1,NULL,NULL),(369,'M',1572.50,'EURIDES FRANCA DE AZEVEDO',8,'',1,NULL,NULL),(370,'F',1572.50,'ELZA FERNANDES LIMA',9,'',2,NULL,NULL),(371,'M',2286.50,'JOSE FERREIRA',10,'',1,NULL,NULL),(372,'M',1560.60,'RAIMUNDO MIRANDA DA SILVA',11,'',2,NULL,NULL),(373,'F',1962.31,'MARIA TEREZA MONTEIRO DE SOUZA',1,'',1,NULL,NULL),(374,'M',1360.00,'ISRAEL MORAES ARAUJO',2,'',1,NULL,NULL),(375,'F',1360.00,'WILLIANA ARAUJO DA SILVA',3,'',3,NULL,NULL),(376,'F',1700.00,'LEILENA PEREIRA LOUZADA',4,'',4,NULL,NULL),(377,'M',1560.60,'RONALDO SAVIO BITTENCOURT LOUZADA',5,'',1,NULL,NULL),(378,'F',1700.00,'LEILANE PEREIRA LOUZADA',6,'',1,NULL,NULL),(379,'F',1560.60,'RAIMUNDA SERRAO ALELUIA',7,'',1,NULL,NULL),(380,'M',2286.50,'JOSE DA CONCEICAO SANTOS',8,'',2,NULL,NULL),(381,'M',1572.50,'ENNES NINA DOS SANTOS',9,'',1,NULL,NULL),(382,'M',2337.50,'ANDERLEY NINA DOS SANTOS',10,'',1,NULL,NULL),(383,'M',1207.00,'FRANCISCO DE ASSIS DOS SANTOS',11,'',1,NULL,NULL),(384,'M',1572.50,'EDVALDO DOS SANTOS DA COSTA',1,'',3,NULL,NULL),(385,'F',1572.50,'ERICA SANTOS DE SOUZA',2,'',1,NULL,NULL),(386,'M',2337.50,'ANDERSON SANTOS DE SOUZA',3,'',1,NULL,NULL),(387,'F',1360.00,'ZILENE SILVA SANTOS',4,'',1,NULL,NULL),(388,'M',1275.00,'SEBASTIAO FERREIRA DA COSTA',5,'',2,NULL,NULL),(389,'F',2337.50,'AUXILIADORA SILVA DOS SANTOS',6,'',1,NULL,NULL),(390,'M',1275.00,'SIDNEY SANTOS DE SOUZA',7,'',1,NULL,NULL),(391,'M',1207.00,'FILIPE SANTOS DE SOUZA',8,'',1,NULL,NULL),(392,'F',2286.50,'JOELMA PEREIRA DE SOUZA',9,'',1,NULL,NULL),(393,'M',1929.50,'CARLOS HENRIQUE PEREIRA DE SOUZA',10,'',2,NULL,NULL),(394,'F',2286.50,'JESSICA MESQUITA DE SOUZA',11,'',1,NULL,NULL),(395,'M',1360.00,'WILLINGTON CARLOS MESQUITA DE SOUZA',1,'',1,NULL,NULL),(396,'M',1207.00,'FRANCISCO CARDOSO DE ARAUJO MOTA',2,'',1,NULL,NULL),(397,'F',1962.31,'MARGARETH PEREIRA DE SOUZA',3,'',1,NULL,NULL),(398,'M',2337.50,'ADRIANO SOUZA DE ARAUJO MOTA',4,'',3,NULL,NULL),(399,'F',2337.50,'ANDREIA SOUZA DE ARAUJO MOTA',5,'',1,NULL,NULL),(400,'M',1207.00,'FRANCISCO CARDOSO DE ARAUJO MOTA JU',6,'',1,NULL,NULL),(401,'M',1275.00,'SIJON STEPHANE SOUZA LIMA',7,'',1,NULL,NULL),(402,'M',1275.00,'SIMONE DA SILVA SOUZA',8,'',3,NULL,NULL),(403,'M',2286.50,'JONSY SOUZA LIMA',9,'',2,NULL,NULL),(404,'F',1428.00,'KATTY NABILA SOUZA LIMA',10,'',1,NULL,NULL),(405,'M',1360.00,'HOCHE MIGUEL DE ARAUJO MOTA',11,'',2,NULL,NULL),(406,'M',2286.50,'JOSE CARDOSO DE ARAUJO MOTA NETO',1,'',1,NULL,NULL),(407,'F',2286.50,'JONCILAINE CAVALCANTE DA SILVA',2,'',1,NULL,NULL),(408,'M',1360.00,'YAGO CAVALCANTE DE ARAUJO',3,'',1,NULL,NULL),(409,'M',1700.00,'LUIZ PABLO CASTRO DA SILVA',4,'',2,NULL,NULL),(410,'F',1360.00,'IRACY VIRGINIA CASTRO DE ARAUJO',5,'',1,NULL,NULL),(411,'M',1560.60,'RAIMUNDO ALVES DA SILVA',6,'',3,NULL,NULL),(412,'M',1360.00,'PATRICK FERNANDO CASTRO DA SILVA',7,'',1,NULL,NULL),(413,'M',1962.31,'MIZRAIM PATRIC LUIZ PONTES GURJAO',8,'',2,NULL,NULL),(414,'F',2278.00,'VANESSA DE OLIVEIRA CORDEIRO',9,'',1,NULL,NULL),(415,'M',1360.00,'WANDERLEY DE OLIVEIRA CORDEIRO',10,'',1,NULL,NULL),(416,'M',1360.00,'ODAY JOSE DE OLIVEIRA CORDEIRO',11,'',2,NULL,NULL),(417,'F',1320.90,'DIELMA SOARES DA SILVA',1,'',1,NULL,NULL),(418,'F',1360.00,'HEMELLY KEULY SOARES CORDEIRO',2,'',1,NULL,NULL),(419,'M',1360.00,'TANCREDO NEVES DA FONSECA',3,'',4,NULL,NULL),(420,'F',1360.00,'TEREZINHA MENDES ROLIM',4,'',1,NULL,NULL),(421,'M',1275.00,'SANDRO ROLIM DA FONSECA',5,'',1,NULL,NULL),(422,'M',1360.00,'TANCREIRES JUNIO ROLIM DA FONSECA',6,'',1,NULL,NULL),(423,'M',1360.00,'THIAGO ROLIM DA FONSECA',7,'',2,NULL,NULL),(424,'F',1360.00,'TATIANA ROLIM DA FONSECA',8,'',1,NULL,NULL),(425,'F',2337.50,'AURELIA MARQUES REIS',9,'',1,NULL,NULL),(426,'M',1428.00,'KENNEDY REIS DE SOUZA',10,'',3,NULL,NULL),(427,'M',1360.00,'IVAN BELEM DE SOUZA',11,'',1,NULL,NULL),(428,'F',1560.60,'ROSIMARY DA SILVA',1,'',3,NULL,NULL),(429,'M',1428.00,'KELYSON DA SILVA GOUVEA',2,'',1,NULL,NULL),(430,'M',1360.00,'WEDSON DA SILVA GOUVEA',3,'',2,NULL,NULL),(431,'F',1428.00,'KEDNA DA SILVA GOUVEA',4,'',2,NULL,NULL),(432,'M',1560.60,'RONALDO PEREIRA DA SILVA',5,'',2,NULL,NULL),(433,'F',1428.00,'KETHLEEN GOUVEA DA SILVA',6,'',1,NULL,NULL),(434,'M',1560.60,'RICARDO DE SA GOUVEA',7,'',1,NULL,NULL),(435,'M',2337.50,'ANDERSON DA GAMA DE ARAUJO',8,'',1,NULL,NULL),(436,'F',1962.31,'MIRIANE FERREIRA DA CUNHA',9,'',1,NULL,NULL),(437,'F',1360.00,'PATRICIA DA CUNHA GOUVEA',10,'',1,NULL,NULL),(438,'M',1560.60,'ROSIVALDO VIEIRA ROLIM',11,'',1,NULL,NULL),(439,'F',1360.00,'GRACIEME BELEM DE SOUZA',1,'',1,NULL,NULL),(440,'M',1360.00,'GIDEAO BELEM DE SOUZA',2,'',2,NULL,NULL),(441,'F',1560.60,'RAQUELLY DE SOUZA ROLIM',3,'',1,NULL,NULL),(442,'M',1360.00,'PEDRO FERREIRA DE MELLO',4,'',1,NULL,NULL),(443,'M',1700.00,'LUCAS WINDISTON LOPES MELLO',5,'',1,NULL,NULL),(444,'F',1962.31,'MAYARA EVELYN CAMPOS FERREIRA',6,'',2,NULL,NULL),(445,'M',1207.00,'FRANCISCO NUNES CAMPOS',7,'',1,NULL,NULL),(446,'F',1560.60,'ROSA MARIA DE SOUSA CAMPOS',8,'',3,NULL,NULL),(447,'M',1962.31,'MARCO ANTONIO MARINHO FERREIRA',9,'',1,NULL,NULL),(448,'F',1572.50,'EDILAINE DE SOUSA CAMPOS',10,'',1,NULL,NULL),(449,'M',1700.00,'LEVY DE ARAUJO SARAIVA',11,'',1,NULL,NULL),(450,'F',1394.00,'BRUNA DE ARAUJO SARAIVA',1,'',2,NULL,NULL),(451,'F',1428.00,'KAROLINA DE ARAUJO SARAIVA',2,'',1,NULL,NULL),(452,'M',1207.00,'FRANCISCO CAVALCANTE SARAIVA',3,'',1,NULL,NULL),(453,'F',1560.60,'ROSA DE ARAUJO SARAIVA',4,'',1,NULL,NULL),(454,'M',2337.50,'ARCANJO MARQUES CORDEIRO',5,'',2,NULL,NULL),(455,'M',1360.00,'ILTOMAR MARQUES PACHECO',6,'',4,NULL,NULL),(456,'M',1700.00,'LEANDRO BEZERRA PACHECO',7,'',1,NULL,NULL),(457,'F',1962.31,'MARIA CONCEICAO LUCINDA OLIVEIRA BE',8,'',1,NULL,NULL),(458,'F',2278.00,'VALERIA BEZERRA PACHECO',9,'',1,NULL,NULL),(459,'F',1360.00,'TELMA BELIZARIO GEISSLER',10,'',1,NULL,NULL),(460,'M',2337.50,'ANTONIO MALCHER DE ASSUNCAO',11,'',1,NULL,NULL),(461,'F',1320.90,'DEBORA PEREIRA DE SOUZA',1,'',1,NULL,NULL),(462,'F',1700.00,'LUCICLEIA CAVALCANTE DA CUNHA',2,'',1,NULL,NULL),(463,'M',1360.00,'HUDSON BARBOSA OLIVEIRA',3,'',1,NULL,NULL),(464,'F',1560.60,'RAIMUNDA BARBOSA NICACIO',4,'',1,NULL,NULL),(465,'F',1929.50,'CLEIDE NICACIO DE OLIVEIRA',5,'',1,NULL,NULL),(466,'M',1360.00,'HUDMAR NICACIO DE OLIVEIRA',6,'',1,NULL,NULL),(467,'F',1572.50,'ELINILZA NICACIO TEIXEIRA',7,'',1,NULL,NULL),(468,'F',1360.00,'HUDLANE NICACIO DE OLIVEIRA',8,'',1,NULL,NULL),(469,'M',1560.60,'RODINEI NICACIO DE OLIVEIRA',9,'',1,NULL,NULL),(470,'M',1560.60,'ROSINEI NICACIO DE OLIVEIRA',10,'',1,NULL,NULL),(471,'F',1275.00,'SARAJANE NICACIO OLIVEIRA',11,'',2,NULL,NULL),(472,'F',1962.31,'MONICA DA GAMA ARAUJO',1,'',1,NULL,NULL),(473,'F',2286.50,'JHENNIFER SUELEM DE OLIVEIRA PANTOJ',2,'',1,NULL,NULL),(474,'M',2286.50,'JOAO HENRIQUE DA SILVA MONTEIRO',3,'',1,NULL,NULL),(475,'M',1700.00,'LURDENIS DE LIMA MONTEIRO',4,'',2,NULL,NULL),(476,'F',1572.50,'EDNA GOMES DA CRUZ',5,'',1,NULL,NULL),(477,'F',1572.50,'EVELY DA CONCEICAO GOMES',6,'',1,NULL,NULL),(478,'M',1428.00,'KLEBERSON JONES SILVA',7,'',1,NULL,NULL),(479,'F',1560.60,'REBECA CRISTINA GOMES SILVA',8,'',1,NULL,NULL),(480,'M',2286.50,'JOAO RODRIGUES DE SOUZA',9,'',2,NULL,NULL),(481,'F',1700.00,'LUCILA RODRIGUES',10,'',1,NULL,NULL),(482,'M',1207.00,'FRANCISCO MORAES GOMES',11,'',4,NULL,NULL),(483,'F',1700.00,'LUCIANE RODRIGUES DA SILVA',1,'',1,NULL,NULL),(484,'M',1700.00,'LUCIANO RODRIGUES DA SILVA',2,'',1,NULL,NULL),(485,'F',1700.00,'LUCILA DA SILVA COSTA',3,'',3,NULL,NULL),(486,'F',1360.00,'NILCILENE FERREIRA BARBOSA',4,'',1,NULL,NULL),(487,'F',1572.50,'EDIMARA FERREIRA DE SOUZA',5,'',2,NULL,NULL),(488,'F',1929.50,'CIMARA FERREIRA DE SOUZA',6,'',2,NULL,NULL),(489,'M',1360.00,'HELITON BARBOSA DE SOUZA',7,'',2,NULL,NULL),(490,'F',1929.50,'CREUZA FERREIRA BARBOSA',8,'',2,NULL,NULL),(491,'M',1207.00,'FRANCISCO FERREIRA DE SOUZA',9,'',2,NULL,NULL),(492,'F',1320.90,'DEDIANE BARBOSA DE SOUZA',10,'',1,NULL,NULL),(493,'F',1929.50,'CRIS FERREIRA DE SOUZA',11,'',1,NULL,NULL),(494,'F',1394.00,'BIANCA BARBOSA DE SOUZA',1,'',1,NULL,NULL),(495,'M',2286.50,'JEFFERSON BARBOSA DE SOUZA',2,'',1,NULL,NULL),(496,'F',1360.00,'TABITA DE SOUZA ARAUJO',3,'',3,NULL,NULL),(497,'M',2337.50,'ALMIR GOMES ALCANTARA JUNIOR',4,'',3,NULL,NULL),(498,'F',1572.50,'ESTELA AUGUSTA BACELAR DE SOUZA',5,'',1,NULL,NULL),(499,'M',1360.00,'WILLIAMES AUGUSTO BACELAR DE SOUZA',6,'',2,NULL,NULL),(500,'F',1929.50,'CINTHIA APARECIDA ARAUJO',7,'',1,NULL,NULL),(501,'F',1360.00,'PRISCILA BARBOSA DE SOUZA',8,'',1,NULL,NULL),(502,'F',1360.00,'PATRIA BARBOSA DE SOUZA',9,'',3,NULL,NULL),(503,'F',1360.00,'PERLA EVELYN BARBOSA DE SOUZA',10,'',2,NULL,NULL),(504,'M',1360.00,'NILOMAR LIMA SOARES',11,'',4,NULL,NULL),(505,'F',1207.00,'FRANCISCA ELESSANDRA LIRA DA SILVA',1,'',1,NULL,NULL),(506,'M',1929.50,'CHARLISON NIELSON LIRA SOARES',2,'',1,NULL,NULL),(507,'M',2337.50,'ARQUIMEDES DE FARIAS GOMES',3,'',1,NULL,NULL),(508,'M',1360.00,'WALDIR ALMEIDA GOMES',4,'',1,NULL,NULL),(509,'M',2286.50,'JACKSON JUNIO ALMEIDA GOMES',5,'',1,NULL,NULL),(510,'F',2286.50,'JUCIANE DE ALMEIDA GOMES',6,'',4,NULL,NULL),(511,'M',2286.50,'JUCELINO DE ALMEIDA GOMES',7,'',1,NULL,NULL),(512,'F',1360.00,'ZUILA ALVES DA SILVA',8,'',2,NULL,NULL),(513,'F',2278.00,'VANDERLEIA ALVES MOTA',9,'',1,NULL,NULL),(514,'F',1275.00,'SARAH MOTA AMORIM',10,'',1,NULL,NULL),(515,'F',1360.00,'NAIANE ALVES MOTA',11,'',2,NULL,NULL),(516,'M',1428.00,'KELLE CRISTINA SILVA ALCANTARA OLIV',1,'',1,NULL,NULL),(517,'F',1207.00,'FERNANDA ALCANTARA OLIVEIRA',2,'',1,NULL,NULL),(518,'M',1320.90,'DELCIMAR DOS PASSOS OLIVEIRA',3,'',1,NULL,NULL),(519,'M',2286.50,'JOSE RAIMUNDO LIRA DE SOUZA',4,'',1,NULL,NULL),(520,'F',1962.31,'MARILENE COUTINHO DE FREITAS',5,'',2,NULL,NULL),(521,'M',2000.00,'MARCELO CHAMY',5,'',1,NULL,NULL),(522,'M',2000.00,'MARCELO CHAMY',5,'',1,NULL,NULL),(523,'M',2000.00,'MARCELO CHAMY',5,'',2,NULL,NULL),(524,'M',2040.00,'CARLOS ALBERTO',5,'',1,NULL,NULL),(525,'M',2000.00,'MARCELO CHAMY',1,'',1,NULL,NULL),(526,'M',4000.00,'MARCELO CHAMY',1,'',1,NULL,NULL),(527,'M',1698.30,'JOSE ALBERTO',4,'8888-9999',1,NULL,NULL),(528,'M',1207.00,'Marcelo Chamy Machado',5,'1111-1111',1,NULL,NULL),(529,'F',5950.00,'CLIENTE TESTE PARA TRIGGER',1,'99999-9999',1,NULL,NULL),(600,'f',3400.00,'cliente 600',1,'8989-6363',1,'2016-10-25',NULL),(601,'f',5100.00,'cliente 601',5,'3232-2121',3,'2016-10-25',NULL),(602,'m',1700.00,'cliente 602',2,'1111-2222',2,'2016-10-25',NULL),(603,'F',3500.00,'Fulana da Silva',1,'88888-8888',1,'2024-03-06',NULL),(604,'F',3400.00,'CLIENTE PARA TESTE TRIGGER',1,'9999-9999',1,'2024-03-13',NULL);
+/*!40000 ALTER TABLE `cliente` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `estadocivil`
+--
+
+DROP TABLE IF EXISTS estadocivil;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE estadocivil (
+  estcodigo int NOT NULL DEFAULT '0',
+  estdescricao varchar(40) NOT NULL,
+  PRIMARY KEY (estcodigo)
+) ENGINE=InnoDB DEFAULT CHARSET=latin1;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `estadocivil`
+--
+
+LOCK TABLES estadocivil WRITE;
+/*!40000 ALTER TABLE `estadocivil` DISABLE KEYS */;
+INSERT INTO estadocivil VALUES (1,'Solteiro'),(2,'Casado'),(3,'Divorciado'),(4,'Viúvo');
+/*!40000 ALTER TABLE `estadocivil` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `filial`
+--
+
+DROP TABLE IF EXISTS filial;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE filial (
+  filcodigo int NOT NULL DEFAULT '0',
+  filnome varchar(40) NOT NULL,
+  filcodgerente int NOT NULL,
+  filbaicodigo int NOT NULL,
+  PRIMARY KEY (filcodigo),
+  KEY filbaicodigo (filbaicodigo),
+  KEY filcodgerente (filcodgerente),
+  CONSTRAINT filial_ibfk_1 FOREIGN KEY (filbaicodigo) REFERENCES bairro (baicodigo),
+  CONSTRAINT filial_ibfk_2 FOREIGN KEY (filcodgerente) REFERENCES funcionario (funcodigo)
+) ENGINE=InnoDB DEFAULT CHARSET=latin1;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `filial`
+--
+
+LOCK TABLES filial WRITE;
+/*!40000 ALTER TABLE `filial` DISABLE KEYS */;
+INSERT INTO filial VALUES (1,'FILIAL ADRIANÓPOLIS',1,1),(2,'FILIAL CENTRO',2,2),(3,'FILIAL SÃO JOSÉ',1,11);
+/*!40000 ALTER TABLE `filial` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `formapagamento`
+--
+
+DROP TABLE IF EXISTS formapagamento;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE formapagamento (
+  fpcodigo smallint unsigned NOT NULL,
+  fpdescricao varchar(60) NOT NULL,
+  fpativo tinyint(1) NOT NULL,
+  PRIMARY KEY (fpcodigo)
+) ENGINE=InnoDB DEFAULT CHARSET=latin1;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `formapagamento`
+--
+
+LOCK TABLES formapagamento WRITE;
+/*!40000 ALTER TABLE `formapagamento` DISABLE KEYS */;
+INSERT INTO formapagamento VALUES (1,'Dinheiro',1),(2,'Débito',1),(3,'Crédito',1),(4,'Pix',1),(5,'Boleto',1);
+/*!40000 ALTER TABLE `formapagamento` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `fornecedor`
+--
+
+DROP TABLE IF EXISTS fornecedor;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE fornecedor (
+  forcnpj char(18) NOT NULL DEFAULT '',
+  fornome varchar(100) NOT NULL,
+  forfone char(9) NOT NULL,
+  forcidcodigo int NOT NULL,
+  PRIMARY KEY (forcnpj),
+  KEY forcidcodigo (forcidcodigo),
+  CONSTRAINT fornecedor_ibfk_1 FOREIGN KEY (forcidcodigo) REFERENCES cidade (cidcodigo)
+) ENGINE=InnoDB DEFAULT CHARSET=latin1;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `fornecedor`
+--
+
+LOCK TABLES fornecedor WRITE;
+/*!40000 ALTER TABLE `fornecedor` DISABLE KEYS */;
+INSERT INTO fornecedor VALUES ('11.111.111/1111-11','Fornecedor 1','1111-1111',1),('22.222.222/2222-22','Fornecedor 2','2222-2222',2),('33.333.333/3333-33','Fornecedor 3','3333-3333',2),('44.444.444/4444-44','Fornecedor 4','4444-4444',4),('55.555.555/5555-55','Fornecedor 5','5555-5555',3);
+/*!40000 ALTER TABLE `fornecedor` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `fornecedorfone`
+--
+
+DROP TABLE IF EXISTS fornecedorfone;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE fornecedorfone (
+  ffforcnpj char(18) NOT NULL,
+  fffone char(9) NOT NULL,
+  PRIMARY KEY (ffforcnpj,fffone),
+  CONSTRAINT fornecedorfone_ibfk_1 FOREIGN KEY (ffforcnpj) REFERENCES fornecedor (forcnpj)
+) ENGINE=InnoDB DEFAULT CHARSET=latin1;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `fornecedorfone`
+--
+
+LOCK TABLES fornecedorfone WRITE;
+/*!40000 ALTER TABLE `fornecedorfone` DISABLE KEYS */;
+/*!40000 ALTER TABLE `fornecedorfone` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `funcionario`
+--
+
+DROP TABLE IF EXISTS funcionario;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE funcionario (
+  funcodigo int NOT NULL DEFAULT '0',
+  funnome varchar(50) NOT NULL,
+  funsalario double(6,2) NOT NULL,
+  funbaicodigo int NOT NULL,
+  funcodgerente int DEFAULT NULL,
+  fundtdem date DEFAULT NULL,
+  funestcodigo int NOT NULL,
+  funsenha varchar(20) DEFAULT NULL,
+  funlogin varchar(30) DEFAULT NULL,
+  fundtnascto date DEFAULT NULL,
+  PRIMARY KEY (funcodigo),
+  KEY funbaicodigo (funbaicodigo),
+  KEY funcodgerente (funcodgerente),
+  KEY funestcodigo (funestcodigo),
+  CONSTRAINT funcionario_ibfk_1 FOREIGN KEY (funbaicodigo) REFERENCES bairro (baicodigo),
+  CONSTRAINT funcionario_ibfk_2 FOREIGN KEY (funcodgerente) REFERENCES funcionario (funcodigo),
+  CONSTRAINT funcionario_ibfk_3 FOREIGN KEY (funestcodigo) REFERENCES estadocivil (estcodigo)
+) ENGINE=InnoDB DEFAULT CHARSET=latin1;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `funcionario`
+--
+
+LOCK TABLES funcionario WRITE;
+/*!40000 ALTER TABLE `funcionario` DISABLE KEYS */;
+INSERT INTO funcionario VALUES (1,'Fernando da Costa',2868.75,8,NULL,NULL,3,'','',NULL),(2,'Joaquim da Silva',1721.25,4,1,NULL,1,'','',NULL),(3,'Manuel Carlos Almeida',1759.50,7,2,NULL,2,'','',NULL),(4,'Suellen Pinheiro',1836.00,4,1,NULL,1,'','',NULL),(5,'Josefina da Costa',2065.50,1,2,NULL,2,'','',NULL),(6,'JOVEMLAN DA SILVA',3634.72,14,1,'2006-01-15',1,'','',NULL),(7,'JEANE DA COSTA',2489.11,13,2,NULL,2,'','',NULL),(8,'VITORIA MELO COELHO',1327.28,14,3,NULL,1,'','',NULL),(9,'ZILDO LEAL BOTELHO',1721.25,12,2,NULL,3,'','',NULL),(10,'ROBSON MENDONÃ‡A MATOS',2999.68,11,3,NULL,1,'','',NULL),(11,'PAULO CESAR DE CARVALHO',2852.48,13,4,NULL,2,'','',NULL),(12,'MARIA DIANA OLIVEIRA',3768.85,6,2,NULL,1,'','',NULL),(13,'ANTONIA LIMA BATISTA',3431.91,4,4,NULL,3,'','',NULL),(14,'LETICIA COSTA SENA',3695.41,1,4,'2006-01-11',1,'','',NULL),(15,'SELMA LIMA FRANCA',8800.36,4,NULL,NULL,2,'','',NULL),(16,'FERNANDA MARTINS DOS SANTOS',7324.88,2,15,NULL,3,'','',NULL),(17,'ANA MAGDA VALENTE',3557.25,3,4,NULL,1,'','',NULL),(18,'BRUNA REIS PAIVA',1391.33,5,2,NULL,2,'','',NULL),(19,'DANIELE FERREIRA OLIVEIRA',2162.86,6,4,NULL,1,'','',NULL),(20,'RAIMUNDO CARLOS SILVEIRA',7239.59,2,15,NULL,2,'','',NULL),(21,'GILSON SANTOS COSTA',2346.36,5,4,NULL,1,'','',NULL),(22,'VICTOR MENDONCA ALVES',3028.40,5,2,'2006-01-11',3,'','',NULL),(23,'MOISES SILVA MOURA',1459.69,12,4,NULL,1,'','',NULL),(24,'PATRICIA LEITE CARVALHO',3748.50,10,2,NULL,1,'','',NULL),(25,'PAULA PEREIRA',1745.90,5,15,NULL,2,'','',NULL),(26,'RAFAEL JUVENAL',2147.97,6,2,NULL,1,'','',NULL),(27,'FRANCISCO SEIXAS',2594.25,5,2,'2006-01-13',2,'','',NULL),(28,'MARIA MADALENA',2086.36,11,15,NULL,1,'','',NULL),(29,'RITA DO PERPETUO SOCORRO',2152.57,12,15,'2006-01-13',3,'','',NULL),(30,'JOAO DE DEUS',4592.86,10,15,NULL,2,'','',NULL);
+/*!40000 ALTER TABLE `funcionario` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `grupoproduto`
+--
+
+DROP TABLE IF EXISTS grupoproduto;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE grupoproduto (
+  grpcodigo int NOT NULL,
+  grpdescricao varchar(40) NOT NULL,
+  grpcomissao double(4,2) NOT NULL,
+  grpativo char(1) NOT NULL,
+  PRIMARY KEY (grpcodigo)
+) ENGINE=InnoDB DEFAULT CHARSET=latin1;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `grupoproduto`
+--
+
+LOCK TABLES grupoproduto WRITE;
+/*!40000 ALTER TABLE `grupoproduto` DISABLE KEYS */;
+INSERT INTO grupoproduto VALUES (1,'TELEFONIA E CELULAR',2.75,''),(2,'FOTO',1.25,''),(3,'ELETRO-ELETRONICOS',3.50,''),(4,'INFORMATICA',3.75,''),(5,'MOVEIS',4.25,''),(6,'MEDICAMENTOS',2.75,'');
+/*!40000 ALTER TABLE `grupoproduto` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `itemvenda`
+--
+
+DROP TABLE IF EXISTS itemvenda;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE itemvenda (
+  itvvencodigo int NOT NULL,
+  itvprocodigo int NOT NULL,
+  itvqtde int NOT NULL,
+  PRIMARY KEY (itvvencodigo,itvprocodigo),
+  KEY itvprocodigo (itvprocodigo),
+  CONSTRAINT itemvenda_ibfk_1 FOREIGN KEY (itvvencodigo) REFERENCES venda (vencodigo),
+  CONSTRAINT itemvenda_ibfk_2 FOREIGN KEY (itvprocodigo) REFERENCES produto (procodigo)
+) ENGINE=InnoDB DEFAULT CHARSET=latin1;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `itemvenda`
+--
+
+LOCK TABLES itemvenda WRITE;
+/*!40000 ALTER TABLE `itemvenda` DISABLE KEYS */;
+INSERT INTO itemvenda VALUES (1,5,20),(1,14,1),(1,24,5),(2,10,1),(2,11,1),(2,20,1),(3,1,1),(4,2,1),(4,7,1),(5,6,1),(6,5,3),(6,15,3),(7,9,1),(8,4,1),(8,12,1),(9,3,1),(9,8,1),(9,13,1),(10,10,1),(10,12,1),(11,11,1),(12,1,1),(12,10,1),(12,11,1),(12,12,1),(12,17,1),(13,14,1),(14,5,1),(14,15,1),(15,19,1),(16,10,1),(16,12,1),(17,10,1),(17,17,1),(18,2,1),(18,4,1),(18,11,1),(19,17,1),(20,4,1),(20,19,1),(21,2,3),(21,6,3),(21,20,3),(22,3,1),(23,4,1),(24,9,1),(25,7,1),(26,6,1),(27,2,1),(27,5,1),(27,9,1),(28,4,1),(29,3,1),(30,10,1),(31,10,1),(32,11,1),(32,19,1),(33,13,1),(34,17,1),(35,15,1),(36,19,1),(37,12,1),(38,3,1),(39,2,1),(40,6,1),(41,7,1),(42,4,1),(42,8,1),(42,13,1),(43,9,1),(44,12,1),(45,20,1),(46,7,1),(46,10,1),(47,6,1),(48,1,1),(48,3,1),(49,10,1),(50,15,1),(51,19,1),(52,14,1),(53,16,1),(54,7,1),(55,9,1),(56,8,1),(57,7,1),(58,6,1),(59,5,1),(60,4,1),(61,3,1),(62,2,1),(63,1,1),(64,12,1),(65,13,1),(66,2,1),(67,1,1),(68,19,1),(69,16,1),(70,13,1),(71,17,1),(72,19,1),(73,20,1),(74,12,1),(75,11,1),(76,11,1),(77,14,1),(78,3,1),(79,8,1),(80,2,1),(80,8,1),(80,9,1),(81,8,1),(82,5,1),(83,2,1),(84,1,1),(85,12,1),(86,11,1),(87,1,1),(88,2,1),(89,3,1),(90,11,1),(90,12,1),(90,13,1),(90,14,1),(91,2,1),(92,10,1),(93,11,1),(94,12,1),(95,1,1),(95,2,1),(95,8,1),(96,7,1),(97,4,1),(97,8,1),(98,9,1),(99,3,1),(100,1,1),(100,7,1),(101,17,1),(102,9,1),(102,10,1),(103,18,1),(104,18,1),(105,12,1),(106,1,1),(106,11,1),(106,17,1),(107,9,1),(108,5,1),(108,10,1),(108,15,1),(109,8,1),(110,2,1),(110,9,1),(111,25,2);
+/*!40000 ALTER TABLE `itemvenda` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `produto`
+--
+
+DROP TABLE IF EXISTS produto;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE produto (
+  procodigo int NOT NULL DEFAULT '0',
+  pronome varchar(80) NOT NULL,
+  procusto double(7,2) NOT NULL,
+  propreco double(7,2) NOT NULL,
+  proativo char(1) NOT NULL,
+  progrpcodigo int NOT NULL,
+  prosaldo int NOT NULL,
+  proforcnpj char(18) NOT NULL,
+  PRIMARY KEY (procodigo),
+  KEY progrpcodigo (progrpcodigo),
+  KEY proforcnpj (proforcnpj),
+  CONSTRAINT produto_ibfk_1 FOREIGN KEY (progrpcodigo) REFERENCES grupoproduto (grpcodigo),
+  CONSTRAINT produto_ibfk_2 FOREIGN KEY (proforcnpj) REFERENCES fornecedor (forcnpj)
+) ENGINE=InnoDB DEFAULT CHARSET=latin1;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `produto`
+--
+
+LOCK TABLES produto WRITE;
+/*!40000 ALTER TABLE `produto` DISABLE KEYS */;
+INSERT INTO produto VALUES (1,'Impressora deskjet HP 1150',800.00,1400.00,'1',4,10,'22.222.222/2222-22'),(2,'No Break 1kva',270.00,4500.00,'0',4,23,'11.111.111/1111-11'),(3,'Bebedouro Esmaltec',134.00,429.00,'1',3,7,'44.444.444/4444-44'),(4,'Fax Panasonic KX-FT908BGR',301.00,520.00,'0',1,9,'22.222.222/2222-22'),(5,'Tv 29\" Toshiba',800.00,1076.00,'1',3,13,'33.333.333/3333-33'),(6,'Tv 20\" SEMP',360.00,480.00,'1',3,17,'33.333.333/3333-33'),(7,'Monitor 15\" LCD Samsung 540L',480.00,817.00,'1',4,3,'11.111.111/1111-11'),(8,'Sapateira com 4 gavetas',150.00,222.00,'1',5,6,'44.444.444/4444-44'),(9,'Notebook LG LS70',4500.00,6999.00,'0',4,21,'11.111.111/1111-11'),(10,'Aparelho DVD Sony DVP-NS45',230.00,470.00,'1',3,17,'22.222.222/2222-22'),(11,'Maquina Fotografica Panasonic',295.00,599.00,'1',2,12,'55.555.555/5555-55'),(12,'Maquina Fotografica Yashica CX400',453.00,745.00,'0',2,15,'55.555.555/5555-55'),(13,'Maquina Fotografica Philips Key008',370.00,691.00,'1',2,15,'55.555.555/5555-55'),(14,'Mini System Sony GNX100',1095.00,2196.00,'1',3,10,'11.111.111/1111-11'),(15,'Fogao 6B Eletrolux',870.00,1499.00,'1',3,15,'22.222.222/2222-22'),(16,'Geladeira Brastemp 330L',760.00,1599.00,'0',3,10,'44.444.444/4444-44'),(17,'Escrivaninha para Computador',134.00,259.00,'1',5,10,'11.111.111/1111-11'),(18,'Mesa de Centro 15 MG',87.00,164.00,'1',5,10,'44.444.444/4444-44'),(19,'Ar Condicionado 7500 Btus 110v',490.00,799.00,'1',3,10,'22.222.222/2222-22'),(20,'Forno Microondas Brastemp',340.00,789.00,'1',3,10,'11.111.111/1111-11'),(21,'Celular motorola v80',750.00,1200.00,'1',1,28,'11.111.111/1111-11'),(22,'Camera Digital Kodak KSX-1290',2000.00,4500.00,'1',2,15,'33.333.333/3333-33'),(23,'Maquina de Lavar Loucas LG',450.00,750.00,'1',3,10,'11.111.111/1111-11'),(24,'Palm Zire V',560.00,950.00,'1',4,27,'33.333.333/3333-33'),(25,'Poltrona com 2 lugares',375.00,890.00,'1',5,8,'11.111.111/1111-11');
+/*!40000 ALTER TABLE `produto` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `venda`
+--
+
+DROP TABLE IF EXISTS venda;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE venda (
+  vencodigo int NOT NULL,
+  vendata date NOT NULL,
+  venfilcodigo int NOT NULL,
+  venclicodigo int NOT NULL,
+  venfuncodigo int NOT NULL,
+  venfpcodigo smallint unsigned DEFAULT NULL,
+  PRIMARY KEY (vencodigo),
+  KEY venclicodigo (venclicodigo),
+  KEY venfuncodigo (venfuncodigo),
+  KEY venda_ibfk_1 (venfilcodigo),
+  KEY venfpcodigo (venfpcodigo),
+  CONSTRAINT venda_ibfk_1 FOREIGN KEY (venfilcodigo) REFERENCES filial (filcodigo),
+  CONSTRAINT venda_ibfk_2 FOREIGN KEY (venclicodigo) REFERENCES cliente (clicodigo),
+  CONSTRAINT venda_ibfk_3 FOREIGN KEY (venfuncodigo) REFERENCES vendedor (vefuncodigo),
+  CONSTRAINT venda_ibfk_4 FOREIGN KEY (venfpcodigo) REFERENCES formapagamento (fpcodigo)
+) ENGINE=InnoDB DEFAULT CHARSET=latin1;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `venda`
+--
+
+LOCK TABLES venda WRITE;
+/*!40000 ALTER TABLE `venda` DISABLE KEYS */;
+INSERT INTO venda VALUES (1,'2024-01-02',1,10,9,1),(2,'2024-01-02',2,1,2,1),(3,'2024-01-02',3,30,3,1),(4,'2024-01-02',2,5,3,1),(5,'2024-01-02',3,6,4,1),(6,'2024-01-02',2,2,8,1),(7,'2024-01-02',3,8,9,1),(8,'2024-01-02',2,2,6,1),(9,'2024-01-02',2,90,2,1),(10,'2024-01-02',2,12,7,1),(11,'2024-01-02',3,57,9,3),(12,'2024-01-02',3,39,6,3),(13,'2024-01-02',1,36,4,3),(14,'2024-01-02',3,28,5,3),(15,'2024-01-02',1,22,7,3),(16,'2024-01-03',2,11,3,3),(17,'2024-01-03',1,44,9,3),(18,'2024-01-03',2,55,3,3),(19,'2024-01-03',2,66,2,3),(20,'2024-01-03',3,77,4,3),(21,'2024-01-03',3,88,8,5),(22,'2024-01-03',3,99,2,5),(23,'2024-01-03',1,26,7,5),(24,'2024-01-03',1,29,3,5),(25,'2024-01-03',2,35,4,5),(26,'2024-01-03',2,42,16,5),(27,'2024-01-03',1,47,13,5),(28,'2024-01-03',3,52,19,5),(29,'2024-01-04',1,59,12,5),(30,'2024-01-04',2,119,12,5),(31,'2024-01-04',2,112,17,5),(32,'2024-01-04',1,104,11,5),(33,'2024-01-04',3,109,10,5),(34,'2024-01-04',1,125,16,5),(35,'2024-01-04',3,129,16,5),(36,'2024-01-04',2,162,12,5),(37,'2024-01-04',1,128,18,5),(38,'2024-01-04',3,137,19,5),(39,'2024-01-04',1,143,16,5),(40,'2024-01-04',2,169,10,5),(41,'2024-01-05',2,152,11,2),(42,'2024-01-05',1,162,12,2),(43,'2024-01-05',1,127,10,2),(44,'2024-01-05',2,129,14,2),(45,'2024-01-05',1,168,11,2),(46,'2024-01-05',3,179,12,2),(47,'2024-01-05',3,181,16,2),(48,'2024-01-05',1,171,13,2),(49,'2024-01-05',2,128,13,2),(50,'2024-01-05',1,171,18,2),(51,'2024-01-05',3,161,21,2),(52,'2024-01-05',2,119,22,2),(53,'2024-01-05',1,117,23,2),(54,'2024-01-05',2,126,26,2),(55,'2024-01-05',1,109,30,2),(56,'2024-01-05',3,111,12,2),(57,'2024-01-06',1,199,16,2),(58,'2024-01-06',1,195,6,2),(59,'2024-01-06',2,118,12,2),(60,'2024-01-06',2,115,2,2),(61,'2024-01-06',1,160,5,4),(62,'2024-01-06',3,125,8,4),(63,'2024-01-06',1,183,2,4),(64,'2024-01-06',1,136,7,4),(65,'2024-01-06',1,185,10,4),(66,'2024-01-06',2,116,21,4),(67,'2024-01-06',1,109,26,4),(68,'2024-01-06',2,283,27,4),(69,'2024-01-07',2,293,16,4),(70,'2024-01-07',3,290,2,4),(71,'2024-01-07',1,216,3,4),(72,'2024-01-07',3,237,8,4),(73,'2024-01-07',3,277,11,4),(74,'2024-01-07',2,274,10,4),(75,'2024-01-07',2,273,20,4),(76,'2024-01-07',2,241,21,4),(77,'2024-01-07',2,249,29,4),(78,'2024-01-07',3,218,16,4),(79,'2024-01-07',2,213,18,4),(80,'2024-01-07',3,207,20,4),(81,'2024-01-07',1,295,30,4),(82,'2024-01-07',2,277,10,4),(83,'2024-01-07',1,262,11,4),(84,'2024-01-07',1,231,14,4),(85,'2024-01-07',3,287,17,4),(86,'2024-01-07',3,206,19,4),(87,'2024-01-07',2,265,21,4),(88,'2024-01-07',2,297,22,4),(89,'2024-01-07',3,201,27,4),(90,'2024-01-07',2,261,25,4),(91,'2024-01-08',2,222,21,4),(92,'2024-01-08',3,271,28,4),(93,'2024-01-08',3,291,7,4),(94,'2024-01-08',2,207,22,4),(95,'2024-01-08',3,290,9,4),(96,'2024-01-08',1,274,29,4),(97,'2024-01-08',2,206,27,4),(98,'2024-01-08',2,237,11,4),(99,'2024-01-08',3,235,16,4),(100,'2024-01-09',1,444,12,4),(101,'2024-01-09',2,461,7,4),(102,'2024-01-09',3,480,10,4),(103,'2024-01-09',1,462,12,4),(104,'2024-01-09',3,452,2,4),(105,'2024-01-09',3,422,9,4),(106,'2024-01-10',2,410,22,4),(107,'2024-01-10',2,492,29,4),(108,'2024-01-10',2,498,30,4),(109,'2024-01-10',2,444,2,4),(110,'2024-01-10',1,436,8,4),(111,'2006-08-25',1,100,10,4);
+/*!40000 ALTER TABLE `venda` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `vendedor`
+--
+
+DROP TABLE IF EXISTS vendedor;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE vendedor (
+  vefuncodigo int NOT NULL,
+  PRIMARY KEY (vefuncodigo)
+) ENGINE=InnoDB DEFAULT CHARSET=latin1;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `vendedor`
+--
+
+LOCK TABLES vendedor WRITE;
+/*!40000 ALTER TABLE `vendedor` DISABLE KEYS */;
+INSERT INTO vendedor VALUES (2),(3),(4),(5),(6),(7),(8),(9),(10),(11),(12),(13),(14),(16),(17),(18),(19),(20),(21),(22),(23),(25),(26),(27),(28),(29),(30);
+/*!40000 ALTER TABLE `vendedor` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Temporary view structure for view `vw_cliente_bai_estcivil`
+--
+
+DROP TABLE IF EXISTS vw_cliente_bai_estcivil;
+/*!50001 DROP VIEW IF EXISTS `vw_cliente_bai_estcivil`*/;
+SET @saved_cs_client     = @@character_set_client;
+/*!50503 SET character_set_client = utf8mb4 */;
+/*!50001 CREATE VIEW `vw_cliente_bai_estcivil` AS SELECT 
+ 1 AS `clicodigo`,
+ 1 AS `clinome`,
+ 1 AS `clisexo`,
+ 1 AS `bainome`,
+ 1 AS `estdescricao`,
+ 1 AS `baizoncodigo`,
+ 1 AS `clidtcadastro`*/;
+SET character_set_client = @saved_cs_client;
+
+--
+-- Table structure for table `zona`
+--
+
+DROP TABLE IF EXISTS zona;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE zona (
+  zoncodigo int NOT NULL DEFAULT '0',
+  zonnome varchar(15) NOT NULL,
+  zoncidcodigo int NOT NULL,
+  PRIMARY KEY (zoncodigo),
+  KEY zoncidcodigo (zoncidcodigo),
+  CONSTRAINT zona_ibfk_1 FOREIGN KEY (zoncidcodigo) REFERENCES cidade (cidcodigo)
+) ENGINE=InnoDB DEFAULT CHARSET=latin1;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `zona`
+--
+
+LOCK TABLES zona WRITE;
+/*!40000 ALTER TABLE `zona` DISABLE KEYS */;
+INSERT INTO zona VALUES (1,'NORTE',1),(2,'SUL',1),(3,'LESTE',1),(4,'OESTE',1),(5,'CENTRO-OESTE',1),(6,'CENTRO-SUL',1);
+/*!40000 ALTER TABLE `zona` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Final view structure for view `vw_cliente_bai_estcivil`
+--
+
+/*!50001 DROP VIEW IF EXISTS `vw_cliente_bai_estcivil`*/;
+/*!50001 SET @saved_cs_client          = @@character_set_client */;
+/*!50001 SET @saved_cs_results         = @@character_set_results */;
+/*!50001 SET @saved_col_connection     = @@collation_connection */;
+/*!50001 SET character_set_client      = utf8mb4 */;
+/*!50001 SET character_set_results     = utf8mb4 */;
+/*!50001 SET collation_connection      = utf8mb4_0900_ai_ci */;
+/*!50001 CREATE ALGORITHM=UNDEFINED */
+/*!50013 DEFINER=`root`@`localhost` SQL SECURITY DEFINER */
+/*!50001 VIEW `vw_cliente_bai_estcivil` AS select `cliente`.`clicodigo` AS `clicodigo`,`cliente`.`clinome` AS `clinome`,`cliente`.`clisexo` AS `clisexo`,`bairro`.`bainome` AS `bainome`,`estadocivil`.`estdescricao` AS `estdescricao`,`bairro`.`baizoncodigo` AS `baizoncodigo`,`cliente`.`clidtcadastro` AS `clidtcadastro` from ((`bairro` join `cliente` on((`bairro`.`baicodigo` = `cliente`.`clibaicodigo`))) join `estadocivil` on((`estadocivil`.`estcodigo` = `cliente`.`cliestcodigo`))) */;
+/*!50001 SET character_set_client      = @saved_cs_client */;
+/*!50001 SET character_set_results     = @saved_cs_results */;
+/*!50001 SET collation_connection      = @saved_col_connection */;
+/*!40103 SET TIME_ZONE=@OLD_TIME_ZONE */;
+
+/*!40101 SET SQL_MODE=@OLD_SQL_MODE */;
+/*!40014 SET FOREIGN_KEY_CHECKS=@OLD_FOREIGN_KEY_CHECKS */;
+/*!40014 SET UNIQUE_CHECKS=@OLD_UNIQUE_CHECKS */;
+/*!40101 SET CHARACTER_SET_CLIENT=@OLD_CHARACTER_SET_CLIENT */;
+/*!40101 SET CHARACTER_SET_RESULTS=@OLD_CHARACTER_SET_RESULTS */;
+/*!40101 SET COLLATION_CONNECTION=@OLD_COLLATION_CONNECTION */;
+/*!40111 SET SQL_NOTES=@OLD_SQL_NOTES */;
+
+-- Dump completed on 2025-03-13 22:42:01
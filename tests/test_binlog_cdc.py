@@ -0,0 +1,270 @@
+# tests/test_binlog_cdc.py
+import json
+import os
+from decimal import Decimal
+
+import pytest
+
+import binlog_cdc
+import migration_cli
+from binlog_cdc import BinlogPosition, BinlogPositionStore, ChangePlan, RowChange, MysqlbinlogFileReader
+from migration_logic import MariaDBExtractor, Table, Column
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'mysql-bin.000001.txt')
+
+
+def pedidos_table():
+    return Table('pedidos', [Column('id', 'INT', is_primary_key=True), Column('cliente', 'VARCHAR', max_length=50),
+                             Column('valor', 'DECIMAL(10,2)')])
+
+
+def notas_table():
+    return Table('notas', [Column('id', 'INT', is_primary_key=True), Column('texto', 'TEXT')])
+
+
+def test_insert_without_merge_deletes_by_key_first():
+    plan = ChangePlan.for_table(notas_table())
+
+    assert not plan.supports_merge
+    assert plan.render_change(RowChange('insert', 'notas', values=(7, 'nota'))) == [
+        "DELETE FROM notas WHERE id = 7;",
+        "INSERT INTO notas (id, texto) VALUES (7, 'nota');",
+    ]
+
+
+def test_insert_without_key_stays_plain_insert():
+    table = Table('log', [Column('linha', 'TEXT')])
+
+    assert ChangePlan.for_table(table).render_change(RowChange('insert', 'log', values=('x',))) == [
+        "INSERT INTO log (linha) VALUES ('x');"]
+
+
+@pytest.fixture
+def cli_env(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path) # logs/ e cache/binlog_position.json
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({
+        'mariadb': {'host': 'db', 'port': '3306', 'database': 'loja', 'user': 'u'}}), encoding='utf-8')
+    monkeypatch.setattr(migration_cli.CLIRunner, 'load_tables',
+                        lambda self, config, names, row_count_mode, use_cache: [pedidos_table(), notas_table()])
+    return str(config_path), tmp_path / "cdc"
+
+
+def read_scripts(directory):
+    return {name: (directory / name).read_text(encoding='utf-8') for name in sorted(os.listdir(directory))}
+
+
+def test_cli_replays_mysqlbinlog_text(cli_env):
+    config_path, output = cli_env
+
+    exit_code = migration_cli.main([config_path, '--cdc-binlog', FIXTURE, '--cdc-start', 'mysql-bin.000001:4',
+                                    '--output', str(output)])
+
+    assert exit_code == migration_cli.EXIT_OK
+    scripts = read_scripts(output)
+    assert list(scripts) == ['CDC_mysql-bin.000001_000000000004.sql']
+    body = scripts['CDC_mysql-bin.000001_000000000004.sql'].split("\n\n", 1)[1] # Sem o cabeçalho com a data
+    assert body == (
+        "-- binlog mysql-bin.000001:587\n"
+        "BEGIN WORK;\n"
+        "MERGE INTO pedidos AS tgt\n"
+        "USING (SELECT 10 AS id, 'Ana D''Ávila' AS cliente, 12.50 AS valor FROM sysmaster:sysdual) AS src\n"
+        "ON (tgt.id = src.id)\n"
+        "WHEN MATCHED THEN UPDATE SET cliente = src.cliente, valor = src.valor\n"
+        "WHEN NOT MATCHED THEN INSERT (id, cliente, valor) VALUES (src.id, src.cliente, src.valor);\n"
+        "COMMIT WORK;\n\n"
+        "-- binlog mysql-bin.000001:1029\n"
+        "BEGIN WORK;\n"
+        "UPDATE pedidos SET valor = 15.00 WHERE id = 10;\n"
+        "DELETE FROM pedidos WHERE id = 3;\n"
+        "COMMIT WORK;\n\n"
+        "-- binlog mysql-bin.000001:1453\n"
+        "BEGIN WORK;\n"
+        "DELETE FROM notas WHERE id = 7;\n"
+        "INSERT INTO notas (id, texto) VALUES (7, 'primeira nota');\n"
+        "COMMIT WORK;\n\n"
+    )
+    # As últimas transações (outro banco, tabela não selecionada) não geram script, mas avançam a posição
+    assert BinlogPositionStore('db:3306/loja').get() == BinlogPosition('mysql-bin.000001', 1977)
+
+
+def test_cli_resumes_from_saved_position(cli_env):
+    config_path, output = cli_env
+    store = BinlogPositionStore('db:3306/loja')
+    store.set(BinlogPosition('mysql-bin.000001', 1029))
+    store.save()
+
+    exit_code = migration_cli.main([config_path, '--cdc-binlog', FIXTURE, '--output', str(output)])
+
+    assert exit_code == migration_cli.EXIT_OK
+    scripts = read_scripts(output)
+    assert list(scripts) == ['CDC_mysql-bin.000001_000000001029.sql']
+    body = scripts['CDC_mysql-bin.000001_000000001029.sql']
+    assert "-- binlog mysql-bin.000001:1453\n" in body
+    assert "pedidos" not in body
+
+
+def test_cli_cdc_without_start_position(cli_env):
+    config_path, output = cli_env
+
+    assert migration_cli.main([config_path, '--cdc-binlog', FIXTURE, '--output', str(output)]) \
+        == migration_cli.EXIT_CONFIG_ERROR
+    assert migration_cli.main([config_path, '--cdc-binlog', FIXTURE, '--cdc-start', 'mysql-bin.000001',
+                               '--output', str(output)]) == migration_cli.EXIT_CONFIG_ERROR
+
+
+def test_rows_without_key_are_not_matched_on_binary_columns():
+    table = Table('log', [Column('hash', 'BINARY', max_length=16), Column('linha', 'INT')])
+
+    statements = ChangePlan.for_table(table).render_change(RowChange('delete', 'log', before=(b'\x01', 5)))
+
+    assert statements == ["DELETE FROM log WHERE linha = 5;"]
+
+
+def test_unsigned_columns_use_the_unsigned_reading():
+    # mysqlbinlog -v mostra "-1 (4294967295)" para todo inteiro com o bit de sinal ligado
+    table = Table('contadores', [Column('id', 'INT', is_primary_key=True, is_unsigned=True),
+                                 Column('total', 'BIGINT', is_unsigned=True), Column('saldo', 'INT')])
+    reader = MysqlbinlogFileReader(FIXTURE, {'contadores': table}, 'loja',
+                                   start=BinlogPosition('mysql-bin.000001', 4))
+
+    changes = [change for transaction in reader.transactions() for change in transaction.changes]
+
+    assert changes == [RowChange('insert', 'contadores', values=(4294967295, 18446744073709551615, -1))]
+
+
+def test_schema_column_type_marks_unsigned():
+    row = ('id', 'int', None, 'NO', None, 'PRI', 'auto_increment', 'int(10) unsigned')
+
+    column = MariaDBExtractor._column_from_schema(row)
+
+    assert column.is_unsigned and column.is_primary_key and column.data_type == 'INT'
+    assert not MariaDBExtractor._column_from_schema(row[:7] + ('int(11)',)).is_unsigned
+
+
+class FakeEvent:
+    def __init__(self, **attributes):
+        self.__dict__.update(attributes)
+
+
+class QueryEvent(FakeEvent):
+    pass
+
+
+class XidEvent(FakeEvent):
+    pass
+
+
+class RotateEvent(FakeEvent):
+    pass
+
+
+class WriteRowsEvent(FakeEvent):
+    pass
+
+
+class UpdateRowsEvent(FakeEvent):
+    pass
+
+
+class DeleteRowsEvent(FakeEvent):
+    pass
+
+
+class FakeBinLogStreamReader:
+    """Substitui pymysqlreplication.BinLogStreamReader: devolve eventos prontos, avançando
+    log_file/log_pos como a réplica faz (posição do fim do evento)."""
+
+    events = []
+    instances = []
+
+    def __init__(self, **settings):
+        self.settings = settings
+        self.log_file, self.log_pos = settings['log_file'], settings['log_pos']
+        self.closed = False
+        FakeBinLogStreamReader.instances.append(self)
+
+    def __iter__(self):
+        for event, log_file, log_pos in self.events:
+            self.log_file, self.log_pos = log_file, log_pos
+            yield event
+
+    def close(self):
+        self.closed = True
+
+
+LIVE_EVENTS = [
+    (RotateEvent(next_binlog='mysql-bin.000007', position=4), 'mysql-bin.000007', 4),
+    (QueryEvent(query='BEGIN'), 'mysql-bin.000007', 400),
+    (WriteRowsEvent(table='pedidos', rows=[{'values': {'id': 10, 'cliente': 'Ana', 'valor': Decimal('12.50')}}]),
+     'mysql-bin.000007', 480),
+    (XidEvent(xid=1), 'mysql-bin.000007', 520),
+    (QueryEvent(query='BEGIN'), 'mysql-bin.000007', 600),
+    (UpdateRowsEvent(table='pedidos', rows=[{
+        'before_values': {'id': 10, 'cliente': 'Ana', 'valor': Decimal('12.50')},
+        'after_values': {'id': 10, 'cliente': 'Ana', 'valor': Decimal('15.00')}}]), 'mysql-bin.000007', 700),
+    (DeleteRowsEvent(table='pedidos', rows=[{'values': {'id': 3, 'cliente': 'Bruno', 'valor': None}}]),
+     'mysql-bin.000007', 820),
+    (XidEvent(xid=2), 'mysql-bin.000007', 900),
+    (RotateEvent(next_binlog='mysql-bin.000008', position=4), 'mysql-bin.000008', 4),
+    (QueryEvent(query='BEGIN'), 'mysql-bin.000008', 300),
+    (WriteRowsEvent(table='notas', rows=[{'values': {'id': 7, 'texto': 'primeira nota'}}]), 'mysql-bin.000008', 380),
+    (XidEvent(xid=3), 'mysql-bin.000008', 420),
+    (QueryEvent(query='BEGIN'), 'mysql-bin.000008', 500),
+    (WriteRowsEvent(table='auditoria', rows=[{'values': {'id': 1}}]), 'mysql-bin.000008', 560),
+    (XidEvent(xid=4), 'mysql-bin.000008', 600),
+]
+
+
+@pytest.fixture
+def fake_replication(monkeypatch):
+    FakeBinLogStreamReader.events = LIVE_EVENTS
+    FakeBinLogStreamReader.instances = []
+    monkeypatch.setattr(binlog_cdc, 'REPLICATION_AVAILABLE', True)
+    monkeypatch.setattr(binlog_cdc, 'BinLogStreamReader', FakeBinLogStreamReader, raising=False)
+    for event_class in (QueryEvent, XidEvent, RotateEvent, WriteRowsEvent, UpdateRowsEvent, DeleteRowsEvent):
+        monkeypatch.setattr(binlog_cdc, event_class.__name__, event_class, raising=False)
+    return FakeBinLogStreamReader
+
+
+@pytest.mark.parametrize("follow", [False, True])
+def test_cli_live_groups_transactions_and_saves_position(cli_env, fake_replication, follow):
+    config_path, output = cli_env
+    config = json.loads(open(config_path, encoding='utf-8').read())
+    config['options'] = {'cdc_transactions_per_file': '2'}
+    open(config_path, 'w', encoding='utf-8').write(json.dumps(config))
+    argv = [config_path, '--cdc-live', '--cdc-start', 'mysql-bin.000007:4', '--output', str(output)]
+
+    exit_code = migration_cli.main(argv + (['--cdc-follow'] if follow else []))
+
+    assert exit_code == migration_cli.EXIT_OK
+    settings = fake_replication.instances[0].settings
+    assert (settings['log_file'], settings['log_pos'], settings['blocking']) == ('mysql-bin.000007', 4, follow)
+    assert settings['only_schemas'] == ['loja'] and fake_replication.instances[0].closed
+    scripts = read_scripts(output)
+    # Duas transações por arquivo; o segundo começa na posição em que o primeiro terminou
+    assert list(scripts) == ['CDC_mysql-bin.000007_000000000004.sql', 'CDC_mysql-bin.000007_000000000900.sql']
+    first = scripts['CDC_mysql-bin.000007_000000000004.sql']
+    assert "-- binlog mysql-bin.000007:520\nBEGIN WORK;\nMERGE INTO pedidos" in first
+    assert ("-- binlog mysql-bin.000007:900\nBEGIN WORK;\nUPDATE pedidos SET valor = 15.00 WHERE id = 10;\n"
+            "DELETE FROM pedidos WHERE id = 3;\nCOMMIT WORK;\n") in first
+    second = scripts['CDC_mysql-bin.000007_000000000900.sql']
+    assert ("-- binlog mysql-bin.000008:420\nBEGIN WORK;\nDELETE FROM notas WHERE id = 7;\n"
+            "INSERT INTO notas (id, texto) VALUES (7, 'primeira nota');\nCOMMIT WORK;\n") in second
+    assert "auditoria" not in second
+    assert BinlogPositionStore('db:3306/loja').get() == BinlogPosition('mysql-bin.000008', 600)
+
+
+def test_cli_live_continues_from_saved_position(cli_env, fake_replication):
+    config_path, output = cli_env
+    store = BinlogPositionStore('db:3306/loja')
+    store.set(BinlogPosition('mysql-bin.000008', 420))
+    store.save()
+    fake_replication.events = [event for event in LIVE_EVENTS if (event[1], event[2]) > ('mysql-bin.000008', 420)]
+
+    assert migration_cli.main([config_path, '--cdc-live', '--output', str(output)]) == migration_cli.EXIT_OK
+
+    settings = fake_replication.instances[0].settings
+    assert (settings['log_file'], settings['log_pos']) == ('mysql-bin.000008', 420)
+    assert not output.exists() or not os.listdir(output) # Só a transação da tabela não selecionada
+    assert BinlogPositionStore('db:3306/loja').get() == BinlogPosition('mysql-bin.000008', 600)
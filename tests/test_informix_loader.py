@@ -0,0 +1,148 @@
+# tests/test_informix_loader.py
+import json
+import sqlite3
+
+import pytest
+
+import migration_cli
+from informix_loader import InformixDirectLoader, DirectLoadOptions, connect_dsn
+from migration_logic import Table, Column
+from fake_mariadb import FakeMariaDB
+
+
+class CountingConnection:
+    """Conexão SQLite que conta executemany e COMMITs, para conferir o tamanho das transações."""
+
+    def __init__(self, path, stats):
+        self._connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._stats = stats
+
+    def cursor(self):
+        connection, stats = self._connection, self._stats
+
+        class Cursor:
+            def __init__(self):
+                self._cursor = connection.cursor()
+
+            def executemany(self, sql, rows):
+                rows = list(rows)
+                stats.setdefault('batches', []).append(len(rows))
+                self._cursor.executemany(sql, rows)
+
+            def close(self):
+                self._cursor.close()
+
+        return Cursor()
+
+    def commit(self):
+        self._stats['commits'] = self._stats.get('commits', 0) + 1
+        self._connection.commit()
+
+    def rollback(self):
+        self._connection.rollback()
+
+    def close(self):
+        self._connection.close()
+
+
+@pytest.fixture
+def source(monkeypatch):
+    db = FakeMariaDB()
+    db.execute("CREATE TABLE pedidos (id INTEGER PRIMARY KEY, cliente TEXT, valor REAL)")
+    db.execute("INSERT INTO pedidos VALUES (?, ?, ?)", [(i, f"cliente '{i}'", i * 1.5) for i in range(1, 2501)])
+    db.execute("CREATE TABLE sem_pk (nome TEXT, qtd INTEGER)")
+    db.execute("INSERT INTO sem_pk VALUES (?, ?)", [(f"n{i}", i) for i in range(7)])
+    db.install(monkeypatch)
+    yield [
+        Table('pedidos', [Column('id', 'INT', is_primary_key=True), Column('cliente', 'VARCHAR', max_length=50),
+                          Column('valor', 'DOUBLE')], row_count=2500),
+        Table('sem_pk', [Column('nome', 'VARCHAR', max_length=10), Column('qtd', 'INT')], row_count=7),
+    ]
+    db.close()
+
+
+@pytest.fixture
+def target_path(tmp_path):
+    path = str(tmp_path / "destino.db")
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE pedidos (id INTEGER, cliente TEXT, valor REAL)")
+    connection.execute("CREATE TABLE sem_pk (nome TEXT, qtd INTEGER)")
+    connection.commit()
+    connection.close()
+    return path
+
+
+def table_stats(path, table):
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute(f"SELECT COUNT(*), SUM(LENGTH(cliente)) FROM {table}").fetchone() \
+            if table == 'pedidos' else connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize("mode", ['paged', 'stream'])
+def test_direct_load_commits_in_batches(source, target_path, mode):
+    stats = {}
+    options = DirectLoadOptions(batch_size=300, commit_every=1000, workers=1, extraction_mode=mode)
+    loader = InformixDirectLoader({}, lambda: CountingConnection(target_path, stats), options)
+
+    results = loader.run([source[0]])
+
+    assert [(r.table_name, r.rows, r.commits, r.error) for r in results] == [('pedidos', 2500, 3, None)]
+    # 8 lotes de 300 + 1 de 100; COMMIT ao passar de 1000 linhas (1200, 2400) e no fim (100)
+    assert stats['batches'] == [300] * 8 + [100]
+    assert stats['commits'] == 3
+    assert table_stats(target_path, 'pedidos')[0] == 2500
+    assert loader.total_records == 2500
+
+
+def test_direct_load_row_counts_per_table(source, target_path):
+    loader = InformixDirectLoader({}, lambda: connect_dsn(f"sqlite:///{target_path}"),
+                                  DirectLoadOptions(batch_size=1000, commit_every=1000, workers=2))
+
+    results = loader.run(source)
+
+    assert {r.table_name: r.rows for r in results} == {'pedidos': 2500, 'sem_pk': 7}
+    assert table_stats(target_path, 'pedidos')[0] == 2500
+    assert table_stats(target_path, 'sem_pk') == (7,)
+
+
+def test_direct_load_isolates_table_errors(source, target_path):
+    connection = sqlite3.connect(target_path)
+    connection.execute("DROP TABLE sem_pk")
+    connection.commit()
+    connection.close()
+
+    results = InformixDirectLoader({}, lambda: connect_dsn(f"sqlite:///{target_path}"),
+                                   DirectLoadOptions(workers=2)).run(source)
+
+    by_name = {r.table_name: r for r in results}
+    assert by_name['pedidos'].rows == 2500 and by_name['pedidos'].error is None
+    assert by_name['sem_pk'].rows == 0 and 'sem_pk' in by_name['sem_pk'].error
+
+
+def test_cli_direct_load(source, target_path, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path) # logs/ do CLI
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({
+        'mariadb': {'host': 'localhost', 'port': '3306', 'database': 'origem', 'user': 'u', 'password': ''},
+        'options': {'batch_size': '500', 'commit_every': '1000', 'workers': '2'},
+    }), encoding='utf-8')
+    monkeypatch.setattr(migration_cli.CLIRunner, 'load_tables',
+                        lambda self, config, names, row_count_mode, use_cache: source)
+
+    exit_code = migration_cli.main([str(config_path), '--direct-load', f"sqlite:///{target_path}"])
+
+    assert exit_code == migration_cli.EXIT_OK
+    assert table_stats(target_path, 'pedidos')[0] == 2500
+    assert table_stats(target_path, 'sem_pk') == (7,)
+
+
+def test_cli_requires_output_or_direct_load(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({
+        'mariadb': {'host': 'localhost', 'port': '3306', 'database': 'origem', 'user': 'u'}}), encoding='utf-8')
+
+    assert migration_cli.main([str(config_path)]) == migration_cli.EXIT_CONFIG_ERROR
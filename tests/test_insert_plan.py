@@ -0,0 +1,57 @@
+# tests/test_insert_plan.py
+from migration_logic import InsertPlan, UpsertPlan, InformixGenerator, Table, Column, render_batch
+
+
+def test_binary_columns_disable_union_insert():
+    # BINARY/VARBINARY viram BYTE(n) no Informix: o tipo base é que conta
+    table = Table('arquivos', [Column('id', 'INT', is_primary_key=True), Column('hash', 'VARBINARY', max_length=32)])
+
+    plan = InsertPlan.for_table(table)
+
+    assert plan.target_types == ['INTEGER', 'BYTE(32)']
+    assert not plan.supports_union_insert
+    assert not UpsertPlan.for_table(table).supports_merge
+
+
+def test_plain_columns_allow_union_insert():
+    table = Table('cidades', [Column('id', 'INT', is_primary_key=True), Column('nome', 'VARCHAR', max_length=40)])
+
+    assert InsertPlan.for_table(table).supports_union_insert
+
+
+def test_render_batch_uses_plan_rendering():
+    table = Table('itens', [Column('id', 'INT', is_primary_key=True, is_auto_increment=True),
+                            Column('nome', 'VARCHAR', max_length=20), Column('qtd', 'INT')])
+    rows = [(i, f"item {i}", None if i % 2 else i) for i in range(1, 6)]
+
+    single, _ = render_batch(table, rows)
+    union, _ = render_batch(table, rows, rows_per_statement=2)
+    merge, _ = render_batch(table, rows, rows_per_statement=2, upsert=True)
+
+    assert single == InformixGenerator.generate_insert_statements(table, rows)
+    assert single[0] == "INSERT INTO itens (nome, qtd) VALUES ('item 1', NULL);"
+    assert union == InformixGenerator.generate_insert_statements(table, rows, 2)
+    assert union[0] == ("INSERT INTO itens (nome, qtd)\n"
+                        "SELECT 'item 1', NULL::INTEGER FROM sysmaster:sysdual\n"
+                        "UNION ALL SELECT 'item 2', 2 FROM sysmaster:sysdual;")
+    assert len(union) == 3
+    assert merge == UpsertPlan.for_table(table).render_statements(rows, 2) and len(merge) == 3
+
+
+def test_only_auto_increment_columns_render_nothing():
+    table = Table('seq', [Column('id', 'INT', is_primary_key=True, is_auto_increment=True)])
+
+    assert render_batch(table, [(1,), (2,)])[0] == []
+    assert InformixGenerator.generate_insert_statements(table, [(1,)]) == []
+
+
+def test_plan_cache_is_keyed_by_table_contents():
+    def clientes(name_type='VARCHAR'):
+        return Table('clientes', [Column('id', 'INT', is_primary_key=True), Column('nome', name_type, max_length=20)])
+
+    plan = InsertPlan.for_table(clientes())
+
+    assert InsertPlan.for_table(clientes()) is plan # Cópia dos metadados (recarga, processo de renderização)
+    changed = InsertPlan.for_table(clientes('TEXT'))
+    assert changed is not plan and not changed.supports_union_insert
+    assert UpsertPlan.for_table(clientes()) is not plan # Cada tipo de plano no seu cache
@@ -0,0 +1,198 @@
+# tests/test_script_generator.py
+import os
+import re
+from datetime import datetime
+
+import pytest
+
+import migration_logic
+from migration_logic import ScriptGenerator, ScriptGenerationOptions, Table, Column
+from fake_mariadb import FakeMariaDB
+
+
+@pytest.fixture
+def source(monkeypatch):
+    db = FakeMariaDB()
+    db.execute("CREATE TABLE clientes (id INTEGER PRIMARY KEY, nome TEXT)")
+    db.execute("INSERT INTO clientes VALUES (?, ?)", [(i, f"c{i}") for i in range(1, 51)])
+    db.execute("CREATE TABLE pedidos (id INTEGER PRIMARY KEY, cliente_id INTEGER)")
+    db.execute("INSERT INTO pedidos VALUES (?, ?)", [(i, i % 50 + 1) for i in range(1, 121)])
+    db.install(monkeypatch)
+    yield db, [
+        Table('clientes', [Column('id', 'INT', is_primary_key=True, is_auto_increment=True),
+                           Column('nome', 'VARCHAR', max_length=20)], row_count=50),
+        Table('pedidos', [Column('id', 'INT', is_primary_key=True, is_auto_increment=True),
+                          Column('cliente_id', 'INT')], row_count=120),
+    ]
+    db.close()
+
+
+class LogCollector:
+    def __init__(self):
+        self.messages = []
+
+    def __call__(self, message, level="INFO"):
+        self.messages.append((level, message))
+
+    def at(self, level):
+        return [message for logged_level, message in self.messages if logged_level == level]
+
+
+def test_binlog_position_failure_only_warns(source, tmp_path, monkeypatch):
+    db, tables = source
+    acquire = migration_logic.MariaDBConnectionPool.acquire
+    calls = []
+
+    def failing_first_acquire(pool):
+        calls.append(1)
+        if len(calls) == 1: # A primeira conexão do pool é a da posição do binlog
+            raise RuntimeError("conexão recusada")
+        return acquire(pool)
+
+    monkeypatch.setattr(migration_logic.MariaDBConnectionPool, 'acquire', failing_first_acquire)
+    log = LogCollector()
+    generator = ScriptGenerator({}, ScriptGenerationOptions(output_directory=str(tmp_path), workers=1,
+                                                            render_processes=0), log=log)
+
+    results = generator.run(tables)
+
+    assert [(r.table_name, r.records, r.error) for r in results] == [('clientes', 50, None), ('pedidos', 120, None)]
+    assert generator.binlog_position is None
+    assert any("conexão recusada" in message for message in log.at("WARNING"))
+
+
+def test_delta_planning_error_is_isolated_per_table(source, tmp_path, monkeypatch):
+    db, tables = source
+    column_max = migration_logic.MariaDBExtractor.get_column_max
+
+    def failing_column_max(extractor, table, column_name):
+        if table.name == 'clientes':
+            raise RuntimeError("tempo esgotado")
+        return column_max(extractor, table, column_name)
+
+    monkeypatch.setattr(migration_logic.MariaDBExtractor, 'get_column_max', failing_column_max)
+    done = []
+    options = ScriptGenerationOptions(output_directory=str(tmp_path), workers=2, render_processes=0,
+                                      delta_mode=True, delta_state_path=str(tmp_path / "delta.json"))
+    generator = ScriptGenerator({}, options, log=LogCollector(), on_table_done=done.append)
+
+    results = generator.run(tables)
+
+    by_name = {result.table_name: result for result in results}
+    assert "tempo esgotado" in by_name['clientes'].error and by_name['clientes'].records == 0
+    assert by_name['pedidos'].error is None and by_name['pedidos'].records == 120
+    assert sorted(result.table_name for result in done) == ['clientes', 'pedidos']
+    # A tabela com erro não ganha marca d'água: a próxima execução extrai tudo
+    assert generator.delta_state.get('clientes') is None
+    assert generator.delta_state.get('pedidos') == ('id', 120)
+
+
+
+@pytest.fixture
+def changed_rows(monkeypatch):
+    db = FakeMariaDB()
+    db.execute("CREATE TABLE produtos (id INTEGER PRIMARY KEY, nome TEXT, updated_at TEXT)")
+    db.execute("INSERT INTO produtos VALUES (?, ?, ?)", [(1, "a", "2025-03-01 10:00:00"),
+                                                       (2, "b", "2025-03-01 10:00:05"),
+                                                       (3, "c", "2025-03-01 10:00:05")])
+    db.install(monkeypatch)
+    column_max = migration_logic.MariaDBExtractor.get_column_max
+    # O SQLite devolve texto; o MariaDB devolve datetime
+    monkeypatch.setattr(migration_logic.MariaDBExtractor, 'get_column_max',
+                        lambda extractor, table, name: datetime.fromisoformat(column_max(extractor, table, name)))
+    yield db, [Table('produtos', [Column('id', 'INT', is_primary_key=True),
+                                  Column('nome', 'VARCHAR', max_length=5),
+                                  Column('updated_at', 'DATETIME')], row_count=3)]
+    db.close()
+
+
+def run_delta(tables, output_directory, state_path, log, delta_output='auto'):
+    os.makedirs(output_directory, exist_ok=True)
+    options = ScriptGenerationOptions(output_directory=str(output_directory), workers=1, render_processes=0,
+                                      delta_mode=True, delta_columns='updated_at', delta_output=delta_output,
+                                      delta_state_path=str(state_path))
+    generator = ScriptGenerator({}, options, log=log)
+    return generator, generator.run(tables)
+
+
+def test_delta_by_timestamp_rereads_overlap_with_merge(changed_rows, tmp_path):
+    db, tables = changed_rows
+    state_path = tmp_path / "delta.json"
+    run_delta(tables, tmp_path / "run1", state_path, LogCollector())
+    # No mesmo segundo da marca e confirmada depois da leitura do MAX com data anterior
+    db.execute("INSERT INTO produtos VALUES (?, ?, ?)", [(4, "d", "2025-03-01 10:00:05"),
+                                                       (5, "e", "2025-03-01 09:59:50")])
+
+    log = LogCollector()
+    generator, results = run_delta(tables, tmp_path / "run2", state_path, log)
+
+    assert results[0].error is None and results[0].records == 5
+    with open(tmp_path / "run2" / "produtos_data.sql", encoding='utf-8') as f:
+        script = f.read()
+    assert script.count("MERGE INTO") == 5
+    assert generator.delta_state.get('produtos') == ('updated_at', datetime(2025, 3, 1, 10, 0, 5))
+    assert not any("PK duplicada" in message for message in log.at("WARNING"))
+
+
+def test_delta_by_timestamp_with_insert_output_warns(changed_rows, tmp_path):
+    db, tables = changed_rows
+    log = LogCollector()
+
+    generator, results = run_delta(tables, tmp_path / "run1", tmp_path / "delta.json", log, delta_output='insert')
+
+    assert results[0].records == 3
+    assert any("PK duplicada" in message for message in log.at("WARNING"))
+
+def stop_after(calls):
+    """should_continue que deixa passar `calls` verificações e depois cancela."""
+    remaining = [calls]
+
+    def should_continue():
+        remaining[0] -= 1
+        return remaining[0] >= 0
+    return should_continue
+
+
+def generate(tables, output_directory, extraction_mode='paged', resume=False, should_continue=None, log=None):
+    options = ScriptGenerationOptions(output_directory=str(output_directory), workers=1, render_processes=0,
+                                      batch_size=10, extraction_mode=extraction_mode, resume=resume)
+    return ScriptGenerator({}, options, log=log, should_continue=should_continue).run(tables)
+
+
+@pytest.fixture
+def table_without_key(monkeypatch):
+    db = FakeMariaDB()
+    db.execute("CREATE TABLE eventos (tipo TEXT, valor INTEGER)")
+    # Inserção fora de ordem e com linhas repetidas
+    db.execute("INSERT INTO eventos VALUES (?, ?)", [(f"t{i % 7}", (i * 37) % 11) for i in range(45, 0, -1)])
+    db.install(monkeypatch)
+    yield [Table('eventos', [Column('tipo', 'VARCHAR', max_length=5), Column('valor', 'INT')], row_count=45)]
+    db.close()
+
+
+def data_lines(directory):
+    with open(os.path.join(directory, 'eventos_data.sql'), encoding='utf-8') as f:
+        return [line for line in f if line.startswith("INSERT")]
+
+
+@pytest.mark.parametrize("mode", ['paged', 'stream'])
+def test_resume_without_primary_key_matches_full_run(table_without_key, tmp_path, mode):
+    full, resumed = tmp_path / "completo", tmp_path / "retomado"
+    full.mkdir()
+    resumed.mkdir()
+    generate(table_without_key, full, mode)
+
+    interrupted = generate(table_without_key, resumed, mode, should_continue=stop_after(4))
+    assert interrupted[0].records < 45
+    log = LogCollector()
+    results = generate(table_without_key, resumed, mode, resume=True, log=log)
+
+    assert results[0].records == 45
+    assert data_lines(resumed) == data_lines(full)
+    if mode == 'paged':
+        # LIMIT/OFFSET ordenado por todas as colunas: a retomada continua do mesmo ponto
+        rows = [re.search(r"VALUES \('(\w+)', (\d+)\)", line).groups() for line in data_lines(full)]
+        assert rows == sorted(rows, key=lambda row: (row[0], int(row[1])))
+        assert any("retomando após" in message for message in log.at("INFO"))
+    else:
+        assert any("gerando a parte do zero" in message for message in log.at("WARNING"))
@@ -0,0 +1,98 @@
+# tests/test_sql_converter.py
+import os
+
+import pytest
+
+from sql_converter_logic import SQLConverter
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def convert(sql):
+    return SQLConverter().convert(sql)[0]
+
+
+def convert_file(tmp_path, sql):
+    source, target = tmp_path / "entrada.sql", tmp_path / "saida.sql"
+    source.write_text(sql, encoding='utf-8')
+    SQLConverter().convert_file(str(source), str(target))
+    return target.read_text(encoding='utf-8')
+
+
+def test_end_case_does_not_reopen_block():
+    sql = "DELIMITER $$ CREATE PROCEDURE p() BEGIN CASE WHEN 1 THEN SELECT 2; END CASE; END$$"
+
+    assert convert(sql) == "CREATE PROCEDURE p() BEGIN CASE WHEN 1 THEN SELECT 2; END CASE; END PROCEDURE;"
+
+
+def test_compound_ends_inside_routine(tmp_path):
+    sql = ("DELIMITER //\n"
+           "CREATE PROCEDURE p(x INT)\n"
+           "BEGIN\n"
+           "  IF x > 0 THEN SELECT 1; END IF;\n"
+           "  CASE x WHEN 1 THEN SELECT 2; ELSE BEGIN SELECT 3; END; END CASE;\n"
+           "  SELECT CASE WHEN x THEN 1 END FROM t;\n"
+           "END//\n"
+           "DELIMITER ;\n")
+    expected = ("CREATE PROCEDURE p(x INT)\n"
+                "BEGIN\n"
+                "  IF x > 0 THEN SELECT 1; END IF;\n"
+                "  CASE x WHEN 1 THEN SELECT 2; ELSE BEGIN SELECT 3; END; END CASE;\n"
+                "  SELECT CASE WHEN x THEN 1 END FROM t;\n"
+                "END PROCEDURE;")
+
+    assert convert(sql) == expected
+    assert convert_file(tmp_path, sql).strip() == expected
+
+
+def test_limit_after_line_comment_keeps_terminator_out_of_comment(tmp_path):
+    sql = "SELECT a FROM t WHERE x -- c\n LIMIT 3;"
+
+    assert convert(sql) == "SELECT FIRST 3 a FROM t WHERE x -- c\n;"
+    assert convert_file(tmp_path, sql + "\nSELECT 1;\n") == "SELECT FIRST 3 a FROM t WHERE x -- c\n;\nSELECT 1;\n"
+    assert convert("SELECT a FROM t # c\n LIMIT 3;") == "SELECT FIRST 3 a FROM t --c\n;"
+
+
+@pytest.mark.parametrize("name", ['abd_2025', 'test'])
+def test_sample_scripts_match_expected_output(name):
+    # Saída revisada do conversor por tokens; as diferenças para o antigo conversor por
+    # regex estão nos testes abaixo. Regerar o esperado só depois de revisar o diff.
+    with open(os.path.join(REPO, f"{name}.sql"), encoding='utf-8') as f:
+        converted = SQLConverter().convert(f.read())[0]
+    with open(os.path.join(FIXTURES, f"{name}_expected.sql"), encoding='utf-8', newline='') as f:
+        expected = f.read()
+
+    assert converted + "\n" == expected
+
+
+# Diferenças intencionais em relação ao conversor antigo (regex sobre o texto inteiro)
+
+def test_limit_moves_to_the_select_of_its_own_statement():
+    # O regex procurava o SELECT para trás sem parar no ';' e punha o FIRST no comando anterior
+    sql = ("SELECT DBINFO('version', 'full') AS server_version FROM sysmaster:sysdual;\n"
+           "SELECT * FROM temp_data WHERE random_number < 10 ORDER BY id LIMIT 5;")
+
+    assert convert(sql) == ("SELECT DBINFO('version', 'full') AS server_version FROM sysmaster:sysdual;\n"
+                            "SELECT FIRST 5 * FROM temp_data WHERE random_number < 10 ORDER BY id;")
+
+
+def test_auto_increment_table_option_is_kept():
+    # AUTO_INCREMENT=5 é opção da tabela (próximo valor), não coluna: o regex gerava "SERIAL=5"
+    sql = "CREATE TABLE a (id int(11) NOT NULL AUTO_INCREMENT, PRIMARY KEY (id)) ENGINE=InnoDB AUTO_INCREMENT=5;"
+
+    assert convert(sql) == "CREATE TABLE a (id SERIAL, PRIMARY KEY (id)) ENGINE=InnoDB AUTO_INCREMENT=5;"
+
+
+def test_end_foreach_is_not_routine_end():
+    # Rotina já em SPL do Informix: o regex trocava o END de "END FOREACH" por END PROCEDURE
+    sql = ("CREATE PROCEDURE p(n VARCHAR(50))\n"
+           "RETURNING VARCHAR(50);\n"
+           "DEFINE x VARCHAR(50);\n"
+           "FOREACH\n"
+           "    SELECT tabname INTO x FROM systables WHERE tabname = n\n"
+           "RETURN x WITH RESUME;\n"
+           "END FOREACH;\n"
+           "END PROCEDURE;")
+
+    assert convert(sql) == sql